@@ -34,7 +34,9 @@ tax1    [or here]
 """
 
 # note: might want to use make_safe_f to strip out additional params passed on.
-from numpy import array, zeros
+from numpy import (arange, array, asarray, concatenate, searchsorted, unique,
+                   where, zeros)
+from multiprocessing import Pool
 import os.path
 from optparse import OptionParser
 
@@ -45,6 +47,13 @@ import qiime.pycogent_backports.alpha_diversity as alph  # relying on backports
 from qiime.parse import make_envs_dict
 from qiime.util import FunctionWithParams, make_safe_f
 from qiime.format import format_matrix
+from qiime.collate_alpha import make_output_row, write_output_file
+from qiime.rarefaction import (get_nested_rarefaction_data,
+                               nested_rarefy_sample)
+from qiime.tree_index import TreeIndex
+from qiime.sparse_alpha_diversity import (SampleStats, sparse_alpha,
+                                          is_sparse_alpha_metric)
+from qiime.sparse_beta_diversity import SampleVectors
 from sys import exit, stderr
 import sys
 import os.path
@@ -97,7 +106,7 @@ class AlphaDiversityCalc(FunctionWithParams):
         self.Params = params or {}
 
     def getResult(self, data_path, taxon_names=None, sample_names=None,
-                  tree_path=None):
+                  tree_path=None, sample_stats=None):
         """Returns per-sample diversity from incidence matrix and optional tree.
 
         Parameters:
@@ -111,7 +120,14 @@ class AlphaDiversityCalc(FunctionWithParams):
         taxon_names: list of names of taxa, same order as in row (required for
         phylogenetic methods)
 
-        tree: cogent.tree.PhyloNode object, or file path
+        tree: cogent.tree.PhyloNode object, or file path, or
+        qiime.tree_index.TreeIndex (PD_whole_tree is always computed on a
+        TreeIndex of the tree)
+
+        sample_stats: qiime.sparse_alpha_diversity.SampleStats of the
+        table, which may be shared between calcs (built from the table if
+        needed and not passed). Metrics which can be computed for all
+        samples at once (see is_sparse_alpha_metric) are computed from it.
 
         output:
         1d/2d array containing diversity of each sample, preserving order from
@@ -122,7 +138,27 @@ class AlphaDiversityCalc(FunctionWithParams):
         """
         otu_table = self.getBiomData(data_path)
         data = otu_table.iterSampleData()
-        if self.IsPhylogenetic:
+        if self.Metric is fast_unifrac.PD_whole_tree:
+            if isinstance(tree_path, TreeIndex):
+                tree_index = tree_path
+            else:
+                tree_index = TreeIndex.from_tree(self.getTree(tree_path))
+            if sample_stats is None:
+                sample_vectors = SampleVectors.from_table(otu_table)
+            else:
+                sample_vectors = sample_stats.sample_vectors
+            tip_indices = tree_index.get_tip_indices(otu_table.ObservationIds)
+            _check_tips_in_tree(tip_indices)
+            result = tree_index.pd(sample_vectors, tip_indices)
+            sample_indices = dict([(sample_id, i) for i, sample_id in
+                                   enumerate(otu_table.SampleIds)])
+            ordered_res = zeros(len(sample_names), 'float')
+            for i, sample in enumerate(sample_names):
+                if sample in sample_indices:
+                    ordered_res[i] = result[sample_indices[sample]]
+            return ordered_res
+
+        elif self.IsPhylogenetic:
             tree = self.getTree(tree_path)
             # build envs dict: envs = {otu_id:{sample_id:count}}
             envs = {}
@@ -143,6 +179,11 @@ class AlphaDiversityCalc(FunctionWithParams):
                     pass  # already is zero
             return array(ordered_res)
 
+        elif is_sparse_alpha_metric(self.Metric):
+            if sample_stats is None:
+                sample_stats = SampleStats.from_table(otu_table)
+            return sparse_alpha(sample_stats, self.Metric, self.Params)
+
         else:
             def metric(row):
                 return self.Metric(row, **self.Params)
@@ -179,6 +220,7 @@ class AlphaDiversityCalcs(FunctionWithParams):
         * data_path: file path, tab delimited, otu table format --OR --
         tuple: (sample_names, taxon_names, data (2d numpy), lineages)
         * tree: newick tree path --OR-- cogent.core.tree.PhyloNode object
+        --OR-- qiime.tree_index.TreeIndex (for PD_whole_tree only)
 
         output:
         result: a matrix of sample by alpha diversity method, sample_names,
@@ -192,18 +234,32 @@ class AlphaDiversityCalcs(FunctionWithParams):
             calc_names.extend(getattr(calc.Metric, 'return_names',
                                       (calc.Metric.__name__,)))
         needs_tree = max([c.IsPhylogenetic for c in self.Calcs])
-        if needs_tree:
+        if not needs_tree:
+            tree = None
+        elif isinstance(tree_path, TreeIndex):
+            tree = tree_path
+        elif [c for c in self.Calcs if c.IsPhylogenetic and
+              c.Metric is not fast_unifrac.PD_whole_tree]:
             tree = self.getTree(tree_path)
         else:
-            tree = None
+            # index the tree once for all of the calcs
+            tree = TreeIndex.from_tree(self.getTree(tree_path))
+        # the per-sample reductions used by the table-wide metrics are
+        # computed once, and shared by all of them
+        if [c for c in self.Calcs if c.Metric is fast_unifrac.PD_whole_tree or
+                (not c.IsPhylogenetic and is_sparse_alpha_metric(c.Metric))]:
+            sample_stats = SampleStats.from_table(otu_table)
+        else:
+            sample_stats = None
         # calculations
         res = []
         for c in self.Calcs:
             # add either calc's multiple return value names, or fn name
-            metric_res = c(data_path=data_path,
+            metric_res = c(data_path=otu_table,
                            taxon_names=otu_table.ObservationIds,
                            tree_path=tree,
-                           sample_names=otu_table.SampleIds)
+                           sample_names=otu_table.SampleIds,
+                           sample_stats=sample_stats)
             if len(metric_res.shape) == 1:
                 res.append(metric_res)
             elif len(metric_res.shape) == 2:
@@ -222,6 +278,15 @@ class AlphaDiversityCalcs(FunctionWithParams):
         return res
 
 
+def _check_tips_in_tree(tip_indices):
+    """Raise a ValueError if none of the OTUs of tip_indices are in the tree"""
+    if not (tip_indices >= 0).any():
+        # as raised by cogent's PD_whole_tree
+        raise ValueError("No valid samples/environments found. Check "
+                         "whether tree tips match otus/taxa present "
+                         "in samples/environments")
+
+
 def get_nonphylogenetic_metric(name):
     """Gets metric by name from list in this module
     """
@@ -294,7 +359,15 @@ cup_metrics = [
 # starr, not yet needs tests]
 
 
-def single_file_alpha(infilepath, metrics, outfilepath, tree_path):
+def single_file_alpha(infilepath, metrics, outfilepath, tree_path,
+                      tree_cache_dir=None):
+    """Compute metrics for the OTU table at infilepath
+
+    tree_path: path to the newick tree, or a qiime.tree_index.TreeIndex of
+     it (required for the phylogenetic metrics)
+    tree_cache_dir: directory in which to cache the TreeIndex of the tree
+     (see TreeIndex.from_newick_file)
+    """
     metrics_list = metrics
     try:
         metrics_list = metrics_list.split(',')
@@ -321,6 +394,9 @@ def single_file_alpha(infilepath, metrics, outfilepath, tree_path):
     all_calcs = AlphaDiversityCalcs(calcs)
 
     try:
+        if isinstance(tree_path, str) and \
+                [c for c in calcs if c.IsPhylogenetic]:
+            tree_path = TreeIndex.from_newick_file(tree_path, tree_cache_dir)
         result = all_calcs(data_path=infilepath, tree_path=tree_path,
                            result_path=outfilepath, log_path=None)
         if result:  # can send to stdout instead of file
@@ -331,13 +407,17 @@ def single_file_alpha(infilepath, metrics, outfilepath, tree_path):
         exit(1)
 
 
-def multiple_file_alpha(input_path, output_path, metrics, tree_path=None):
+def multiple_file_alpha(input_path, output_path, metrics, tree_path=None,
+                        tree_cache_dir=None):
     """ performs minimal error checking on input args, then calls os.system
     to execute single_file_alpha for each file in the input directory
 
     this is to facilitate future task farming - replace os.system with
     write to file, each command is independant
 
+    the tree is indexed once (or loaded from tree_cache_dir, see
+    TreeIndex.from_newick_file) and shared by all of the files
+
     """
     file_names = os.listdir(input_path)
     file_names = [fname for fname in file_names if not fname.startswith('.')]
@@ -350,12 +430,14 @@ def multiple_file_alpha(input_path, output_path, metrics, tree_path=None):
     except AttributeError:
         pass
 
+    needs_tree = False
     for metric in metrics_list:
         try:
             metric_f = get_nonphylogenetic_metric(metric)
         except AttributeError:
             try:
                 metric_f = get_phylogenetic_metric(metric)
+                needs_tree = True
                 # bail if we got a phylo metric but no tree file
                 if tree_path is None:
                     raise ValueError("phylogenetic metric supplied, but no " +
@@ -368,6 +450,9 @@ def multiple_file_alpha(input_path, output_path, metrics, tree_path=None):
                     "could not find metric.  %s.\n Known metrics are: %s\n"
                     % (metric, ', '.join(list_known_cup_metrics())))
 
+    if needs_tree:
+        tree_path = TreeIndex.from_newick_file(tree_path, tree_cache_dir)
+
     for fname in file_names:
         # future: try to make sure fname is a valid otu file
 
@@ -378,6 +463,286 @@ def multiple_file_alpha(input_path, output_path, metrics, tree_path=None):
                           output_fp, tree_path)
 
 
+def collated_rarefaction_alpha(otu_table, depths, num_reps, metrics,
+                               tree=None, include_small_samples=False,
+                               empty_otus_removed=True, replace=False,
+                               seed=None, jobs_to_start=1):
+    """ rarefies otu_table and computes alpha diversity, collated by metric
+
+    otu_table: the otu table to rarefy
+    depths, num_reps, include_small_samples, replace, seed: as for
+     qiime.rarefaction.iter_nested_rare_data
+    metrics: comma separated list of metrics; or list
+    tree: cogent.core.tree.PhyloNode object, or qiime.tree_index.TreeIndex
+     (required for PD_whole_tree)
+    empty_otus_removed: as for multiple_rarefactions.py, whether OTUs which
+     aren't observed in a rarefied table are removed from it before
+     computing the metrics
+    jobs_to_start: number of worker processes used for the samples
+
+    Returns (metric names, sample ids, {metric name: rows}), where the rows
+     are those that collate_alpha.py would write for the metric after
+     running multiple_rarefactions.py --nested (with the same seed) and
+     alpha_diversity.py. The rarefied tables are never built: each sample is
+     rarefied to all of the depths of a rep at once, and the metrics are
+     computed from the rarefied counts straight away (for each table at
+     once where there is a table-wide version of the metric, otherwise for
+     each sample in the worker processes). PD_whole_tree is
+     computed on a TreeIndex of tree, so it agrees with cogent's
+     PD_whole_tree up to floating point rounding.
+    """
+    metrics_list = metrics
+    try:
+        metrics_list = metrics_list.split(',')
+    except AttributeError:
+        pass
+
+    calcs = []
+    for metric in metrics_list:
+        try:
+            metric_f = get_nonphylogenetic_metric(metric)
+            is_phylogenetic = False
+        except AttributeError:
+            try:
+                metric_f = get_phylogenetic_metric(metric)
+                is_phylogenetic = True
+            except AttributeError:
+                raise ValueError(
+                    "could not find metric.  %s.\n Known metrics are: %s\n"
+                    % (metric, ', '.join(list_known_metrics())))
+            if tree is None:
+                raise ValueError("phylogenetic metric supplied, but no " +
+                                 "phylogenetic tree supplied")
+        calcs.append(AlphaDiversityCalc(metric_f, is_phylogenetic))
+    calc_names = []
+    for calc in calcs:
+        calc_names.extend(getattr(calc.Metric, 'return_names',
+                                  (calc.Metric.__name__,)))
+
+    # the metrics which can't be computed for a whole table at once are
+    # computed for each sample by the workers
+    per_sample_calcs = [calc for calc in calcs
+                        if calc.IsPhylogenetic or
+                        not is_sparse_alpha_metric(calc.Metric)]
+
+    sample_counts, depths, seed = get_nested_rarefaction_data(
+        otu_table, depths, include_small_samples, seed)
+    sample_ids = otu_table.SampleIds
+    num_otus = len(otu_table.ObservationIds)
+    if tree is not None:
+        if isinstance(tree, TreeIndex):
+            tree_index = tree
+        else:
+            tree_index = TreeIndex.from_tree(tree)
+        otu_tip_indices = tree_index.get_tip_indices(otu_table.ObservationIds)
+        if [calc for calc in calcs if calc.IsPhylogenetic]:
+            _check_tips_in_tree(otu_tip_indices)
+    else:
+        tree_index = otu_tip_indices = None
+    data = (sample_counts, depths, seed, replace, per_sample_calcs,
+            tree_index, otu_tip_indices)
+
+    # the samples in each table (as in get_rare_data)
+    kept_samples = []
+    for depth in depths:
+        kept_samples.append([i for i, (nonzero, counts)
+                             in enumerate(sample_counts)
+                             if include_small_samples or
+                             counts.sum() >= depth])
+    kept_sample_sets = map(set, kept_samples)
+
+    if jobs_to_start > 1 and len(sample_counts) > 1:
+        pool = Pool(jobs_to_start,
+                    initializer=_set_worker_rarefaction_alpha_data,
+                    initargs=(data,))
+        chunksize = max(1, len(sample_counts) // (jobs_to_start * 4))
+    else:
+        pool = None
+
+    tables = []
+    try:
+        for rep in range(num_reps):
+            tasks = [(i, rep) for i in range(len(sample_counts))]
+            if pool is not None:
+                rare_counts = pool.imap(_rarefy_sample_worker, tasks,
+                                        chunksize)
+            else:
+                rare_counts = (_rarefy_sample(data, i, rep)
+                               for i, rep in tasks)
+            rare_counts = list(rare_counts)
+
+            # lay out each sample's counts in each table as they would be
+            # in the table's sample vectors, so that the metrics see
+            # exactly the same vectors as alpha_diversity.py
+            table_otus = []
+            for j, depth in enumerate(depths):
+                if empty_otus_removed:
+                    observed = [sample_counts[i][0][_get_rare_counts(
+                        sample_counts[i], rare_counts[i], j) > 0]
+                        for i in kept_samples[j]]
+                    table_otus.append(unique(concatenate(
+                        observed or [zeros(0, dtype=int)])))
+                else:
+                    table_otus.append(arange(num_otus))
+            tasks = []
+            depth_vectors = [([], [], []) for depth in depths]
+            for i, sample_rare_counts in enumerate(rare_counts):
+                sample_vectors = []
+                for j in range(len(depths)):
+                    if (i not in kept_sample_sets[j] or
+                            len(table_otus[j]) == 0):
+                        continue
+                    counts = _get_rare_counts(sample_counts[i],
+                                              sample_rare_counts, j)
+                    positions = searchsorted(table_otus[j],
+                                             sample_counts[i][0][counts > 0])
+                    sample_vectors.append((j, positions, len(table_otus[j])))
+                    depth_vectors[j][0].append(len(positions))
+                    depth_vectors[j][1].append(positions)
+                    depth_vectors[j][2].append(counts[counts > 0])
+                tasks.append((i, sample_rare_counts, sample_vectors))
+            if not per_sample_calcs:
+                results = ([] for task in tasks)
+            elif pool is not None:
+                results = pool.imap(_rarefaction_alpha_worker, tasks,
+                                    chunksize)
+            else:
+                results = (_rarefaction_alpha_sample(data, *task)
+                           for task in tasks)
+
+            rep_values = [{} for depth in depths]
+            for i, sample_values in enumerate(results):
+                for j, values in sample_values:
+                    rep_values[j][i] = values
+            for j, depth in enumerate(depths):
+                if not kept_samples[j] or len(table_otus[j]) == 0:
+                    # an empty table, which wouldn't be written
+                    continue
+                f_samples = [sample_ids[i] for i in kept_samples[j]]
+                per_sample_values = array(
+                    [rep_values[j].get(i, []) for i in kept_samples[j]],
+                    dtype=float).reshape((len(f_samples), -1))
+                # the metrics which are computed for the whole table
+                lengths, positions, values = depth_vectors[j]
+                sample_stats = SampleStats(SampleVectors(
+                    concatenate([[0], lengths]).cumsum(),
+                    concatenate(positions), concatenate(values),
+                    len(table_otus[j])))
+                columns = []
+                per_sample_column = 0
+                for calc in calcs:
+                    num_columns = len(getattr(calc.Metric, 'return_names',
+                                              (None,)))
+                    if calc in per_sample_calcs:
+                        value = per_sample_values[
+                            :, per_sample_column:
+                            per_sample_column + num_columns]
+                        per_sample_column += num_columns
+                    else:
+                        value = sparse_alpha(sample_stats, calc.Metric,
+                                             calc.Params)
+                    columns.append(asarray(value, dtype=float).reshape(
+                        (len(f_samples), num_columns)))
+                f_data = concatenate(columns, axis=1)
+                tables.append((depth, rep, f_samples, f_data))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    if not tables:
+        raise ValueError("All of the rarefied OTU tables are empty.")
+    # collate_alpha.py takes the samples from the shallowest table
+    all_samples = list(min(tables, key=lambda table: table[0])[2])
+    rows = {}
+    for metric in calc_names:
+        if metric in rows:
+            # e.g. singles, which osd also returns
+            continue
+        rows[metric] = [
+            make_output_row(calc_names, metric, f_samples, f_data,
+                            'alpha_rarefaction_%s_%s.txt' % (depth, rep),
+                            len(all_samples), all_samples)
+            for depth, rep, f_samples, f_data in tables]
+    return calc_names, all_samples, rows
+
+
+def write_collated_rarefaction_alpha(result, output_dir):
+    """ writes collated_rarefaction_alpha's result as collate_alpha.py does
+    """
+    calc_names, all_samples, rows = result
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    for metric in calc_names:
+        if metric in rows:
+            write_output_file(rows.pop(metric), output_dir, metric,
+                              all_samples)
+
+
+def _get_rare_counts(sample_counts, sample_rare_counts, depth_index):
+    """ returns a sample's counts in the table at depth_index """
+    if depth_index < len(sample_rare_counts):
+        return sample_rare_counts[depth_index]
+    # too few sequences to rarefy to this depth
+    return sample_counts[1]
+
+
+def _rarefy_sample(data, sample_index, rep):
+    sample_counts, depths, seed, replace = data[:4]
+    return nested_rarefy_sample(sample_counts[sample_index], depths, seed,
+                                sample_index, rep, replace)
+
+
+def _rarefaction_alpha_sample(data, sample_index, sample_rare_counts,
+                              sample_vectors):
+    """ returns [(depth index, metric values)] for one sample of a rep """
+    (sample_counts, depths, seed, replace, calcs, tree_index,
+     otu_tip_indices) = data
+    nonzero, counts = sample_counts[sample_index]
+
+    if tree_index is not None:
+        # the first depth at which each of the sample's OTUs is observed
+        present = sample_rare_counts > 0
+        first_depths = where(present.any(0), present.argmax(0),
+                             len(sample_rare_counts))
+        tip_indices = otu_tip_indices[nonzero]
+        in_tree = tip_indices >= 0
+        pds = tree_index.nested_pd(tip_indices[in_tree],
+                                   first_depths[in_tree], len(depths))
+
+    result = []
+    for j, positions, num_otus in sample_vectors:
+        sample_counts_j = _get_rare_counts(sample_counts[sample_index],
+                                           sample_rare_counts, j)
+        sample_v = zeros(num_otus)
+        sample_v[positions] = sample_counts_j[sample_counts_j > 0]
+        values = []
+        for calc in calcs:
+            if calc.IsPhylogenetic:
+                values.append(pds[j])
+                continue
+            value = calc.Metric(sample_v, **calc.Params)
+            if hasattr(calc.Metric, 'return_names'):
+                values.extend(value)
+            else:
+                values.append(value)
+        result.append((j, values))
+    return result
+
+
+def _set_worker_rarefaction_alpha_data(data):
+    global _worker_rarefaction_alpha_data
+    _worker_rarefaction_alpha_data = data
+
+
+def _rarefy_sample_worker(task):
+    return _rarefy_sample(_worker_rarefaction_alpha_data, *task)
+
+
+def _rarefaction_alpha_worker(task):
+    return _rarefaction_alpha_sample(_worker_rarefaction_alpha_data, *task)
+
+
 def single_file_cup(otu_filepath, metrics, outfilepath, r, alpha, f, ci_type):
     """Compute variations of the conditional uncovered probability.
 
@@ -107,3 +107,38 @@ def seq_to_bits(seq, nt_to_bits):
         bitstring += nt_to_bits[nt]
     bits = numpy.array(map(int, bitstring))
     return bits
+
+
+class BarcodeCorrector(object):
+
+    """ corrects barcodes via a lookup table, decoding each barcode once
+
+    correction_fn is called as correction_fn(barcode, *args) the first time
+    a barcode is seen, and the result is stored so that later occurrences of
+    the same barcode are a dict lookup. Any additional args must be the same
+    for every call on a given BarcodeCorrector (e.g., the list of valid
+    barcodes for a run), as only the barcode is used as the lookup key.
+
+    precomputed: dict of barcode -> result to seed the table with, e.g. the
+     results for the barcodes in the mapping file
+    max_size: the maximum number of barcodes to store. Once the table is full
+     new barcodes are still corrected but their results are not stored, which
+     bounds memory use on very noisy barcode reads.
+    """
+
+    def __init__(self, correction_fn, precomputed=None, max_size=2 ** 22):
+        self.correction_fn = correction_fn
+        self.max_size = max_size
+        if precomputed is None:
+            self.lookup = {}
+        else:
+            self.lookup = dict(precomputed)
+
+    def __call__(self, barcode, *args):
+        try:
+            return self.lookup[barcode]
+        except KeyError:
+            result = self.correction_fn(barcode, *args)
+            if len(self.lookup) < self.max_size:
+                self.lookup[barcode] = result
+            return result
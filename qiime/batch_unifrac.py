@@ -0,0 +1,343 @@
+#!/usr/bin/env python
+from __future__ import division
+
+__author__ = "Justin Kuczynski"
+__copyright__ = "Copyright 2011, The QIIME Project"
+__credits__ = ["Justin Kuczynski", "Rob Knight", "Greg Caporaso"]
+__license__ = "GPL"
+__version__ = "1.8.0-dev"
+__maintainer__ = "Justin Kuczynski"
+__email__ = "justinak@gmail.com"
+
+"""UniFrac distances for all pairs of samples from a single tree index.
+
+cogent's fast_unifrac indexes the tree and propagates the sample counts up
+the tree every time it is called, and the one_sample variant does the same
+for every row of a distance matrix. UniFracIndex does this once: the tree is
+indexed into postorder arrays, and the node x sample counts are summed up
+the tree in a single pass. Any combination of the weighted and unweighted
+UniFrac variants can then be computed from the same index, in tiles of
+sample pairs which can be spread over a pool of worker processes. The
+workers are forked after the index is built, so they share its arrays
+rather than receiving copies of them.
+"""
+
+from multiprocessing import Pool
+import warnings
+
+from numpy import abs as np_abs, arange, asarray, zeros, int64
+from cogent.maths.unifrac.fast_tree import (index_tree, get_branch_lengths,
+                                            unifrac, unnormalized_unifrac, G,
+                                            unnormalized_G, weighted_unifrac)
+
+from qiime.sparse_beta_diversity import get_tiles, get_tile_size_for_density
+
+# UniFrac variants which can be computed from a UniFracIndex, mapped to the
+# (weighted, metric) arguments that cogent's fast_unifrac would be passed
+unifrac_variants = {
+    'unweighted_unifrac': (False, unifrac),
+    'unweighted_unifrac_full_tree': (False, unnormalized_unifrac),
+    'weighted_unifrac': (True, weighted_unifrac),
+    'weighted_normalized_unifrac': ('correct', weighted_unifrac),
+    'unifrac_g': (False, G),
+    'unifrac_g_full_tree': (False, unnormalized_G),
+}
+
+
+def get_unifrac_variant(weighted, metric):
+    """Return the name of the UniFrac variant for fast_unifrac's arguments
+
+    Returns None if the combination isn't one of unifrac_variants.
+    """
+    if weighted:
+        # fast_unifrac ignores the metric for weighted UniFrac
+        if weighted == 'correct':
+            return 'weighted_normalized_unifrac'
+        return 'weighted_unifrac'
+    for name, (variant_weighted, variant_metric) in unifrac_variants.items():
+        if not variant_weighted and variant_metric is metric:
+            return name
+    return None
+
+
+class UniFracIndex(object):
+
+    """A tree and sample counts indexed for computing UniFrac distances
+
+    The tree (pruned to the taxa in taxon_names if make_subtree is True) is
+    indexed with cogent's index_tree, so node and branch length order is the
+    same as in fast_unifrac. Only samples with a nonzero count for at least
+    one tip of the tree are indexed; distances involving the other samples
+    are set as in qiime.beta_metrics (1 to other samples, 0 to themselves
+    and to each other).
+    """
+
+    def __init__(self, data, taxon_names, tree, sample_names,
+                 make_subtree=True):
+        """Index the tree and the samples x taxa count matrix data"""
+        data = asarray(data)
+        if data.shape != (len(sample_names), len(taxon_names)):
+            raise ValueError(
+                "Shape of matrix %s doesn't match # samples and # taxa (%s and %s)" %
+                (data.shape, len(sample_names), len(taxon_names)))
+        self.SampleNames = list(sample_names)
+
+        if make_subtree:
+            tree = tree.copy()
+            wanted = set(taxon_names)
+
+            def delete_test(node):
+                return node.istip() and node.Name not in wanted
+            tree.removeDeleted(delete_test)
+            tree.prune()
+
+        node_index, child_index = index_tree(tree)
+        self.BranchLengths = get_branch_lengths(node_index)
+        self.TotalBranchLength = self.BranchLengths.sum()
+        num_nodes = len(node_index)
+
+        tips = tree.tips()
+        tip_rows = {}
+        for tip in tips:
+            tip_rows[tip.Name] = tip._leaf_index
+        taxon_rows = []
+        taxon_cols = []
+        for i, taxon in enumerate(taxon_names):
+            if taxon in tip_rows:
+                taxon_rows.append(tip_rows[taxon])
+                taxon_cols.append(i)
+        tip_data = data[:, taxon_cols]
+
+        # samples with no counts on the tree are left out of the index
+        present = (tip_data != 0).any(1)
+        self.PresentSampleIndices = present.nonzero()[0]
+        if len(self.PresentSampleIndices) == 0:
+            raise ValueError("No valid samples/environments found. Check whether tree tips match otus/taxa present in samples/environments")
+
+        # sum the counts up the tree, in postorder (counts are truncated to
+        # integers as in fast_unifrac)
+        counts = zeros((num_nodes, len(self.PresentSampleIndices)), int64)
+        counts[taxon_rows] = tip_data[self.PresentSampleIndices].T
+        for node, start, end in child_index:
+            counts[node] = counts[start:end + 1].sum(0)
+        tip_indices = [tip._leaf_index for tip in tips]
+        sample_sums = counts[tip_indices].sum(0)
+
+        # distance from the root to each tip (zero for internal nodes),
+        # for branch length correction of weighted UniFrac
+        tip_distances = self.BranchLengths.copy()
+        for node in tree.traverse(self_before=True, self_after=False):
+            if node is not tree:
+                tip_distances[node._leaf_index] += \
+                    tip_distances[node.Parent._leaf_index]
+        tip_mask = zeros(num_nodes)
+        tip_mask[tip_indices] = 1
+        tip_distances *= tip_mask
+
+        # nodes which aren't covered by any sample never contribute to a
+        # distance, so only the others are kept. All pairs are computed
+        # over the same nodes, so each distance depends only on the pair of
+        # samples and not on the tile it was computed in.
+        nodes = (counts != 0).any(1).nonzero()[0]
+        self.NodeBranchLengths = self.BranchLengths[nodes]
+        # samples x nodes, so that the rows of a tile are contiguous
+        self.Counts = counts[nodes].T.copy()
+        self.Presence = (self.Counts != 0) * self.NodeBranchLengths
+        self.Fractions = self.Counts / sample_sums[:, None]
+        self.SampleLengths = self.Presence.sum(1)
+        self.SampleTipDistances = \
+            (self.Fractions * tip_distances[nodes]).sum(1)
+
+    def _get_tile_size(self):
+        num_nodes = len(self.NodeBranchLengths)
+        return get_tile_size_for_density(num_nodes, num_nodes)
+
+    def compute_tile(self, variants, row_indices, col_indices):
+        """Return {variant: (row x col distances, col x row distances)}
+
+        row_indices and col_indices are indices of present samples.
+        """
+        row_indices = asarray(row_indices, dtype=int)
+        col_indices = asarray(col_indices, dtype=int)
+        num_rows = len(row_indices)
+        num_cols = len(col_indices)
+
+        result = {}
+        unweighted = [v for v in variants if not unifrac_variants[v][0]]
+        if unweighted:
+            a_present = self.Presence[row_indices]
+            b_present = self.Presence[col_indices] != 0
+            shared = zeros((num_rows, num_cols))
+            for i, present in enumerate(a_present):
+                shared[i] = (present * b_present).sum(1)
+            a_lengths = self.SampleLengths[row_indices][:, None]
+            b_lengths = self.SampleLengths[col_indices][None, :]
+            union = a_lengths + b_lengths - shared
+            for variant in unweighted:
+                metric = unifrac_variants[variant][1]
+                if metric is unifrac:
+                    d = 1 - (shared / union)
+                    result[variant] = (d, d.T)
+                elif metric is unnormalized_unifrac:
+                    d = (union - shared) / self.TotalBranchLength
+                    result[variant] = (d, d.T)
+                elif metric is G:
+                    result[variant] = ((a_lengths - shared) / union,
+                                       ((b_lengths - shared) / union).T)
+                elif metric is unnormalized_G:
+                    result[variant] = (
+                        (a_lengths - shared) / self.TotalBranchLength,
+                        ((b_lengths - shared) / self.TotalBranchLength).T)
+
+        weighted = [v for v in variants if unifrac_variants[v][0]]
+        if weighted:
+            b_fractions = self.Fractions[col_indices]
+            d = zeros((num_rows, num_cols))
+            for i, fractions in enumerate(self.Fractions[row_indices]):
+                d[i] = (np_abs(fractions - b_fractions) *
+                        self.NodeBranchLengths).sum(1)
+            for variant in weighted:
+                if unifrac_variants[variant][0] == 'correct':
+                    corrected = d / (
+                        self.SampleTipDistances[row_indices][:, None] +
+                        self.SampleTipDistances[col_indices][None, :])
+                    result[variant] = (corrected, corrected.T)
+                else:
+                    result[variant] = (d, d.T)
+        return result
+
+    def _check_variants(self, variants):
+        for variant in variants:
+            if variant not in unifrac_variants:
+                raise ValueError("Unknown UniFrac variant: %s" % variant)
+
+    def distance_matrices(self, variants, tile_size=None, jobs_to_start=1):
+        """Return {variant: distance matrix} for all samples
+
+        variants: names of UniFrac variants (keys of unifrac_variants)
+        tile_size: number of samples in each row and column block of a tile
+        jobs_to_start: number of worker processes used to compute tiles
+
+        Matrices are in the order of the sample names the index was built
+        with.
+        """
+        self._check_variants(variants)
+        num_present = len(self.PresentSampleIndices)
+        if tile_size is None:
+            tile_size = self._get_tile_size()
+        tiles = get_tiles(num_present, tile_size)
+
+        present_dists = dict([(v, zeros((num_present, num_present)))
+                              for v in variants])
+        for (row_indices, col_indices), result in zip(
+                tiles, self._map_tiles(variants, tiles, jobs_to_start)):
+            rows = slice(row_indices[0], row_indices[-1] + 1)
+            cols = slice(col_indices[0], col_indices[-1] + 1)
+            for variant, (d, d_t) in result.items():
+                present_dists[variant][rows, cols] = d
+                present_dists[variant][cols, rows] = d_t
+
+        num_samples = len(self.SampleNames)
+        present = self.PresentSampleIndices
+        missing = sorted(set(range(num_samples)) - set(present))
+        for i in missing:
+            warnings.warn('unifrac had no information for sample ' +
+                          self.SampleNames[i] +
+                          ". Distances involving that sample aren't meaningful")
+        results = {}
+        for variant, dists in present_dists.items():
+            dists[arange(num_present), arange(num_present)] = 0.0
+            if not missing:
+                results[variant] = dists
+                continue
+            full_dists = zeros((num_samples, num_samples))
+            full_dists[:, missing] = 1.0
+            full_dists[missing, :] = 1.0
+            for i in missing:
+                full_dists[i, missing] = 0.0
+            full_dists[present[:, None], present[None, :]] = dists
+            results[variant] = full_dists
+        return results
+
+    def distance_rows(self, variants, row_sample_names, tile_size=None,
+                      jobs_to_start=1):
+        """Return {variant: distances from each row sample to all samples}
+
+        variants: names of UniFrac variants (keys of unifrac_variants)
+        row_sample_names: names of the samples for the rows of the result
+        tile_size: number of samples in each row and column block of a tile
+        jobs_to_start: number of worker processes used to compute tiles
+
+        As with the one_sample metrics in qiime.beta_metrics, a row sample
+        without counts on the tree is at distance 1 from all other samples.
+        """
+        self._check_variants(variants)
+        num_samples = len(self.SampleNames)
+        sample_index = dict([(s, i) for i, s in enumerate(self.SampleNames)])
+        present_index = dict([(s, i) for i, s in
+                              enumerate(self.PresentSampleIndices)])
+        row_indices = [sample_index[s] for s in row_sample_names]
+        present_rows = [(row, present_index[i])
+                        for row, i in enumerate(row_indices)
+                        if i in present_index]
+
+        if tile_size is None:
+            tile_size = self._get_tile_size()
+        row_blocks = [present_rows[start:start + tile_size]
+                      for start in range(0, len(present_rows), tile_size)]
+        num_present = len(self.PresentSampleIndices)
+        col_blocks = [range(start, min(start + tile_size, num_present))
+                      for start in range(0, num_present, tile_size)]
+        tiles = [([i for row, i in row_block], col_block)
+                 for row_block in row_blocks for col_block in col_blocks]
+        tile_rows = [[row for row, i in row_block]
+                     for row_block in row_blocks for col_block in col_blocks]
+
+        results = {}
+        for variant in variants:
+            # row samples are at distance 1 from samples without counts
+            results[variant] = zeros((len(row_indices), num_samples)) + 1.0
+        for rows, (ignored, col_indices), result in zip(
+                tile_rows, tiles,
+                self._map_tiles(variants, tiles, jobs_to_start)):
+            cols = self.PresentSampleIndices[col_indices]
+            for variant, (d, d_t) in result.items():
+                results[variant][asarray(rows)[:, None], cols[None, :]] = d
+
+        for row, i in enumerate(row_indices):
+            if i not in present_index:
+                warnings.warn('unifrac had no information on sample ' +
+                              self.SampleNames[i] +
+                              ". Distances involving that sample aren't meaningful")
+                for variant in variants:
+                    results[variant][row] = 1.0
+            for variant in variants:
+                results[variant][row, i] = 0.0
+        return results
+
+    def _map_tiles(self, variants, tiles, jobs_to_start):
+        """Compute tiles, in a pool of worker processes if jobs_to_start > 1
+        """
+        if jobs_to_start > 1 and len(tiles) > 1:
+            pool = Pool(jobs_to_start,
+                        initializer=_set_worker_unifrac_index,
+                        initargs=(self, variants))
+            try:
+                return pool.map(_compute_unifrac_tile_worker, tiles)
+            finally:
+                pool.close()
+                pool.join()
+        return [self.compute_tile(variants, row_indices, col_indices)
+                for row_indices, col_indices in tiles]
+
+
+def _set_worker_unifrac_index(unifrac_index, variants):
+    global _worker_unifrac_index, _worker_variants
+    _worker_unifrac_index = unifrac_index
+    _worker_variants = variants
+
+
+def _compute_unifrac_tile_worker(tile):
+    row_indices, col_indices = tile
+    return _worker_unifrac_index.compute_tile(_worker_variants, row_indices,
+                                              col_indices)
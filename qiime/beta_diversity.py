@@ -39,8 +39,14 @@ from biom.parse import parse_biom_table
 from biom.table import DenseTable
 from qiime.util import (FunctionWithParams, TreeMissingError,
                         OtuMissingError)
-from qiime.format import format_matrix, format_distance_matrix
+from qiime.format import (format_matrix, format_distance_matrix,
+                          create_binary_distance_matrix,
+                          write_binary_distance_matrix)
 from qiime.parse import parse_newick, PhyloNode
+from qiime.sparse_beta_diversity import (SampleVectors, is_sparse_beta_metric,
+                                         iter_multiple_sparse_beta_rows,
+                                         sparse_beta)
+from qiime.batch_unifrac import UniFracIndex
 import qiime.beta_metrics
 
 
@@ -192,8 +198,163 @@ class BetaDiversityCalc(FunctionWithParams):
         return format_distance_matrix(sample_names, data)
 
 
+def get_otu_matrix(otu_table):
+    """Returns the dense samples x observations matrix of otu_table"""
+    if isinstance(otu_table, DenseTable):
+        return otu_table._data.T
+    else:
+        return asarray([v for v in otu_table.iterSampleData()])
+
+
+def use_sparse_beta(otu_table, metric_f, is_phylogenetic, rowids):
+    """Returns True if metric_f should be computed from sparse sample vectors
+
+    The sparse path is used for full distance matrices of non-phylogenetic
+    metrics which depend only on the pair of samples being compared.
+    """
+    return (rowids is None and not is_phylogenetic and
+            is_sparse_beta_metric(metric_f) and
+            len(otu_table.ObservationIds) > 0)
+
+
+def _get_metric_f(metric, tree):
+    """Returns (metric_f, is_phylogenetic), or exits if metric is unknown"""
+    try:
+        metric_f = get_nonphylogenetic_metric(metric)
+        is_phylogenetic = False
+    except AttributeError:
+        try:
+            metric_f = get_phylogenetic_metric(metric)
+            is_phylogenetic = True
+            if tree is None:
+                stderr.write("metric %s requires a tree, but none found\n"
+                             % (metric,))
+                exit(1)
+        except AttributeError:
+            stderr.write("Could not find metric %s.\n\nKnown metrics are: %s\n"
+                         % (metric, ', '.join(list_known_metrics())))
+            exit(1)
+    return metric_f, is_phylogenetic
+
+
+def _get_row_dissims(otumtx, otu_table, metric, metric_f, is_phylogenetic,
+                     tree, rowid, full_tree):
+    """Returns the dissimilarities between rowid and all samples"""
+    rowidx = otu_table.SampleIds.index(rowid)
+
+    # first test if we can the dissim is a fn of only the pair
+    # if not, just calc the whole matrix
+    if metric_f.__name__ == 'dist_chisq' or \
+            metric_f.__name__ == 'dist_gower' or \
+            metric_f.__name__ == 'dist_hellinger' or\
+            metric_f.__name__ == 'binary_dist_chisq':
+        warnings.warn('dissimilarity ' + metric_f.__name__ +
+                      ' is not parallelized, calculating the whole matrix...')
+        return metric_f(otumtx)[rowidx]
+
+    try:
+        row_metric = get_phylogenetic_row_metric(metric)
+    except AttributeError:
+        # do element by element
+        dissims = []
+        for i in range(len(otu_table.SampleIds)):
+            if is_phylogenetic:
+                dissim = metric_f(otumtx[[rowidx, i], :],
+                                  otu_table.ObservationIds, tree,
+                                  [otu_table.SampleIds[rowidx],
+                                   otu_table.SampleIds[i]],
+                                  make_subtree=(not full_tree))[0, 1]
+            else:
+                dissim = metric_f(otumtx[[rowidx, i], :])[0, 1]
+            dissims.append(dissim)
+        return dissims
+    else:
+        # do whole row at once
+        return row_metric(otumtx, otu_table.ObservationIds, tree,
+                          otu_table.SampleIds, rowid,
+                          make_subtree=(not full_tree))
+
+
+def iter_beta_dissims(otu_table, metric_fs, tree, rowids=None,
+                      full_tree=False, jobs_to_start=1):
+    """Generates (metric, dissims) for each of metric_fs
+
+    otu_table -- a otu_table in the biom format
+    metric_fs -- list of (metric name, metric function, is_phylogenetic)
+    tree -- a phylonode cogent tree object if needed by the metrics
+    rowids -- comma seperated string; if given, dissims are the rows of the
+     distance matrix for these samples, rather than the full matrix
+    full_tree -- if True, the tree isn't pruned to the otus in otu_table
+    jobs_to_start -- number of processes used by UniFrac metrics
+
+    The dense otu matrix is built once for all of the metrics, and all of
+    the UniFrac metrics are computed from a single UniFracIndex (i.e., the
+    tree is indexed, and the counts summed up the tree, only once).
+    """
+    otumtx = get_otu_matrix(otu_table)
+    if rowids is None:
+        rowids_list = None
+    else:
+        rowids_list = rowids.split(',')
+
+    unifrac_variants = []
+    for metric, metric_f, is_phylogenetic in metric_fs:
+        variant = getattr(metric_f, 'unifrac_variant', None)
+        if variant and variant not in unifrac_variants:
+            unifrac_variants.append(variant)
+    if unifrac_variants:
+        try:
+            unifrac_index = UniFracIndex(otumtx, otu_table.ObservationIds,
+                                         tree, otu_table.SampleIds,
+                                         make_subtree=(not full_tree))
+        except ValueError as e:
+            if 'No valid samples' not in str(e):
+                raise e
+            # none of the samples are on the tree, which the metrics
+            # themselves handle
+            unifrac_variants = []
+    if unifrac_variants:
+        if rowids_list is None:
+            unifrac_dissims = unifrac_index.distance_matrices(
+                unifrac_variants, jobs_to_start=jobs_to_start)
+        else:
+            unifrac_dissims = unifrac_index.distance_rows(
+                unifrac_variants, rowids_list, jobs_to_start=jobs_to_start)
+
+    for metric, metric_f, is_phylogenetic in metric_fs:
+        variant = getattr(metric_f, 'unifrac_variant', None)
+        if variant in unifrac_variants:
+            dissims = unifrac_dissims[variant]
+            if rowids_list is not None:
+                dissims = list(dissims)
+        elif rowids_list is not None:
+            # only calc d(rowid1, *) for each rowid
+            dissims = [_get_row_dissims(otumtx, otu_table, metric, metric_f,
+                                        is_phylogenetic, tree, rowid,
+                                        full_tree)
+                       for rowid in rowids_list]
+        elif is_phylogenetic:
+            dissims = metric_f(otumtx, otu_table.ObservationIds, tree,
+                               otu_table.SampleIds,
+                               make_subtree=(not full_tree))
+        else:
+            dissims = metric_f(otumtx)
+        yield metric, dissims
+
+
+def get_beta_output_fp(output_dir, metric, input_basename,
+                       binary_output=False):
+    """Returns the path of the distance matrix file written for metric"""
+    if binary_output:
+        ext = '.dm'
+    else:
+        ext = '.txt'
+    return os.path.join(output_dir, metric + '_' + input_basename + ext)
+
+
 def single_file_beta(input_path, metrics, tree_path, output_dir,
-                     rowids=None, full_tree=False):
+                     rowids=None, full_tree=False, jobs_to_start=1,
+                     tree=None, binary_output=False):
     """ does beta diversity calc on a single otu table
 
     uses name in metrics to name output beta diversity files
@@ -205,6 +366,15 @@ def single_file_beta(input_path, metrics, tree_path, output_dir,
      tree_path (str)
      output_dir (str)
      rowids (comma separated str)
+     jobs_to_start (int, number of processes used by UniFrac metrics and by
+      metrics which are computed from sparse sample vectors)
+     tree (PhyloNode, used instead of reading tree_path if given)
+     binary_output (bool, write the distance matrices in the binary format
+      read by qiime.parse.parse_binary_distmat, rather than as text)
+
+    The otu table and tree are loaded once for all of the metrics. Metrics
+    which are computed from sparse sample vectors are computed together in
+    a single pass over the samples, as are the UniFrac metrics.
     """
     metrics_list = metrics
     try:
@@ -212,103 +382,82 @@ def single_file_beta(input_path, metrics, tree_path, output_dir,
     except AttributeError:
         pass
 
-    otu_table = parse_biom_table(open(input_path, 'U'))
+    if binary_output and rowids is not None:
+        raise ValueError("Binary output is only supported for full distance "
+                         "matrices.")
 
-    if isinstance(otu_table, DenseTable):
-        otumtx = otu_table._data.T
-    else:
-        otumtx = asarray([v for v in otu_table.iterSampleData()])
+    otu_table = parse_biom_table(open(input_path, 'U'))
 
-    if tree_path:
+    if tree is None and tree_path:
         tree = parse_newick(open(tree_path, 'U'),
                             PhyloNode)
-    else:
-        tree = None
+
+    # look up all of the metrics before computing any of them
+    metric_fs = [(metric,) + _get_metric_f(metric, tree)
+                 for metric in metrics_list]
 
     input_dir, input_filename = os.path.split(input_path)
     input_basename, input_ext = os.path.splitext(input_filename)
-    for metric in metrics_list:
-        outfilepath = os.path.join(output_dir, metric + '_' +
-                                   input_basename + '.txt')
-        try:
-            metric_f = get_nonphylogenetic_metric(metric)
-            is_phylogenetic = False
-        except AttributeError:
-            try:
-                metric_f = get_phylogenetic_metric(metric)
-                is_phylogenetic = True
-                if tree is None:
-                    stderr.write("metric %s requires a tree, but none found\n"
-                                 % (metric,))
-                    exit(1)
-            except AttributeError:
-                stderr.write("Could not find metric %s.\n\nKnown metrics are: %s\n"
-                             % (metric, ', '.join(list_known_metrics())))
-                exit(1)
+    outfilepaths = dict([(metric, get_beta_output_fp(output_dir, metric,
+                                                     input_basename,
+                                                     binary_output))
+                         for metric in metrics_list])
+
+    sparse_metric_fs = [(metric, metric_f)
+                        for metric, metric_f, is_phylogenetic in metric_fs
+                        if use_sparse_beta(otu_table, metric_f,
+                                           is_phylogenetic, rowids)]
+    if sparse_metric_fs:
+        sample_vectors = SampleVectors.from_table(otu_table)
+        rows = iter_multiple_sparse_beta_rows(
+            sample_vectors, [metric_f for metric, metric_f in sparse_metric_fs],
+            jobs_to_start=jobs_to_start)
+        # write each row as soon as it's computed
+        if binary_output:
+            dists = [create_binary_distance_matrix(
+                     map(str, otu_table.SampleIds), outfilepaths[metric])
+                     for metric, metric_f in sparse_metric_fs]
+            for i, metric_rows in rows:
+                for j, row in enumerate(metric_rows):
+                    dists[j][i] = row
+            # closing the memory maps writes out the distances
+            del dists
+        else:
+            fs = [open(outfilepaths[metric], 'w')
+                  for metric, metric_f in sparse_metric_fs]
+            for f in fs:
+                f.write('\t'.join([''] + map(str, otu_table.SampleIds)))
+            for i, metric_rows in rows:
+                for f, row in zip(fs, metric_rows):
+                    f.write('\n')
+                    f.write('\t'.join([str(otu_table.SampleIds[i])] +
+                                      map(str, row)))
+            for f in fs:
+                f.close()
+
+    sparse_metrics = set([metric for metric, metric_f in sparse_metric_fs])
+    metric_fs = [m for m in metric_fs if m[0] not in sparse_metrics]
+    if not metric_fs:
+        return
+
+    for metric, dissims in iter_beta_dissims(otu_table, metric_fs, tree,
+                                             rowids, full_tree,
+                                             jobs_to_start):
+        if binary_output:
+            write_binary_distance_matrix(map(str, otu_table.SampleIds),
+                                         dissims, outfilepaths[metric])
+            continue
+        f = open(outfilepaths[metric], 'w')
         if rowids is None:
-            # standard, full way
-            if is_phylogenetic:
-                dissims = metric_f(otumtx, otu_table.ObservationIds,
-                                   tree, otu_table.SampleIds, make_subtree=(not full_tree))
-            else:
-                dissims = metric_f(otumtx)
-            f = open(outfilepath, 'w')
             f.write(format_distance_matrix(otu_table.SampleIds, dissims))
-            f.close()
         else:
-            # only calc d(rowid1, *) for each rowid
-            rowids_list = rowids.split(',')
-            row_dissims = []  # same order as rowids_list
-            for rowid in rowids_list:
-                rowidx = otu_table.SampleIds.index(rowid)
-
-                # first test if we can the dissim is a fn of only the pair
-                # if not, just calc the whole matrix
-                if metric_f.__name__ == 'dist_chisq' or \
-                        metric_f.__name__ == 'dist_gower' or \
-                        metric_f.__name__ == 'dist_hellinger' or\
-                        metric_f.__name__ == 'binary_dist_chisq':
-                    warnings.warn('dissimilarity ' + metric_f.__name__ +
-                                  ' is not parallelized, calculating the whole matrix...')
-                    row_dissims.append(metric_f(otumtx)[rowidx])
-                else:
-                    try:
-                        row_metric = get_phylogenetic_row_metric(metric)
-                    except AttributeError:
-                        # do element by element
-                        dissims = []
-                        for i in range(len(otu_table.SampleIds)):
-                            if is_phylogenetic:
-                                dissim = metric_f(otumtx[[rowidx, i], :],
-                                                  otu_table.ObservationIds, tree,
-                                                  [otu_table.SampleIds[rowidx],
-                                                   otu_table.SampleIds[i]],
-                                                  make_subtree=(not full_tree))[0, 1]
-                            else:
-                                dissim = metric_f(otumtx[[rowidx, i], :])[0, 1]
-                            dissims.append(dissim)
-                        row_dissims.append(dissims)
-                    else:
-                        # do whole row at once
-                        dissims = row_metric(otumtx,
-                                             otu_table.ObservationIds, tree,
-                                             otu_table.SampleIds, rowid,
-                                             make_subtree=(not full_tree))
-                        row_dissims.append(dissims)
-
-            # rows_outfilepath = os.path.join(output_dir, metric + '_' +\
-            #     '_'.join(rowids_list) + '_' + os.path.split(input_path)[1])
-            f = open(outfilepath, 'w')
-            f.write(
-                format_matrix(
-                    row_dissims,
-                    rowids_list,
-                    otu_table.SampleIds))
-            f.close()
+            f.write(format_matrix(dissims, rowids.split(','),
+                                  otu_table.SampleIds))
+        f.close()
 
 
 def single_object_beta(otu_table, metrics, tr, rowids=None,
-                       full_tree=False):
+                       full_tree=False, jobs_to_start=1):
     """mod of single_file_beta to recieve and return otu obj, tree str
 
     uses name in metrics to name output beta diversity files
@@ -320,95 +469,38 @@ def single_object_beta(otu_table, metrics, tr, rowids=None,
                 tr -- a phylonode cogent tree object if needed by the chosen beta
                                         diversity metric
                 rowids -- comma seperated string
+                jobs_to_start -- number of processes used by UniFrac metrics
+                                        and by metrics which are computed from
+                                        sparse sample vectors
     """
-    if isinstance(otu_table, DenseTable):
-        otumtx = otu_table._data.T
-    else:
-        otumtx = asarray([v for v in otu_table.iterSampleData()])
-
     if tr:
         tree = tr
     else:
         tree = None
 
-    metrics_list = metrics.split(',')
-
-    for metric in metrics_list:
-        try:
-            metric_f = get_nonphylogenetic_metric(metric)
-            is_phylogenetic = False
-        except AttributeError:
-            try:
-                metric_f = get_phylogenetic_metric(metric)
-                is_phylogenetic = True
-                if tree is None:
-                    stderr.write("metric %s requires a tree, but none found\n"
-                                 % (metric,))
-                    exit(1)
-            except AttributeError:
-                stderr.write("Could not find metric %s.\n\nKnown metrics are: %s\n"
-                             % (metric, ', '.join(list_known_metrics())))
-                exit(1)
+    # only the result of the first metric is returned
+    metric = metrics.split(',')[0]
+    metric_f, is_phylogenetic = _get_metric_f(metric, tree)
+    if use_sparse_beta(otu_table, metric_f, is_phylogenetic, rowids):
+        dissims = sparse_beta(SampleVectors.from_table(otu_table),
+                              metric_f, jobs_to_start=jobs_to_start)
+        return format_distance_matrix(otu_table.SampleIds,
+                                      dissims).split('\n')
+
+    for metric, dissims in iter_beta_dissims(
+            otu_table, [(metric, metric_f, is_phylogenetic)], tree, rowids,
+            full_tree, jobs_to_start):
         if rowids is None:
-            # standard, full way
-            if is_phylogenetic:
-                dissims = metric_f(otumtx, otu_table.ObservationIds, tree,
-                                   otu_table.SampleIds, make_subtree=(not full_tree))
-            else:
-                dissims = metric_f(otumtx)
-
-            return (
-                format_distance_matrix(
-                    otu_table.SampleIds,
-                    dissims).split(
-                    '\n')
-            )
+            return format_distance_matrix(otu_table.SampleIds,
+                                          dissims).split('\n')
         else:
-            # only calc d(rowid1, *) for each rowid
-            rowids_list = rowids.split(',')
-            row_dissims = []  # same order as rowids_list
-            for rowid in rowids_list:
-                rowidx = otu_table.SampleIds.index(rowid)
-
-                # first test if we can the dissim is a fn of only the pair
-                # if not, just calc the whole matrix
-                if metric_f.__name__ == 'dist_chisq' or \
-                        metric_f.__name__ == 'dist_gower' or \
-                        metric_f.__name__ == 'dist_hellinger' or\
-                        metric_f.__name__ == 'binary_dist_chisq':
-                    warnings.warn('dissimilarity ' + metric_f.__name__ +
-                                  ' is not parallelized, calculating the whole matrix...')
-                    row_dissims.append(metric_f(otumtx)[rowidx])
-                else:
-                    try:
-                        row_metric = get_phylogenetic_row_metric(metric)
-                    except AttributeError:
-                        # do element by element
-                        dissims = []
-                        for i in range(len(otu_table.SampleIds)):
-                            if is_phylogenetic:
-                                dissim = metric_f(otumtx[[rowidx, i], :],
-                                                  otu_table.ObservationIds, tree,
-                                                  [otu_table.SampleIds[rowidx],
-                                                   otu_table.SampleIds[i]],
-                                                  make_subtree=(not full_tree))[0, 1]
-                            else:
-                                dissim = metric_f(otumtx[[rowidx, i], :])[0, 1]
-                            dissims.append(dissim)
-                        row_dissims.append(dissims)
-                    else:
-                        # do whole row at once
-                        dissims = row_metric(otumtx,
-                                             otu_table.ObservationIds, tree,
-                                             otu_table.SampleIds, rowid,
-                                             make_subtree=(not full_tree))
-                        row_dissims.append(dissims)
-
-            return format_matrix(row_dissims, rowids_list, otu_table.SampleIds)
+            return format_matrix(dissims, rowids.split(','),
+                                 otu_table.SampleIds)
 
 
 def multiple_file_beta(input_path, output_dir, metrics, tree_path,
-                       rowids=None, full_tree=False):
+                       rowids=None, full_tree=False, jobs_to_start=1,
+                       binary_output=False):
     """ runs beta diversity for each input file in the input directory
 
     performs minimal error checking on input args, then calls single_file_beta
@@ -446,6 +538,14 @@ def multiple_file_beta(input_path, output_dir, metrics, tree_path,
                     "Could not find metric %s.\n\nKnown metrics are: %s\n"
                     % (metric, ', '.join(list_known_metrics())))
 
+    # parse the tree once for all of the input files
+    if tree_path:
+        tree = parse_newick(open(tree_path, 'U'), PhyloNode)
+    else:
+        tree = None
+
     for fname in file_names:
         single_file_beta(os.path.join(input_path, fname),
-                         metrics, tree_path, output_dir, rowids, full_tree)
+                         metrics, tree_path, output_dir, rowids, full_tree,
+                         jobs_to_start, tree=tree,
+                         binary_output=binary_output)
@@ -18,6 +18,7 @@ import cogent.maths.unifrac.fast_tree as fast_tree
  #    G, unnormalized_G, weighted_unifrac)
 from cogent.maths.unifrac.fast_unifrac import fast_unifrac, fast_unifrac_one_sample
 from qiime.parse import make_envs_dict
+from qiime.batch_unifrac import UniFracIndex, get_unifrac_variant
 import numpy
 import warnings
 
@@ -32,11 +33,28 @@ def make_unifrac_metric(weighted, metric, is_symmetric):
     is_symmetric: saves calc time if metric is symmetric.
     kwargs passed to fast_unifrac
     """
+    variant = get_unifrac_variant(weighted, metric)
+
     def result(data, taxon_names, tree, sample_names, **kwargs):
         """ wraps the fast_unifrac fn to return just a matrix, in correct order
 
             sample_names: list of unique strings
         """
+        if variant is not None and set(kwargs) <= set(['make_subtree']):
+            try:
+                unifrac_index = UniFracIndex(data, taxon_names, tree,
+                                             sample_names, **kwargs)
+            except ValueError as e:
+                if 'No valid samples' not in str(e):
+                    raise e
+                # as for fast_unifrac, which has no information on any of
+                # the samples (see _reorder_unifrac_res)
+                for sample_name in sample_names:
+                    warnings.warn('unifrac had no information for sample ' +
+                                  sample_name + ". Distances involving that "
+                                  "sample aren't meaningful")
+                return numpy.zeros((len(sample_names),) * 2)
+            return unifrac_index.distance_matrices([variant])[variant]
 
         envs = make_envs_dict(data, sample_names, taxon_names)
         unifrac_res = fast_unifrac(
@@ -45,6 +63,8 @@ def make_unifrac_metric(weighted, metric, is_symmetric):
         dist_mtx = _reorder_unifrac_res(unifrac_res['distance_matrix'],
                                         sample_names)
         return dist_mtx
+    # allows callers to compute several variants from one UniFracIndex
+    result.unifrac_variant = variant
     return result
 
 # these should start with dist_ to be discoverable by beta_diversity.py
@@ -76,12 +96,28 @@ def make_unifrac_row_metric(weighted, metric, is_symmetric):
     is_symmetric: ignored
     sample_name: of the sample corresponding to the row of the dissim mtx
     """
+    variant = get_unifrac_variant(weighted, metric)
+
     def result(data, taxon_names, tree, sample_names,
                one_sample_name, **kwargs):
         """ wraps the fast_unifrac fn to return just a matrix, in correct order
 
             sample_names: list of unique strings
         """
+        if variant is not None and set(kwargs) <= set(['make_subtree']):
+            # fast_unifrac_one_sample doesn't make a subtree by default
+            make_subtree = kwargs.get('make_subtree', False)
+            try:
+                unifrac_index = UniFracIndex(data, taxon_names, tree,
+                                             sample_names, make_subtree)
+            except ValueError as e:
+                if 'No valid samples' not in str(e):
+                    raise e
+                unifrac_index = None
+            if unifrac_index is not None:
+                return unifrac_index.distance_rows(
+                    [variant], [one_sample_name])[variant][0]
+
         envs = make_envs_dict(data, sample_names, taxon_names)
         try:
             unifrac_res = fast_unifrac_one_sample(one_sample_name,
@@ -99,6 +135,7 @@ def make_unifrac_row_metric(weighted, metric, is_symmetric):
         dist_mtx = _reorder_unifrac_res_one_sample(unifrac_res,
                                                    sample_names)
         return dist_mtx
+    result.unifrac_variant = variant
     return result
 
 one_sample_unweighted_unifrac = make_unifrac_row_metric(
@@ -0,0 +1,326 @@
+#!/usr/bin/env python
+from __future__ import division
+
+__author__ = "Greg Caporaso"
+__copyright__ = "Copyright 2011, The QIIME Project"
+__credits__ = ["Greg Caporaso"]
+__license__ = "GPL"
+__version__ = "1.8.0-dev"
+__maintainer__ = "Greg Caporaso"
+__email__ = "gregcaporaso@gmail.com"
+
+"""Compact, integer-indexed representation of OTU maps.
+
+An OTU map is usually held as a dict of {otu_id: [seq_ids]}, where each
+seq_id is of the form <sample_id>_<read_number>. For large runs this means
+tens of millions of small string and list objects. CompactOtuMap interns the
+sample ids and stores each read as a (sample index, read number) pair in
+array-backed columns, with a CSR-style offsets array delimiting the reads
+belonging to each OTU.
+"""
+
+from array import array
+from json import dumps, loads
+
+from numpy import (arange, asarray, bincount, diff, dtype, empty, fromfile,
+                   frombuffer, int32, int64, repeat, searchsorted, unique,
+                   zeros)
+
+compact_otu_map_magic = 'QIIME compact OTU map v1\n'
+
+
+class CompactOtuMap(object):
+
+    """An OTU map with interned sample ids and integer read numbers
+
+    Reads whose ids are not of the form <sample_id><delim><read_number>
+    (e.g. with no delimiter, or a non-integer suffix) are stored verbatim,
+    so iterating over the map always yields the original seq ids.
+    """
+
+    def __init__(self, otu_ids, sample_ids, offsets, sample_indices,
+                 read_numbers, irregular_ids=None, delim='_'):
+        """
+        otu_ids: list of OTU ids
+        sample_ids: list of interned sample ids
+        offsets: array of len(otu_ids) + 1 positions, where the reads of
+         the i-th OTU are at positions offsets[i]:offsets[i + 1]
+        sample_indices: index into sample_ids of each read
+        read_numbers: read number of each read, or -1 if the read's id is
+         stored verbatim in irregular_ids
+        irregular_ids: dict of {read position: seq_id} for reads whose ids
+         could not be split into a sample id and a read number
+        delim: the delimiter between sample id and read number
+        """
+        self.otu_ids = list(otu_ids)
+        self.sample_ids = list(sample_ids)
+        self.offsets = asarray(offsets, dtype=int64)
+        self.sample_indices = asarray(sample_indices, dtype=int32)
+        self.read_numbers = asarray(read_numbers, dtype=int64)
+        self.irregular_ids = irregular_ids or {}
+        self.delim = delim
+
+        if len(self.offsets) != len(self.otu_ids) + 1:
+            raise ValueError("Expected %d offsets, found %d." %
+                             (len(self.otu_ids) + 1, len(self.offsets)))
+        if not (len(self.sample_indices) == len(self.read_numbers) ==
+                self.offsets[-1]):
+            raise ValueError("Number of reads is inconsistent with offsets.")
+
+    @classmethod
+    def from_items(cls, otu_map_items, delim='_'):
+        """Build a CompactOtuMap from (otu_id, seq_ids) pairs
+
+        otu_map_items: iterable of (otu_id, seq_ids), e.g. the items of
+         an {otu_id: [seq_ids]} dict
+        delim: the delimiter between sample id and read number
+        """
+        otu_ids = []
+        sample_ids = []
+        sample_id_idx = {}
+        offsets = array('l', [0])
+        sample_indices = array('i')
+        read_numbers = array('l')
+        irregular_ids = {}
+        position = 0
+        for otu_id, seq_ids in otu_map_items:
+            otu_ids.append(otu_id)
+            for seq_id in seq_ids:
+                sample_id, read_number = _split_seq_id(seq_id, delim)
+                try:
+                    sample_index = sample_id_idx[sample_id]
+                except KeyError:
+                    sample_index = len(sample_ids)
+                    sample_id_idx[sample_id] = sample_index
+                    sample_ids.append(sample_id)
+                sample_indices.append(sample_index)
+                if read_number is None:
+                    irregular_ids[position] = seq_id
+                    read_numbers.append(-1)
+                else:
+                    read_numbers.append(read_number)
+                position += 1
+            offsets.append(position)
+        return cls(otu_ids, sample_ids,
+                   _array_to_numpy(offsets, int64),
+                   _array_to_numpy(sample_indices, int32),
+                   _array_to_numpy(read_numbers, int64),
+                   irregular_ids, delim)
+
+    @classmethod
+    def from_otu_map_lines(cls, otu_map_f, delim='_'):
+        """Build a CompactOtuMap from the lines of a classic OTU map file
+        """
+        return cls.from_items(_parse_otu_map_lines(otu_map_f), delim)
+
+    @classmethod
+    def load(cls, compact_otu_map_f):
+        """Load a CompactOtuMap written by CompactOtuMap.save
+
+        compact_otu_map_f: file object opened for reading in binary mode
+        """
+        if compact_otu_map_f.readline() != compact_otu_map_magic:
+            raise ValueError("File is not a compact OTU map.")
+        header = loads(compact_otu_map_f.readline())
+        n_otus = len(header['otu_ids'])
+        n_reads = header['n_reads']
+        offsets = fromfile(compact_otu_map_f, dtype=dtype('<i8'),
+                           count=n_otus + 1)
+        sample_indices = fromfile(compact_otu_map_f, dtype=dtype('<i4'),
+                                  count=n_reads)
+        read_numbers = fromfile(compact_otu_map_f, dtype=dtype('<i8'),
+                                count=n_reads)
+        if len(offsets) != n_otus + 1 or len(read_numbers) != n_reads:
+            raise ValueError("Compact OTU map file is truncated.")
+        # json gives back unicode, but ids are handled as str elsewhere
+        irregular_ids = dict((p, seq_id.encode('utf-8'))
+                             for p, seq_id in header['irregular_ids'])
+        return cls([i.encode('utf-8') for i in header['otu_ids']],
+                   [i.encode('utf-8') for i in header['sample_ids']],
+                   offsets, sample_indices, read_numbers, irregular_ids,
+                   header['delim'].encode('utf-8'))
+
+    def save(self, compact_otu_map_f):
+        """Write the map to compact_otu_map_f in the binary sidecar format
+
+        The format is a magic line, a one-line JSON header holding the
+        ids, and then the offsets, sample index and read number columns as
+        little-endian integers.
+
+        compact_otu_map_f: file object opened for writing in binary mode
+        """
+        header = {'delim': self.delim,
+                  'otu_ids': self.otu_ids,
+                  'sample_ids': self.sample_ids,
+                  'n_reads': len(self.read_numbers),
+                  'irregular_ids': sorted(self.irregular_ids.items())}
+        compact_otu_map_f.write(compact_otu_map_magic)
+        compact_otu_map_f.write(dumps(header))
+        compact_otu_map_f.write('\n')
+        compact_otu_map_f.write(self.offsets.astype('<i8').tostring())
+        compact_otu_map_f.write(self.sample_indices.astype('<i4').tostring())
+        compact_otu_map_f.write(self.read_numbers.astype('<i8').tostring())
+
+    def __len__(self):
+        return len(self.otu_ids)
+
+    def __iter__(self):
+        return iter(self.otu_ids)
+
+    def get_seq_ids(self, otu_index):
+        """Return the seq ids of the OTU at otu_index"""
+        start = self.offsets[otu_index]
+        end = self.offsets[otu_index + 1]
+        sample_ids = self.sample_ids
+        delim = self.delim
+        result = []
+        for position, sample_index, read_number in zip(
+                xrange(start, end),
+                self.sample_indices[start:end].tolist(),
+                self.read_numbers[start:end].tolist()):
+            if read_number < 0:
+                result.append(self.irregular_ids[position])
+            else:
+                result.append('%s%s%d' % (sample_ids[sample_index], delim,
+                                          read_number))
+        return result
+
+    def iteritems(self):
+        """Yield (otu_id, seq_ids) for each OTU, in order"""
+        for otu_index, otu_id in enumerate(self.otu_ids):
+            yield otu_id, self.get_seq_ids(otu_index)
+
+    def iter_lines(self):
+        """Yield the lines of the classic tab-separated OTU map"""
+        for otu_id, seq_ids in self.iteritems():
+            yield '%s\n' % '\t'.join([otu_id] + seq_ids)
+
+    def get_sample_otu_counts(self, otu_ids_to_exclude=None, delim='_'):
+        """Return the same result as qiime.parse.parse_otu_map
+
+        Returns a sparse dict of {(otu_idx, sample_idx): count}, the list of
+        sample ids and the list of otu ids, where sample ids are the part
+        of each seq id preceding the first delim.
+        """
+        if otu_ids_to_exclude is None:
+            otu_ids_to_exclude = {}
+
+        keep_otu = asarray([otu_id not in otu_ids_to_exclude
+                            for otu_id in self.otu_ids], dtype=bool)
+        otu_ids = [otu_id for otu_id, keep in zip(self.otu_ids, keep_otu)
+                   if keep]
+        reads_per_otu = diff(self.offsets)
+        read_otu_indices = repeat(arange(len(self.otu_ids)), reads_per_otu)
+        keep_read = keep_otu[read_otu_indices] if len(read_otu_indices) \
+            else zeros(0, dtype=bool)
+
+        # label each read with an integer standing for its table sample id.
+        # When splitting on our own delimiter, the part of a seq id before
+        # the first delim is the part of its interned sample id before the
+        # first delim, so this can be done per sample rather than per read.
+        labels = {}
+        if delim == self.delim:
+            sample_labels = [labels.setdefault(s.split(delim)[0], len(labels))
+                             for s in self.sample_ids]
+            sample_labels = asarray(sample_labels + [0], dtype=int64)
+            read_labels = sample_labels[self.sample_indices]
+        else:
+            read_labels = empty(len(self.read_numbers), dtype=int64)
+            for position in xrange(len(self.read_numbers)):
+                seq_id = self._get_seq_id(position)
+                read_labels[position] = labels.setdefault(
+                    seq_id.split(delim)[0], len(labels))
+
+        # number the table samples in order of their first appearance
+        kept_labels = read_labels[keep_read]
+        kept_otu_indices = read_otu_indices[keep_read]
+        label_names = [None] * len(labels)
+        for name, label in labels.iteritems():
+            label_names[label] = name
+        present_labels, first_seen = unique(kept_labels, return_index=True)
+        present_labels = present_labels[first_seen.argsort()]
+        sample_ids = [label_names[label] for label in present_labels]
+        label_to_sample_index = zeros(len(labels), dtype=int64)
+        label_to_sample_index[present_labels] = arange(len(present_labels))
+
+        # renumber the otus to skip excluded ones
+        otu_index_map = keep_otu.cumsum() - 1
+        rows = otu_index_map[kept_otu_indices]
+        cols = label_to_sample_index[kept_labels]
+        n_samples = max(len(sample_ids), 1)
+        cells = rows * n_samples + cols
+        unique_cells = unique(cells)
+        counts = bincount(searchsorted(unique_cells, cells))
+        cells = unique_cells
+        result = {}
+        for cell, count in zip(cells.tolist(), counts.tolist()):
+            result[divmod(cell, n_samples)] = count
+        return result, sample_ids, otu_ids
+
+    def _get_seq_id(self, position):
+        """Return the seq id of the read at position"""
+        read_number = self.read_numbers[position]
+        if read_number < 0:
+            return self.irregular_ids[position]
+        return '%s%s%d' % (self.sample_ids[self.sample_indices[position]],
+                           self.delim, read_number)
+
+
+def _split_seq_id(seq_id, delim):
+    """Split seq_id into (sample_id, read_number)
+
+    read_number is None if seq_id does not end in delim followed by an
+    integer that round-trips through str.
+    """
+    sample_id, found_delim, suffix = seq_id.rpartition(delim)
+    if not found_delim:
+        return seq_id, None
+    if suffix.isdigit() and len(suffix) < 19 and \
+            (suffix == '0' or not suffix.startswith('0')):
+        return sample_id, int(suffix)
+    return sample_id, None
+
+
+def _parse_otu_map_lines(otu_map_f):
+    """Yield (otu_id, seq_ids) from the lines of an OTU map file"""
+    for line in otu_map_f:
+        fields = line.strip().split('\t')
+        if not fields[0]:
+            continue
+        yield fields[0], fields[1:]
+
+
+def _array_to_numpy(a, dtype):
+    """Convert a stdlib array to a numpy array of dtype"""
+    if len(a) == 0:
+        return empty(0, dtype=dtype)
+    return frombuffer(a, dtype=a.typecode).astype(dtype)
+
+
+def is_compact_otu_map_file(fp):
+    """Return True if fp is a compact OTU map written by CompactOtuMap.save
+    """
+    f = open(fp, 'rb')
+    try:
+        return f.read(len(compact_otu_map_magic)) == compact_otu_map_magic
+    finally:
+        f.close()
+
+
+def load_otu_map(fp, delim='_'):
+    """Return a CompactOtuMap loaded from fp, in either format
+
+    fp may be either a compact OTU map written by CompactOtuMap.save or a
+    classic tab-separated OTU map.
+    """
+    if is_compact_otu_map_file(fp):
+        f = open(fp, 'rb')
+        try:
+            return CompactOtuMap.load(f)
+        finally:
+            f.close()
+    f = open(fp, 'U')
+    try:
+        return CompactOtuMap.from_otu_map_lines(f, delim)
+    finally:
+        f.close()
@@ -11,12 +11,14 @@ __maintainer__ = "Jai Ram Rideout"
 __email__ = "jai.rideout@gmail.com"
 
 from os.path import join
+from tempfile import NamedTemporaryFile
 from types import ListType
 
 from skbio.core.distance import DistanceMatrix
 
 from qiime.format import (format_anosim_results, format_best_results,
-                          format_permanova_results)
+                          format_distance_matrix, format_permanova_results)
+from qiime.parse import is_binary_distmat, parse_distmat
 from qiime.stats import Anosim, Best, Permanova
 from qiime.util import get_qiime_temp_dir, MetadataMap, RExecutor
 
@@ -24,7 +26,8 @@ methods = ['adonis', 'anosim', 'best', 'morans_i', 'mrpp', 'permanova',
            'permdisp', 'dbrda']
 
 
-def compare_categories(dm_fp, map_fp, method, categories, num_perms, out_dir):
+def compare_categories(dm_fp, map_fp, method, categories, num_perms, out_dir,
+                       jobs_to_start=1, best_stepwise=False):
     """Runs the specified statistical method using the category of interest.
 
     This method does not return anything; all output is written to results
@@ -43,6 +46,11 @@ def compare_categories(dm_fp, map_fp, method, categories, num_perms, out_dir):
         out_dir - path to the output directory where results files will be
             written. It is assumed that this directory already exists and we
             have write permissions to it
+        jobs_to_start - the number of processes to compute the ANOSIM or
+            PERMANOVA permutations, or the BEST combinations, in
+        best_stepwise - if True and method is 'best', search the
+            combinations of categories stepwise rather than exhaustively
+            (see qiime.stats.Best)
     """
 
     # Make sure we were passed a list of categories, not a single string.
@@ -66,7 +74,9 @@ def compare_categories(dm_fp, map_fp, method, categories, num_perms, out_dir):
         md_map = MetadataMap.parseMetadataMap(map_f)
 
     with open(dm_fp, 'U') as dm_f:
-        dm = DistanceMatrix.from_file(dm_f)
+        binary_dm = is_binary_distmat(dm_f)
+        dm_ids, dm_data = parse_distmat(dm_f)
+    dm = DistanceMatrix(dm_data, dm_ids)
 
     # Remove any samples from the mapping file that aren't in the distance
     # matrix (important for validation checks). Use strict=True so that an
@@ -96,6 +106,16 @@ def compare_categories(dm_fp, map_fp, method, categories, num_perms, out_dir):
                                  "there is only a single group)."
                                  % (category, method))
 
+        # The R scripts only read tab-delimited distance matrices, so hand
+        # them a temporary text copy of a binary one.
+        if binary_dm:
+            text_dm_f = NamedTemporaryFile(prefix='compare_categories_',
+                                           suffix='.txt',
+                                           dir=get_qiime_temp_dir())
+            text_dm_f.write(format_distance_matrix(dm_ids, dm_data))
+            text_dm_f.flush()
+            dm_fp = text_dm_f.name
+
         # Build the command arguments string.
         command_args = ['-d %s -m %s -c %s -o %s'
                         % (dm_fp, map_fp, categories[0], out_dir)]
@@ -130,21 +150,23 @@ def compare_categories(dm_fp, map_fp, method, categories, num_perms, out_dir):
         rex(command_args, '%s.r' % method, output_dir=out_dir)
     elif method == 'anosim':
         anosim = Anosim(md_map, dm, categories[0])
-        anosim_results = anosim(num_perms)
+        anosim_results = anosim(num_perms, jobs_to_start=jobs_to_start)
 
         out_f = open(join(out_dir, '%s_results.txt' % method), 'w+')
         out_f.write(format_anosim_results(anosim_results))
         out_f.close()
     elif method == 'best':
         best = Best(dm, md_map, categories)
-        best_results = best()
+        best_results = best(jobs_to_start=jobs_to_start,
+                            stepwise=best_stepwise)
 
         out_f = open(join(out_dir, '%s_results.txt' % method), 'w+')
         out_f.write(format_best_results(best_results))
         out_f.close()
     elif method == 'permanova':
         permanova = Permanova(md_map, dm, categories[0])
-        permanova_results = permanova(num_perms)
+        permanova_results = permanova(num_perms,
+                                      jobs_to_start=jobs_to_start)
 
         out_f = open(join(out_dir, '%s_results.txt' % method), 'w+')
         out_f.write(format_permanova_results(permanova_results))
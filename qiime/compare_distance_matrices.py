@@ -21,7 +21,7 @@ from qiime.stats import Mantel, MantelCorrelogram, PartialMantel
 
 def run_mantel_test(method, fps, distmats, num_perms, tail_type, comment,
                     control_dm_fp=None, control_dm=None,
-                    sample_id_map=None):
+                    sample_id_map=None, jobs_to_start=1):
     """Runs a Mantel test on all pairs of distance matrices.
 
     Returns a string suitable for writing out to a file containing the results
@@ -49,6 +49,8 @@ def run_mantel_test(method, fps, distmats, num_perms, tail_type, comment,
             then)
         sample_id_map - dict mapping sample IDs (i.e. what is expected by
             make_compatible_distance_matrices)
+        jobs_to_start - the number of processes to compute the permutations
+            of each test in
     """
     if len(fps) != len(distmats):
         raise ValueError("Must provide the same number of filepaths as there "
@@ -106,7 +108,8 @@ def run_mantel_test(method, fps, distmats, num_perms, tail_type, comment,
             # Create an instance of our correlation test and run it with
             # the specified number of permutations.
             if method == 'mantel':
-                results = Mantel(dm1, dm2, tail_type)(num_perms)
+                results = Mantel(dm1, dm2, tail_type)(
+                    num_perms, jobs_to_start=jobs_to_start)
                 p_str = format_p_value_for_num_iters(results['p_value'],
                                                      num_perms)
                 result += "%s\t%s\t%d\t%.5f\t%s\t%d\t%s\n" % (fp1, fp2,
@@ -115,7 +118,8 @@ def run_mantel_test(method, fps, distmats, num_perms, tail_type, comment,
                                                               num_perms, tail_type)
             elif method == 'partial_mantel':
                 cdm = DistanceMatrix(cdm_data, cdm_labels)
-                results = PartialMantel(dm1, dm2, cdm)(num_perms)
+                results = PartialMantel(dm1, dm2, cdm)(
+                    num_perms, jobs_to_start=jobs_to_start)
                 p_str = format_p_value_for_num_iters(results['mantel_p'],
                                                      num_perms)
                 result += "%s\t%s\t%s\t%d\t%.5f\t%s\t%d\t%s\n" % (fp1, fp2,
@@ -127,7 +131,8 @@ def run_mantel_test(method, fps, distmats, num_perms, tail_type, comment,
 
 def run_mantel_correlogram(fps, distmats, num_perms, comment, alpha,
                            sample_id_map=None,
-                           variable_size_distance_classes=False):
+                           variable_size_distance_classes=False,
+                           jobs_to_start=1):
     """Runs a Mantel correlogram analysis on all pairs of distance matrices.
 
     Returns a string suitable for writing out to a file containing the results
@@ -157,6 +162,8 @@ def run_mantel_correlogram(fps, distmats, num_perms, comment, alpha,
         variable_size_distance_classes - create distance classes that vary in
             size (i.e. width) but have the same number of distances in each
             class
+        jobs_to_start - the number of processes to compute the permutations
+            of each correlogram in
     """
     if len(fps) != len(distmats):
         raise ValueError("Must provide the same number of filepaths as there "
@@ -191,7 +198,7 @@ def run_mantel_correlogram(fps, distmats, num_perms, comment, alpha,
             # the specified number of permutations.
             mc = MantelCorrelogram(dm1, dm2, alpha=alpha,
                                    variable_size_distance_classes=variable_size_distance_classes)
-            results = mc(num_perms)
+            results = mc(num_perms, jobs_to_start=jobs_to_start)
 
             # Generate a name for the current correlogram and save it and the
             # correlogram itself.
@@ -32,7 +32,7 @@ from qiime.parse import QiimeParseError, MinimalQualParser
 from qiime.hamming import decode_barcode_8
 from qiime.golay import decode as decode_golay_12
 from qiime.check_id_map import process_id_map
-from qiime.barcode import correct_barcode
+from qiime.barcode import correct_barcode, BarcodeCorrector
 
 """ This library contains the code for demultiplexing 454 data.  Apart from
     barcode correction/mismatch counts, this code does not quality
@@ -219,6 +219,12 @@ def assign_seqs(file_data,
     log_data = initialize_log_data(ids_bcs_added_field)
     bc_freqs = defaultdict(int)
 
+    # exact matches need no correction, and every other barcode is only
+    # corrected the first time it is seen
+    bc_correction_f = BarcodeCorrector(
+        attempt_bc_correction,
+        precomputed=dict([(bc, (bc, 0)) for bc in all_bcs]))
+
     seq_counts = 0
     enum_val = start_index
     corrected_bc_count = [0, 0]
@@ -236,7 +242,8 @@ def assign_seqs(file_data,
                 bc, corrected_bc, num_errors, added_field =\
                     get_demultiplex_data(ids_bcs_added_field,
                                          fasta_label, fasta_seq, bc_lens, all_bcs, barcode_type,
-                                         max_bc_errors, disable_bc_correction, added_demultiplex_field)
+                                         max_bc_errors, disable_bc_correction, added_demultiplex_field,
+                                         bc_correction_f)
 
                 bc_freqs[bc] += 1
 
@@ -276,7 +283,8 @@ def assign_seqs(file_data,
                 bc, corrected_bc, num_errors, added_field =\
                     get_demultiplex_data(ids_bcs_added_field,
                                          fasta_label, fasta_seq, bc_lens, all_bcs, barcode_type,
-                                         max_bc_errors, disable_bc_correction, added_demultiplex_field)
+                                         max_bc_errors, disable_bc_correction, added_demultiplex_field,
+                                         bc_correction_f)
 
                 bc_freqs[bc] += 1
 
@@ -478,7 +486,8 @@ def get_demultiplex_data(ids_bcs_added_field,
                          barcode_type="golay_12",
                          max_bc_errors=1.5,
                          disable_bc_correction=False,
-                         added_demultiplex_field=None):
+                         added_demultiplex_field=None,
+                         bc_correction_f=None):
     """ Attempts to find bc in a given sequence and added demultiplex field
 
     ids_bcs_added_field:  dict of (barcode,added_demultiplex): SampleID
@@ -493,6 +502,9 @@ def get_demultiplex_data(ids_bcs_added_field,
     disable_bc_correction:  Only tests for exact matches to barcodes.
     added_demultiplex_field:  Uses data supplied in metadata mapping field
      and demultiplexes according to data in fasta labels.
+    bc_correction_f:  Function called as f(curr_bc, all_bcs, barcode_type)
+     to correct barcodes, e.g. a BarcodeCorrector wrapping
+     attempt_bc_correction (the default if None).
     """
 
     # To allow for variable length barcodes, need to step down from largest
@@ -503,7 +515,7 @@ def get_demultiplex_data(ids_bcs_added_field,
         corrected_bc, num_errors, added_field = get_curr_bc_added_field(
             curr_bc,
             ids_bcs_added_field, fasta_label, all_bcs, barcode_type,
-            disable_bc_correction, added_demultiplex_field)
+            disable_bc_correction, added_demultiplex_field, bc_correction_f)
 
         # Escape if exact hit found for barcode, only matters for variable
         # length barcodes.  Need special case for variable length barcodes
@@ -523,7 +535,8 @@ def get_curr_bc_added_field(curr_bc,
                             all_bcs,
                             barcode_type="golay_12",
                             disable_bc_correction=False,
-                            added_demultiplex_field=None):
+                            added_demultiplex_field=None,
+                            bc_correction_f=None):
     """ Attempts to correct barcode, get added demultiplex data
 
     curr_bc: current barcode sequence to attempt correction with
@@ -535,8 +548,13 @@ def get_curr_bc_added_field(curr_bc,
     disable_bc_correction:  Only tests for exact matches to barcodes.
     added_demultiplex_field:  Uses data supplied in metadata mapping field
      and demultiplexes according to data in fasta labels.
+    bc_correction_f:  Function called as f(curr_bc, all_bcs, barcode_type)
+     to correct barcodes. Defaults to attempt_bc_correction if None.
     """
 
+    if bc_correction_f is None:
+        bc_correction_f = attempt_bc_correction
+
     if added_demultiplex_field:
         added_field = get_added_demultiplex_field(ids_bcs_added_field,
                                                   fasta_label, added_demultiplex_field)
@@ -547,8 +565,8 @@ def get_curr_bc_added_field(curr_bc,
         num_errors = 0
         corrected_bc = get_exact_bc_matches(curr_bc, all_bcs)
     else:
-        corrected_bc, num_errors = attempt_bc_correction(curr_bc,
-                                                         all_bcs, barcode_type)
+        corrected_bc, num_errors = bc_correction_f(curr_bc,
+                                                   all_bcs, barcode_type)
 
     return corrected_bc, num_errors, added_field
 
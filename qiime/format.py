@@ -21,6 +21,7 @@ from skbio.core.sequence import BiologicalSequence
 from biom.table import DenseOTUTable, SparseTaxonTable, table_factory
 
 from qiime.util import get_qiime_library_version, load_qiime_config
+from qiime.parse import BINARY_DISTMAT_MAGIC
 from qiime.colors import data_color_hsv
 
 """Contains formatters for the files we expect to encounter in 454 workflow.
@@ -334,6 +335,41 @@ def format_distance_matrix(labels, data):
     return format_matrix(data, labels, labels)
 
 
+def create_binary_distance_matrix(labels, output_fp):
+    """Creates a binary distance matrix file, returning a map of its data
+
+    The file is written in the format read by
+    qiime.parse.parse_binary_distmat. The returned array is a writable
+    memory map of the (initially all zero) distances, so a large matrix can
+    be filled in (e.g., a row at a time) without holding it in memory. It
+    must be flushed or deleted once it has been filled in.
+    """
+    header = BINARY_DISTMAT_MAGIC + '\t'.join(map(str, labels))
+    # pad the header so that the distances are 8-byte aligned
+    header += ' ' * (-(len(header) + 1) % 8) + '\n'
+    f = open(output_fp, 'wb')
+    f.write(header)
+    f.close()
+    num_samples = len(labels)
+    if num_samples == 0:
+        return numpy.zeros((0, 0))
+    return numpy.memmap(output_fp, dtype='<f8', mode='r+', offset=len(header),
+                        shape=(num_samples, num_samples))
+
+
+def write_binary_distance_matrix(labels, data, output_fp):
+    """Writes distance matrix to output_fp in the binary format"""
+    data = asarray(data)
+    if data.shape != (len(labels), len(labels)):
+        raise ValueError(
+            "Data shape of %s doesn't match header size %s" %
+            (data.shape, len(labels)))
+    dists = create_binary_distance_matrix(labels, output_fp)
+    dists[:] = data
+    # closing the memory map writes out the distances
+    del dists
+
+
 def format_matrix(data, row_names, col_names):
     """Writes matrix as tab-delimited text.
 
@@ -51,11 +51,14 @@ TO DOs:
 
 
 def get_invalid_golay_barcodes(seqs):
+    seqs = list(seqs)
+    twelve_nt_seqs = [e for e in seqs if len(e) == 12]
+    num_errors = dict(zip(twelve_nt_seqs, decode_many(twelve_nt_seqs)[1]))
     result = []
     for e in seqs:
         if len(e) != 12:
             result.append(e)
-        elif decode(e)[1] > 0:
+        elif num_errors[e] > 0:
             result.append(e)
     return result
 
@@ -82,6 +85,33 @@ def decode(seq, nt_to_bits=None):
 decode_golay_12 = decode
 
 
+def decode_many(seqs, nt_to_bits=None):
+    """decodes many nucleotide strings of 12 bases at once
+
+    equivalent to calling decode on each sequence, but the barcodes are
+    packed into 24 bit integers and syndromes are computed with vectorized
+    bit operations and looked up in an integer-indexed syndrome table
+
+    inputs:
+    - seqs, a list of 12 base nucleotide strings
+    - nt_to_bits, e.g.: { "A":"11",  "C":"00", "T":"10", "G":"01"}
+    output:
+    corrected_seqs (list), num_bit_errors (numpy array)
+    corrected_seqs[i] is None if a 4 bit error was detected in seqs[i]"""
+    if nt_to_bits is None:
+        nt_to_bits = DEFAULT_GOLAY_NT_TO_BITS
+    received = _seqs_to_ints(seqs, nt_to_bits)
+    syndromes = numpy.zeros(len(received), dtype=numpy.int32)
+    for i, column in enumerate(_H_COLUMN_INTS):
+        syndromes ^= ((received >> (23 - i)) & 1) * column
+    errors = DEFAULT_SYNDROME_INT_LUT[syndromes]
+    num_errors = DEFAULT_SYNDROME_INT_LUT_WEIGHTS[syndromes]
+    corrected_seqs = _ints_to_seqs(received ^ errors, nt_to_bits)
+    for i in numpy.flatnonzero(errors < 0):
+        corrected_seqs[i] = None
+    return corrected_seqs, num_errors
+
+
 def encode(bits, nt_to_bits=None):
     """ takes any 12 bits, returns the golay 24bit codeword in nucleotide format
 
@@ -189,6 +219,59 @@ def _bits_to_seq(bits, nt_to_bits):
         bit2 = str(int(round(bits[i + 1])))
         seq += bits_to_nt[bit1 + bit2]
     return seq
+
+
+def _bits_to_int(bits):
+    """ e.g.: [0,0,0,1,1,0] -> 6 (first bit is most significant)"""
+    result = 0
+    for bit in bits:
+        result = (result << 1) | int(bit)
+    return result
+
+
+def _seqs_to_ints(seqs, nt_to_bits, seq_len=12):
+    """ packs nucleotide strings into an array of ints, 2 bits per base
+
+    the first base is in the most significant bits, so the packed bits are
+    in the same order as _seq_to_bits gives them. raises ValueError if a
+    sequence is not seq_len long or contains a base not in nt_to_bits
+    """
+    nt_values = numpy.empty(256, dtype=numpy.int32)
+    nt_values.fill(-1)
+    for nt, bits in nt_to_bits.items():
+        nt_values[ord(nt)] = int(bits, 2)
+
+    for seq in seqs:
+        if len(seq) != seq_len:
+            raise ValueError("All sequences must be %d bases long: %s"
+                             % (seq_len, seq))
+    codes = numpy.frombuffer(''.join(seqs), dtype=numpy.uint8)
+    values = nt_values[codes].reshape((len(seqs), seq_len))
+    if (values < 0).any():
+        bad_seq = seqs[numpy.flatnonzero((values < 0).any(axis=1))[0]]
+        raise ValueError("Only %s are valid bases: %s"
+                         % (','.join(sorted(nt_to_bits)), bad_seq))
+
+    result = numpy.zeros(len(seqs), dtype=numpy.int32)
+    for i in range(seq_len):
+        result = (result << 2) | values[:, i]
+    return result
+
+
+def _ints_to_seqs(ints, nt_to_bits, seq_len=12):
+    """ unpacks an array of ints into a list of nucleotide strings
+
+    inverse of _seqs_to_ints
+    """
+    value_to_nt = numpy.zeros(4, dtype=numpy.uint8)
+    for nt, bits in nt_to_bits.items():
+        value_to_nt[int(bits, 2)] = ord(nt)
+
+    ints = numpy.asarray(ints)
+    codes = numpy.empty((len(ints), seq_len), dtype=numpy.uint8)
+    for i in range(seq_len):
+        codes[:, i] = value_to_nt[(ints >> (2 * (seq_len - 1 - i))) & 3]
+    return codes.view('S%d' % seq_len).ravel().tolist()
 # end support fns
 
 
@@ -242,4 +325,20 @@ for errvec in _ALL_3BIT_ERRORS:
     syn = tuple(numpy.dot(DEFAULT_H, errvec) % 2)
     DEFAULT_SYNDROME_LUT[syn] = (errvec)
 
+# integer-indexed versions of the syndrome lookup table for decode_many.
+# index: syndrome packed into a 12 bit int. Val: 24 bit err packed into an
+# int (-1 if the syndrome indicates a 4 bit error), and the number of bit
+# errors
+DEFAULT_SYNDROME_INT_LUT = numpy.empty(2 ** 12, dtype=numpy.int32)
+DEFAULT_SYNDROME_INT_LUT.fill(-1)
+DEFAULT_SYNDROME_INT_LUT_WEIGHTS = numpy.empty(2 ** 12, dtype=numpy.int64)
+DEFAULT_SYNDROME_INT_LUT_WEIGHTS.fill(4)
+for syn, errvec in DEFAULT_SYNDROME_LUT.items():
+    DEFAULT_SYNDROME_INT_LUT[_bits_to_int(syn)] = _bits_to_int(errvec)
+    DEFAULT_SYNDROME_INT_LUT_WEIGHTS[_bits_to_int(syn)] = sum(errvec)
+
+# the columns of H packed into ints: the syndrome of a packed received
+# vector is the xor of the columns for each of its set bits
+_H_COLUMN_INTS = [_bits_to_int(column) for column in DEFAULT_H.T]
+
 # END module level constants
@@ -8,7 +8,8 @@ Run demo via command line: "python hamming.py"
 
 Author: Micah Hamady (hamady@colorado.edu)
 """
-from numpy import array
+from numpy import (array, arange, bitwise_xor, empty, flatnonzero, frombuffer,
+                   int32, ones, uint8, zeros)
 from functools import reduce
 __author__ = "Micah Hamady"
 __copyright__ = "Copyright 2011, The QIIME Project"
@@ -88,6 +89,69 @@ def decode_barcode_8(nt_barcode):
 # alt name for function to support consistency with golay
 decode_hamming_8 = decode_barcode_8
 
+
+def decode_many(nt_barcodes):
+    """ Decode many length 8 barcodes at once
+
+    Equivalent to calling decode_barcode_8 on each barcode, but each barcode
+    is packed into a 16 bit int which indexes a precomputed table of the
+    decoded codewords. Returns a list of corrected barcodes (None where the
+    barcode can't be corrected) and an array of the number of errors.
+    """
+    for nt_barcode in nt_barcodes:
+        if len(nt_barcode) != 8:
+            raise ValueError("barcode must be 8 nt long.")
+    codes = frombuffer(''.join(nt_barcodes), dtype=uint8)
+    values = NT_CODE_TO_INT[codes].reshape((len(nt_barcodes), 8))
+    if (values < 0).any():
+        raise ValueError("Only A,T,C,G valid chars.")
+
+    codewords = zeros(len(nt_barcodes), dtype=int32)
+    for i in range(8):
+        codewords = (codewords << 2) | values[:, i]
+
+    corrected = CODEWORD_LUT[codewords]
+    num_errors = CODEWORD_ERRORS_LUT[codewords]
+
+    corrected_codes = empty((len(nt_barcodes), 8), dtype=uint8)
+    for i in range(8):
+        corrected_codes[:, i] = INT_TO_NT_CODE[(corrected >> (14 - 2 * i)) & 3]
+    corrected_barcodes = corrected_codes.view('S8').ravel().tolist()
+    for i in flatnonzero(corrected < 0):
+        corrected_barcodes[i] = None
+    return corrected_barcodes, num_errors
+
+
+def _build_codeword_luts(n=16):
+    """ Decode every n bit codeword, returning corrected codewords and errors
+
+    Codewords are packed into ints with bit 0 of the codeword as the most
+    significant bit. Corrected codewords are -1 where there were too many
+    errors to correct.
+    """
+    codewords = arange(2 ** n)
+    bits = (codewords[:, None] >> arange(n - 1, -1, -1)) & 1
+    sym = bitwise_xor.reduce(bits * arange(n), axis=1)
+    extra_parity = bitwise_xor.reduce(bits[:, 1:], axis=1)
+    parity_ok = extra_parity == bits[:, 0]
+
+    corrected = codewords ^ (1 << (n - 1 - sym))
+    corrected[parity_ok] = codewords[parity_ok]
+    corrected[parity_ok & (sym != 0)] = -1
+
+    num_errors = ones(2 ** n)
+    num_errors[parity_ok] = 0
+    num_errors[parity_ok & (sym != 0)] = 2
+    return corrected.astype(int32), num_errors / 2.0
+
+# lookup tables for decode_many
+CODEWORD_LUT, CODEWORD_ERRORS_LUT = _build_codeword_luts()
+NT_CODE_TO_INT = -ones(256, dtype=int32)
+INT_TO_NT_CODE = zeros(4, dtype=uint8)
+for nt, value in CUR_ENC_FO.items():
+    NT_CODE_TO_INT[ord(nt)] = value
+    INT_TO_NT_CODE[value] = ord(nt)
+
 # mapping from barcode used to original sample id
 DEMO_SAMPLE_MAPPING = {
     "AACCATGC": "Sample 1",
@@ -22,6 +22,7 @@ from numpy import array, zeros
 from cogent.util.misc import flatten
 from qiime.format import format_otu_table
 from qiime.parse import parse_otu_map
+from qiime.compact_otu_map import CompactOtuMap
 from qiime.format import format_biom_table
 from biom.table import SparseOTUTable, DenseOTUTable, table_factory
 
@@ -44,7 +45,10 @@ def make_otu_table(otu_map_f,
                    sample_metadata=None,
                    constructor=SparseOTUTable):
 
-    data, sample_ids, otu_ids = parse_otu_map(otu_map_f, delim)
+    if isinstance(otu_map_f, CompactOtuMap):
+        data, sample_ids, otu_ids = otu_map_f.get_sample_otu_counts(delim)
+    else:
+        data, sample_ids, otu_ids = parse_otu_map(otu_map_f, delim)
 
     if otu_to_taxonomy is not None:
         otu_metadata = []
@@ -13,14 +13,21 @@ __email__ = "lkursell@gmail.com"
 from biom.parse import parse_biom_table
 from qiime.parse import parse_mapping_file_to_dict
 from numpy import (array, argsort, vstack, isnan, inf, nan, apply_along_axis,
-                   mean, zeros)
+                   mean, zeros, arange, concatenate, cumsum, dot, empty,
+                   errstate, finfo, log, maximum, minimum, newaxis, sign,
+                   sqrt, triu_indices, where)
+from numpy.random import permutation, randint
+from cogent.maths.stats import chisqprob
+from cogent.maths.stats.distribution import chi_high, f_high, tprob, zprob
 from qiime.pycogent_backports.test import (fisher_population_correlation,
                                            pearson, spearman, G_fit, ANOVA_one_way, kruskal_wallis, mw_test,
                                            mw_boot, t_paired, mc_t_two_sample, t_two_sample,
-                                           fisher, kendall, assign_correlation_pval, cscore)
+                                           fisher, kendall, assign_correlation_pval, cscore,
+                                           MACHEP)
 from qiime.util import biom_taxonomy_formatter
 from collections import defaultdict
 from itertools import izip
+from multiprocessing import Pool
 
 """
 Library for group_significance.py.
@@ -68,6 +75,14 @@ CORRELATION_PVALUE_CHOICES = [
     'parametric_t_distribution', 'fisher_z_transform',
     'bootstrapped', 'kendall']
 
+# number of entries in the largest arrays of each chunk of OTUs (times the
+# permutations or pairs of samples they are computed for at once) in the
+# batch tests
+_OTU_CHUNK_ENTRIES = 2 ** 22
+
+# number of permutations whose statistics are computed at once
+_PERMUTATION_BLOCK_SIZE = 100
+
 # Functions for group significance testing
 
 
@@ -152,6 +167,225 @@ def run_group_significance_test(data_generator, test, test_choices, reps=1000):
     return test_stats, pvals, means
 
 
+def group_significance_data(bt, cat_sam_indices):
+    """Return the OTU table as a 2D array with the samples of each group together.
+
+    Returns the (otu x sample) array, whose columns are the samples of each
+    group in the order of cat_sam_indices.values() (as for
+    group_significance_row_generator), and the number of samples in each
+    group.
+    Inputs:
+     bt - biom table object. Described at top of library.
+     cat_sam_indices - dict, output of get_sample_indices.
+    """
+    data = array([i for i in bt.iterObservationData()])
+    indices = cat_sam_indices.values()
+    return (data.take(concatenate(indices).astype(int), axis=1),
+            map(len, indices))
+
+
+def batch_group_significance_test(data, group_sizes, test, reps=1000,
+                                  jobs_to_start=1):
+    """Run any of the group significance tests on all OTUs at once.
+
+    The statistics of a chunk of OTUs are computed together with array
+    operations, rather than one OTU at a time, and the chunks are spread
+    over jobs_to_start processes. The results match those of
+    run_group_significance_test, except that the permutations (for
+    nonparametric_t_test) or bootstrap samples (for
+    bootstrap_mann_whitney_u) of the samples are drawn once, in this
+    process, and shared by all of the OTUs. The results for a given seed
+    therefore don't depend on jobs_to_start. If any group has a single
+    sample, the OTUs are tested one at a time with
+    run_group_significance_test.
+    Inputs:
+     data - 2D array, output of group_significance_data.
+     group_sizes - list of ints, output of group_significance_data.
+     test - string, key of GROUP_TEST_CHOICES.
+     reps - int, number of reps or permutations to do for the bootstrapped
+      tests.
+     jobs_to_start - int, number of processes to test the chunks of OTUs in.
+    Ouputs are lists of test statistics, p values, and means of each group.
+    """
+    if min(group_sizes) < 2:
+        bounds = cumsum([0] + list(group_sizes))
+        row_gen = izip(*[data[:, start:stop]
+                         for start, stop in zip(bounds[:-1], bounds[1:])])
+        return run_group_significance_test(row_gen, test, GROUP_TEST_CHOICES,
+                                           reps)
+
+    num_samples = data.shape[1]
+    if test == 'nonparametric_t_test':
+        samples = array([permutation(num_samples) for i in range(reps)])
+    elif test == 'bootstrap_mann_whitney_u':
+        samples = array([randint(0, num_samples, num_samples)
+                         for i in range(reps)])
+    else:
+        samples = None
+    task_data = (data, group_sizes, test, samples)
+    results = _run_otu_chunks(task_data, _group_significance_chunk,
+                              _set_worker_group_significance_data,
+                              _group_significance_worker, jobs_to_start)
+    test_stats = concatenate([r[0] for r in results])
+    pvals = concatenate([r[1] for r in results])
+    means = concatenate([r[2] for r in results])
+    return test_stats.tolist(), pvals.tolist(), means.tolist()
+
+
+def _group_significance_chunk(task_data, start, stop):
+    """Return the test statistics, p values and group means of some OTUs."""
+    data, group_sizes, test, samples = task_data
+    data = array(data[start:stop], dtype=float)
+    bounds = cumsum([0] + list(group_sizes))
+    groups = [data[:, b_start:b_stop]
+              for b_start, b_stop in zip(bounds[:-1], bounds[1:])]
+    means = array([group.mean(1) for group in groups]).T
+    num_groups = len(groups)
+    num_samples = data.shape[1]
+
+    with errstate(divide='ignore', invalid='ignore'):
+        if test == 'ANOVA':
+            grand_mean = data.mean(1)
+            within = sum([((group - group_mean[:, newaxis]) ** 2).sum(1)
+                          for group, group_mean in zip(groups, means.T)])
+            between = sum([len(group.T) * (group_mean - grand_mean) ** 2
+                           for group, group_mean in zip(groups, means.T)])
+            dfn = num_groups - 1
+            dfd = num_samples - num_groups
+            within /= dfd
+            test_stats = where(within == 0, nan, (between / dfn) / within)
+            pvals = _map_pvals(lambda F: f_high(dfn, dfd, F), test_stats)
+        elif test == 'g_test':
+            n = means.sum(1)
+            exp_freqs = n / num_groups
+            G = 2. * (means * log(means / exp_freqs[:, newaxis])).sum(1)
+            # williams correction
+            G /= 1. + (num_groups + 1.) / (6. * n)
+            # undefined for negative values, or a group with no observations
+            invalid = (data < 0).any(1) | ~(means > 0).all(1)
+            test_stats = where(invalid, nan, G)
+            pvals = _map_pvals(lambda G: chi_high(G, num_groups - 1),
+                               test_stats)
+        elif test == 'kruskal_wallis':
+            ranks, run_lengths = _rank_rows(data)
+            tot = sum([ranks[:, b_start:b_stop].sum(1) ** 2 /
+                       (b_stop - b_start)
+                       for b_start, b_stop in zip(bounds[:-1], bounds[1:])])
+            H = 12. / (num_samples * (num_samples + 1)) * tot - \
+                3. * (num_samples + 1)
+            D = 1. - (run_lengths ** 3 - run_lengths).sum(1) / \
+                float(num_samples ** 3 - num_samples)
+            test_stats = where(D == 0, nan, H / D)
+            pvals = _map_pvals(lambda H: chisqprob(H, num_groups - 1),
+                               test_stats)
+        elif test == 'parametric_t_test':
+            x, y = groups
+            ss = sum([((group - group_mean[:, newaxis]) ** 2).sum(1)
+                      for group, group_mean in zip(groups, means.T)])
+            test_stats = _t_stats(means[:, 0], means[:, 1], ss, len(x.T),
+                                  len(y.T))
+            # t_two_sample gives nan when neither group varies
+            test_stats[ss == 0] = nan
+            df = num_samples - 2
+            pvals = _map_pvals(lambda t: tprob(t, df), test_stats)
+        elif test == 'nonparametric_t_test':
+            x, y = groups
+            ss = sum([((group - group_mean[:, newaxis]) ** 2).sum(1)
+                      for group, group_mean in zip(groups, means.T)])
+            test_stats = _t_stats(means[:, 0], means[:, 1], ss, len(x.T),
+                                  len(y.T))
+            tolerance = sqrt(finfo(float).eps)
+            num_better = zeros(len(data))
+            for block_start in range(0, len(samples),
+                                     _PERMUTATION_BLOCK_SIZE):
+                perms = samples[block_start:
+                                block_start + _PERMUTATION_BLOCK_SIZE]
+                perm_t_stats = _permuted_t_stats(data, len(x.T), perms)
+                num_better += (abs(perm_t_stats) >=
+                               abs(test_stats)[:, newaxis] - tolerance).sum(1)
+            pvals = (num_better + 1) / (len(samples) + 1)
+            pvals[isnan(test_stats)] = nan
+        elif test in ('mann_whitney_u', 'bootstrap_mann_whitney_u'):
+            x, y = groups
+            test_stats, z = _mw_stats(data, len(x.T))
+            if test == 'mann_whitney_u':
+                pvals = _map_pvals(zprob, z)
+            else:
+                tol = MACHEP * 100
+                num_greater = zeros(len(data))
+                for block_start in range(0, len(samples),
+                                         _PERMUTATION_BLOCK_SIZE):
+                    block = samples[block_start:
+                                    block_start + _PERMUTATION_BLOCK_SIZE]
+                    # the rows are the OTUs times the bootstrap samples
+                    sampled = data[:, block].reshape(-1, num_samples)
+                    boot_u = _mw_stats(sampled, len(x.T))[0]
+                    num_greater += (boot_u.reshape(len(data), len(block)) >=
+                                    (test_stats - tol)[:, newaxis]).sum(1)
+                pvals = num_greater / len(samples)
+        else:
+            raise ValueError("Unknown group significance test: %s" % test)
+    return test_stats, pvals, means
+
+
+def _t_stats(mean1, mean2, ss, n1, n2):
+    """Return two sample t statistics from the group means and sums of squares.
+
+    As for t_two_sample with none_on_zero_variance=False, t is +/-inf if
+    neither group varies, or nan if they have the same mean as well.
+    """
+    svar = ss / (n1 + n2 - 2)
+    return (mean1 - mean2) / sqrt(svar * (1 / n1 + 1 / n2))
+
+
+def _permuted_t_stats(data, n1, perms):
+    """Return the t statistic of each row of data for each permutation.
+
+    The first n1 samples of each permutation (each row of perms) form the
+    first group. Returns an (OTU x permutation) array. The group sums are
+    computed as matrix products with the group membership of each
+    permutation, so the sums of squares are only exact up to rounding.
+    """
+    num_samples = data.shape[1]
+    n2 = num_samples - n1
+    in_x = zeros((num_samples, len(perms)))
+    in_x[perms[:, :n1].T, arange(len(perms))] = 1.
+    sums_x = dot(data, in_x)
+    sq_sums_x = dot(data ** 2, in_x)
+    sums_y = data.sum(1)[:, newaxis] - sums_x
+    sq_sums_y = (data ** 2).sum(1)[:, newaxis] - sq_sums_x
+    ss = maximum(sq_sums_x - sums_x ** 2 / n1, 0) + \
+        maximum(sq_sums_y - sums_y ** 2 / n2, 0)
+    return _t_stats(sums_x / n1, sums_y / n2, ss, n1, n2)
+
+
+def _mw_stats(data, n1):
+    """Return the Mann-Whitney U and its normal approximation for each row.
+
+    The first n1 samples form the first group. The z values are nan where
+    all of the values of a row are tied.
+    """
+    num_samples = data.shape[1]
+    n2 = num_samples - n1
+    ranks, run_lengths = _rank_rows(data)
+    C = n1 * n2 + n2 * (n2 + 1) / 2. - ranks[:, n1:].sum(1)
+    U = maximum(C, n1 * n2 - C)
+    T = (run_lengths ** 3 - run_lengths).sum(1)
+    denominator = sqrt((n1 * n2 / float(num_samples * (num_samples - 1))) *
+                       ((num_samples ** 3 - num_samples - T) / 12.))
+    z = where(denominator == 0, nan, (U - n1 * n2 / 2.) / denominator)
+    return U, z
+
+
+def _set_worker_group_significance_data(data):
+    global _group_significance_data
+    _group_significance_data = data
+
+
+def _group_significance_worker(bounds):
+    return _group_significance_chunk(_group_significance_data, *bounds)
+
+
 def group_significance_output_formatter(bt, test_stats, pvals, fdr_pvals,
                                         bon_pvals, means, cat_sample_indices, md_key):
     """Format the output for gradient tests so it can be easily written.
@@ -282,16 +516,8 @@ def correlation_row_generator(bt, pmf, category):
      cat_sam_indices - dict, output of get_sample_indices.
      category - str, category to pull continuous sample metadata from.
     """
-    data = array([i for i in bt.iterObservationData()])
-    # ensure that the order of the category vector sample values is the same
-    # as the order of the samples in data. otherwise will have hard to
-    # diagnose correspondence issues
-    try:
-        cat_vect = array([pmf[s][category] for s in bt.SampleIds], dtype=float)
-        return ((row, cat_vect) for row in data)
-    except ValueError:
-        raise ValueError("Mapping file category contained data that couldn't " +
-                         "be converted to float. Can't continue.")
+    data, cat_vect = correlation_data(bt, pmf, category)
+    return ((row, cat_vect) for row in data)
 
 
 def run_correlation_test(data_generator, test, test_choices,
@@ -323,6 +549,163 @@ def run_correlation_test(data_generator, test, test_choices,
     return corr_coefs, pvals
 
 
+def correlation_data(bt, pmf, category):
+    """Return the OTU table as a 2D array, and the metadata values of its samples.
+
+    The metadata values are in the order of the samples (the columns) of the
+    array, as for correlation_row_generator.
+    Inputs:
+     bt - biom table object. Described at top of library.
+     pmf - parsed mapping file. Described at top of library.
+     category - str, category to pull continuous sample metadata from.
+    """
+    data = array([i for i in bt.iterObservationData()])
+    # ensure that the order of the category vector sample values is the same
+    # as the order of the samples in data. otherwise will have hard to
+    # diagnose correspondence issues
+    try:
+        cat_vect = array([pmf[s][category] for s in bt.SampleIds], dtype=float)
+    except ValueError:
+        raise ValueError("Mapping file category contained data that couldn't " +
+                         "be converted to float. Can't continue.")
+    return data, cat_vect
+
+
+def batch_correlation_test(data, md_vals, test, pval_assignment_method,
+                           permutations=None, jobs_to_start=1):
+    """Run correlation tests on all OTUs at once.
+
+    The correlations of a chunk of OTUs are computed together with array
+    operations, rather than one OTU at a time, and the chunks are spread
+    over jobs_to_start processes. The results match those of
+    run_correlation_test, except that for bootstrapped pvalues the
+    permutations of md_vals are drawn once, in this process, and shared by
+    all of the OTUs. The results for a given seed therefore don't depend on
+    jobs_to_start.
+    Inputs:
+     data - 2D array, (otu x sample) output of correlation_data.
+     md_vals - 1D array, the metadata value of each sample.
+     test - str, one of CORRELATION_TEST_CHOICES keys.
+     pval_assignment_method - str, one of CORRELATION_PVALUE_CHOICES.
+     permutations - int or None, number of permutations to use for
+      bootstrapped methods.
+     jobs_to_start - int, number of processes to test the chunks of OTUs in.
+    """
+    if test not in CORRELATION_TEST_CHOICES:
+        raise ValueError("Unknown correlation test: %s" % test)
+    if len(md_vals) < 2:
+        raise ValueError("One or more vectors isn't long enough" +
+                         " to correlate or they have unequal lengths. Can't continue.")
+    if pval_assignment_method == 'bootstrapped':
+        if permutations is None:
+            raise ValueError('You must specify vectors, permutation ' +
+                             'function, and number of permutations to calculate ' +
+                             'bootstrapped pvalues. Cant continue.')
+        perms = array([permutation(len(md_vals))
+                       for i in range(permutations)])
+    else:
+        perms = None
+    task_data = (data, array(md_vals, dtype=float), test,
+                 pval_assignment_method, perms)
+    results = _run_otu_chunks(task_data, _correlation_chunk,
+                              _set_worker_correlation_data,
+                              _correlation_worker, jobs_to_start)
+    corr_coefs = concatenate([r[0] for r in results])
+    pvals = concatenate([r[1] for r in results])
+    return corr_coefs.tolist(), pvals.tolist()
+
+
+def _correlation_chunk(task_data, start, stop):
+    """Return the correlation coefficients and p values of some OTUs."""
+    data, md_vals, test, pval_assignment_method, perms = task_data
+    data = array(data[start:stop], dtype=float)
+    n = len(md_vals)
+    with errstate(divide='ignore', invalid='ignore'):
+        x, y = _prepare_correlation(test, data, md_vals)
+        corr_coefs = _correlation_stats(test, x, y[newaxis])[:, 0]
+        if pval_assignment_method == 'bootstrapped':
+            tolerance = sqrt(finfo(float).eps)
+            num_better = zeros(len(data))
+            for block_start in range(0, len(perms), _PERMUTATION_BLOCK_SIZE):
+                block = perms[block_start:
+                              block_start + _PERMUTATION_BLOCK_SIZE]
+                perm_coefs = _correlation_stats(test, x, y[block])
+                num_better += (abs(perm_coefs) >=
+                               abs(corr_coefs)[:, newaxis] - tolerance).sum(1)
+            pvals = num_better / float(len(perms))
+    if pval_assignment_method != 'bootstrapped':
+        # outside of the errstate, as the parametric p value of a correlation
+        # of +-1 is nan only if its division by zero raises an error
+        pvals = array([assign_correlation_pval(r, n, pval_assignment_method)
+                       for r in corr_coefs])
+    return corr_coefs, pvals
+
+
+def _prepare_correlation(test, data, md_vals):
+    """Return the OTU and metadata values in the form that test works on.
+
+    The prepared metadata values of a permutation of the samples are the
+    permuted prepared values, so they're only prepared once.
+    """
+    if test == 'spearman':
+        data = _rank_rows(data)[0]
+        md_vals = _rank_rows(md_vals[newaxis])[0][0]
+    if test in ('pearson', 'spearman'):
+        # center and scale each row, so that the correlation of two rows is
+        # their dot product
+        data = data - data.mean(1)[:, newaxis]
+        data /= sqrt((data ** 2).sum(1))[:, newaxis]
+        md_vals = md_vals - md_vals.mean()
+        md_vals /= sqrt((md_vals ** 2).sum())
+    elif test == 'cscore':
+        data = (data != 0).astype(float)
+        md_vals = (md_vals != 0).astype(float)
+    return data, md_vals
+
+
+def _correlation_stats(test, x, ys):
+    """Return the correlation of each row of x with each row of ys.
+
+    x and ys must be prepared by _prepare_correlation. Returns a (row of x
+    x row of ys) array.
+    """
+    if test in ('pearson', 'spearman'):
+        return dot(x, ys.T)
+    elif test == 'cscore':
+        sij = dot(x, ys.T)
+        return (x.sum(1)[:, newaxis] - sij) * (ys.sum(1)[newaxis] - sij)
+    elif test == 'kendall':
+        # tau is the sum over the pairs of samples of the product of the signs
+        # of their differences, over the tie corrected number of pairs
+        num_samples = x.shape[1]
+        rows, cols = triu_indices(num_samples, 1)
+        n_o = num_samples * (num_samples - 1) * .5
+        x_ties = _rank_rows(x)[1]
+        y_ties = _rank_rows(ys)[1]
+        denom = sqrt(
+            (n_o - (x_ties * (x_ties - 1)).sum(1) * .5)[:, newaxis] *
+            (n_o - (y_ties * (y_ties - 1)).sum(1) * .5)[newaxis])
+        y_signs = sign(ys[:, rows] - ys[:, cols])
+        # the pairs of samples are taken in blocks, to limit the size of the
+        # array of signs of the differences of x
+        block_size = max(1, _OTU_CHUNK_ENTRIES // max(1, len(x)))
+        c_minus_d = zeros((len(x), len(ys)))
+        for start in range(0, len(rows), block_size):
+            stop = start + block_size
+            x_signs = sign(x[:, rows[start:stop]] - x[:, cols[start:stop]])
+            c_minus_d += dot(x_signs, y_signs[:, start:stop].T)
+        return c_minus_d / denom
+
+
+def _set_worker_correlation_data(data):
+    global _correlation_data
+    _correlation_data = data
+
+
+def _correlation_worker(bounds):
+    return _correlation_chunk(_correlation_data, *bounds)
+
+
 def correlation_output_formatter(bt, corr_coefs, pvals, fdr_pvals, bon_pvals,
                                  md_key):
     """Format the output of the correlations for easy writing.
@@ -396,6 +779,71 @@ def sort_by_pval(lines, ind):
     )
 
 
+def _rank_rows(data):
+    """Return the ranks of the values of each row of data, and their ties.
+
+    Tied values get the average of their ranks, as for rank_with_ties. The
+    second array has the number of values in each run of tied values of a
+    row at the position of the first of them (in sorted order), and 0
+    elsewhere.
+    """
+    num_rows, num_cols = data.shape
+    rows = arange(num_rows)[:, newaxis]
+    order = data.argsort(axis=1, kind='mergesort')
+    sorted_data = data[rows, order]
+    positions = arange(num_cols)
+    starts = empty(data.shape, dtype=bool)
+    starts[:, :1] = True
+    starts[:, 1:] = sorted_data[:, 1:] != sorted_data[:, :-1]
+    ends = empty(data.shape, dtype=bool)
+    ends[:, -1:] = True
+    ends[:, :-1] = starts[:, 1:]
+    # the first position of the run of each value, and one past its last
+    run_starts = maximum.accumulate(where(starts, positions, 0), axis=1)
+    run_ends = minimum.accumulate(
+        where(ends, positions + 1, num_cols)[:, ::-1], axis=1)[:, ::-1]
+    ranks = empty(data.shape)
+    ranks[rows, order] = (run_starts + run_ends + 1) * .5
+    return ranks, where(starts, run_ends - run_starts, 0)
+
+
+def _map_pvals(pval_f, test_stats):
+    """Return pval_f of each of test_stats, or nan where they are nan."""
+    return array([nan if isnan(test_stat) else pval_f(test_stat)
+                  for test_stat in test_stats])
+
+
+def _run_otu_chunks(task_data, chunk_f, initializer, worker, jobs_to_start):
+    """Return chunk_f(task_data, start, stop) for each chunk of OTUs.
+
+    task_data starts with the (otu x sample) array and ends with the 2D
+    array of permutations (or None), which together set the number of OTUs
+    in each chunk. The chunks are spread over jobs_to_start processes, each
+    given task_data by initializer, and computed by worker.
+    """
+    data, perms = task_data[0], task_data[-1]
+    num_otus, num_samples = data.shape
+    if perms is None:
+        chunk_size = _OTU_CHUNK_ENTRIES // max(1, num_samples)
+    else:
+        chunk_size = _OTU_CHUNK_ENTRIES // max(
+            1, num_samples * min(len(perms), _PERMUTATION_BLOCK_SIZE))
+    if jobs_to_start > 1:
+        chunk_size = min(chunk_size, num_otus // (jobs_to_start * 4))
+    chunk_size = max(1, chunk_size)
+    chunks = [(start, min(start + chunk_size, num_otus))
+              for start in range(0, num_otus, chunk_size)] or [(0, 0)]
+    if jobs_to_start > 1 and len(chunks) > 1:
+        pool = Pool(jobs_to_start, initializer=initializer,
+                    initargs=(task_data,))
+        results = pool.map(worker, chunks)
+        pool.close()
+        pool.join()
+    else:
+        results = [chunk_f(task_data, start, stop) for start, stop in chunks]
+    return results
+
+
 def _add_metadata(bt, md_key, lines):
     """Add metadata to formatted correlation output lines."""
     taxonomy_md = biom_taxonomy_formatter(bt, md_key)
@@ -38,7 +38,10 @@ class ParallelAlphaDiversity(ParallelWrapper):
         result_filepaths = []
 
         if params['tree_path']:
-            tree_str = '-t %s' % params['tree_path']
+            # the jobs share the index of the tree, so that it's only parsed
+            # once
+            tree_str = '-t %s --tree_cache_dir %s' % (params['tree_path'],
+                                                      working_dir)
         else:
             tree_str = ''
 
@@ -10,11 +10,14 @@ __version__ = "1.8.0-dev"
 __maintainer__ = "Greg Caporaso"
 __email__ = "gregcaporaso@gmail.com"
 
-from os.path import join, split, splitext
+from os.path import basename, join, split, splitext
+from StringIO import StringIO
 from cogent.util.misc import create_dir
+from numpy import array
 from biom.parse import parse_biom_table
 from qiime.parallel.util import ParallelWrapper
-from qiime.format import format_distance_matrix
+from qiime.beta_diversity import get_beta_output_fp
+from qiime.format import create_binary_distance_matrix
 
 
 class ParallelBetaDiversity(ParallelWrapper):
@@ -37,6 +40,8 @@ class ParallelBetaDiversity(ParallelWrapper):
 
 
 class ParallelBetaDiversitySingle(ParallelBetaDiversity):
+    _process_run_results_f =\
+        'qiime.parallel.beta_diversity.parallel_beta_diversity_process_run_results_f'
 
     def _identify_files_to_remove(self, job_result_filepaths, params):
         """ The output of the individual jobs are the files we want to keep
@@ -53,12 +58,17 @@ class ParallelBetaDiversitySingle(ParallelBetaDiversity):
         merge_map_f = open(merge_map_filepath, 'w')
 
         for metric in params['metrics'].split(','):
+            # match the whole file name, as one metric name can be a prefix
+            # of another (e.g., unifrac_g and unifrac_g_full_tree)
+            output_fn = '%s_%s.txt' % (metric, input_file_basename)
             fps_to_merge = [
-                fp for fp in job_result_filepaths if '/%s_' %
-                metric in fp]
-            output_fp = join(
-                output_dir, '%s_%s.txt' %
-                (metric, input_file_basename))
+                fp for fp in job_result_filepaths
+                if basename(fp) == output_fn]
+            # the jobs write text rows, which are assembled into a binary
+            # distance matrix if one was requested
+            output_fp = get_beta_output_fp(output_dir, metric,
+                                           input_file_basename,
+                                           params.get('binary_output', False))
             merge_map_f.write(
                 '%s\t%s\n' %
                 ('\t'.join(fps_to_merge), output_fp))
@@ -156,7 +166,7 @@ class ParallelBetaDiversitySingle(ParallelBetaDiversity):
              merge_map_filepath,
              deletion_list_filepath,
              self._seconds_to_sleep,
-             'qiime.parallel.beta_diversity.parallel_beta_diversity_process_run_results_f',
+             self._process_run_results_f,
              command_suffix)
 
         return result, []
@@ -185,6 +195,11 @@ class ParallelBetaDiversityMultiple(ParallelBetaDiversity):
         else:
             tree_str = ''
 
+        if params.get('binary_output', False):
+            binary_output_str = '-b'
+        else:
+            binary_output_str = ''
+
         commands = []
         result_filepaths = []
 
@@ -194,13 +209,14 @@ class ParallelBetaDiversityMultiple(ParallelBetaDiversity):
             input_path, input_fn = split(input_fp)
             input_basename, input_ext = splitext(input_fn)
             output_fns = \
-                ['%s_%s.txt' % (metric, input_basename)
+                [get_beta_output_fp('', metric, input_basename,
+                                    params.get('binary_output', False))
                  for metric in metrics.split(',')]
             rename_command, current_result_filepaths = self._get_rename_command(
                 output_fns, working_dir, output_dir)
             result_filepaths += current_result_filepaths
 
-            command = '%s %s -i %s -o %s %s -m %s %s %s %s' %\
+            command = '%s %s -i %s -o %s %s -m %s %s %s %s %s' %\
                 (command_prefix,
                  self._script_name,
                  input_fp,
@@ -208,6 +224,7 @@ class ParallelBetaDiversityMultiple(ParallelBetaDiversity):
                  tree_str,
                  params['metrics'],
                  full_tree_str,
+                 binary_output_str,
                  rename_command,
                  command_suffix)
 
@@ -229,46 +246,123 @@ def parallel_beta_diversity_process_run_results_f(f):
         fields = line.strip().split('\t')
         dm_components = fields[:-1]
         output_fp = fields[-1]
-        # assemble the current dm
-        dm = assemble_distance_matrix(map(open, dm_components))
-        # and write it to file
-        output_f = open(output_fp, 'w')
-        output_f.write(dm)
-        output_f.close()
+        # assemble the current dm directly into the output file
+        component_fs = map(open, dm_components)
+        if output_fp.endswith('.dm'):
+            write_assembled_binary_distance_matrix(component_fs, output_fp)
+        else:
+            output_f = open(output_fp, 'w')
+            write_assembled_distance_matrix(component_fs, output_f)
+            output_f.close()
+        for component_f in component_fs:
+            component_f.close()
 
     return True
 
 
+def index_distance_matrix_component(dm_component):
+    """ return the column ids and the position of each row of a dm component
+
+        dm_component: an open file containing rows of a distance matrix, as
+         written by beta_diversity.py -r
+
+        Returns the column ids, and a dict mapping the id of each row to
+         the byte offset of that row in dm_component. Only the row ids are
+         read from the rows, so the distances themselves are never parsed.
+    """
+    col_ids = None
+    row_offsets = {}
+    offset = dm_component.tell()
+    line = dm_component.readline()
+    while line:
+        if line.strip():
+            # if no column ids seen yet, these are them
+            if col_ids is None:
+                col_ids = line.strip().split()
+            # otherwise this is a data row so record its position
+            else:
+                row_offsets[line.split(None, 1)[0]] = offset
+        offset = dm_component.tell()
+        line = dm_component.readline()
+    return col_ids, row_offsets
+
+
+def write_assembled_distance_matrix(dm_components, output_f):
+    """ write a complete dm to output_f from its row components
+
+        dm_components: open files each containing rows of the distance
+         matrix, as written by beta_diversity.py -r
+        output_f: open file to which the distance matrix is written
+
+        Rows are written in the order of the column ids of the components
+         (i.e., the order of the samples in the input OTU table). Each row is
+         copied as-is from its component, so the matrix is assembled in a
+         single streaming pass without holding it in memory.
+    """
+    col_ids, row_positions = _index_distance_matrix_components(dm_components)
+
+    output_f.write('\t'.join([''] + col_ids))
+    for sid in col_ids:
+        c, offset = row_positions[sid]
+        c.seek(offset)
+        output_f.write('\n')
+        output_f.write(c.readline().rstrip('\r\n'))
+
+
+def write_assembled_binary_distance_matrix(dm_components, output_fp):
+    """ write a complete binary dm to output_fp from its row components
+
+        dm_components: open files each containing rows of the distance
+         matrix, as written by beta_diversity.py -r
+        output_fp: path of the binary distance matrix file to write
+
+        Each row is parsed from its component and written directly into a
+         memory map of the output file by its index, so the matrix is never
+         held in memory.
+    """
+    col_ids, row_positions = _index_distance_matrix_components(dm_components)
+
+    dists = create_binary_distance_matrix(col_ids, output_fp)
+    for i, sid in enumerate(col_ids):
+        c, offset = row_positions[sid]
+        c.seek(offset)
+        dists[i] = array(c.readline().rstrip('\n').split('\t')[1:],
+                         dtype=float)
+    # closing the memory map writes out the distances
+    del dists
+
+
+def _index_distance_matrix_components(dm_components):
+    """ return the column ids, and the component and offset of each row
+    """
+    col_ids = None
+    # map each row id to the component and the byte offset it's found at
+    row_positions = {}
+    for c in dm_components:
+        current_col_ids, row_offsets = index_distance_matrix_component(c)
+        if current_col_ids is None:
+            continue
+        if col_ids is None:
+            col_ids = current_col_ids
+        elif current_col_ids != col_ids:
+            raise ValueError("Distance matrix components have different "
+                             "column ids.")
+        for row_id, offset in row_offsets.iteritems():
+            row_positions[row_id] = (c, offset)
+
+    if col_ids is None:
+        raise ValueError("No distance matrix rows found in components.")
+    missing_ids = [sid for sid in col_ids if sid not in row_positions]
+    if missing_ids:
+        raise ValueError("No rows found for samples: %s" %
+                         ', '.join(missing_ids))
+    return col_ids, row_positions
+
+
 def assemble_distance_matrix(dm_components):
     """ assemble distance matrix components into a complete dm string
 
     """
-    print "I get called."
-    data = {}
-    # iterate over compenents
-    for c in dm_components:
-        # create a blank list to store the column ids
-        col_ids = []
-        # iterate over lines
-        for line in c:
-            # split on tabs remove leading and trailing whitespace
-            fields = line.strip().split()
-            if fields:
-                # if no column ids seen yet, these are them
-                if not col_ids:
-                    col_ids = fields
-                # otherwise this is a data row so add it to data
-                else:
-                    sid = fields[0]
-                    data[sid] = dict(zip(col_ids, fields[1:]))
-
-    # grab the col/row ids as a list so it's ordered
-    labels = data.keys()
-    # create an empty list to build the dm
-    dm = []
-    # construct the dm one row at a time
-    for l1 in labels:
-        dm.append([data[l1][l2] for l2 in labels])
-    # create the dm string and return it
-    dm = format_distance_matrix(labels, dm)
-    return dm
+    result = StringIO()
+    write_assembled_distance_matrix(dm_components, result)
+    return result.getvalue()
@@ -17,9 +17,9 @@ from brokit.formatdb import build_blast_db_from_fasta_path
 from skbio.parse.sequences import parse_fasta
 
 from qiime.identify_chimeric_seqs import make_cidx_file
-from qiime.parse import parse_tmp_to_final_filepath_map_file
 from qiime.util import write_degapped_fasta_to_file
 from qiime.parallel.util import ParallelWrapper
+from qiime.parallel.poller import basic_process_run_results_f
 
 
 class ParallelChimericSequenceIdentifier(ParallelWrapper):
@@ -177,34 +177,3 @@ class ParallelChimericSequenceIdentifier(ParallelWrapper):
             f.write('\t'.join(in_files + [out_file]))
             f.write('\n')
         f.close()
-
-
-def basic_process_run_results_f(f):
-    """ Copy each list of infiles to each outfile and delete infiles
-
-        f: file containing one set of mapping instructions per line
-
-        example f:
-         f1.txt f2.txt f3.txt f_combined.txt
-         f1.log f2.log f3.log f_combined.log
-
-        If f contained the two lines above, this function would
-         concatenate f1.txt, f2.txt, and f3.txt into f_combined.txt
-         and f1.log, f2.log, and f3.log into f_combined.log
-    """
-    infiles_lists, out_filepaths = parse_tmp_to_final_filepath_map_file(f)
-    for infiles_list, out_filepath in zip(infiles_lists, out_filepaths):
-        try:
-            of = open(out_filepath, 'w')
-        except IOError:
-            raise IOError("Poller can't open final output file: %s" % out_filepath +
-                          "\nLeaving individual jobs output.\n Do you have write access?")
-
-        for fp in infiles_list:
-            for line in open(fp):
-                of.write('%s\n' % line.strip('\n'))
-        of.close()
-    # It is a good idea to have your clean_up_callback return True.
-    # That way, if you get mixed up and pass it as check_run_complete_callback,
-    # you'll get an error right away rather than going into an infinite loop
-    return True
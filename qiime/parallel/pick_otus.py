@@ -332,15 +332,10 @@ def parallel_pick_otus_process_run_results_f(f):
          and f1.log, f2.log, and f3.log into f_combined.log
     """
     lines = list(f)
-    # handle catting of log files and failure files
-    basic_process_run_results_f([lines[1]])
-    try:
-        basic_process_run_results_f([lines[2]])
-        basic_process_run_results_f([lines[3]])
-    except IndexError:
-        # no failures files or blast6 were generated (BLAST
-        # doesn't create these)
-        pass
+    # handle catting of log files and failure files (these are merged
+    # concurrently). There may be no failures files or blast6 files (BLAST
+    # doesn't create these), in which case the slice is shorter.
+    basic_process_run_results_f(lines[1:4])
     # handle merging of otu maps
     fields = lines[0].strip().split()
     infiles_list = fields[:-1]
@@ -549,15 +544,10 @@ def parallel_pick_otus_trie_process_run_results_f(f):
                sets, we have to make the otu_ids disjoint as well.
     """
     lines = list(f)
-    # handle catting of log files and failure files
-    basic_process_run_results_f([lines[1]])
-    try:
-        basic_process_run_results_f([lines[2]])
-        basic_process_run_results_f([lines[3]])
-    except IndexError:
-        # no failures files or blast6 were generated (BLAST
-        # doesn't create these)
-        pass
+    # handle catting of log files and failure files (these are merged
+    # concurrently). There may be no failures files or blast6 files (BLAST
+    # doesn't create these), in which case the slice is shorter.
+    basic_process_run_results_f(lines[1:4])
     # handle merging of otu maps
     fields = lines[0].strip().split()
     infiles_list = fields[:-1]
@@ -1,14 +1,24 @@
 #!/usr/bin/env python
 
 from __future__ import division
-from time import sleep
+from collections import defaultdict
+from multiprocessing.pool import ThreadPool
+from time import sleep, time
 from optparse import OptionParser
-from os import getenv, remove
-from os.path import exists, isdir
-from shutil import rmtree
+from os import getenv, remove, SEEK_END
+from os.path import abspath, dirname, exists, isdir
+from shutil import copyfileobj, rmtree
 from cogent.util.misc import remove_files
 from qiime.parse import parse_tmp_to_final_filepath_map_file
 
+# pyinotify is only available on Linux, so it's an optional dependency. If it
+# can't be imported, the poller falls back to checking for files periodically.
+try:
+    from pyinotify import (WatchManager, Notifier, ProcessEvent,
+                           IN_CREATE, IN_CLOSE_WRITE, IN_MOVED_TO)
+except ImportError:
+    WatchManager = None
+
 __author__ = "Greg Caporaso"
 __copyright__ = "Copyright 2011, The QIIME Project"
 __credits__ = ["Greg Caporaso"]
@@ -61,10 +71,52 @@ def basic_check_run_complete_f(f):
     return True
 
 
-def basic_process_run_results_f(f):
+def merge_files(infiles_list, out_filepath, buffer_size=1024 * 1024):
+    """ Concatenate the files in infiles_list into out_filepath
+
+        infiles_list: list of filepaths to concatenate, in order
+        out_filepath: path to the merged output file
+        buffer_size: number of bytes to copy at a time
+
+        Files are copied in blocks rather than line by line. A newline is
+         added after any non-empty file that doesn't end with one, so
+         the last line of one file is never joined to the first line of
+         the next.
+    """
+    try:
+        of = open(out_filepath, 'wb')
+    except IOError:
+        raise IOError("Poller can't open final output file: %s" % out_filepath +
+                      "\nLeaving individual jobs output.\n Do you have write access?")
+
+    try:
+        for fp in infiles_list:
+            inf = open(fp, 'rb')
+            try:
+                copyfileobj(inf, of, buffer_size)
+                # check the last byte copied to see if a newline is needed
+                if inf.tell() > 0:
+                    inf.seek(-1, SEEK_END)
+                    if inf.read(1) != '\n':
+                        of.write('\n')
+            finally:
+                inf.close()
+    finally:
+        of.close()
+
+
+def _merge_files_star(args):
+    """ Call merge_files with a tuple of arguments (for ThreadPool.map)
+    """
+    return merge_files(*args)
+
+
+def basic_process_run_results_f(f, max_concurrent_merges=4):
     """ Copy each list of infiles to each outfile and delete infiles
 
         f: file containing one set of mapping instructions per line
+        max_concurrent_merges: maximum number of outfiles to write at
+         the same time
 
         example f:
          f1.txt f2.txt f3.txt f_combined.txt
@@ -75,17 +127,20 @@ def basic_process_run_results_f(f):
          and f1.log, f2.log, and f3.log into f_combined.log
     """
     infiles_lists, out_filepaths = parse_tmp_to_final_filepath_map_file(f)
-    for infiles_list, out_filepath in zip(infiles_lists, out_filepaths):
+    merges = zip(infiles_lists, out_filepaths)
+    num_threads = min(max_concurrent_merges, len(merges))
+    if num_threads > 1:
+        # copying is I/O bound, so threads can merge several outfiles
+        # at once
+        pool = ThreadPool(num_threads)
         try:
-            of = open(out_filepath, 'w')
-        except IOError:
-            raise IOError("Poller can't open final output file: %s" % out_filepath +
-                          "\nLeaving individual jobs output.\n Do you have write access?")
-
-        for fp in infiles_list:
-            for line in open(fp):
-                of.write('%s\n' % line.strip('\n'))
-        of.close()
+            pool.map(_merge_files_star, merges)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        for infiles_list, out_filepath in merges:
+            merge_files(infiles_list, out_filepath)
     # It is a good idea to have your clean_up_callback return True.
     # That way, if you get mixed up and pass it as check_run_complete_callback,
     # you'll get an error right away rather than going into an infinite loop
@@ -187,6 +242,106 @@ def verbose_clean_up_f(f):
     return True
 
 
+def get_remaining_filepaths(filepaths):
+    """ Return the set of filepaths which do not exist yet
+    """
+    return set([fp for fp in filepaths if not exists(fp)])
+
+
+def inotify_available():
+    """ Return True if pyinotify can be used to watch for new files
+    """
+    return WatchManager is not None
+
+
+def wait_for_filepaths(filepaths,
+                       seconds_to_sleep,
+                       use_inotify=True):
+    """ Block until all filepaths exist, returning the number of loops
+
+        filepaths: list of filepaths (e.g., lines of the
+         check_run_complete_file; surrounding whitespace is ignored)
+        seconds_to_sleep: number of seconds to wait between checks for
+         files that have not been created yet
+        use_inotify: if True and pyinotify is available, wake up as soon
+         as the remaining files are created rather than waiting for the
+         next check
+
+        Only the files which have not been seen yet are checked on each
+         loop, so the cost of each check shrinks as jobs complete. When
+         inotify is used, the remaining files are still checked every
+         seconds_to_sleep seconds in case events are not delivered (e.g.,
+         for files written by other hosts on a network filesystem).
+    """
+    remaining = get_remaining_filepaths(
+        [fp.strip() for fp in filepaths if fp.strip()])
+    if not remaining:
+        return 0
+
+    if use_inotify and inotify_available():
+        return _wait_for_filepaths_inotify(remaining, seconds_to_sleep)
+
+    number_of_loops = 0
+    while remaining:
+        sleep(seconds_to_sleep)
+        number_of_loops += 1
+        remaining = get_remaining_filepaths(remaining)
+    return number_of_loops
+
+
+def _wait_for_filepaths_inotify(remaining, seconds_to_sleep):
+    """ Wait for the remaining filepaths using inotify events
+
+        remaining: set of filepaths which do not exist yet
+        seconds_to_sleep: maximum number of seconds between checks for
+         the remaining files
+    """
+    # group the remaining files by the absolute path of the directory that
+    # will contain them, so only one watch is added per directory
+    remaining_by_dir = defaultdict(dict)
+    for fp in remaining:
+        abs_fp = abspath(fp)
+        remaining_by_dir[dirname(abs_fp)][abs_fp] = fp
+
+    class RemainingFileHandler(ProcessEvent):
+
+        def process_default(self, event):
+            fp = remaining_by_dir.get(event.path, {}).pop(event.pathname, None)
+            if fp is not None:
+                remaining.discard(fp)
+
+    watch_manager = WatchManager()
+    notifier = Notifier(watch_manager, RemainingFileHandler())
+    try:
+        for dir_path in remaining_by_dir:
+            # directories which don't exist yet can't be watched, so
+            # files in those are only found by the periodic checks
+            if isdir(dir_path):
+                watch_manager.add_watch(dir_path,
+                                        IN_CREATE | IN_CLOSE_WRITE |
+                                        IN_MOVED_TO,
+                                        quiet=True)
+
+        number_of_loops = 0
+        # re-check after the watches are in place in case files were
+        # created before they were added
+        remaining.intersection_update(get_remaining_filepaths(remaining))
+        last_check = time()
+        while remaining:
+            timeout = max(seconds_to_sleep - (time() - last_check), 0)
+            if notifier.check_events(timeout=int(timeout * 1000)):
+                notifier.read_events()
+                notifier.process_events()
+            if remaining and time() - last_check >= seconds_to_sleep:
+                remaining.intersection_update(
+                    get_remaining_filepaths(remaining))
+                last_check = time()
+                number_of_loops += 1
+    finally:
+        notifier.stop()
+    return number_of_loops
+
+
 def poller(check_run_complete_f,
            process_run_results_f,
            clean_up_f,
@@ -209,11 +364,19 @@ def poller(check_run_complete_f,
         seconds_to_sleep: number of seconds to sleep between calls
          to check_run_complete_f
 
+        If check_run_complete_f is basic_check_run_complete_f, the
+         poller waits for the files using wait_for_filepaths instead of
+         calling check_run_complete_f repeatedly.
+
     """
     number_of_loops = 0
-    while(not check_run_complete_f(check_run_complete_file)):
-        sleep(seconds_to_sleep)
-        number_of_loops += 1
+    if check_run_complete_f is basic_check_run_complete_f:
+        number_of_loops = wait_for_filepaths(check_run_complete_file,
+                                             seconds_to_sleep)
+    else:
+        while(not check_run_complete_f(check_run_complete_file)):
+            sleep(seconds_to_sleep)
+            number_of_loops += 1
     process_run_results_f(process_run_results_file)
     clean_up_f(clean_up_file)
     est_per_proc_run_time = number_of_loops * seconds_to_sleep
@@ -15,9 +15,11 @@ from math import ceil
 from os.path import split, splitext, join
 from os import makedirs, mkdir
 from random import choice
+from multiprocessing import Pool
 from skbio.parse.sequences import parse_fasta
 from qiime.split import split_fasta
 from qiime.util import load_qiime_config, qiime_system_call, count_seqs
+from qiime.parallel.poller import get_function_handle, basic_clean_up_f
 
 qiime_config = load_qiime_config()
 
@@ -25,12 +27,20 @@ RANDOM_JOB_PREFIX_CHARS = "abcdefghigklmnopqrstuvwxyz"
 RANDOM_JOB_PREFIX_CHARS += RANDOM_JOB_PREFIX_CHARS.upper()
 RANDOM_JOB_PREFIX_CHARS += "0123456790"
 
+# passing this as cluster_jobs_fp runs the jobs in a pool of local worker
+# processes, rather than submitting them through a cluster jobs script
+LOCAL_CLUSTER_JOBS_FP = 'local'
+
 
 class ParallelWrapper(object):
 
     """
     """
 
+    # the function called by the poller to merge the job results
+    _process_run_results_f =\
+        'qiime.parallel.poller.basic_process_run_results_f'
+
     def __init__(self,
                  cluster_jobs_fp=qiime_config['cluster_jobs_fp'],
                  jobs_to_start=int(qiime_config['jobs_to_start']),
@@ -150,6 +160,8 @@ class ParallelWrapper(object):
                                                   input_file_basename,
                                                   params)
 
+        run_locally = self._cluster_jobs_fp == LOCAL_CLUSTER_JOBS_FP
+
         # Set up poller apparatus if the user does not suppress polling
         if not self._suppress_polling:
             poller_command = self._initiate_polling(job_result_filepaths,
@@ -160,8 +172,10 @@ class ParallelWrapper(object):
                                                     expected_files_filepath)
 
         # If the poller should be run in the same way as the other commands
-        # (rather than by the current process), add it to the list of commands
-        if not poll_directly:
+        # (rather than by the current process), add it to the list of commands.
+        # When running locally, the results are instead processed by the
+        # current process as soon as the jobs complete.
+        if not poll_directly and not run_locally:
             commands.append(poller_command)
 
         # Build the filepath for the 'jobs script'. Add that file to the
@@ -170,15 +184,23 @@ class ParallelWrapper(object):
         self._write_jobs_file(commands, jobs_fp)
         self.files_to_remove.append(jobs_fp)
 
+        if run_locally:
+            # run the jobs in local worker processes, and merge and clean up
+            # their results once they have all completed
+            if not suppress_submit_jobs:
+                self._run_jobs_locally(commands)
+                if not self._suppress_polling:
+                    self._process_local_run_results(merge_map_filepath,
+                                                    deletion_list_filepath)
         # submit the jobs file using cluster_jobs, if not suppressed by the
         # user
-        if not suppress_submit_jobs:
+        elif not suppress_submit_jobs:
             stdout, stderr, return_value = self._submit_jobs(
                 jobs_fp=jobs_fp, job_prefix=job_prefix)
 
         # If the poller is going to be run by the current process,
         # start polling
-        if poll_directly:
+        if poll_directly and not run_locally:
             # IMPORTANT: the following line MUST use qiime_system_call()
             # instead of subprocess.call, .check_call, or .check_output in case
             # we are invoked in a child process with PIPEs (a deadlock will
@@ -257,6 +279,48 @@ class ParallelWrapper(object):
 
         return stdout, stderr, return_value
 
+    def _run_jobs_locally(self, commands):
+        """ Run the jobs in a pool of local worker processes
+
+            Each job is run as soon as a worker is free, and this returns
+            once all of the jobs have completed. A RuntimeError is raised if
+            any of the jobs fail.
+        """
+        if not commands:
+            return
+        pool = Pool(max(1, min(self._jobs_to_start, len(commands))))
+        try:
+            jobs = [pool.apply_async(run_local_job, (command,))
+                    for command in commands]
+            failures = []
+            for job in jobs:
+                command, stdout, stderr, return_value = job.get()
+                if return_value != 0:
+                    failures.append("Command run was:\n %s\n" % command +
+                                    "Command returned exit status: %d\n" %
+                                    return_value +
+                                    "Stdout:\n%s\nStderr\n%s\n" %
+                                    (stdout, stderr))
+        finally:
+            pool.close()
+            pool.join()
+        if failures:
+            raise RuntimeError("\n\n*** %d of %d parallel jobs failed.\n" %
+                               (len(failures), len(commands)) +
+                               '\n'.join(failures))
+
+    def _process_local_run_results(self,
+                                   merge_map_filepath,
+                                   deletion_list_filepath):
+        """ Merge the results of locally run jobs and clean up after them
+
+            This does what the poller does once all expected files exist.
+        """
+        process_run_results_f = get_function_handle(
+            self._process_run_results_f)
+        process_run_results_f(list(open(merge_map_filepath, 'U')))
+        basic_clean_up_f(list(open(deletion_list_filepath, 'U')))
+
     def _identify_files_to_remove(self, job_result_filepaths, params):
         """ Select the files to remove: by default remove all files
         """
@@ -495,6 +559,21 @@ class ParallelWrapper(object):
         return input_fps, False
 
 
+def run_local_job(command):
+    """ Run a job command in the current process's shell
+
+        The /bin/bash and exit subcommands which wrap the commands for
+        cluster jobs scripts are dropped, as start_parallel_jobs.py does.
+
+        Returns (command, stdout, stderr, return_value).
+    """
+    subcommands = [c for c in command.split(';')
+                   if c.strip() not in ('/bin/bash', 'exit')]
+    command = ';'.join(subcommands).strip()
+    stdout, stderr, return_value = qiime_system_call(command)
+    return command, stdout, stderr, return_value
+
+
 class BufferedWriter():
 
     """A file like object that delays writing to file without keeping an open filehandle
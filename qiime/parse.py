@@ -19,7 +19,8 @@ from os.path import expandvars
 import re
 from types import GeneratorType
 
-from numpy import concatenate, repeat, zeros, nan, asarray
+from numpy import (concatenate, repeat, zeros, nan, asarray, fromstring,
+                   memmap)
 from numpy.random import permutation
 
 from skbio.parse.record_finder import LabeledRecordFinder
@@ -215,13 +216,83 @@ def group_by_fields(table, names):
     return result
 
 
+# first line of a binary distance matrix file (see parse_binary_distmat)
+BINARY_DISTMAT_MAGIC = '\x93QIIME_DM\n'
+
+
+def is_binary_distmat(dm_f):
+    """Returns True if the open file dm_f is a binary distance matrix
+
+    The position of dm_f is left unchanged. Returns False for objects which
+    can't be checked without consuming them (e.g., lists of lines).
+    """
+    try:
+        position = dm_f.tell()
+        start = dm_f.read(len(BINARY_DISTMAT_MAGIC))
+        dm_f.seek(position)
+    except (AttributeError, IOError):
+        return False
+    return start == BINARY_DISTMAT_MAGIC
+
+
+def parse_binary_distmat(dm_f):
+    """Parser for binary distance matrix file.
+
+    The file starts with the BINARY_DISTMAT_MAGIC line, followed by a line of
+    tab-separated sample ids (padded with spaces so that the distances are
+    8-byte aligned), followed by the sample x sample distances as
+    little-endian float64 values in row-major order.
+
+    If dm_f is a file on disk, the distances are memory-mapped rather than
+    read, so only the parts of the matrix that are used are ever loaded.
+    The map is copy-on-write: changes to the returned array are not
+    written back to the file.
+    """
+    try:
+        # reopen the file in binary mode, as it may have been opened in
+        # universal newline mode
+        f = open(dm_f.name, 'rb')
+        f.seek(dm_f.tell())
+    except (AttributeError, IOError, TypeError):
+        # not a file on disk (e.g., a StringIO), so read it directly
+        f = dm_f
+    if f.readline() != BINARY_DISTMAT_MAGIC:
+        raise ValueError("Not a binary distance matrix file.")
+    header = f.readline().strip()
+    header = header.split('\t') if header else []
+    num_samples = len(header)
+    num_bytes = num_samples * num_samples * 8
+
+    if f is dm_f:
+        data = fromstring(f.read(num_bytes), dtype='<f8')
+    else:
+        offset = f.tell()
+        f.seek(0, 2)
+        if f.tell() - offset < num_bytes:
+            raise ValueError("Binary distance matrix file is truncated.")
+        f.close()
+        if num_samples == 0:
+            data = zeros(0)
+        else:
+            data = memmap(dm_f.name, dtype='<f8', mode='c', offset=offset,
+                          shape=(num_samples, num_samples))
+    if data.size != num_samples * num_samples:
+        raise ValueError("Binary distance matrix file is truncated.")
+    return header, data.reshape((num_samples, num_samples))
+
+
 def parse_distmat(lines):
     """Parser for distance matrix file (e.g. UniFrac dist matrix).
 
     The examples I have of this file are just sample x sample tab-delimited
     text, so easiest way to handle is just to convert into a numpy array
     plus a list of field names.
+
+    Binary distance matrix files (see parse_binary_distmat) are also
+    accepted.
     """
+    if is_binary_distmat(lines):
+        return parse_binary_distmat(lines)
     header = None
     result = []
     for line in lines:
@@ -254,10 +325,14 @@ def parse_matrix(lines):
 def parse_distmat_to_dict(table):
     """Parse a dist matrix into an 2d dict indexed by sample ids.
 
-    table: table as lines
+    table: table as lines, or a binary distance matrix file
     """
 
-    col_headers, row_headers, data = parse_matrix(table)
+    if is_binary_distmat(table):
+        col_headers, data = parse_binary_distmat(table)
+        row_headers = col_headers
+    else:
+        col_headers, row_headers, data = parse_matrix(table)
     assert(col_headers == row_headers)
 
     result = defaultdict(dict)
@@ -17,11 +17,16 @@ grouping those sequences by similarity.
 
 from copy import copy
 from itertools import ifilter
-from os.path import splitext, split, abspath, join
+from os.path import splitext, split, abspath, join, getsize
 from os import makedirs, close
 from itertools import imap
+from heapq import merge
+from hashlib import md5
+from struct import pack, unpack
+from multiprocessing import Pool
 from tempfile import mkstemp
 
+from numpy import dtype, fromfile, memmap, uint64, zeros
 from cogent.parse.mothur import parse_otu_list as mothur_parse
 from cogent import DNA as DNA_cogent
 
@@ -140,23 +145,139 @@ class OtuPicker(FunctionWithParams):
             seq_id_map[temp_seq_id].append(seq_id)
         return filtered_seqs, seq_id_map
 
+    def _prefilter_exact_matches_on_disk(self, seq_path, unique_seqs_fp,
+                                         bucket_size=64 * 1024 * 1024,
+                                         max_open_files=256):
+        """Collapse identical sequences in seq_path without holding them all
+
+        This is the on-disk counterpart of _prefilter_exact_matches for
+        inputs too large to dereplicate in memory. Sequences are first
+        spilled to hash buckets on disk, each bucket is dereplicated on its
+        own, and the per-bucket results are merged back into input order, so
+        the filtered sequences and their temporary ids are identical to those
+        produced by _prefilter_exact_matches.
+
+        There are as many buckets as are needed for each to hold roughly
+        bucket_size bytes of the input, and the index of the returned map
+        is also kept on disk, so memory use is roughly bounded by
+        bucket_size (the spill buffers, the distinct sequences of one bucket,
+        or one part of the index) whatever the size of the input. Buckets
+        are written through buffers and merged in passes, so no more than
+        max_open_files (at least 3) files are open at once.
+
+        seq_path: path to the fasta file to be dereplicated
+        unique_seqs_fp: path where the filtered fasta file will be written
+
+        Returns an ExactMatchSeqIdMap mapping each temporary sequence id to
+        the list of original sequence ids it represents. The map is backed
+        by files which are added to self.files_to_remove, and which it keeps
+        open until its close method is called.
+        """
+        temp_dir = get_qiime_temp_dir()
+        num_buckets = int(getsize(seq_path) // bucket_size) + 1
+        temp_fps = []
+        try:
+            # spill each sequence, along with its position in the input and
+            # its id, to a bucket chosen by the hash of the sequence, so that
+            # all copies of a sequence end up in the same bucket
+            bucket_fps = _make_temp_fps(temp_dir, 'QiimeExactMatchBucket',
+                                        num_buckets)
+            temp_fps.extend(bucket_fps)
+            buckets = _BufferedFiles(bucket_fps, bucket_size)
+            seqs = parse_fasta(open(seq_path, 'U'))
+            for i, (seq_id, seq) in enumerate(seqs):
+                seq_id = seq_id.split()[0]
+                buckets.write(hash(seq) % num_buckets,
+                              '%d\t%s\t%s\n' % (i, seq_id, seq))
+            buckets.flush()
+            del buckets
+
+            # dereplicate each bucket, writing its unique sequences sorted
+            # by the position of their first occurrence in the input
+            for bucket_fp in bucket_fps:
+                unique_sequences = {}
+                for line in open(bucket_fp, 'U'):
+                    i, seq_id, seq = line.rstrip('\n').split('\t')
+                    try:
+                        unique_sequences[seq][1].append(seq_id)
+                    except KeyError:
+                        unique_sequences[seq] = (int(i), [seq_id])
+                unique_sequences = sorted((i, seq, seq_ids)
+                                          for seq, (i, seq_ids)
+                                          in unique_sequences.iteritems())
+                bucket_f = open(bucket_fp, 'w')
+                for i, seq, seq_ids in unique_sequences:
+                    bucket_f.write('%d\t%s\t%s\n' %
+                                   (i, seq, '\t'.join(seq_ids)))
+                bucket_f.close()
+                del unique_sequences
+            bucket_fps = _merge_bucket_fps(bucket_fps, max_open_files,
+                                           temp_dir, temp_fps)
+
+            # merge the sorted buckets back into input order, writing the
+            # (key, offset) index records of the map to parts which each
+            # hold a range of keys
+            seq_id_map_fp, index_fp = _make_temp_fps(temp_dir,
+                                                     'QiimeExactMatchMap', 2)
+            self.files_to_remove.extend([seq_id_map_fp, index_fp])
+            index_part_fps = _make_temp_fps(temp_dir,
+                                            'QiimeExactMatchIndex',
+                                            num_buckets)
+            temp_fps.extend(index_part_fps)
+            index_parts = _BufferedFiles(index_part_fps, bucket_size)
+            bucket_fs = [open(bucket_fp, 'U') for bucket_fp in bucket_fps]
+            unique_seqs_f = open(unique_seqs_fp, 'w')
+            seq_id_map_f = open(seq_id_map_fp, 'w')
+            offset = 0
+            num_seqs = 0
+            for _, seq, seq_ids in merge(*map(_sorted_bucket_records,
+                                              bucket_fs)):
+                first_seq_id = seq_ids.split('\t', 1)[0].rstrip('\n')
+                temp_seq_id = 'QiimeExactMatch.%s' % first_seq_id
+                unique_seqs_f.write('>%s\n%s\n' % (temp_seq_id, seq))
+                line = '%s\t%s' % (temp_seq_id, seq_ids)
+                seq_id_map_f.write(line)
+                key = _seq_id_map_key(temp_seq_id)
+                index_parts.write(key * num_buckets >> 64,
+                                  pack('<QQ', key, offset))
+                offset += len(line)
+                num_seqs += 1
+            unique_seqs_f.close()
+            seq_id_map_f.close()
+            for bucket_f in bucket_fs:
+                bucket_f.close()
+            index_parts.flush()
+            del index_parts
+
+            # each part holds a range of keys, so sorting the parts one at a
+            # time sorts the whole index
+            index_f = open(index_fp, 'wb')
+            for index_part_fp in index_part_fps:
+                records = fromfile(index_part_fp,
+                                   dtype=_SEQ_ID_MAP_INDEX_DTYPE)
+                records.sort(order='key')
+                records.tofile(index_f)
+                del records
+            index_f.close()
+        finally:
+            remove_files(temp_fps, error_on_missing=False)
+
+        return ExactMatchSeqIdMap(seq_id_map_fp, index_fp, num_seqs)
+
     def _prefilter_with_trie(self, seq_path):
 
-        trunc_id = lambda a_b: (a_b[0].split()[0], a_b[1])
-        # get the prefix map
+        # read the seqs once, and get the prefix map by sorting them (this
+        # gives the same map as CompressedTrie(...).prefix_map)
         with open(seq_path, 'U') as seq_lines:
-            t = CompressedTrie(fasta_to_pairlist(imap(trunc_id,
-                                                      parse_fasta(seq_lines))))
-        mapping = t.prefix_map
+            seqs = [(label.split()[0], seq)
+                    for label, seq in parse_fasta(seq_lines)]
+        mapping = sorted_prefix_map(seqs)
         for key in mapping.keys():
                 mapping[key].append(key)
 
         # collect the representative seqs
-        filtered_seqs = []
-        for (label, seq) in parse_fasta(open(seq_path)):
-            label = label.split()[0]
-            if label in mapping:
-                filtered_seqs.append((label, seq))
+        filtered_seqs = [(label, seq) for label, seq in seqs
+                         if label in mapping]
         return filtered_seqs, mapping
 
     def _map_filtered_clusters_to_full_clusters(self, clusters, filter_map):
@@ -171,6 +292,178 @@ class OtuPicker(FunctionWithParams):
         return results
 
 
+def _sorted_bucket_records(lines):
+    """Yield (input index, seq, tab-separated seq ids + newline) from lines
+    """
+    for line in lines:
+        i, seq, seq_ids = line.split('\t', 2)
+        yield int(i), seq, seq_ids
+
+
+def _make_temp_fps(temp_dir, prefix, num_fps):
+    """Return the paths of num_fps new empty temporary files"""
+    fps = []
+    for i in range(num_fps):
+        fd, fp = mkstemp(dir=temp_dir, prefix=prefix, suffix='.txt')
+        close(fd)
+        fps.append(fp)
+    return fps
+
+
+def _merge_bucket_fps(bucket_fps, max_open_files, temp_dir, temp_fps):
+    """Merge sorted bucket files until there are at most max_open_files
+
+    Each merged file is added to temp_fps, and the files it was merged from
+    are removed. Returns the paths of the remaining bucket files.
+    """
+    # each merged file needs at least two files to merge into it
+    max_open_files = max(max_open_files, 3)
+    while len(bucket_fps) > max_open_files:
+        merged_fps = []
+        # leave room for the merged file
+        group_size = max_open_files - 1
+        for start in range(0, len(bucket_fps), group_size):
+            group_fps = bucket_fps[start:start + group_size]
+            merged_fp = _make_temp_fps(temp_dir, 'QiimeExactMatchBucket',
+                                       1)[0]
+            temp_fps.append(merged_fp)
+            group_fs = [open(fp, 'U') for fp in group_fps]
+            merged_f = open(merged_fp, 'w')
+            for i, seq, seq_ids in merge(*map(_sorted_bucket_records,
+                                              group_fs)):
+                merged_f.write('%d\t%s\t%s' % (i, seq, seq_ids))
+            merged_f.close()
+            for group_f in group_fs:
+                group_f.close()
+            remove_files(group_fps)
+            merged_fps.append(merged_fp)
+        bucket_fps = merged_fps
+    return bucket_fps
+
+
+class _BufferedFiles(object):
+
+    """Appends to many files, buffering up to buffer_size bytes in memory
+
+    Only one of the files is open at a time, when the buffers are flushed.
+    """
+
+    def __init__(self, fps, buffer_size):
+        self._fps = fps
+        self._buffers = [[] for fp in fps]
+        self._buffer_size = buffer_size
+        self._buffered = 0
+
+    def write(self, i, s):
+        """Append s to the i-th file"""
+        self._buffers[i].append(s)
+        self._buffered += len(s)
+        if self._buffered >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        for fp, buf in zip(self._fps, self._buffers):
+            if buf:
+                f = open(fp, 'ab')
+                f.write(''.join(buf))
+                f.close()
+                del buf[:]
+        self._buffered = 0
+
+
+# the records of an ExactMatchSeqIdMap's index
+_SEQ_ID_MAP_INDEX_DTYPE = dtype([('key', '<u8'), ('offset', '<u8')])
+
+
+def _seq_id_map_key(temp_seq_id):
+    """Return the 64-bit key of temp_seq_id in an ExactMatchSeqIdMap index
+
+    The key is taken from the md5 of the id, so keys are spread evenly
+    over their range.
+    """
+    return unpack('<Q', md5(temp_seq_id).digest()[:8])[0]
+
+
+class ExactMatchSeqIdMap(object):
+
+    """Read-only {temp_seq_id: [seq_ids]} map backed by files on disk
+
+    Nothing is held in memory for each temporary sequence id: each line of
+    the map file is found through an index file of (key, byte offset)
+    records sorted by key (see _seq_id_map_key), which is memory-mapped and
+    bisected on lookup. This can be used in place of the dict returned by
+    OtuPicker._prefilter_exact_matches. The files are kept open until close
+    is called.
+    """
+
+    def __init__(self, seq_id_map_fp, index_fp, num_seqs):
+        # keep the files open so lookups still work once they have been
+        # unlinked when the OTU picker cleans up its temporary files
+        self._seq_id_map_f = open(seq_id_map_fp, 'U')
+        self._num_seqs = num_seqs
+        if num_seqs:
+            index = memmap(index_fp, dtype=_SEQ_ID_MAP_INDEX_DTYPE, mode='r')
+        else:
+            # an empty file can't be memory-mapped
+            index = zeros(0, dtype=_SEQ_ID_MAP_INDEX_DTYPE)
+        self._keys = index['key']
+        self._offsets = index['offset']
+
+    def _read_line(self, offset):
+        self._seq_id_map_f.seek(offset)
+        return self._seq_id_map_f.readline()
+
+    def _find(self, temp_seq_id):
+        """Return the original sequence ids of temp_seq_id, or None"""
+        if self._seq_id_map_f.closed:
+            raise ValueError("I/O operation on closed ExactMatchSeqIdMap")
+        key = uint64(_seq_id_map_key(temp_seq_id))
+        i = self._keys.searchsorted(key)
+        # different ids may share a key
+        while i < self._num_seqs and self._keys[i] == key:
+            fields = self._read_line(int(self._offsets[i])).rstrip(
+                '\n').split('\t')
+            if fields[0] == temp_seq_id:
+                return fields[1:]
+            i += 1
+        return None
+
+    def __getitem__(self, temp_seq_id):
+        seq_ids = self._find(temp_seq_id)
+        if seq_ids is None:
+            raise KeyError(temp_seq_id)
+        return seq_ids
+
+    def __contains__(self, temp_seq_id):
+        return self._find(temp_seq_id) is not None
+
+    def __len__(self):
+        return self._num_seqs
+
+    def iteritems(self):
+        offset = 0
+        for i in range(self._num_seqs):
+            line = self._read_line(offset)
+            offset += len(line)
+            fields = line.rstrip('\n').split('\t')
+            yield fields[0], fields[1:]
+
+    def __iter__(self):
+        for temp_seq_id, seq_ids in self.iteritems():
+            yield temp_seq_id
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        return list(self.iteritems())
+
+    def close(self):
+        """Close the files backing the map, after which it can't be used"""
+        self._seq_id_map_f.close()
+        self._keys = self._offsets = None
+
+
 class BlastOtuPicker(OtuPicker):
 
     """Blast-based OTU picker: clusters sequence by their 'best' blast hit.
@@ -581,8 +874,7 @@ class TrieOtuPicker(OtuPicker):
                         parse_fasta(open(seq_path)))
 
         # Build the mapping
-        t = CompressedTrie(fasta_to_pairlist(seqs))
-        mapping = t.prefix_map
+        mapping = self._get_prefix_map(seqs)
         log_lines.append('Num OTUs: %d' % len(mapping))
 
         if result_path:
@@ -615,6 +907,249 @@ class TrieOtuPicker(OtuPicker):
         # written to file)
         return result
 
+    def _get_prefix_map(self, seqs):
+        """Returns {seq_id: [seq_ids]} collapsing seqs onto longer seqs
+
+        seqs: iterable of (seq_id, seq) pairs
+        """
+        t = CompressedTrie(fasta_to_pairlist(seqs))
+        return t.prefix_map
+
+
+class SortedPrefixOtuPicker(TrieOtuPicker):
+
+    """Prefix OTU picker which sorts sequences rather than building a trie
+
+    The OTUs are identical to those of TrieOtuPicker, but instead of
+    inserting every sequence into a trie of pure-Python nodes the distinct
+    sequences are sorted and the trie structure is recovered in a single
+    pass over the sorted order, using the length of the common prefix of
+    adjacent sequences. Sequences are partitioned by their first base and
+    the partitions can be processed in parallel.
+    """
+
+    Name = 'SortedPrefixOtuPicker'
+
+    def __init__(self, params):
+        """Return new OtuPicker object with specified params.
+
+        In addition to the TrieOtuPicker params, params may contain:
+
+        jobs_to_start: number of processes to use, default 1
+        """
+        _params = {'Algorithm': 'Sorted prefix or suffix matching',
+                   'jobs_to_start': 1}
+        _params.update(params)
+        TrieOtuPicker.__init__(self, _params)
+
+    def _get_prefix_map(self, seqs):
+        """Returns {seq_id: [seq_ids]} collapsing seqs onto longer seqs
+
+        seqs: iterable of (seq_id, seq) pairs
+        """
+        return sorted_prefix_map(seqs, self.Params['jobs_to_start'])
+
+
+class _PrefixNode(object):
+
+    """A node of the trie recovered from sorted sequences"""
+
+    __slots__ = ['depth', 'rank', 'min_rank', 'seq', 'children']
+
+    def __init__(self, depth, rank, seq):
+        self.depth = depth
+        self.rank = rank
+        # branch nodes (rank of -1) hold no sequence of their own
+        self.min_rank = rank if rank >= 0 else float('inf')
+        self.seq = seq
+        self.children = []
+
+    def add_child(self, child):
+        self.children.append(child)
+        self.min_rank = min(self.min_rank, child.min_rank)
+
+
+def sorted_prefix_map(seqs, jobs_to_start=1):
+    """Returns {seq_id: [seq_ids]} collapsing seqs onto longer seqs
+
+    The result is identical to CompressedTrie(...).prefix_map, including
+    which group sequences that are prefixes of several others are added to.
+
+    seqs: iterable of (seq_id, seq) pairs
+    jobs_to_start: number of processes used to process the partitions
+    """
+    # collapse identical sequences, numbering the distinct sequences
+    # in the order in which they were first seen
+    ranks = {}
+    ids_by_rank = []
+    for seq_id, seq in seqs:
+        try:
+            ids_by_rank[ranks[seq]].append(seq_id)
+        except KeyError:
+            ranks[seq] = len(ids_by_rank)
+            ids_by_rank.append([seq_id])
+
+    # partition the distinct sequences by their first base, which
+    # corresponds to the children of the root of the trie
+    partitions = {}
+    root_rank = -1
+    for seq, rank in ranks.iteritems():
+        if seq:
+            partitions.setdefault(seq[0], []).append((seq, rank))
+        else:
+            root_rank = rank
+    del ranks
+    first_bases = _trie_child_order(
+        [(min(rank for _, rank in partition), first_base)
+         for first_base, partition in partitions.iteritems()],
+        root_rank, root=True)
+
+    jobs_to_start = min(jobs_to_start, len(first_bases))
+    if jobs_to_start > 1:
+        pool = Pool(jobs_to_start, _set_worker_prefix_partitions,
+                    (partitions,))
+        try:
+            postorders = pool.map(_prefix_partition_postorder_worker,
+                                  first_bases)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        postorders = [_prefix_partition_postorder(partitions[b])
+                      for b in first_bases]
+    del partitions
+
+    postorder = []
+    for partition_postorder in postorders:
+        postorder.extend(partition_postorder)
+    postorder.append((root_rank, len(first_bases)))
+    return _prefix_map_from_postorder(postorder, ids_by_rank)
+
+
+def _common_prefix_length(a, b):
+    """Returns the length of the longest common prefix of a and b"""
+    lo = 0
+    hi = min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _trie_child_order(children, rank, root=False):
+    """Returns the children of a trie node in CompressedTrie iteration order
+
+    CompressedTrie stores the children of a node in a dict keyed by their
+    first base, and iterates over them in that dict's order, which depends
+    on the order in which they were inserted. Children are added in the
+    order in which their first sequence was seen, except that when a node
+    is created by splitting an existing edge the new branch is inserted
+    before the existing one. The root is never split.
+
+    children: list of (min_rank, key) pairs, where min_rank is the rank of
+     the first-seen sequence below the child
+    rank: the rank of the node's own sequence, or -1 if it has none
+    """
+    children = sorted(children)
+    if not root and len(children) > 1 and \
+            (rank < 0 or rank > children[1][0]):
+        children[0], children[1] = children[1], children[0]
+    ordered = {}
+    for _, key in children:
+        ordered[key] = None
+    return ordered.keys()
+
+
+def _prefix_partition_postorder(seqs):
+    """Returns the post-order of the trie built from seqs
+
+    seqs: list of (seq, rank) pairs, where all seqs are distinct and share
+     their first base
+
+    Returns a list of (rank, number of children) for each node of the
+    trie, where children are listed in CompressedTrie iteration order
+    before their parent.
+    """
+    # recover the trie by sweeping over the sorted sequences: the common
+    # prefix of adjacent sequences is the depth at which they branch
+    root = _PrefixNode(0, -1, '')
+    stack = [root]
+    previous_seq = ''
+    for seq, rank in sorted(seqs):
+        lcp = _common_prefix_length(previous_seq, seq)
+        while stack[-1].depth > lcp:
+            last = stack.pop()
+            if stack[-1].depth < lcp:
+                branch = _PrefixNode(lcp, -1, seq)
+                branch.add_child(last)
+                stack.append(branch)
+            else:
+                stack[-1].add_child(last)
+        stack.append(_PrefixNode(len(seq), rank, seq))
+        previous_seq = seq
+    while len(stack) > 1:
+        last = stack.pop()
+        stack[-1].add_child(last)
+
+    result = []
+    to_visit = [(root.children[0], False)]
+    while to_visit:
+        node, visited = to_visit.pop()
+        if visited:
+            result.append((node.rank, len(node.children)))
+            continue
+        to_visit.append((node, True))
+        children = dict((child.seq[node.depth], child)
+                        for child in node.children)
+        order = _trie_child_order(
+            [(child.min_rank, key) for key, child in children.iteritems()],
+            node.rank)
+        to_visit.extend((children[key], False) for key in reversed(order))
+    return result
+
+
+def _set_worker_prefix_partitions(partitions):
+    """Pool initializer making the prefix partitions available to workers
+    """
+    global _worker_prefix_partitions
+    _worker_prefix_partitions = partitions
+
+
+def _prefix_partition_postorder_worker(first_base):
+    return _prefix_partition_postorder(_worker_prefix_partitions[first_base])
+
+
+def _prefix_map_from_postorder(postorder, ids_by_rank):
+    """Returns the prefix map of the trie described by postorder
+
+    This mirrors CompressedTrie.prefix_map, building the same dicts in the
+    same order so that ties between equally sized groups are broken in
+    the same way.
+    """
+    stack = []
+    for rank, num_children in postorder:
+        values = ids_by_rank[rank] if rank >= 0 else []
+        if num_children == 0:
+            stack.append(({values[0]: values[1:]}, len(values) - 1))
+            continue
+        children = stack[-num_children:]
+        del stack[-num_children:]
+        mapping = {}
+        for child_mapping, _ in children:
+            mapping.update(child_mapping)
+        # the first largest group, in dict iteration order, takes the
+        # sequences that end at this node
+        largest_size = max(size for _, size in children)
+        for key, value in mapping.iteritems():
+            if len(value) == largest_size:
+                break
+        value.extend(values)
+        stack.append((mapping, largest_size + len(values)))
+    return stack[-1][0]
+
 
 class CdHitOtuPicker(OtuPicker):
 
@@ -795,6 +1330,11 @@ class UclustOtuPickerBase(OtuPicker):
         fd, unique_seqs_fp = mkstemp(
             prefix='UclustExactMatchFilter', suffix='.fasta')
         close(fd)
+        if self.Params['prefilter_identical_sequences_on_disk']:
+            self.files_to_remove.append(unique_seqs_fp)
+            exact_match_id_map = self._prefilter_exact_matches_on_disk(
+                seq_path, unique_seqs_fp)
+            return exact_match_id_map, unique_seqs_fp
         seqs_to_cluster, exact_match_id_map =\
             self._prefilter_exact_matches(parse_fasta(open(seq_path, 'U')))
         self.files_to_remove.append(unique_seqs_fp)
@@ -846,7 +1386,8 @@ class UclustOtuPicker(UclustOtuPickerBase):
                    'stable_sort': True,
                    'save_uc_files': True,
                    'output_dir': '.',
-                   'prefilter_identical_sequences': True}
+                   'prefilter_identical_sequences': True,
+                   'prefilter_identical_sequences_on_disk': False}
         _params.update(params)
         OtuPicker.__init__(self, _params)
 
@@ -909,6 +1450,8 @@ class UclustOtuPicker(UclustOtuPickerBase):
         if prefilter_identical_sequences:
             clusters = self._map_filtered_clusters_to_full_clusters(
                 clusters, exact_match_id_map)
+            if self.Params['prefilter_identical_sequences_on_disk']:
+                exact_match_id_map.close()
 
         otu_id_prefix = self.Params['new_cluster_identifier']
         if otu_id_prefix is None:
@@ -1468,7 +2011,8 @@ class UclustReferenceOtuPicker(UclustOtuPickerBase):
                    'stable_sort': True,
                    'save_uc_files': True,
                    'output_dir': '.',
-                   'prefilter_identical_sequences': True}
+                   'prefilter_identical_sequences': True,
+                   'prefilter_identical_sequences_on_disk': False}
         _params.update(params)
         OtuPicker.__init__(self, _params)
 
@@ -1541,6 +2085,8 @@ class UclustReferenceOtuPicker(UclustOtuPickerBase):
             for fa in failures:
                 temp_failures.extend(exact_match_id_map[fa])
             failures = temp_failures
+            if self.Params['prefilter_identical_sequences_on_disk']:
+                exact_match_id_map.close()
 
         self._rename_clusters(cluster_map, new_seeds)
 
@@ -1739,6 +2285,7 @@ otu_picking_method_constructors = {
     'prefix_suffix': PrefixSuffixOtuPicker,
     'mothur': MothurOtuPicker,
     'trie': TrieOtuPicker,
+    'sorted_trie': SortedPrefixOtuPicker,
     'blast': BlastOtuPicker,
     'uclust': UclustOtuPicker,
     'uclust_ref': UclustReferenceOtuPicker,
@@ -22,6 +22,8 @@ This is heavily based on pick_otus.py.
 from optparse import OptionParser
 from qiime.util import FunctionWithParams, invert_dict
 from qiime.parse import fields_to_dict
+from qiime.compact_otu_map import (CompactOtuMap, is_compact_otu_map_file,
+                                   load_otu_map)
 from random import choice
 from numpy import argmax
 from skbio.parse.sequences import parse_fasta
@@ -29,6 +31,21 @@ from skbio.parse.sequences import parse_fasta
 label_to_name = lambda x: x.split()[0]
 
 
+def load_otus(otu_path):
+    """Returns (otu_id, seq_ids) pairs from an OTU map
+
+    otu_path: path to a classic or compact OTU map file, or a CompactOtuMap
+    """
+    if isinstance(otu_path, CompactOtuMap):
+        return otu_path.iteritems()
+    if is_compact_otu_map_file(otu_path):
+        return load_otu_map(otu_path).iteritems()
+    otu_f = open(otu_path, 'U')
+    otus = fields_to_dict(otu_f)
+    otu_f.close()
+    return otus.items()
+
+
 def first(items):
     """Returns first item from a list, used to fake random for testing."""
     return items[0]
@@ -145,7 +162,7 @@ class GenericRepSetPicker(RepSetPicker):
 
         Parameters:
         seq_path: path to file of sequences
-        otu_path: path to file of OTUs
+        otu_path: path to file of OTUs, or a CompactOtuMap
         result_path: path to file of results. If specified,
         dumps the result to the desired path instead of returning it.
         log_path: path to log, which includes dump of params.
@@ -159,9 +176,7 @@ class GenericRepSetPicker(RepSetPicker):
         seq_f.close()
 
         # Load the otu file
-        otu_f = open(otu_path, 'U')
-        otus = fields_to_dict(otu_f)
-        otu_f.close()
+        otus = load_otus(otu_path)
 
         if self.Params['ChoiceFRequiresSeqs']:
             choice_f = self.Params['ChoiceF'](seqs)
@@ -170,7 +185,7 @@ class GenericRepSetPicker(RepSetPicker):
 
         # actually pick the set
         result = {}
-        for set_id, ids in otus.items():
+        for set_id, ids in otus:
             result[set_id] = choice_f(ids, seqs)
 
         if result_path:
@@ -238,7 +253,7 @@ class ReferenceRepSetPicker(RepSetPicker):
 
         Parameters:
         seq_path: path to file of sequences
-        otu_path: path to file of OTUs
+        otu_path: path to file of OTUs, or a CompactOtuMap
         result_path: path to file of results. If specified,
         dumps the result to the desired path instead of returning it.
         log_path: path to log, which includes dump of params.
@@ -265,9 +280,7 @@ class ReferenceRepSetPicker(RepSetPicker):
         reference_f.close()
 
         # Load the otu file
-        otu_f = open(otu_path, 'U')
-        otus = fields_to_dict(otu_f)
-        otu_f.close()
+        otus = load_otus(otu_path)
 
         if self.Params['ChoiceFRequiresSeqs']:
             choice_f = self.Params['ChoiceF'](seqs)
@@ -276,7 +289,7 @@ class ReferenceRepSetPicker(RepSetPicker):
 
         # actually pick the set
         result = {}
-        for set_id, ids in otus.items():
+        for set_id, ids in otus:
             if set_id in reference_seqs:
                 result[set_id] = (reference_seqs, set_id)
             elif seqs:
@@ -15,10 +15,12 @@ from numpy import (absolute, arctanh, array, asarray, concatenate, transpose,
                    ravel, take, nonzero, log, sum, mean, cov, corrcoef, fabs, any,
                    reshape, tanh, clip, nan, isnan, isinf, sqrt, trace, exp,
                    median as _median, zeros, ones, unique, copy, searchsorted, var,
-                   argsort, hstack, arange, empty, e, where)
+                   argsort, hstack, arange, empty, e, where, dot, newaxis,
+                   finfo, bincount, intp, repeat)
         #, std - currently incorrect
 from numpy.random import permutation, randint, shuffle
 from scipy.special import gammaln
+from multiprocessing import Pool
 from operator import add
 from random import choice
 
@@ -431,11 +433,19 @@ def kruskal_wallis(data):
 
 def rank_with_ties(v1):
     '''Return ranked values of 1D vector v1 with averages for tied entries.'''
-    tmp_v1 = sorted(array(v1).astype(float))
-    return (
-        (searchsorted(tmp_v1, v1, 'left')
-         + searchsorted(tmp_v1, v1, 'right') + 1) * .5
-    )
+    v1 = array(v1).astype(float)
+    ranks = empty(len(v1))
+    if not len(v1):
+        return ranks
+    # each run of tied values in sorted order gets the average of the
+    # positions of the run
+    order = v1.argsort()
+    sorted_v1 = v1[order]
+    bounds = concatenate([[True], sorted_v1[1:] != sorted_v1[:-1],
+                          [True]]).nonzero()[0]
+    starts, ends = bounds[:-1], bounds[1:]
+    ranks[order] = repeat((starts + ends + 1) * .5, ends - starts)
+    return ranks
 
 
 def count_occurrences(x):
@@ -1601,7 +1611,7 @@ def mantel(m1, m2, n):
 
 
 def mantel_test(m1, m2, n, alt="two sided",
-                suppress_symmetry_and_hollowness_check=False):
+                suppress_symmetry_and_hollowness_check=False, jobs_to_start=1):
     """Runs a Mantel test on two distance matrices.
 
     Returns the p-value, Mantel correlation statistic, and a list of Mantel
@@ -1626,6 +1636,8 @@ def mantel_test(m1, m2, n, alt="two sided",
             is fairly fast. However, if you *know* you have symmetric and
             hollow distance matrices, you can disable this check for small
             performance gains on extremely large distance matrices
+        jobs_to_start - the number of processes to compute the permutations
+            in (see mantel_stats)
     """
     # Perform some sanity checks on our input.
     if alt not in ("two sided", "greater", "less"):
@@ -1642,30 +1654,23 @@ def mantel_test(m1, m2, n, alt="two sided",
             raise ValueError("Both distance matrices must be symmetric and "
                              "hollow.")
 
-    # Get a flattened list of lower-triangular matrix elements (excluding the
-    # diagonal) in column-major order. Use these values to calculate the
-    # correlation statistic.
-    m1_flat, m2_flat = _flatten_lower_triangle(m1), _flatten_lower_triangle(m2)
-    orig_stat = pearson(m1_flat, m2_flat)
-
-    # Run our permutation tests so we can calculate a p-value for the test.
-    size = len(m1)
-    better = 0
-    perm_stats = []
-    for i in range(n):
-        perm = permute_2d(m1, permutation(size))
-        perm_flat = _flatten_lower_triangle(perm)
-        r = pearson(perm_flat, m2_flat)
-
-        if alt == 'two sided':
-            if abs(r) >= abs(orig_stat):
-                better += 1
-        else:
-            if ((alt == 'greater' and r >= orig_stat) or
-                    (alt == 'less' and r <= orig_stat)):
-                better += 1
-        perm_stats.append(r)
-    return (better + 1) / (n + 1), orig_stat, perm_stats
+    # Correlate m1 and its permutations with m2, and compare the
+    # correlations of the permutations to that of m1.
+    orig_stats, perm_stats = mantel_stats(m1, [m2], n,
+                                          jobs_to_start=jobs_to_start)
+    # The correlations of permutations which give the same pairs of
+    # distances are summed in a different order, so count those within
+    # rounding error of the original correlation as ties.
+    tol = sqrt(finfo(float).eps)
+    orig_stat = orig_stats[0]
+    perm_stats = perm_stats[:, 0]
+    if alt == 'two sided':
+        better = (absolute(perm_stats) >= absolute(orig_stat) - tol).sum()
+    elif alt == 'greater':
+        better = (perm_stats >= orig_stat - tol).sum()
+    else:
+        better = (perm_stats <= orig_stat + tol).sum()
+    return (better + 1) / (n + 1), orig_stat, perm_stats.tolist()
 
 
 def is_symmetric_and_hollow(matrix):
@@ -1689,6 +1694,268 @@ def _flatten_lower_triangle(matrix):
                     flattened.append(matrix[row_num][col_num])
     return flattened
 
+
+# The number of entries of the rows of the permuted matrix gathered at a
+# time (see _mantel_perm_stats), small enough to stay in the cache.
+_MANTEL_ROW_BLOCK_ENTRIES = 2 ** 15
+
+# The largest number of entries of the block of permutations sent to each
+# process (see _run_mantel_permutations).
+_MANTEL_PERM_BLOCK_ENTRIES = 2 ** 22
+
+
+def _get_mantel_x(m1):
+    """Returns m1 centered and scaled, and the mask of its lower triangle.
+
+    m1 is centered on the mean of its lower triangle (excluding the
+    diagonal), and scaled so that the sum of squares of the lower triangle
+    is one.
+    """
+    m1 = asarray(m1, dtype=float)
+    size = len(m1)
+    if size < 3:
+        raise ValueError("The matrices must have at least three rows to "
+                         "correlate their lower triangles.")
+    lower = arange(size)[:, newaxis] > arange(size)
+    m1_flat = m1[lower]
+    x = m1 - m1_flat.mean()
+    x /= sqrt(((m1_flat - m1_flat.mean()) ** 2).sum())
+    return x, lower
+
+
+def _get_row_blocks(size):
+    """Returns the start and end of each block of rows gathered at a time.
+    """
+    row_block_size = max(1, _MANTEL_ROW_BLOCK_ENTRIES // size)
+    return [(start, min(start + row_block_size, size))
+            for start in range(0, size, row_block_size)]
+
+
+def _get_mantel_data(m1, others):
+    """Returns the data used to correlate permutations of m1 with others.
+
+    Returns m1 centered and scaled (see _get_mantel_x) and, for each block
+    of rows, the centered and scaled lower triangles of the matrices in
+    others over those rows (as the rows of a 2D array, up to the diagonal of
+    the last row of the block), for _mantel_perm_stats.
+
+    Arguments:
+        m1 - the matrix to permute (symmetric and hollow)
+        others - list of matrices to correlate the permutations of m1 with
+            (symmetric and hollow, and the same size as m1)
+    """
+    x, lower = _get_mantel_x(m1)
+    ys = []
+    for m in others:
+        m = asarray(m, dtype=float)
+        m_flat = m[lower]
+        y = where(lower, m - m_flat.mean(), 0.0)
+        y /= sqrt(((m_flat - m_flat.mean()) ** 2).sum())
+        ys.append(y)
+
+    y_blocks = [(start, end, array([y[start:end, :end].ravel() for y in ys]))
+                for start, end in _get_row_blocks(len(x))]
+    return x, y_blocks, _correlation_block_stats, len(others)
+
+
+def _get_mantel_class_data(m1, classes, num_classes):
+    """Returns the data used to sum permutations of m1 over each class.
+
+    Returns m1 centered and scaled (see _get_mantel_x) and, for each block
+    of rows, the class of each pair of samples in the lower triangle over
+    those rows (up to the diagonal of the last row of the block), for
+    _mantel_perm_stats. Pairs which aren't in the lower triangle or in any
+    of the classes are given the class num_classes.
+
+    Arguments:
+        m1 - the matrix to permute (symmetric and hollow)
+        classes - matrix of the class (from 0 to num_classes - 1) of each
+            pair of samples, the same size as m1
+        num_classes - the number of classes
+    """
+    x, lower = _get_mantel_x(m1)
+    classes = asarray(classes)
+    labels = where(lower & (classes >= 0) & (classes < num_classes),
+                   classes, num_classes).astype(intp)
+    label_blocks = [(start, end, labels[start:end, :end].ravel())
+                    for start, end in _get_row_blocks(len(x))]
+    return x, label_blocks, _class_block_sums, num_classes
+
+
+def _correlation_block_stats(y_block, values, num_stats):
+    """Returns the dot product of values with each row of y_block."""
+    return dot(y_block, values)
+
+
+def _class_block_sums(labels, values, num_classes):
+    """Returns the sum of values in each class of labels."""
+    sums = bincount(labels, weights=values)[:num_classes]
+    if len(sums) < num_classes:
+        sums = concatenate([sums, zeros(num_classes - len(sums))])
+    return sums
+
+
+def _mantel_perm_stats(data, perms):
+    """Returns the statistics of each permutation of m1.
+
+    Returns a 2D array with a row for each row of perms, and a column for
+    each statistic.
+
+    Arguments:
+        data - the output of _get_mantel_data or _get_mantel_class_data
+        perms - 2D array with a permutation of the samples in each row
+
+    Each permuted matrix is gathered a block of rows at a time into the
+    same buffers, and only up to the diagonal, so it is never built whole.
+    The statistics are the sums over the blocks of the block statistics
+    function of the data. Since m1 is centered and scaled, the correlation
+    with another centered and scaled matrix is a single dot product.
+    """
+    x, blocks, block_stats_f, num_stats = data
+    size = len(x)
+    row_block_size = blocks[0][1] - blocks[0][0]
+    rows_buf = empty(row_block_size * size)
+    perm_buf = empty(row_block_size * size)
+    result = zeros((len(perms), num_stats))
+    for i, perm in enumerate(perms):
+        for start, end, block in blocks:
+            rows = rows_buf[:(end - start) * size].reshape(end - start, size)
+            x.take(perm[start:end], axis=0, out=rows)
+            permuted = perm_buf[:(end - start) * end].reshape(end - start,
+                                                              end)
+            rows.take(perm[:end], axis=1, out=permuted)
+            result[i] += block_stats_f(block, permuted.ravel(), num_stats)
+    return result
+
+
+def _iter_permutations(size, num_perms, block_size):
+    """Yields num_perms permutations of range(size), in blocks of block_size
+    rows."""
+    for start in range(0, num_perms, block_size):
+        block = empty((min(block_size, num_perms - start), size), dtype=int)
+        for i in range(len(block)):
+            block[i] = permutation(size)
+        yield block
+
+
+def _run_mantel_permutations(data, n, jobs_to_start):
+    """Returns the statistics of m1 and of n permutations of m1.
+
+    Arguments:
+        data - the output of _get_mantel_data or _get_mantel_class_data
+        n - the number of permutations of m1
+        jobs_to_start - the number of processes to compute the statistics of
+            the blocks of permutations in
+
+    The permutations are drawn with numpy.random.permutation in the parent
+    process, so the results for a given seed don't depend on jobs_to_start.
+    """
+    size = len(data[0])
+    # The statistics of m1 itself are computed in the same way as those of
+    # the permutations, so that a permutation which gives the same matrix
+    # gives exactly the same statistics.
+    orig_stats = _mantel_perm_stats(data, arange(size)[newaxis])[0]
+
+    block_size = _MANTEL_PERM_BLOCK_ENTRIES // size
+    if jobs_to_start > 1:
+        block_size = min(block_size, n // (jobs_to_start * 4))
+    block_size = max(1, block_size)
+    blocks = _iter_permutations(size, n, block_size)
+    if jobs_to_start > 1:
+        pool = Pool(jobs_to_start, initializer=_set_worker_mantel_data,
+                    initargs=(data,))
+        block_stats = list(pool.imap(_mantel_worker, blocks))
+        pool.close()
+        pool.join()
+    else:
+        block_stats = [_mantel_perm_stats(data, block) for block in blocks]
+    if block_stats:
+        perm_stats = concatenate(block_stats)
+    else:
+        perm_stats = zeros((0, len(orig_stats)))
+    return orig_stats, perm_stats
+
+
+def mantel_stats(m1, others, n, jobs_to_start=1):
+    """Returns the correlations of m1 and permutations of m1 with others.
+
+    Returns a 1D array of the Pearson correlation of m1 with each of the
+    matrices in others, and a 2D array with a row of these correlations for
+    each of n permutations of the rows and columns of m1.
+
+    Only the lower triangles (excluding the diagonal) of the matrices are
+    used, so they must be symmetric and hollow.
+
+    Arguments:
+        m1 - the matrix to permute
+        others - list of matrices to correlate m1 with
+        n - the number of permutations of m1
+        jobs_to_start - the number of processes to compute the correlations
+            of the blocks of permutations in
+
+    The permutations are drawn with numpy.random.permutation, as they were
+    by mantel_test.
+    """
+    return _run_mantel_permutations(_get_mantel_data(m1, others), n,
+                                    jobs_to_start)
+
+
+def mantel_class_stats(m1, classes, num_classes, n, jobs_to_start=1):
+    """Returns the correlations of m1 and permutations of m1 with classes.
+
+    Returns a 1D array of the Pearson correlation of m1 with the model
+    matrix of each class (which is 1 for the pairs of samples in the class,
+    and 0 otherwise), and a 2D array with a row of these correlations for
+    each of n permutations of the rows and columns of m1. The correlation
+    with a class which holds none or all of the pairs is nan.
+
+    Only the lower triangles (excluding the diagonal) of the matrices are
+    used, so they must be symmetric and hollow.
+
+    Arguments:
+        m1 - the matrix to permute
+        classes - matrix of the class (from 0 to num_classes - 1) of each
+            pair of samples, the same size as m1. Pairs with any other value
+            are in none of the classes
+        num_classes - the number of classes
+        n - the number of permutations of m1
+        jobs_to_start - the number of processes to compute the correlations
+            of the blocks of permutations in
+
+    Each permutation is shared by all of the classes, and is gathered only
+    once. The covariance of m1 with the model matrix of a class is the sum
+    of m1's centered values over the class, so the correlations with all of
+    the classes come from a single weighted count of the class labels.
+    """
+    data = _get_mantel_class_data(m1, classes, num_classes)
+    orig_sums, perm_sums = _run_mantel_permutations(data, n, jobs_to_start)
+
+    # The model matrix of a class with class_size of the num_dists pairs has
+    # a sum of squares of class_size * (1 - class_size / num_dists) once
+    # centered.
+    classes = asarray(classes)
+    size = len(classes)
+    class_flat = classes[arange(size)[:, newaxis] > arange(size)]
+    class_flat = class_flat[(class_flat >= 0) & (class_flat < num_classes)]
+    class_sizes = zeros(num_classes)
+    counts = bincount(class_flat.astype(intp))
+    class_sizes[:len(counts)] = counts
+    num_dists = size * (size - 1) / 2
+    model_ss = class_sizes * (1 - class_sizes / num_dists)
+    scale = empty(num_classes)
+    scale.fill(nan)
+    scale[model_ss > 0] = 1 / sqrt(model_ss[model_ss > 0])
+    return orig_sums * scale, perm_sums * scale
+
+
+def _set_worker_mantel_data(data):
+    global _mantel_data
+    _mantel_data = data
+
+
+def _mantel_worker(perms):
+    return _mantel_perm_stats(_mantel_data, perms)
+
 # Start functions for distance_matrix_permutation_test
 
 
@@ -16,9 +16,12 @@ this takes an otu table and generates a series of subsampled (without
 replacement) otu tables.
 """
 import os.path
+from multiprocessing import Pool
 
 import numpy
-from numpy import inf
+from numpy import (arange, array, bincount, concatenate, inf, repeat,
+                   searchsorted, zeros)
+from numpy.random import RandomState
 from skbio.maths.subsample import subsample
 
 from qiime.util import FunctionWithParams
@@ -96,6 +99,16 @@ class RarefactionMaker(FunctionWithParams):
                 tmp = val.sum()
         self.max_num_taxa = tmp
 
+    def _remove_lineages(self):
+        """ removes taxonomy from the otu table's observation metadata
+        """
+        for (val, id, meta) in self.otu_table.iterObservations():
+            try:
+                del meta['taxonomy']
+            except (TypeError, KeyError) as e:
+                # no meta or just no taxonomy present
+                pass
+
     def rarefy_to_files(self, output_dir, small_included=False,
                         include_full=False, include_lineages=False,
                         empty_otus_removed=False, subsample_f=subsample):
@@ -103,12 +116,7 @@ class RarefactionMaker(FunctionWithParams):
 
         this prevents large memory usage"""
         if not include_lineages:
-            for (val, id, meta) in self.otu_table.iterObservations():
-                try:
-                    del meta['taxonomy']
-                except (TypeError, KeyError) as e:
-                    # no meta or just no taxonomy present
-                    pass
+            self._remove_lineages()
 
         self.output_dir = output_dir
         for depth in self.rare_depths:
@@ -127,6 +135,46 @@ class RarefactionMaker(FunctionWithParams):
         if include_full:
             self._write_rarefaction('full', 0, self.otu_table)
 
+    def iter_nested_rarefactions(self, small_included=False,
+                                 include_lineages=False,
+                                 empty_otus_removed=False, replace=False,
+                                 seed=None, jobs_to_start=1):
+        """ generates (depth, rep, rarefied otu table) for all depths and reps
+
+        uses iter_nested_rare_data, so all depths of a rep are drawn
+        together (see there for details), and the tables are generated
+        in memory, one rep at a time
+        """
+        if not include_lineages:
+            self._remove_lineages()
+
+        for depth, rep, sub_otu_table in iter_nested_rare_data(
+                self.otu_table, self.rare_depths, self.num_reps,
+                small_included, replace, seed, jobs_to_start):
+            if empty_otus_removed:
+                sub_otu_table = filter_otus_from_otu_table(
+                    sub_otu_table,
+                    sub_otu_table.ObservationIds, 1, inf, 0, inf)
+            yield depth, rep, sub_otu_table
+
+    def nested_rarefy_to_files(self, output_dir, small_included=False,
+                               include_full=False, include_lineages=False,
+                               empty_otus_removed=False, replace=False,
+                               seed=None, jobs_to_start=1):
+        """ computes nested rarefied otu tables and writes them
+
+        writes the same files as rarefy_to_files, but draws the tables with
+        iter_nested_rarefactions
+        """
+        self.output_dir = output_dir
+        for depth, rep, sub_otu_table in self.iter_nested_rarefactions(
+                small_included, include_lineages, empty_otus_removed,
+                replace, seed, jobs_to_start):
+            self._write_rarefaction(depth, rep, sub_otu_table)
+
+        if include_full:
+            self._write_rarefaction('full', 0, self.otu_table)
+
     def rarefy_to_list(self, small_included=False, include_full=False,
                        include_lineages=False):
         """ computes rarefied otu tables and returns a list
@@ -190,3 +238,203 @@ def get_rare_data(otu_table,
     subsampled_otu_table = otu_table.transformSamples(func)
 
     return subsampled_otu_table
+
+
+def nested_subsample(counts, depths, num_reps=1, prng=numpy.random,
+                     replace=False):
+    """Rarefy a vector of counts to several depths at once
+
+    counts: 1-D vector of integer counts
+    depths: rarefaction depths in increasing order, none of which may be
+     greater than the sum of counts
+    num_reps: number of independent draws to make
+    prng: the random number generator used to make the draws (a
+     numpy.random.RandomState, or the numpy.random module)
+    replace: if True, subsample with replacement
+
+    Returns an array of shape (num_reps, len(depths), len(counts)), where
+     result[rep, i] is the rarefaction of counts to depths[i] in rep.
+
+    Each rep makes a single draw of depths[-1] items (a random permutation
+     of the items when subsampling without replacement), and the
+     rarefaction to each depth is the prefix of that draw of the same
+     length. Each rarefaction is a uniform random subsample of counts, as
+     made by subsample, but within a rep the rarefactions are nested: each
+     one extends the one at the previous depth. This takes one pass over
+     the items per rep rather than one per depth per rep.
+    """
+    counts = array(counts).astype(int)
+    if counts.ndim != 1:
+        raise ValueError("Only 1-D vectors are supported.")
+    depths = array(depths, dtype=int).reshape(-1)
+    if (depths[1:] < depths[:-1]).any():
+        raise ValueError("Depths must be in increasing order.")
+    num_depths = len(depths)
+    num_counts = len(counts)
+    result_size = num_reps * num_depths * num_counts
+    if result_size == 0 or depths[-1] == 0:
+        return zeros((num_reps, num_depths, num_counts), dtype=int)
+    if depths[0] < 0:
+        raise ValueError("Depths cannot be negative.")
+    total = counts.sum()
+    max_depth = depths[-1]
+    if max_depth > total:
+        raise ValueError("Cannot subsample more items than exist in input "
+                         "counts vector.")
+
+    if replace:
+        draws = searchsorted(counts.cumsum(),
+                             prng.randint(0, total, (num_reps, max_depth)),
+                             side='right')
+    else:
+        items = repeat(arange(num_counts), counts)
+        draws = array([prng.permutation(items)[:max_depth]
+                       for rep in range(num_reps)])
+
+    # the item at each position of a draw is first counted at the depth of
+    # the first prefix which contains it, so count the items by (rep, depth
+    # of first prefix, index), and sum over the depths
+    first_depths = searchsorted(depths, arange(max_depth), side='right')
+    bins = ((arange(num_reps)[:, None] * num_depths + first_depths) *
+            num_counts + draws)
+    increments = bincount(bins.ravel())
+    increments = concatenate([increments,
+                              zeros(result_size - len(increments),
+                                    dtype=increments.dtype)])
+    return increments.reshape((num_reps, num_depths, num_counts)).cumsum(1)
+
+
+def iter_nested_rare_data(otu_table, depths, num_reps,
+                          include_small_samples=False, replace=False,
+                          seed=None, jobs_to_start=1):
+    """Generate (depth, rep, rarefied otu table) for each depth and rep
+
+    otu_table, include_small_samples: as for get_rare_data
+    depths: the depths to rarefy to
+    num_reps: the number of rarefied tables to make at each depth
+    replace: if True, subsample with replacement
+    seed: seed for the random number generators. If None, a seed is drawn
+     from numpy.random, so the results follow numpy.random.seed
+    jobs_to_start: number of worker processes used to subsample the samples
+
+    Each sample is rarefied with nested_subsample, so within a rep the
+     rarefied tables are nested: each sample's counts at one depth extend
+     its counts at the previous depth. Each sample gets its own random
+     number generator for each rep, seeded from seed, the sample's index
+     and the rep, so the results only depend on seed (and not e.g., on
+     jobs_to_start). The tables are generated in order of rep, then
+     depth, and only one rep is held in memory at a time. Unless
+     include_small_samples is True, depths greater than every sample are
+     skipped.
+    """
+    sample_counts, depths, seed = get_nested_rarefaction_data(
+        otu_table, depths, include_small_samples, seed)
+    sample_indices = dict([(sample_id, i)
+                           for i, sample_id in enumerate(otu_table.SampleIds)])
+
+    if jobs_to_start > 1 and len(sample_counts) > 1:
+        pool = Pool(jobs_to_start,
+                    initializer=_set_worker_rarefaction_data,
+                    initargs=(sample_counts, depths, replace, seed))
+        chunksize = max(1, len(sample_counts) // (jobs_to_start * 4))
+    else:
+        pool = None
+
+    try:
+        for rep in range(num_reps):
+            tasks = [(i, rep) for i in range(len(sample_counts))]
+            if pool is not None:
+                results = pool.imap(_nested_subsample_worker, tasks,
+                                    chunksize)
+            else:
+                results = (nested_rarefy_sample(sample_counts[i], depths,
+                                                seed, i, rep, replace)
+                           for i, rep in tasks)
+            rare_counts = list(results)
+
+            for i, depth in enumerate(depths):
+                def func(x, s_id, s_md):
+                    sample_rare_counts = rare_counts[sample_indices[s_id]]
+                    if i >= len(sample_rare_counts):
+                        # too few sequences to rarefy to this depth
+                        return x
+                    nonzero = sample_counts[sample_indices[s_id]][0]
+                    result = zeros(len(x), dtype=int)
+                    result[nonzero] = sample_rare_counts[i]
+                    return result
+
+                sub_otu_table = otu_table.transformSamples(func)
+                if not include_small_samples:
+                    # rarefied samples now contain exactly depth sequences,
+                    # so this only removes the samples which were too small
+                    sub_otu_table = filter_samples_from_otu_table(
+                        sub_otu_table,
+                        sub_otu_table.SampleIds,
+                        depth,
+                        inf)
+                yield depth, rep, sub_otu_table
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+def get_nested_rarefaction_data(otu_table, depths,
+                                include_small_samples=False, seed=None):
+    """Return the (sample counts, depths, seed) to rarefy otu_table with
+
+    sample counts: a (nonzero observation indices, counts) pair for each
+     sample, as taken by nested_rarefy_sample
+    depths: depths in increasing order, without the depths greater than
+     every sample unless include_small_samples is True
+    seed: seed, or a seed drawn from numpy.random if seed is None
+    """
+    depths = sorted(depths)
+    if seed is None:
+        seed = numpy.random.randint(0, 2 ** 31 - 1)
+    sample_counts = []
+    for sample_v in otu_table.iterSampleData():
+        nonzero = sample_v.nonzero()[0]
+        sample_counts.append((nonzero, sample_v[nonzero].astype(int)))
+    if not include_small_samples:
+        # skip the depths which are greater than every sample
+        max_total = max([counts.sum() for nonzero, counts in sample_counts]
+                        or [0])
+        depths = [depth for depth in depths if depth <= max_total]
+    return sample_counts, depths, seed
+
+
+def nested_rarefy_sample(sample_counts, depths, seed, sample_index, rep,
+                         replace=False):
+    """Rarefy one sample of a table as iter_nested_rare_data does
+
+    sample_counts, depths, seed: as returned by get_nested_rarefaction_data
+    sample_index: index of the sample in the table
+    rep: the rep to rarefy
+
+    Returns the sample's rarefied counts (of its nonzero observations) at
+     each of the depths which it has enough sequences for.
+    """
+    nonzero, counts = sample_counts
+    total = counts.sum()
+    sample_depths = [depth for depth in depths if depth <= total]
+    if not sample_depths:
+        return zeros((0, len(counts)), dtype=int)
+    prng = RandomState([seed, sample_index, rep])
+    return nested_subsample(counts, sample_depths, 1, prng, replace)[0]
+
+
+def _set_worker_rarefaction_data(sample_counts, depths, replace, seed):
+    global _worker_sample_counts, _worker_depths, _worker_replace, \
+        _worker_seed
+    _worker_sample_counts = sample_counts
+    _worker_depths = depths
+    _worker_replace = replace
+    _worker_seed = seed
+
+
+def _nested_subsample_worker(task):
+    sample_index, rep = task
+    return nested_rarefy_sample(_worker_sample_counts[sample_index],
+                                _worker_depths, _worker_seed, sample_index,
+                                rep, _worker_replace)
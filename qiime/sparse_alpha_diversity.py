@@ -0,0 +1,478 @@
+#!/usr/bin/env python
+from __future__ import division
+
+__author__ = "Justin Kuczynski"
+__copyright__ = "Copyright 2011, The QIIME Project"
+__credits__ = ["Justin Kuczynski", "Rob Knight", "Greg Caporaso"]
+__license__ = "GPL"
+__version__ = "1.8.0-dev"
+__maintainer__ = "Justin Kuczynski"
+__email__ = "justinak@gmail.com"
+
+"""Non-phylogenetic alpha diversity computed for all samples at once.
+
+The metrics in qiime.pycogent_backports.alpha_diversity take the dense count
+vector of one sample at a time. The functions here compute a metric for every
+sample of a SampleVectors (see qiime.sparse_beta_diversity) at once, from
+per-sample reductions over the nonzero counts (totals, singletons and
+doubletons, sums of squares, entropies, order statistics...), so the table is
+never densified. The reductions are held by a SampleStats, and are shared by
+all of the metrics computed from it.
+
+Each sample's values are reduced in order, so the results are the same as
+those of the per-sample metrics (with numpy 1.9 or later, which sums arrays
+pairwise, metrics which sum non-integer terms, such as dominance, may differ
+in the last bits). Samples without any counts are passed to the per-sample
+metric, so they give the same results (and errors) as before. Iterative
+estimators (fisher_alpha, michaelis_menten_fit and the lladser metrics) have
+no table-wide version, and are still computed one sample at a time.
+"""
+
+from math import ceil, e
+
+from numpy import (arange, array, asarray, bincount, concatenate, diff, exp,
+                   errstate, lexsort, log, maximum, result_type, sqrt, where,
+                   zeros)
+from scipy.special import gammaln
+
+import qiime.pycogent_backports.alpha_diversity as alph
+from qiime.sparse_beta_diversity import SampleVectors
+
+
+class SampleStats(object):
+
+    """Per-sample reductions of a SampleVectors, shared between metrics
+
+    Each reduction is computed the first time a metric asks for it, so
+    computing several metrics on the same samples only computes it once.
+    """
+
+    def __init__(self, sample_vectors):
+        self.sample_vectors = sample_vectors
+        self.num_samples = len(sample_vectors)
+        self.num_observations = sample_vectors.num_observations
+        self.values = sample_vectors.values
+        self._cache = {}
+
+    @classmethod
+    def from_table(cls, otu_table):
+        """Build SampleStats from a biom table without densifying it"""
+        return cls(SampleVectors.from_table(otu_table))
+
+    def _cached(self, name, f):
+        if name not in self._cache:
+            self._cache[name] = f()
+        return self._cache[name]
+
+    def get_nonempty(self):
+        """Return the SampleStats of the samples which have any counts"""
+        def f():
+            offsets = self.sample_vectors.offsets
+            nonempty = concatenate([[True], diff(offsets) > 0])
+            return SampleStats(SampleVectors(
+                offsets[nonempty], self.sample_vectors.indices, self.values,
+                self.num_observations))
+        return self._cached('nonempty', f)
+
+    def get_sample_indices(self):
+        """Return the index of the sample of each nonzero value"""
+        return self._cached('sample_indices', lambda: arange(
+            self.num_samples).repeat(diff(self.sample_vectors.offsets)))
+
+    def segment_sums(self, x):
+        """Return the sum of x over the nonzero values of each sample
+
+        The values of each sample are summed in order, as python's sum
+        would.
+        """
+        return _pad(bincount(self.get_sample_indices(), weights=x),
+                    self.num_samples)
+
+    def segment_counts(self, mask):
+        """Return the number of nonzero values of each sample in mask"""
+        return _pad(bincount(self.get_sample_indices()[mask]),
+                    self.num_samples)
+
+    def get_observed(self):
+        return self._cached('observed',
+                            lambda: diff(self.sample_vectors.offsets))
+
+    def get_singles(self):
+        return self._cached('singles',
+                            lambda: self.segment_counts(self.values == 1))
+
+    def get_doubles(self):
+        return self._cached('doubles',
+                            lambda: self.segment_counts(self.values == 2))
+
+    def get_totals(self):
+        return self._cached('totals', lambda: self.segment_sums(self.values))
+
+    def get_sums_of_squares(self):
+        return self._cached('sums_of_squares',
+                            lambda: self.segment_sums(self.values ** 2))
+
+    def get_freqs(self):
+        """Return each nonzero value as a fraction of its sample's total"""
+        return self._cached('freqs', lambda: self.values /
+                            self.get_totals()[self.get_sample_indices()])
+
+    def get_dominance(self):
+        """Return the sum of the squared frequencies of each sample"""
+        def f():
+            freqs = self.get_freqs()
+            return self.segment_sums(freqs * freqs)
+        return self._cached('dominance', f)
+
+    def get_entropy(self):
+        """Return the sum of freq * log(freq) over each sample"""
+        def f():
+            freqs = self.get_freqs()
+            return self.segment_sums(freqs * log(freqs))
+        return self._cached('entropy', f)
+
+    def get_sorted_order(self):
+        """Return the order which sorts the values within each sample"""
+        return self._cached('sorted_order', lambda: lexsort(
+            (self.values, self.get_sample_indices())))
+
+    def get_order_statistics(self, ranks):
+        """Return the value of each sample at ranks in its sorted counts
+
+        ranks: the rank (0 is the smallest) of the value to return for each
+         sample, counting the zeros of the sample's dense count vector
+        """
+        num_zeros = self.num_observations - self.get_observed()
+        ranks = asarray(ranks) - num_zeros
+        positions = self.sample_vectors.offsets[:-1] + maximum(ranks, 0)
+        sorted_values = concatenate([self.values[self.get_sorted_order()],
+                                     [0.]])
+        return where(ranks < 0, 0., sorted_values[positions])
+
+    def get_maxima(self):
+        def f():
+            ranks = zeros(self.num_samples, dtype=int)
+            ranks += self.num_observations - 1
+            return self.get_order_statistics(ranks)
+        return self._cached('maxima', f)
+
+
+def _pad(a, length):
+    """Pad a bincount result with zeros up to length"""
+    result = zeros(length, dtype=a.dtype)
+    result[:len(a)] = a
+    return result
+
+
+def _observed_species(stats):
+    return stats.get_observed()
+
+
+def _singles(stats):
+    return stats.get_singles()
+
+
+def _doubles(stats):
+    return stats.get_doubles()
+
+
+def _osd(stats):
+    return array([stats.get_observed(), stats.get_singles(),
+                  stats.get_doubles()]).T
+
+
+def _margalef(stats):
+    return (stats.get_observed() - 1) / log(stats.get_totals())
+
+
+def _menhinick(stats):
+    return stats.get_observed() / sqrt(stats.get_totals())
+
+
+def _dominance(stats):
+    return stats.get_dominance()
+
+
+def _simpson(stats):
+    return 1 - stats.get_dominance()
+
+
+def _simpson_reciprocal(stats):
+    return 1.0 / stats.get_dominance()
+
+
+def _enspie(stats):
+    return 1. / stats.get_dominance()
+
+
+def _simpson_e(stats):
+    return (1. / stats.get_dominance()) / stats.get_observed()
+
+
+def _shannon(stats, base=2):
+    return -stats.get_entropy() / log(base)
+
+
+def _equitability(stats, base=2):
+    return _shannon(stats, base) / (log(stats.get_observed()) / log(base))
+
+
+def _heip_e(stats):
+    return exp(_shannon(stats, base=e) - 1) / (stats.get_observed() - 1)
+
+
+def _berger_parker_d(stats):
+    return stats.get_maxima() / stats.get_totals()
+
+
+def _mcintosh_d(stats):
+    u = sqrt(stats.get_sums_of_squares())
+    n = stats.get_totals()
+    return (n - u) / (n - sqrt(n))
+
+
+def _mcintosh_e(stats):
+    numerator = sqrt(stats.get_sums_of_squares())
+    n = stats.get_totals()
+    s = stats.get_observed()
+    denominator = sqrt((n - s + 1) ** 2 + s - 1)
+    return numerator / denominator
+
+
+def _brillouin_d(stats):
+    n = stats.get_totals()
+    return (gammaln(n + 1) -
+            stats.segment_sums(gammaln(stats.values + 1))) / n
+
+
+def _robbins(stats):
+    return stats.get_singles() / stats.get_totals()
+
+
+def _goods_coverage(stats):
+    return 1 - (stats.get_singles() / stats.get_totals())
+
+
+def _esty_ci(stats):
+    n1 = stats.get_singles()
+    n2 = stats.get_doubles()
+    n = stats.get_totals()
+    z = 1.959963985
+    W = (n1 * (n - n1) + 2 * n * n2) / (n ** 3)
+    return array([n1 / n + z * sqrt(W), n1 / n - z * sqrt(W)]).T
+
+
+def _chao1(stats, bias_corrected=True):
+    o = stats.get_observed()
+    s = stats.get_singles()
+    d = stats.get_doubles()
+    result = alph.chao1_bias_corrected(o, s, d)
+    if not bias_corrected:
+        # chao1_uncorrected, where there are singletons and doubletons
+        with errstate(divide='ignore', invalid='ignore'):
+            result = where((s > 0) & (d > 0), o + s ** 2 / (d * 2.0),
+                           result)
+    return result
+
+
+def _chao1_confidence(stats, bias_corrected=True, zscore=1.96):
+    o = stats.get_observed()
+    s = stats.get_singles().astype(float)
+    d = stats.get_doubles().astype(float)
+    with errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # chao1_var, for the samples with singletons
+        chao = _chao1(stats, bias_corrected)
+        if bias_corrected:
+            var = (s * (s - 1) / (2 * (d + 1)) +
+                   (s * (2 * s - 1) ** 2) / (4 * (d + 1) ** 2) +
+                   (s ** 2 * d * (s - 1) ** 2) / (4 * (d + 1) ** 4))
+        else:
+            r = s / d
+            var = d * (.5 * r ** 2 + r ** 3 + .24 * r ** 4)
+        var = where(d == 0, s * (s - 1) / 2 + s * (2 * s - 1) ** 2 / 4 -
+                    s ** 4 / (4 * chao), var)
+        # chao_confidence_with_singletons
+        T = chao - o
+        K = exp(abs(zscore) * sqrt(log(1 + (var / T ** 2))))
+        lower = where(T == 0, o, o + T / K)
+        upper = where(T == 0, o, o + T * K)
+        # chao_confidence_no_singletons
+        n = stats.get_totals()
+        obs = o.astype(float)
+        P = exp(-n / obs)
+        bound = zscore * sqrt((obs * P / (1 - P)))
+        # as max(obs, x), which is obs if x is nan
+        no_singles_lower = obs / (1 - P) - bound
+        no_singles_lower = where(no_singles_lower > obs, no_singles_lower,
+                                 obs)
+        lower = where(s == 0, no_singles_lower, lower)
+        upper = where(s == 0, obs / (1 - P) + bound, upper)
+    return array([lower, upper]).T
+
+
+def _strong(stats):
+    # the largest value is at one of the sample's nonzero counts (it is 0
+    # at the last of them, and negative at the zeros after them)
+    sample_indices = stats.get_sample_indices()
+    order = lexsort((-stats.values, sample_indices))
+    starts = stats.sample_vectors.offsets[:-1]
+    sorted_sums = stats.values[order].cumsum()
+    sorted_sums -= concatenate([[0.], sorted_sums])[starts][sample_indices]
+    i = arange(1, len(order) + 1) - starts[sample_indices]
+    n = stats.get_totals()[sample_indices]
+    s = stats.get_observed()[sample_indices]
+    values = sorted_sums / n - (i / s)
+    result = zeros(stats.num_samples)
+    nonempty = stats.get_observed() > 0
+    if nonempty.any():
+        result[nonempty] = maximum.reduceat(values, starts[nonempty])
+    return result
+
+
+def _gini_index(stats, method='rectangles'):
+    if method not in ('rectangles', 'trapezoids'):
+        return None
+    if (stats.values < 0).any():
+        raise ValueError('Lorenz curves aren\'t meaningful for non-positive ' +
+                         'data.')
+    # the points of the Lorenz curve at the zeros are 0, so only the points
+    # at the nonzero counts add to its area
+    sample_indices = stats.get_sample_indices()
+    starts = stats.sample_vectors.offsets[:-1]
+    sorted_sums = stats.values[stats.get_sorted_order()].cumsum()
+    sorted_sums -= concatenate([[0.], sorted_sums])[starts][sample_indices]
+    heights = sorted_sums / stats.get_totals()[sample_indices]
+    dx = 1. / stats.num_observations
+    if method == 'rectangles':
+        B = dx * stats.segment_sums(heights)
+    else:
+        # the last point is only counted by h_n
+        is_last = zeros(len(heights), dtype=bool)
+        is_last[stats.sample_vectors.offsets[1:][stats.get_observed() > 0]
+                - 1] = True
+        h_n = zeros(stats.num_samples)
+        h_n[sample_indices[is_last]] = heights[is_last]
+        sum_hs = stats.segment_sums(where(is_last, 0., heights))
+        B = dx * ((0.0 + h_n) / 2. + sum_hs)
+    return 1 - 2 * B
+
+
+def _kempton_taylor_q(stats, lower_quantile=.25, upper_quantile=.75):
+    n = stats.num_observations
+    lower = int(ceil(n * lower_quantile))
+    upper = int(n * upper_quantile)
+    ranks = zeros(stats.num_samples, dtype=int)
+    return (upper - lower) / log(stats.get_order_statistics(ranks + upper) /
+                                 stats.get_order_statistics(ranks + lower))
+
+
+def _ace(stats, rare_threshold=10):
+    # the number of OTUs with each count up to rare_threshold, as computed by
+    # counts (which truncates non-integer counts)
+    counts = stats.values.astype(int)
+    freq_counts = zeros((rare_threshold + 1, stats.num_samples))
+    for i in range(1, rare_threshold + 1):
+        freq_counts[i] = stats.segment_counts(counts == i)
+    num_rare = freq_counts[1:rare_threshold].sum(0)
+    s_abun = stats.segment_counts(counts > rare_threshold)
+    only_abundant = num_rare == 0
+    if ((freq_counts[1] == num_rare) & ~only_abundant).any():
+        raise ValueError("only rare species are singletons, ACE " +
+                         "metric is undefined. EstimateS suggests using bias corrected Chao1")
+    s_rare = freq_counts[1:].sum(0)
+    i = arange(rare_threshold + 1)[:, None]
+    n_rare = (i * freq_counts).sum(0)
+    with errstate(divide='ignore', invalid='ignore'):
+        c_ace = 1 - freq_counts[1] / n_rare
+        top = s_rare * (i * freq_counts * (i - 1)).sum(0)
+        bottom = c_ace * n_rare * (n_rare - 1.0)
+        gamma_ace = maximum((top / bottom) - 1.0, 0)
+        result = s_abun + (s_rare / c_ace) + ((freq_counts[1] / c_ace) *
+                                              gamma_ace)
+    return where(only_abundant, s_abun, result)
+
+
+# Metrics which can be computed for all samples at once, mapped to a
+# function taking the SampleStats (and the metric's parameters). The
+# function may return None if it can't handle the parameters, in which case
+# the metric is computed one sample at a time.
+sparse_alpha_metrics = {
+    alph.ACE: _ace,
+    alph.berger_parker_d: _berger_parker_d,
+    alph.brillouin_d: _brillouin_d,
+    alph.chao1: _chao1,
+    alph.chao1_confidence: _chao1_confidence,
+    alph.dominance: _dominance,
+    alph.doubles: _doubles,
+    alph.enspie: _enspie,
+    alph.equitability: _equitability,
+    alph.esty_ci: _esty_ci,
+    alph.gini_index: _gini_index,
+    alph.goods_coverage: _goods_coverage,
+    alph.heip_e: _heip_e,
+    alph.kempton_taylor_q: _kempton_taylor_q,
+    alph.margalef: _margalef,
+    alph.mcintosh_d: _mcintosh_d,
+    alph.mcintosh_e: _mcintosh_e,
+    alph.menhinick: _menhinick,
+    alph.observed_species: _observed_species,
+    alph.osd: _osd,
+    alph.robbins: _robbins,
+    alph.shannon: _shannon,
+    alph.simpson: _simpson,
+    alph.simpson_e: _simpson_e,
+    alph.simpson_reciprocal: _simpson_reciprocal,
+    alph.singles: _singles,
+    alph.strong: _strong,
+}
+
+
+def is_sparse_alpha_metric(metric_f):
+    """Return True if metric_f can be computed with sparse_alpha"""
+    return metric_f in sparse_alpha_metrics
+
+
+def sparse_alpha(sample_stats, metric_f, params=None):
+    """Return metric_f for each sample of sample_stats
+
+    sample_stats: a SampleStats
+    metric_f: a metric from qiime.pycogent_backports.alpha_diversity
+    params: dict of keyword arguments for metric_f
+
+    The result is laid out as AlphaDiversityCalc's: a value per sample, or a
+     row of values per sample if metric_f has return_names.
+    """
+    params = params or {}
+    table_f = sparse_alpha_metrics.get(metric_f)
+    empty = sample_stats.get_observed() == 0
+    result = None
+    if table_f is not None and not empty.all():
+        # empty samples are left out, so that they can't raise errors which
+        # the per-sample metric doesn't
+        result = table_f(sample_stats.get_nonempty(), **params)
+    if result is None:
+        # no table-wide version, so compute the metric one sample at a time
+        return array([metric_f(v, **params)
+                      for v in _iter_dense_samples(sample_stats)])
+
+    if empty.any():
+        # use the metric's own value for an empty sample
+        result = asarray(result)
+        empty_value = asarray(metric_f(zeros(sample_stats.num_observations),
+                                       **params))
+        full_result = zeros((sample_stats.num_samples,) + result.shape[1:],
+                            dtype=result_type(result, empty_value))
+        full_result[~empty] = result
+        full_result[empty] = empty_value
+        result = full_result
+    return result
+
+
+def _iter_dense_samples(sample_stats):
+    sample_vectors = sample_stats.sample_vectors
+    for i in range(len(sample_vectors)):
+        start, end = sample_vectors.offsets[i:i + 2]
+        v = zeros(sample_vectors.num_observations)
+        v[sample_vectors.indices[start:end]] = sample_vectors.values[
+            start:end]
+        yield v
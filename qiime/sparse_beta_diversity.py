@@ -0,0 +1,519 @@
+#!/usr/bin/env python
+from __future__ import division
+
+__author__ = "Justin Kuczynski"
+__copyright__ = "Copyright 2011, The QIIME Project"
+__credits__ = ["Justin Kuczynski", "Greg Caporaso"]
+__license__ = "GPL"
+__version__ = "1.8.0-dev"
+__maintainer__ = "Justin Kuczynski"
+__email__ = "justinak@gmail.com"
+
+"""Non-phylogenetic beta diversity computed from sparse sample vectors.
+
+The metrics in cogent.maths.distance_transform take a dense samples x
+observations matrix. For large, mostly empty OTU tables that matrix can be
+much larger than the table itself. The functions here instead hold each
+sample as its nonzero (observation index, value) pairs, and compute the
+distance matrix in square tiles of samples. Each tile is densified only
+over the observations present in at least one of its samples, so memory
+use is bounded by the tile size rather than by the size of the table.
+
+Only metrics where the distance between two samples depends on those two
+samples alone, and is unchanged by observations which are absent from both,
+can be computed this way (e.g., not chisq or gower, which depend on the
+other samples, or pearson, which depends on the number of observations).
+"""
+
+from itertools import izip
+from multiprocessing import Pool
+
+from numpy import (arange, argsort, array, asarray, concatenate, dot,
+                   isfinite, maximum, minimum, searchsorted, sqrt, unique,
+                   where, zeros)
+import cogent.maths.distance_transform as distance_transform
+from biom.table import DenseTable
+
+
+class _TileStats(object):
+
+    """Per-sample statistics of a pair of tiles, shared between metrics
+
+    Row sums (used by the Bray-Curtis family and Kulczynski) and presence
+    counts (used by the binary metrics) are computed the first time a metric
+    asks for them, so computing several metrics on the same tiles only
+    computes them once.
+    """
+
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+        self._sums = None
+        self._binary_counts = None
+
+    def get_sums(self):
+        """Return the row sums of a and of b"""
+        if self._sums is None:
+            a_sums = self.a.sum(1)
+            if self.b is self.a:
+                b_sums = a_sums
+            else:
+                b_sums = self.b.sum(1)
+            self._sums = (a_sums, b_sums)
+        return self._sums
+
+    def get_binary_counts(self):
+        """Return the observation counts of a and b, and the shared counts"""
+        if self._binary_counts is None:
+            a = (self.a != 0).astype(float)
+            if self.b is self.a:
+                b = a
+            else:
+                b = (self.b != 0).astype(float)
+            self._binary_counts = (a.sum(1)[:, None], b.sum(1)[None, :],
+                                   dot(a, b.T))
+        return self._binary_counts
+
+
+def _bray_curtis_tile(a, b, stats):
+    result = zeros((len(a), len(b)))
+    a_sums, b_sums = stats.get_sums()
+    for i, r in enumerate(a):
+        abs_v = abs(r - b).sum(1)
+        v = a_sums[i] + b_sums
+        nonzero = v > 0
+        result[i][nonzero] = abs_v[nonzero] / v[nonzero]
+    return result
+
+
+def _bray_curtis_magurran_tile(a, b, stats):
+    result = zeros((len(a), len(b)))
+    a_sums, b_sums = stats.get_sums()
+    for i, r in enumerate(a):
+        min_sums = minimum(r, b).sum(1)
+        sums = a_sums[i] + b_sums
+        nonzero = sums != 0
+        result[i][nonzero] = 1 - ((2 * min_sums[nonzero]) / sums[nonzero])
+    return result
+
+
+def _canberra_tile(a, b, stats):
+    result = zeros((len(a), len(b)))
+    for i, r in enumerate(a):
+        numerator = abs(r - b)
+        denominator = r + b
+        net = zeros(denominator.shape)
+        nonzero = denominator != 0
+        net[nonzero] = numerator[nonzero] / denominator[nonzero]
+        num_nonzeros = (net != 0).sum(1)
+        nonzero = num_nonzeros > 0
+        result[i][nonzero] = net.sum(1)[nonzero] / num_nonzeros[nonzero]
+    return result
+
+
+def _euclidean_tile(a, b, stats):
+    result = zeros((len(a), len(b)))
+    for i, r in enumerate(a):
+        result[i] = sqrt(((r - b) ** 2).sum(1))
+    return result
+
+
+def _kulczynski_tile(a, b, stats):
+    result = zeros((len(a), len(b)))
+    a_sums, b_sums = stats.get_sums()
+    for i, r in enumerate(a):
+        if a_sums[i] == 0.0:
+            # one row zeros (distance 1), or both rows zeros (distance 0)
+            result[i] = where(b_sums == 0.0, 0.0, 1.0)
+            continue
+        min_sums = minimum(r, b).sum(1)
+        result[i] = 1.0
+        nonzero = b_sums != 0.0
+        result[i][nonzero] = 1.0 - (((min_sums[nonzero] / a_sums[i]) +
+                                     (min_sums[nonzero] / b_sums[nonzero])) / 2.0)
+    return result
+
+
+def _manhattan_tile(a, b, stats):
+    result = zeros((len(a), len(b)))
+    for i, r in enumerate(a):
+        result[i] = abs(r - b).sum(1)
+    return result
+
+
+def _soergel_tile(a, b, stats):
+    result = zeros((len(a), len(b)))
+    for i, r in enumerate(a):
+        top = abs(r - b).sum(1)
+        bottom = maximum(r, b).sum(1)
+        nonzero = bottom > 0.0
+        result[i][nonzero] = top[nonzero] / bottom[nonzero]
+    return result
+
+
+def _binary_euclidean_tile(a, b, stats):
+    a_counts, b_counts, shared = stats.get_binary_counts()
+    return sqrt(a_counts + b_counts - (2.0 * shared))
+
+
+def _binary_hamming_tile(a, b, stats):
+    a_counts, b_counts, shared = stats.get_binary_counts()
+    return a_counts + b_counts - (2.0 * shared)
+
+
+def _binary_jaccard_tile(a, b, stats):
+    a_counts, b_counts, shared = stats.get_binary_counts()
+    union = a_counts + b_counts - shared
+    result = zeros(shared.shape)
+    nonzero = union != 0
+    result[nonzero] = 1.0 - (shared[nonzero] / union[nonzero])
+    return result
+
+
+def _binary_lennon_tile(a, b, stats):
+    a_counts, b_counts, shared = stats.get_binary_counts()
+    result = zeros(shared.shape)
+    result[(a_counts + b_counts) != 0] = 1.0
+    nonzero = shared != 0
+    min_unshared = minimum(a_counts - shared, b_counts - shared)[nonzero]
+    result[nonzero] = 1.0 - (shared[nonzero] /
+                             (shared[nonzero] + min_unshared))
+    return result
+
+
+def _binary_ochiai_tile(a, b, stats):
+    a_counts, b_counts, shared = stats.get_binary_counts()
+    products = a_counts * b_counts
+    result = zeros(shared.shape)
+    result[(a_counts + b_counts) != 0] = 1.0
+    nonzero = products != 0
+    result[nonzero] = 1.0 - (shared[nonzero] / sqrt(products[nonzero]))
+    return result
+
+
+def _binary_sorensen_dice_tile(a, b, stats):
+    a_counts, b_counts, shared = stats.get_binary_counts()
+    bottom = a_counts + b_counts
+    result = zeros(shared.shape)
+    nonzero = bottom != 0
+    result[nonzero] = 1 - (2 * shared[nonzero] / bottom[nonzero])
+    return result
+
+
+# Metrics which can be computed from sparse sample vectors, mapped to
+# a function computing the a x b distances between the rows of two dense
+# tiles (given the tiles and their _TileStats), or None if the cogent metric
+# should be applied to the tiles directly
+sparse_beta_metrics = {
+    distance_transform.dist_abund_jaccard: None,
+    distance_transform.dist_bray_curtis: _bray_curtis_tile,
+    distance_transform.dist_bray_curtis_magurran: _bray_curtis_magurran_tile,
+    distance_transform.dist_canberra: _canberra_tile,
+    distance_transform.dist_chord: None,
+    distance_transform.dist_euclidean: _euclidean_tile,
+    distance_transform.dist_hellinger: None,
+    distance_transform.dist_kulczynski: _kulczynski_tile,
+    distance_transform.dist_manhattan: _manhattan_tile,
+    distance_transform.dist_morisita_horn: None,
+    distance_transform.dist_soergel: _soergel_tile,
+    distance_transform.dist_specprof: None,
+    distance_transform.binary_dist_chord: None,
+    distance_transform.binary_dist_euclidean: _binary_euclidean_tile,
+    distance_transform.binary_dist_hamming: _binary_hamming_tile,
+    distance_transform.binary_dist_jaccard: _binary_jaccard_tile,
+    distance_transform.binary_dist_lennon: _binary_lennon_tile,
+    distance_transform.binary_dist_ochiai: _binary_ochiai_tile,
+    distance_transform.binary_dist_sorensen_dice: _binary_sorensen_dice_tile,
+}
+
+# Metrics which (in cogent) raise a ValueError for negative values
+_nonnegative_metrics = set([distance_transform.dist_abund_jaccard,
+                            distance_transform.dist_bray_curtis,
+                            distance_transform.dist_bray_curtis_magurran,
+                            distance_transform.dist_canberra,
+                            distance_transform.dist_hellinger,
+                            distance_transform.dist_kulczynski,
+                            distance_transform.dist_morisita_horn,
+                            distance_transform.dist_soergel,
+                            distance_transform.dist_specprof])
+
+
+def is_sparse_beta_metric(metric_f):
+    """Return True if metric_f can be computed with sparse_beta"""
+    return metric_f in sparse_beta_metrics
+
+
+class SampleVectors(object):
+
+    """Nonzero observation counts of each sample in an OTU table
+
+    The observation indices and values of sample i are
+    indices[offsets[i]:offsets[i + 1]] and values[offsets[i]:offsets[i + 1]],
+    with indices sorted within each sample.
+    """
+
+    def __init__(self, offsets, indices, values, num_observations):
+        self.offsets = asarray(offsets)
+        self.indices = asarray(indices)
+        self.values = asarray(values, dtype=float)
+        self.num_observations = num_observations
+
+    @classmethod
+    def from_table(cls, otu_table):
+        """Build SampleVectors from a biom table without densifying it"""
+        num_samples = len(otu_table.SampleIds)
+        num_observations = len(otu_table.ObservationIds)
+        if isinstance(otu_table, DenseTable):
+            # the dense table data is observations x samples
+            data = asarray(otu_table._data).T
+            sample_indices, indices = data.nonzero()
+            values = data[sample_indices, indices]
+        else:
+            items = otu_table._data.items()
+            indices = array([k[0] for k, v in items if v != 0], dtype=int)
+            sample_indices = array([k[1] for k, v in items if v != 0],
+                                   dtype=int)
+            values = array([v for k, v in items if v != 0], dtype=float)
+            # sort by sample, then by observation
+            order = argsort(sample_indices * num_observations + indices,
+                            kind='mergesort')
+            sample_indices = sample_indices[order]
+            indices = indices[order]
+            values = values[order]
+        offsets = searchsorted(sample_indices, arange(num_samples + 1))
+        return cls(offsets, indices, values, num_observations)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def get_dense_tile(self, sample_indices):
+        """Return the samples as a dense matrix over their observations
+
+        Only the observations which are present in at least one of the
+        samples are included as columns.
+        """
+        slices = [slice(self.offsets[i], self.offsets[i + 1])
+                  for i in sample_indices]
+        if slices:
+            columns = unique(concatenate([self.indices[s] for s in slices]))
+        else:
+            columns = array([], dtype=int)
+        tile = zeros((len(slices), len(columns)))
+        for row, s in enumerate(slices):
+            tile[row, searchsorted(columns, self.indices[s])] = self.values[s]
+        return tile
+
+
+def _check_values(values, metric_f):
+    """Raise ValueError as cogent's strict checks would"""
+    if not isfinite(values).all():
+        raise ValueError("non finite number in input matrix")
+    if metric_f in _nonnegative_metrics and (values < 0.0).any():
+        raise ValueError("negative value in input matrix")
+
+
+def _compute_tiles(sample_vectors, metric_fs, row_indices, col_indices):
+    """Return the distances between row_indices and col_indices samples
+
+    A list with the distances for each of metric_fs is returned. The samples
+    are densified once, and their _TileStats are shared by all metrics.
+
+    If row_indices and col_indices are the same, a diagonal tile is
+    computed and its diagonal is set to zero.
+    """
+    diagonal = row_indices == col_indices
+    if diagonal:
+        tile = sample_vectors.get_dense_tile(row_indices)
+        a = b = tile
+    else:
+        tile = sample_vectors.get_dense_tile(list(row_indices) +
+                                             list(col_indices))
+        a = tile[:len(row_indices)]
+        b = tile[len(row_indices):]
+
+    if tile.shape[1] == 0:
+        # all of the samples are empty
+        return [zeros((len(row_indices), len(col_indices)))
+                for metric_f in metric_fs]
+
+    stats = _TileStats(a, b)
+    results = []
+    for metric_f in metric_fs:
+        tile_f = sparse_beta_metrics[metric_f]
+        if tile_f is not None:
+            result = tile_f(a, b, stats)
+        elif diagonal:
+            result = metric_f(tile)
+        else:
+            result = metric_f(tile)[:len(row_indices), len(row_indices):]
+
+        if diagonal:
+            result[arange(len(result)), arange(len(result))] = 0.0
+        results.append(result)
+    return results
+
+
+def _compute_tile(sample_vectors, metric_f, row_indices, col_indices):
+    """Return the distances between row_indices and col_indices samples
+
+    See _compute_tiles for details.
+    """
+    return _compute_tiles(sample_vectors, [metric_f], row_indices,
+                          col_indices)[0]
+
+
+def get_tile_size(sample_vectors, max_tile_elements=2 ** 18):
+    """Return a tile size which keeps the dense tiles cache-sized
+
+    The number of columns in a tile is estimated from the mean number of
+    observations per sample, and the largest power of two number of
+    samples (between 8 and 1024) whose tiles are expected to have at most
+    max_tile_elements values is returned.
+    """
+    num_samples = max(len(sample_vectors), 1)
+    return get_tile_size_for_density(sample_vectors.num_observations,
+                                     len(sample_vectors.indices) / num_samples,
+                                     max_tile_elements)
+
+
+def get_tile_size_for_density(num_columns, mean_nonzeros,
+                              max_tile_elements=2 ** 18):
+    """Return a tile size for samples with mean_nonzeros of num_columns values
+
+    See get_tile_size for a description of how the size is chosen.
+    """
+    mean_nonzeros = max(mean_nonzeros, 1)
+    tile_size = 8
+    while tile_size < 1024:
+        next_size = tile_size * 2
+        tile_columns = min(num_columns, 2 * next_size * mean_nonzeros)
+        if next_size * tile_columns > max_tile_elements:
+            break
+        tile_size = next_size
+    return tile_size
+
+
+def get_tiles(num_samples, tile_size):
+    """Return the lower triangle tiles in column-major order
+
+    Each tile is a (row block, column block) pair of lists of sample
+    indices. Once all of the tiles in a column block have been computed,
+    the rows of that block are complete.
+    """
+    blocks = [range(start, min(start + tile_size, num_samples))
+              for start in range(0, num_samples, tile_size)]
+    tiles = []
+    for j, col_block in enumerate(blocks):
+        tiles.append((col_block, col_block))
+        for row_block in blocks[j + 1:]:
+            tiles.append((row_block, col_block))
+    return tiles
+
+
+def _set_worker_sample_vectors(sample_vectors, metric_fs):
+    global _worker_sample_vectors, _worker_metric_fs
+    _worker_sample_vectors = sample_vectors
+    _worker_metric_fs = metric_fs
+
+
+def _compute_tiles_worker(tile):
+    row_indices, col_indices = tile
+    return _compute_tiles(_worker_sample_vectors, _worker_metric_fs,
+                          row_indices, col_indices)
+
+
+def iter_sparse_beta_rows(sample_vectors, metric_f, tile_size=None,
+                          jobs_to_start=1):
+    """Generate (sample index, distances) for each row of the distance matrix
+
+    sample_vectors: a SampleVectors object
+    metric_f: a metric function from cogent.maths.distance_transform for
+     which is_sparse_beta_metric returns True
+    tile_size: number of samples in each row and column block of a tile
+     (default: chosen by get_tile_size)
+    jobs_to_start: number of worker processes used to compute tiles
+
+    Rows are generated in order as soon as all of the tiles they span have
+     been computed, so the distance matrix can be written out while it is
+     still being computed.
+    """
+    rows = iter_multiple_sparse_beta_rows(sample_vectors, [metric_f],
+                                          tile_size, jobs_to_start)
+    return ((i, metric_rows[0]) for i, metric_rows in rows)
+
+
+def iter_multiple_sparse_beta_rows(sample_vectors, metric_fs, tile_size=None,
+                                   jobs_to_start=1):
+    """Generate (sample index, [distances for each metric]) for each row
+
+    As iter_sparse_beta_rows, but computes the distance matrices of all of
+     metric_fs in a single pass over the tiles.
+    """
+    for metric_f in metric_fs:
+        if not is_sparse_beta_metric(metric_f):
+            raise ValueError("%s can't be computed from sparse sample vectors."
+                             % metric_f.__name__)
+        # check the values before any rows are generated
+        _check_values(sample_vectors.values, metric_f)
+    return _iter_sparse_beta_rows(sample_vectors, list(metric_fs), tile_size,
+                                  jobs_to_start)
+
+
+def _iter_sparse_beta_rows(sample_vectors, metric_fs, tile_size,
+                           jobs_to_start):
+    num_samples = len(sample_vectors)
+    if tile_size is None:
+        tile_size = get_tile_size(sample_vectors)
+    tiles = get_tiles(num_samples, tile_size)
+    if jobs_to_start > 1 and len(tiles) > 1:
+        pool = Pool(jobs_to_start,
+                    initializer=_set_worker_sample_vectors,
+                    initargs=(sample_vectors, metric_fs))
+        results = pool.imap(_compute_tiles_worker, tiles)
+    else:
+        pool = None
+        results = (_compute_tiles(sample_vectors, metric_fs, row_indices,
+                                  col_indices)
+                   for row_indices, col_indices in tiles)
+
+    try:
+        dists = [zeros((num_samples, num_samples)) for metric_f in metric_fs]
+        for (row_indices, col_indices), tile_results in izip(tiles, results):
+            rows = slice(row_indices[0], row_indices[-1] + 1)
+            cols = slice(col_indices[0], col_indices[-1] + 1)
+            for metric_dists, result in zip(dists, tile_results):
+                metric_dists[rows, cols] = result
+                metric_dists[cols, rows] = result.T
+            if row_indices[-1] == num_samples - 1:
+                # last tile of this column block, so its rows are complete
+                for i in col_indices:
+                    yield i, [metric_dists[i] for metric_dists in dists]
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+def sparse_beta(sample_vectors, metric_f, tile_size=None, jobs_to_start=1):
+    """Return the distance matrix between all samples in sample_vectors
+
+    See iter_sparse_beta_rows for a description of the parameters.
+    """
+    return multiple_sparse_beta(sample_vectors, [metric_f], tile_size,
+                                jobs_to_start)[0]
+
+
+def multiple_sparse_beta(sample_vectors, metric_fs, tile_size=None,
+                         jobs_to_start=1):
+    """Return a list of the distance matrices for each of metric_fs
+
+    The tiles are densified once for all of the metrics. See
+     iter_sparse_beta_rows for a description of the other parameters.
+    """
+    num_samples = len(sample_vectors)
+    dists = [zeros((num_samples, num_samples)) for metric_f in metric_fs]
+    for i, metric_rows in iter_multiple_sparse_beta_rows(
+            sample_vectors, metric_fs, tile_size, jobs_to_start):
+        for metric_dists, row in zip(dists, metric_rows):
+            metric_dists[i] = row
+    return dists
@@ -53,7 +53,7 @@ from cogent.util.misc import remove_files
 from skbio.core.sequence import DNASequence
 
 from qiime.check_id_map import process_id_map
-from qiime.barcode import correct_barcode
+from qiime.barcode import correct_barcode, BarcodeCorrector
 from qiime.hamming import decode_barcode_8
 from qiime.golay import decode as decode_golay_12
 from qiime.format import format_histograms
@@ -603,6 +603,14 @@ def check_seqs(fasta_out, fasta_files, starting_ix, valid_map, qual_mappings,
     below_seq_min_after_trunc = 0
     below_seq_min_after_ambi_trunc = 0
 
+    valid_barcodes = valid_map.keys()
+    # without an added demultiplex field the barcode check depends only on
+    # the barcode, so each distinct barcode is checked (and corrected) once
+    if added_demultiplex_field:
+        check_barcode_f = check_barcode
+    else:
+        check_barcode_f = BarcodeCorrector(check_barcode)
+
     for fasta_in in fasta_files:
         for curr_id, curr_seq in parse_fasta(fasta_in):
             curr_rid = curr_id.split()[0]
@@ -702,8 +710,8 @@ def check_seqs(fasta_out, fasta_files, starting_ix, valid_map, qual_mappings,
             # get current barcode
             try:
                 bc_diffs, curr_bc, corrected_bc = \
-                    check_barcode(cbc, barcode_type, valid_map.keys(),
-                                  attempt_bc_correction, added_demultiplex_field, curr_id)
+                    check_barcode_f(cbc, barcode_type, valid_barcodes,
+                                    attempt_bc_correction, added_demultiplex_field, curr_id)
                 if bc_diffs > max_bc_errors:
                     raise ValueError("Too many errors in barcode")
                 corr_ct += bool(corrected_bc)
@@ -10,11 +10,14 @@ __version__ = "1.8.0-dev"
 __maintainer__ = "Greg Caporaso"
 __email__ = "gregcaporaso@gmail.com"
 
-from itertools import izip, cycle
+from itertools import izip, cycle, islice
+from collections import deque
+from multiprocessing import Pool
 from os.path import split, splitext
 from os import makedirs
 
-from numpy import log10, arange, histogram
+from numpy import (log10, arange, histogram, array, asarray, zeros, uint8,
+                   frombuffer, concatenate, maximum, where)
 
 from skbio.parse.sequences import parse_fastq
 from skbio.core.sequence import DNA
@@ -24,6 +27,7 @@ from qiime.format import (format_histogram_one_count,
 from qiime.parse import is_casava_v180_or_later
 from qiime.hamming import decode_hamming_8
 from qiime.golay import decode_golay_12
+from qiime.barcode import BarcodeCorrector
 from qiime.quality import phred_to_ascii33, phred_to_ascii64
 
 
@@ -75,6 +79,23 @@ def read_qual_score_filter(seq, qual, max_run_length, threshold):
     return seq, qual
 
 
+def has_bad_illumina_qual_digit(header):
+    """True if the Illumina quality digit in header is 0"""
+    h = header.split()[0]
+    try:
+        # this block is a little strange because each of these
+        # can throw a ValueError. The same thing needs to be done
+        # in either case, so it doesn't really make sense to split
+        # into two separate try/excepts, particulary because that would
+        # complicate the logic
+        quality_char = header[h.index('#') + 1]
+        illumina_quality_digit = int(quality_char)
+    except ValueError:
+        return False
+    else:
+        return illumina_quality_digit == 0
+
+
 def quality_filter_sequence(header,
                             sequence,
                             quality,
@@ -83,21 +104,8 @@ def quality_filter_sequence(header,
                             min_per_read_length,
                             seq_max_N,
                             filter_bad_illumina_qual_digit):
-    if filter_bad_illumina_qual_digit:
-        h = header.split()[0]
-        try:
-            # this block is a little strange because each of these
-            # can throw a ValueError. The same thing needs to be done
-            # in either case, so it doesn't really make sense to split
-            # into two separate try/excepts, particulary because that would
-            # complicate the logic
-            quality_char = header[h.index('#') + 1]
-            illumina_quality_digit = int(quality_char)
-        except ValueError:
-            pass
-        else:
-            if illumina_quality_digit == 0:
-                return 3, sequence, quality
+    if filter_bad_illumina_qual_digit and has_bad_illumina_qual_digit(header):
+        return 3, sequence, quality
 
     sequence, quality = read_qual_score_filter(sequence,
                                                quality,
@@ -112,6 +120,89 @@ def quality_filter_sequence(header,
         return 0, sequence, quality
 
 
+def quality_filter_sequences(headers,
+                             sequences,
+                             qualities,
+                             max_bad_run_length,
+                             phred_quality_threshold,
+                             min_per_read_length,
+                             seq_max_N,
+                             filter_bad_illumina_qual_digit):
+    """Quality filter a batch of reads at once
+
+        Equivalent to calling quality_filter_sequence on each
+        (header, sequence, quality) triple, but the search for runs of
+        low quality bases and the N counting are performed on padded
+        arrays covering the whole batch rather than base by base.
+
+        return value: list of (quality filter result, sequence, quality)
+         tuples, one per input read, as returned by quality_filter_sequence
+    """
+    num_reads = len(sequences)
+    if num_reads == 0:
+        return []
+
+    lengths = array([len(seq) for seq in sequences])
+    max_length = lengths.max()
+    positions = arange(max_length)
+
+    # scatter the concatenated reads into a (reads x positions) matrix.
+    # padding positions are treated as good quality so they never
+    # extend a bad run
+    in_read = positions < lengths[:, None]
+    if max_length > 0:
+        seq_codes = zeros((num_reads, max_length), dtype=uint8)
+        seq_codes[in_read] = frombuffer(''.join(sequences), dtype=uint8)
+        bad = zeros((num_reads, max_length), dtype=bool)
+        if phred_quality_threshold is not None:
+            bad[in_read] = \
+                concatenate([asarray(q) for q in qualities]) <= \
+                phred_quality_threshold
+    else:
+        seq_codes = zeros((num_reads, 0), dtype=uint8)
+        bad = zeros((num_reads, 0), dtype=bool)
+
+    # for each position, the index of the most recent good base (or -1),
+    # and from that the length of the bad run ending at that position
+    last_good = maximum.accumulate(where(bad, -1, positions), axis=1)
+    too_long = (positions - last_good) > max_bad_run_length
+
+    # reads are truncated after the last good base preceding the first
+    # bad run which exceeds max_bad_run_length
+    truncated_lengths = lengths.copy()
+    has_long_run = too_long.any(axis=1)
+    if has_long_run.any():
+        # argmax fails when every read is empty, but then none have runs
+        first_long_run = too_long.argmax(axis=1)
+        truncated_lengths[has_long_run] = \
+            last_good[has_long_run, first_long_run[has_long_run]] + 1
+
+    n_counts = ((seq_codes == ord('N')) &
+                (positions < truncated_lengths[:, None])).sum(axis=1)
+
+    results = []
+    for i in range(num_reads):
+        sequence = sequences[i]
+        quality = qualities[i]
+        if filter_bad_illumina_qual_digit and \
+           has_bad_illumina_qual_digit(headers[i]):
+            results.append((3, sequence, quality))
+            continue
+
+        truncated_length = truncated_lengths[i]
+        if truncated_length < lengths[i]:
+            sequence = sequence[:truncated_length]
+            quality = quality[:truncated_length]
+
+        if truncated_length < min_per_read_length:
+            results.append((1, sequence, quality))
+        elif n_counts[i] > seq_max_N:
+            results.append((2, sequence, quality))
+        else:
+            results.append((0, sequence, quality))
+    return results
+
+
 def check_header_match_pre180(header1, header2):
 
     # split on '#' and '/' to handle cases with and without the
@@ -185,7 +276,9 @@ def process_fastq_single_end_read_file_no_barcode(
         filter_bad_illumina_qual_digit=False,
         log_f=None,
         histogram_f=None,
-        phred_to_ascii_f=None):
+        phred_to_ascii_f=None,
+        jobs_to_start=1,
+        chunk_size=10000):
     """ Quality filtering when a single sample has been run in a lane
 
         This code simulates a barcode file to allow us to re-use the quality
@@ -214,7 +307,9 @@ def process_fastq_single_end_read_file_no_barcode(
             barcode_correction_fn=None,
             max_barcode_errors=0,
             strict_header_match=False,
-            phred_to_ascii_f=phred_to_ascii_f):
+            phred_to_ascii_f=phred_to_ascii_f,
+            jobs_to_start=jobs_to_start,
+            chunk_size=chunk_size):
         yield e
 
 
@@ -235,13 +330,17 @@ def process_fastq_single_end_read_file(fastq_read_f,
                                        barcode_correction_fn=None,
                                        max_barcode_errors=1.5,
                                        strict_header_match=True,
-                                       phred_to_ascii_f=None):
+                                       phred_to_ascii_f=None,
+                                       jobs_to_start=1,
+                                       chunk_size=10000):
     """parses fastq single-end read file
-    """
-    header_index = 0
-    sequence_index = 1
-    quality_index = 2
 
+        Records are processed in chunks of chunk_size (barcode, read) pairs.
+        If jobs_to_start is greater than one, chunks are demultiplexed and
+        quality filtered in a pool of jobs_to_start worker processes. Results
+        are always yielded in input order, and sequence ids, log and histogram
+        output are identical to a serial run.
+    """
     seq_id = start_seq_id
     # grab the first lines and then seek back to the beginning of the file
     try:
@@ -275,6 +374,30 @@ def process_fastq_single_end_read_file(fastq_read_f,
     min_per_read_length = min_per_read_length_fraction * \
         len(fastq_read_f_line2)
 
+    # barcodes in the mapping file map directly to their sample ids, and
+    # all other barcodes are corrected once and then looked up
+    barcode_corrector = BarcodeCorrector(
+        correct_barcode,
+        precomputed=dict([(bc, (0, bc, False, sid))
+                          for bc, sid in barcode_to_sample_id.items()]))
+
+    filter_params = {
+        'barcode_to_sample_id': barcode_to_sample_id,
+        'barcode_corrector': barcode_corrector,
+        'barcode_length': barcode_length,
+        'check_header_match_f': check_header_match_f,
+        'strict_header_match': strict_header_match,
+        'store_unassigned': store_unassigned,
+        'max_bad_run_length': max_bad_run_length,
+        'phred_quality_threshold': phred_quality_threshold,
+        'min_per_read_length': min_per_read_length,
+        'rev_comp': rev_comp,
+        'rev_comp_barcode': rev_comp_barcode,
+        'seq_max_N': seq_max_N,
+        'filter_bad_illumina_qual_digit': filter_bad_illumina_qual_digit,
+        'barcode_correction_fn': barcode_correction_fn,
+        'max_barcode_errors': max_barcode_errors}
+
     # prep data for logging
     input_sequence_count = 0
     count_barcode_not_in_map = 0
@@ -284,10 +407,105 @@ def process_fastq_single_end_read_file(fastq_read_f,
     count_barcode_errors_exceed_max = 0
     sequence_lengths = []
     seqs_per_sample_counts = {}
-    for bc_data, read_data in izip(
-            parse_fastq(fastq_barcode_f, strict=False, phred_offset=offset),
-            parse_fastq(fastq_read_f, strict=False, phred_offset=offset)):
-        input_sequence_count += 1
+
+    records = izip(
+        parse_fastq(fastq_barcode_f, strict=False, phred_offset=offset),
+        parse_fastq(fastq_read_f, strict=False, phred_offset=offset))
+    chunks = _chunk_records(records, chunk_size)
+    if jobs_to_start > 1:
+        chunk_results = _ordered_pool_map(_process_fastq_record_chunk_worker,
+                                          chunks,
+                                          jobs_to_start,
+                                          _set_worker_filter_params,
+                                          (filter_params,))
+    else:
+        chunk_results = (process_fastq_record_chunk(chunk, filter_params)
+                         for chunk in chunks)
+
+    for chunk_count, passed_records, failure_counts in chunk_results:
+        input_sequence_count += chunk_count
+        count_barcode_not_in_map += failure_counts[0]
+        count_too_short += failure_counts[1]
+        count_too_many_N += failure_counts[2]
+        count_bad_illumina_qual_digit += failure_counts[3]
+        count_barcode_errors_exceed_max += failure_counts[4]
+
+        for (sample_id, header, barcode, corrected_barcode,
+             num_barcode_errors, sequence, quality) in passed_records:
+            sequence_lengths.append(len(sequence))
+
+            try:
+                seqs_per_sample_counts[sample_id] += 1
+            except KeyError:
+                seqs_per_sample_counts[sample_id] = 1
+
+            fasta_header = '%s_%s %s orig_bc=%s new_bc=%s bc_diffs=%d' %\
+                (sample_id, seq_id, header, barcode,
+                 corrected_barcode, num_barcode_errors)
+            yield fasta_header, sequence, quality, seq_id
+            seq_id += 1
+
+    # Add sample IDs with zero counts to dictionary for logging
+    for curr_sample_id in barcode_to_sample_id.values():
+        if curr_sample_id not in seqs_per_sample_counts.keys():
+            seqs_per_sample_counts[curr_sample_id] = 0
+
+    if log_f is not None:
+        log_str = format_split_libraries_fastq_log(count_barcode_not_in_map,
+                                                   count_too_short,
+                                                   count_too_many_N,
+                                                   count_bad_illumina_qual_digit,
+                                                   count_barcode_errors_exceed_max,
+                                                   input_sequence_count,
+                                                   sequence_lengths,
+                                                   seqs_per_sample_counts)
+        log_f.write(log_str)
+
+    if len(sequence_lengths) and histogram_f is not None:
+        counts, bin_edges = make_histograms(sequence_lengths)
+        histogram_str = format_histogram_one_count(counts, bin_edges)
+        histogram_f.write(histogram_str)
+        histogram_f.write('\n--\n\n')
+
+
+def process_fastq_record_chunk(records, filter_params):
+    """Demultiplex and quality filter a chunk of (barcode, read) records
+
+        records: list of (barcode fastq record, read fastq record) pairs
+        filter_params: dict of the filtering options built in
+         process_fastq_single_end_read_file
+
+        return value: (number of input records,
+                       list of (sample_id, header, barcode, corrected_barcode,
+                        num_barcode_errors, sequence, quality) tuples for the
+                        records which passed filtering, in input order,
+                       list of failure counts: [barcode not in map,
+                        too short, too many N, bad illumina quality digit,
+                        barcode errors exceed max])
+    """
+    barcode_to_sample_id = filter_params['barcode_to_sample_id']
+    barcode_corrector = filter_params['barcode_corrector']
+    barcode_length = filter_params['barcode_length']
+    check_header_match_f = filter_params['check_header_match_f']
+    strict_header_match = filter_params['strict_header_match']
+    store_unassigned = filter_params['store_unassigned']
+    max_bad_run_length = filter_params['max_bad_run_length']
+    phred_quality_threshold = filter_params['phred_quality_threshold']
+    min_per_read_length = filter_params['min_per_read_length']
+    rev_comp = filter_params['rev_comp']
+    rev_comp_barcode = filter_params['rev_comp_barcode']
+    seq_max_N = filter_params['seq_max_N']
+    filter_bad_illumina_qual_digit = \
+        filter_params['filter_bad_illumina_qual_digit']
+    barcode_correction_fn = filter_params['barcode_correction_fn']
+    max_barcode_errors = filter_params['max_barcode_errors']
+
+    header_index = 0
+    sequence_index = 1
+
+    assigned_records = []
+    failure_counts = [0, 0, 0, 0, 0]
+    for bc_data, read_data in records:
         # Confirm match between barcode and read headers
         if strict_header_match and \
            (not check_header_match_f(bc_data[header_index], read_data[header_index])):
@@ -310,94 +528,115 @@ def process_fastq_single_end_read_file(fastq_read_f,
             barcode = bc_data[sequence_index]
         if rev_comp_barcode:
             barcode = str(DNA(barcode).rc())
-        # Grab the read sequence
-        sequence = read_data[1]
-        # Grab the read quality
-        quality = read_data[2]
 
         # correct the barcode (if applicable) and map to sample id
         num_barcode_errors, corrected_barcode, correction_attempted, sample_id = \
-            correct_barcode(
+            barcode_corrector(
                 barcode,
                 barcode_to_sample_id,
                 barcode_correction_fn)
         # skip samples with too many errors
         if (num_barcode_errors > max_barcode_errors):
-            count_barcode_errors_exceed_max += 1
+            failure_counts[4] += 1
             continue
 
         # skip unassignable samples unless otherwise requested
         if sample_id is None:
             if not store_unassigned:
-                count_barcode_not_in_map += 1
+                failure_counts[0] += 1
                 continue
             else:
                 sample_id = 'Unassigned'
 
-        quality_filter_result, sequence, quality =\
-            quality_filter_sequence(header,
-                                    sequence,
-                                    quality,
-                                    max_bad_run_length,
-                                    phred_quality_threshold,
-                                    min_per_read_length,
-                                    seq_max_N,
-                                    filter_bad_illumina_qual_digit)
+        assigned_records.append((sample_id, header, barcode,
+                                 corrected_barcode, num_barcode_errors,
+                                 read_data))
+
+    # quality filter all of the assigned reads in one batch
+    quality_filter_results = quality_filter_sequences(
+        [r[1] for r in assigned_records],
+        [r[5][1] for r in assigned_records],
+        [r[5][2] for r in assigned_records],
+        max_bad_run_length,
+        phred_quality_threshold,
+        min_per_read_length,
+        seq_max_N,
+        filter_bad_illumina_qual_digit)
+
+    passed_records = []
+    for assigned_record, quality_filter_result in \
+            izip(assigned_records, quality_filter_results):
+        (sample_id, header, barcode, corrected_barcode,
+         num_barcode_errors, _) = assigned_record
+        quality_filter_result, sequence, quality = quality_filter_result
 
         # process quality result
         if quality_filter_result != 0:
             # if the quality filter didn't pass record why and
             # move on to the next record
-            if quality_filter_result == 1:
-                count_too_short += 1
-            elif quality_filter_result == 2:
-                count_too_many_N += 1
-            elif quality_filter_result == 3:
-                count_bad_illumina_qual_digit += 1
+            if quality_filter_result in (1, 2, 3):
+                failure_counts[quality_filter_result] += 1
             else:
                 raise ValueError(
                     "Unknown quality filter result: %d" %
                     quality_filter_result)
             continue
 
-        sequence_lengths.append(len(sequence))
-
-        try:
-            seqs_per_sample_counts[sample_id] += 1
-        except KeyError:
-            seqs_per_sample_counts[sample_id] = 1
-
         if rev_comp:
             sequence = str(DNA(sequence).rc())
             quality = quality[::-1]
 
-        fasta_header = '%s_%s %s orig_bc=%s new_bc=%s bc_diffs=%d' %\
-            (sample_id, seq_id, header, barcode,
-             corrected_barcode, num_barcode_errors)
-        yield fasta_header, sequence, quality, seq_id
-        seq_id += 1
+        passed_records.append((sample_id, header, barcode, corrected_barcode,
+                               num_barcode_errors, sequence, quality))
 
-    # Add sample IDs with zero counts to dictionary for logging
-    for curr_sample_id in barcode_to_sample_id.values():
-        if curr_sample_id not in seqs_per_sample_counts.keys():
-            seqs_per_sample_counts[curr_sample_id] = 0
+    return len(records), passed_records, failure_counts
 
-    if log_f is not None:
-        log_str = format_split_libraries_fastq_log(count_barcode_not_in_map,
-                                                   count_too_short,
-                                                   count_too_many_N,
-                                                   count_bad_illumina_qual_digit,
-                                                   count_barcode_errors_exceed_max,
-                                                   input_sequence_count,
-                                                   sequence_lengths,
-                                                   seqs_per_sample_counts)
-        log_f.write(log_str)
 
-    if len(sequence_lengths) and histogram_f is not None:
-        counts, bin_edges = make_histograms(sequence_lengths)
-        histogram_str = format_histogram_one_count(counts, bin_edges)
-        histogram_f.write(histogram_str)
-        histogram_f.write('\n--\n\n')
+# filter params for process_fastq_record_chunk in pool worker processes.
+# these are set once per worker so each worker keeps its own barcode
+# correction lookup table for the whole run
+_worker_filter_params = None
+
+
+def _set_worker_filter_params(filter_params):
+    global _worker_filter_params
+    _worker_filter_params = filter_params
+
+
+def _process_fastq_record_chunk_worker(records):
+    return process_fastq_record_chunk(records, _worker_filter_params)
+
+
+def _chunk_records(records, chunk_size):
+    """Yield lists of up to chunk_size items from the records iterator"""
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            break
+        yield chunk
+
+
+def _ordered_pool_map(f, items, jobs_to_start, initializer=None,
+                      initargs=()):
+    """Apply f to items in a pool of processes, yielding results in order
+
+        At most two items per process are in flight at any time, so a large
+        (or infinite) items iterator is never read far ahead of the consumer.
+    """
+    pool = Pool(jobs_to_start, initializer, initargs)
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(pool.apply_async(f, (item,)))
+            if len(pending) >= 2 * jobs_to_start:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
 
 
 def make_histograms(lengths, binwidth=10):
@@ -25,21 +25,25 @@ from os.path import join
 from types import ListType
 from copy import deepcopy
 from itertools import combinations
+from multiprocessing import Pool
 
 from matplotlib import use
 use('Agg', warn=False)
 from matplotlib.pyplot import figure
-from numpy import (argsort, array, ceil, empty, fill_diagonal, finfo,
-                   log2, mean, ones, sqrt, tri, unique, zeros, ndarray, floor,
-                   median, nan, min as np_min, max as np_max)
+from numpy import (arange, argsort, array, asarray, bincount, ceil,
+                   concatenate, dot, empty, fill_diagonal, finfo, log2, mean,
+                   inf, newaxis, ones, searchsorted, sqrt, tile, tri,
+                   tril_indices, triu_indices, unique, where, zeros, ndarray,
+                   floor, median, nan, min as np_min, max as np_max)
 from numpy.random import permutation
 from cogent.maths.stats.test import t_one_sample
 from biom.table import table_factory, DenseOTUTable
 from skbio.core.distance import DistanceMatrix
 from skbio.util.misc import create_dir
 
-from qiime.pycogent_backports.test import (mantel_test, mc_t_two_sample,
-                                           pearson, permute_2d, spearman)
+from qiime.pycogent_backports.test import (mantel_class_stats, mantel_stats,
+                                           mantel_test, mc_t_two_sample,
+                                           pearson, spearman, rank_with_ties)
 from qiime.format import format_p_value_for_num_iters, format_biom_table
 from qiime.util import MetadataMap
 
@@ -585,7 +589,7 @@ class Anosim(CategoryStats):
         super(Anosim, self).__init__(mdmap, [dm], [cat], num_dms=1,
                                      random_fn=random_fn)
 
-    def __call__(self, num_perms=999):
+    def __call__(self, num_perms=999, jobs_to_start=1):
         """Runs ANOSIM on the current distance matrix and sample grouping.
 
         Returns a dict containing the results. The following keys are set:
@@ -599,38 +603,29 @@ class Anosim(CategoryStats):
         Arguments:
             num_perms - the number of permutations to use when calculating the
                 p-value
+            jobs_to_start - the number of processes to spread the permutations
+                over
+
+        The ranks of the distances are computed once, and the R statistics of
+        the permuted groupings are computed in blocks (see
+        _permutation_test).
         """
         results = super(Anosim, self).__call__(num_perms)
-        category = self.Categories[0]
-        samples = self.DistanceMatrices[0].ids
+        dm = self.DistanceMatrices[0]
+        codes, group_sizes = _get_group_codes(self.MetadataMap, dm.ids,
+                                              self.Categories[0])
 
-        # Create the group map, which maps sample ID to category value (e.g.
-        # sample 1 to 'control' and sample 2 to 'fast').
-        group_map = {}
-        for samp_id in samples:
-            group_map[samp_id] = self.MetadataMap.getCategoryValue(
-                samp_id, category)
-
-        # Calculate the R statistic with the grouping found in the current
-        # metadata map.
-        r_stat = self._anosim(group_map)
-
-        if num_perms > 0:
-            # Calculate the p-value based on the number of permutations.
-            perm_stats = []
-            for i in range(num_perms):
-                # Randomize grouping. We don't use values() in order to
-                # preserve ordering in case the user's random function doesn't
-                # change the order of the items in the list.
-                grouping_random = [group_map[sample] for sample in samples]
-                grouping_random = self.RandomFunction(grouping_random)
-                for j, sample in enumerate(samples):
-                    group_map[sample] = grouping_random[j]
-                perm_stats.append(self._anosim(group_map))
-            # Calculate the p-value.
-            p_value = (sum(perm_stats >= r_stat) + 1) / (num_perms + 1)
-        else:
-            p_value = 1.0
+        # Rank the distances (averaging ties), and lay the ranks out as a
+        # matrix.
+        dm_size = dm.shape[0]
+        upper = tri(dm_size) == 0
+        rank_matrix = zeros(dm.shape)
+        rank_matrix[upper] = rank_with_ties(dm.data[upper])
+        rank_matrix += rank_matrix.T
+
+        r_stat, p_value = _permutation_test(
+            _anosim_r_values, (rank_matrix, group_sizes), codes, num_perms,
+            self.RandomFunction, jobs_to_start=jobs_to_start)
 
         results['method_name'] = 'ANOSIM'
         results['r_value'] = r_stat
@@ -787,7 +782,7 @@ class Permanova(CategoryStats):
         super(Permanova, self).__init__(mdmap, [dm], [cat], num_dms=1,
                                         random_fn=random_fn)
 
-    def __call__(self, num_perms=999):
+    def __call__(self, num_perms=999, jobs_to_start=1):
         """Runs PERMANOVA on the current distance matrix and sample grouping.
 
         Returns a dict containing the results. The following keys are set:
@@ -801,38 +796,29 @@ class Permanova(CategoryStats):
         Arguments:
             num_perms - the number of permutations to use when calculating the
                 p-value
+            jobs_to_start - the number of processes to spread the permutations
+                over
+
+        The F statistics of the permuted groupings are computed in blocks
+        (see _permutation_test). Their sums of squares aren't added up in the
+        same order as the observed statistic's, so permuted statistics within
+        rounding error of it count as being at least as large (as vegan's
+        adonis does).
         """
         results = super(Permanova, self).__call__(num_perms)
-        category = self.Categories[0]
-        samples = self.DistanceMatrices[0].ids
+        dm = self.DistanceMatrices[0]
+        codes, group_sizes = _get_group_codes(self.MetadataMap, dm.ids,
+                                              self.Categories[0])
 
-        # Create the group map, which maps sample ID to category value (e.g.
-        # sample 1 to 'control' and sample 2 to 'fast').
-        group_map = {}
-        for samp_id in samples:
-            group_map[samp_id] = self.MetadataMap.getCategoryValue(
-                samp_id, category)
-
-        # Calculate the F statistic with the grouping found in the current
-        # metadata map.
-        f_stat = self._permanova(group_map)
-
-        if num_perms > 0:
-            # Calculate the p-value based on the number of permutations.
-            perm_stats = []
-            for i in range(num_perms):
-                # Randomize grouping. We don't use values() in order to
-                # preserve ordering in case the user's random function doesn't
-                # change the order of the items in the list.
-                grouping_random = [group_map[sample] for sample in samples]
-                grouping_random = self.RandomFunction(grouping_random)
-                for j, sample in enumerate(samples):
-                    group_map[sample] = grouping_random[j]
-                perm_stats.append(self._permanova(group_map))
-            # Calculate the p-value.
-            p_value = (sum(perm_stats >= f_stat) + 1) / (num_perms + 1)
-        else:
-            p_value = 1.0
+        squared_dm = dm.data ** 2
+        fill_diagonal(squared_dm, 0)
+        distances = dm.data[tri(dm.shape[0]) == 0]
+        s_T = (distances * distances).sum() / dm.shape[0]
+
+        f_stat, p_value = _permutation_test(
+            _permanova_f_values, (squared_dm, group_sizes, s_T), codes,
+            num_perms, self.RandomFunction,
+            tolerance=sqrt(finfo(float).eps), jobs_to_start=jobs_to_start)
 
         results['method_name'] = 'PERMANOVA'
         results['f_value'] = f_stat
@@ -913,6 +899,279 @@ class Permanova(CategoryStats):
         return (s_A / (a - 1)) / (s_W / (N - a))
 
 
+def _get_group_codes(mdmap, sample_ids, category):
+    """Returns the group of each sample as an index, and the group sizes.
+
+    The groups are the sorted unique values of category for sample_ids.
+    """
+    groups = [mdmap.getCategoryValue(samp_id, category)
+              for samp_id in sample_ids]
+    unique_groups, codes = unique(groups, return_inverse=True)
+    return codes, bincount(codes)
+
+
+# The largest number of entries of the group indicator matrix built for a
+# block of permutations (see _within_group_sums).
+_PERMUTATION_BLOCK_ENTRIES = 2 ** 22
+
+
+def _within_group_sums(matrix, groupings, num_groups):
+    """Sums a matrix over the pairs of samples in each group of groupings.
+
+    Returns a 2D array with a row for each grouping and a column for each
+    group, holding the sum of matrix over the (unordered) pairs of distinct
+    samples in that group.
+
+    Arguments:
+        matrix - a symmetric matrix with a zero diagonal
+        groupings - a 2D array with a row for each grouping, giving the group
+            (from 0 to num_groups - 1) of each sample
+        num_groups - the number of groups
+
+    The groupings are laid out as an indicator matrix, with a column for
+    each group of each grouping, so the sums over each group of every
+    sample's row of matrix are a single matrix product.
+    """
+    num_groupings, num_samples = groupings.shape
+    rows = tile(arange(num_samples), num_groupings)
+    cols = (arange(num_groupings)[:, newaxis] * num_groups +
+            groupings).ravel()
+    indicator = zeros((num_samples, num_groupings * num_groups))
+    indicator[rows, cols] = 1
+    # Each sample's sum over the other samples in its own group.
+    within = dot(matrix, indicator)[rows, cols]
+    sums = zeros(num_groupings * num_groups)
+    group_sums = bincount(cols, weights=within)
+    sums[:len(group_sums)] = group_sums
+    return sums.reshape(num_groupings, num_groups) / 2
+
+
+def _anosim_r_values(data, groupings):
+    """Returns the ANOSIM R statistic of each row of groupings.
+
+    data is a tuple of the matrix of the ranks of the distances and the
+    sizes of the groups. The ranks are whole or half numbers, so their sums
+    are exact.
+    """
+    rank_matrix, group_sizes = data
+    num_samps = len(rank_matrix)
+    num_dists = num_samps * (num_samps - 1) / 2
+    num_within = (group_sizes * (group_sizes - 1) / 2).sum()
+    within_ranks = _within_group_sums(rank_matrix, groupings,
+                                      len(group_sizes)).sum(1)
+    r_W = within_ranks / num_within
+    r_B = ((num_dists * (num_dists + 1) / 2 - within_ranks) /
+           (num_dists - num_within))
+    divisor = num_samps * ((num_samps - 1) / 4)
+    return (r_B - r_W) / divisor
+
+
+def _permanova_f_values(data, groupings):
+    """Returns the PERMANOVA F statistic of each row of groupings.
+
+    data is a tuple of the matrix of the squared distances, the sizes of the
+    groups and the total sum of squares (s_T).
+    """
+    squared_dm, group_sizes, s_T = data
+    a = len(group_sizes)
+    N = len(squared_dm)
+    s_W = (_within_group_sums(squared_dm, groupings, a) / group_sizes).sum(1)
+    s_A = s_T - s_W
+    return (s_A / (a - 1)) / (s_W / (N - a))
+
+
+def _iter_permuted_groupings(codes, num_perms, random_fn, block_size):
+    """Yields num_perms permutations of codes, in blocks of block_size rows.
+
+    Each permutation is random_fn applied to the one before it, starting from
+    codes.
+    """
+    grouping = codes
+    for start in range(0, num_perms, block_size):
+        block = empty((min(block_size, num_perms - start), len(codes)),
+                      dtype=codes.dtype)
+        for i in range(len(block)):
+            grouping = asarray(random_fn(grouping))
+            block[i] = grouping
+        yield block
+
+
+def _permutation_test(stat_f, data, codes, num_perms, random_fn,
+                      tolerance=0.0, jobs_to_start=1):
+    """Returns the statistic of a grouping and its p-value.
+
+    Arguments:
+        stat_f - function taking data and a 2D array of groupings, and
+            returning the statistic of each grouping
+        data - the data passed to stat_f (the same for every grouping)
+        codes - the group of each sample, as an index
+        num_perms - the number of permutations of codes to compare the
+            statistic to. If 0, the p-value is 1.0
+        random_fn - the function used to permute the groupings
+        tolerance - permuted statistics at least the statistic minus
+            tolerance count towards the p-value
+        jobs_to_start - the number of processes to compute the statistics of
+            the blocks of permutations in
+
+    The permutations are drawn in the parent process, and their statistics
+    are computed a block at a time, so there is no Python loop over the
+    permutations other than to draw them.
+    """
+    stat = stat_f(data, codes[newaxis])[0]
+    if num_perms == 0:
+        return stat, 1.0
+
+    block_size = _PERMUTATION_BLOCK_ENTRIES // (len(codes) * (codes.max() + 1))
+    if jobs_to_start > 1:
+        block_size = min(block_size, num_perms // (jobs_to_start * 4))
+    block_size = max(1, block_size)
+    blocks = _iter_permuted_groupings(codes, num_perms, random_fn, block_size)
+    if jobs_to_start > 1:
+        pool = Pool(jobs_to_start,
+                    initializer=_set_worker_permutation_test_data,
+                    initargs=((stat_f, data),))
+        perm_stats = pool.imap(_permutation_test_worker, blocks)
+    else:
+        pool = None
+        perm_stats = (stat_f(data, block) for block in blocks)
+
+    num_at_least = 0
+    for block_stats in perm_stats:
+        num_at_least += (block_stats >= stat - tolerance).sum()
+    if pool is not None:
+        pool.close()
+        pool.join()
+    return stat, (num_at_least + 1) / (num_perms + 1)
+
+
+def _set_worker_permutation_test_data(data):
+    global _permutation_test_data
+    _permutation_test_data = data
+
+
+def _permutation_test_worker(block):
+    stat_f, data = _permutation_test_data
+    return stat_f(data, block)
+
+
+def _get_best_data(dm, metadata_map, cats):
+    """Returns the data used to find the BEST combinations of cats.
+
+    Returns a 2D array with a row for each category, holding the squared
+    differences of the category's values between each pair of samples (in
+    condensed form), and the ranks of the distances of dm (in the same
+    order).
+    """
+    rows, cols = triu_indices(dm.shape[0], 1)
+    sq_diffs = empty((len(cats), len(rows)))
+    for i, cat in enumerate(cats):
+        values = array(metadata_map.getCategoryValues(dm.ids, cat),
+                       dtype=float)
+        sq_diffs[i] = (values[rows] - values[cols]) ** 2
+    return sq_diffs, rank_with_ties(dm.condensed_form())
+
+
+def _best_rho(data, sq_dists):
+    """Returns the Spearman correlation of the distances with sq_dists.
+
+    sq_dists are the squared Euclidean distances of a combination of the
+    categories.
+    """
+    sq_diffs, dm_ranks = data
+    return pearson(dm_ranks, rank_with_ties(sqrt(sq_dists)))
+
+
+def _best_search(data, root, extend):
+    """Returns the best combination of each size found from root.
+
+    Returns a dict mapping each size of combination to its highest
+    correlation and the combination it belongs to (as a tuple of category
+    indices). The first of combinations with the same correlation is kept,
+    and sizes without any correlation that isn't nan are left out.
+
+    Arguments:
+        data - the output of _get_best_data
+        root - tuple of the category indices of the first combination to
+            compute, in increasing order (if empty, it isn't computed)
+        extend - if True, also compute every combination which starts with
+            root, followed by larger category indices
+
+    The combinations are visited depth first, in the same (lexicographic)
+    order as itertools.combinations gives for each size. The squared
+    distances of each combination are those of its parent plus those of its
+    last category, so they are summed in the same order as by
+    _derive_euclidean_dm, and tied distances stay tied.
+    """
+    sq_diffs = data[0]
+    best = {}
+
+    def visit(combo, sq_dists):
+        rho = _best_rho(data, sq_dists)
+        if rho > best.get(len(combo), (-inf, None))[0]:
+            best[len(combo)] = (rho, combo)
+
+    if root:
+        root_sq_dists = sq_diffs[root[0]].copy()
+        for i in root[1:]:
+            root_sq_dists += sq_diffs[i]
+        visit(root, root_sq_dists)
+    else:
+        root_sq_dists = zeros(sq_diffs.shape[1])
+    if not extend:
+        return best
+
+    # Each entry of the stack is a combination, its squared distances and
+    # the next category to try adding to it.
+    first = root[-1] + 1 if root else 0
+    stack = [(root, root_sq_dists, first)]
+    while stack:
+        combo, sq_dists, next_cat = stack.pop()
+        if next_cat >= len(sq_diffs):
+            continue
+        stack.append((combo, sq_dists, next_cat + 1))
+        child = combo + (next_cat,)
+        child_sq_dists = sq_dists + sq_diffs[next_cat]
+        visit(child, child_sq_dists)
+        stack.append((child, child_sq_dists, next_cat + 1))
+    return best
+
+
+def _search_best(data, tasks, jobs_to_start=1):
+    """Returns the best combination of each size found from tasks.
+
+    tasks is a list of (root, extend) arguments to _best_search, whose
+    combinations are in the order they should be compared in (so the first
+    of combinations with the same correlation is kept). Returns a dict as
+    for _best_search.
+    """
+    if jobs_to_start > 1:
+        pool = Pool(jobs_to_start, initializer=_set_worker_best_data,
+                    initargs=(data,))
+        results = list(pool.imap(_best_worker, tasks))
+        pool.close()
+        pool.join()
+    else:
+        results = [_best_search(data, root, extend)
+                   for root, extend in tasks]
+
+    best = {}
+    for result in results:
+        for size, (rho, combo) in result.items():
+            if rho > best.get(size, (-inf, None))[0]:
+                best[size] = (rho, combo)
+    return best
+
+
+def _set_worker_best_data(data):
+    global _best_data
+    _best_data = data
+
+
+def _best_worker(task):
+    root, extend = task
+    return _best_search(_best_data, root, extend)
+
+
 class Best(CategoryStats):
     """Class for the BEST/BioEnv statistical analysis.
 
@@ -938,7 +1197,7 @@ class Best(CategoryStats):
                                    suppress_numeric_category_check=False,
                                    suppress_single_category_value_check=True)
 
-    def __call__(self, num_perms=999):
+    def __call__(self, num_perms=999, jobs_to_start=1, stepwise=False):
         """Runs the BEST/BioEnv analysis on a distance matrix using specified
         metadata map categories.
 
@@ -951,32 +1210,63 @@ class Best(CategoryStats):
             vars - mapping of category names to indices
             rho_vals - spearman correlation statistics, one for each
                 combination of vars
+
+        Arguments:
+            jobs_to_start - the number of processes to compute the
+                combinations in
+            stepwise - if True, only the combinations which add one category
+                to the best combination of the size before are computed
+                (forward selection), rather than all of them. This scales to
+                many more categories, but may miss the best combinations
+
+        The squared differences of each category's values are computed once,
+        and the distances of each combination are summed from them.
         """
         res = super(Best, self).__call__()
         cats = self.Categories
         dm = self.DistanceMatrices[0]
-        dm_flat = dm.condensed_form()
-
-        row_count = dm.shape[0]
+        data = _get_best_data(dm, self.MetadataMap, cats)
         col_count = len(cats)
-        sum = 0
-        stats = [(-777777777, '') for c in range(col_count + 1)]
-        for i in range(1, col_count + 1):
-            combo = combinations([j for j in range(1, col_count + 1)], i)
 
-            for element in combo:
-                cat_mat = self._make_cat_mat(cats, element)
-                cat_dm = self._derive_euclidean_dm(cat_mat, row_count)
-                cat_dm_flat = cat_dm.condensed_form()
-                r = spearman(dm_flat, cat_dm_flat)
-                if r > stats[i - 1][0]:
-                    stats[i - 1] = (r, ','.join(str(s) for s in element))
+        if stepwise:
+            best = {}
+            selected = ()
+            for i in range(1, col_count + 1):
+                tasks = [(tuple(sorted(selected + (j,))), False)
+                         for j in range(col_count) if j not in selected]
+                tasks.sort()
+                size_best = _search_best(data, tasks, jobs_to_start)
+                if i in size_best:
+                    best[i] = size_best[i]
+                    selected = size_best[i][1]
+                else:
+                    selected = tasks[0][0]
+        else:
+            # Split the combinations by their first few categories, to spread
+            # them across the processes.
+            if jobs_to_start > 1:
+                root_size = min(col_count, 3)
+                tasks = [(root, len(root) == root_size)
+                         for i in range(1, root_size + 1)
+                         for root in combinations(range(col_count), i)]
+                tasks.sort()
+            else:
+                tasks = [((), True)]
+            best = _search_best(data, tasks, jobs_to_start)
+
+        stats = []
+        for i in range(1, col_count + 1):
+            if i in best:
+                r, element = best[i]
+                stats.append((r, ','.join(str(j + 1) for j in element)))
+            else:
+                stats.append((-777777777, ''))
 
         res['method_name'] = 'BEST'
         res['num_vars'] = col_count
         res['vars'] = ['%s = %d' % (name, val + 1)
                        for val, name in enumerate(cats)]
-        res['rho_vals'] = stats[:-1]
+        res['rho_vals'] = stats
 
         return res
 
@@ -1068,7 +1358,7 @@ class MantelCorrelogram(CorrelationStats):
         else:
             raise ValueError("Alpha must be between 0 and 1.")
 
-    def __call__(self, num_perms=999):
+    def __call__(self, num_perms=999, jobs_to_start=1):
         """Runs a Mantel correlogram test over the current distance matrices.
 
         Returns a dict containing the results. The following keys are set:
@@ -1086,6 +1376,8 @@ class MantelCorrelogram(CorrelationStats):
         Arguments:
             num_perms - the number of permutations to use when calculating the
                 p-values
+            jobs_to_start - the number of processes to compute the
+                permutations in
 
         Note: This code is heavily based on the implementation of
         mantel.correlog in R's vegan package.
@@ -1116,61 +1408,64 @@ class MantelCorrelogram(CorrelationStats):
         results['mantel_r'] = []
         results['mantel_p'] = []
 
-        # Create a model matrix for each distance class, then compute a Mantel
-        # test using it and the original eco distance matrix. A model matrix
-        # contains ones for each element that is in the current distance class,
-        # and zeros otherwise (zeros on the diagonal as well).
+        # Count the number of each sample's distances in each distance class
+        # (the row sums of the model matrix of the class, which contains ones
+        # for each element that is in the class, and zeros otherwise), and
+        # the number of elements of each model matrix in the class.
+        off_diagonal = dist_class_matrix >= 0
+        class_rows = (dist_class_matrix * dm_size +
+                      arange(dm_size)[:, newaxis])[off_diagonal]
+        row_sums = zeros(num_classes * dm_size, dtype=int)
+        counts = bincount(class_rows)
+        row_sums[:len(counts)] = counts
+        row_sums = row_sums.reshape(num_classes, dm_size)
+        num_distances = row_sums.sum(axis=1)
+
+        # Only stop running Mantel tests if we've gone through half of the
+        # distance classes and at least one row has a sum of zero (i.e. the
+        # sample doesn't have any distances that fall in the current class).
+        tested = [num_distances[class_num] > 0 and
+                  not (class_num > ((num_classes // 2) - 1) and
+                       (row_sums[class_num] == 0).any())
+                  for class_num in range(num_classes)]
+
+        # Compute a Mantel test of the model matrix of each tested class
+        # against the original eco distance matrix. Permuting the eco
+        # distance matrix instead of the model matrices gives the same
+        # statistics, so each permutation is shared by all of the classes.
+        class_labels = where(
+            array(tested)[dist_class_matrix.clip(0)] & off_diagonal,
+            dist_class_matrix, -1)
+        orig_stats, perm_stats = mantel_class_stats(
+            eco_dm.data, class_labels, num_classes, num_perms,
+            jobs_to_start=jobs_to_start)
+        # Allow for rounding error in the permuted statistics (see
+        # mantel_test).
+        tol = sqrt(finfo(float).eps)
+
         for class_num in range(num_classes):
             results['class_index'].append(class_indices[class_num])
-            model_matrix = zeros([dm_size, dm_size], dtype=int)
-            for i in range(dm_size):
-                for j in range(dm_size):
-                    curr_ele = dist_class_matrix[i][j]
-                    if curr_ele == class_num and i != j:
-                        model_matrix[i][j] = 1
-            model_matrix = DistanceMatrix(model_matrix, geo_dm.ids)
-
-            # Count the number of distances in the current distance class.
-            num_distances = int(model_matrix.data.sum())
-            results['num_dist'].append(num_distances)
-            if num_distances == 0:
+            results['num_dist'].append(int(num_distances[class_num]))
+            if tested[class_num]:
+                orig_stat = orig_stats[class_num]
+                class_perm_stats = perm_stats[:, class_num]
+
+                # Negate the Mantel r statistic because we are using
+                # distance matrices, not similarity matrices (this is a
+                # necessary step, see Legendre's Numerical Ecology
+                # algorithm reference for more details).
+                results['mantel_r'].append(-orig_stat)
+
+                # The Mantel test is one-tailed (H1: r>0). Here, compute a
+                # one-tailed p-value in the direction of the sign.
+                if orig_stat < 0:
+                    perm_sum = (class_perm_stats <= orig_stat + tol).sum()
+                else:
+                    perm_sum = (class_perm_stats >= orig_stat - tol).sum()
+                results['mantel_p'].append((perm_sum + 1) / (num_perms + 1))
+            else:
                 results['mantel_r'].append(None)
                 results['mantel_p'].append(None)
-            else:
-                row_sums = model_matrix.data.sum(axis=1)
-                row_sums = map(int, row_sums)
-                has_zero_sum = 0 in row_sums
-
-                # Only stop running Mantel tests if we've gone through half of
-                # the distance classes and at least one row has a sum of zero
-                # (i.e. the sample doesn't have any distances that fall in the
-                # current class).
-                if not (class_num > ((num_classes // 2) - 1) and has_zero_sum):
-                    mantel_test = Mantel(model_matrix, eco_dm,
-                                         tail_type='greater')
-                    mantel_test_results = mantel_test(num_perms)
-                    p_val, orig_stat, perm_stats = (
-                        mantel_test_results['p_value'],
-                        mantel_test_results['r_value'],
-                        mantel_test_results['perm_stats'])
-
-                    # Negate the Mantel r statistic because we are using
-                    # distance matrices, not similarity matrices (this is a
-                    # necessary step, see Legendre's Numerical Ecology
-                    # algorithm reference for more details).
-                    results['mantel_r'].append(-orig_stat)
-
-                    # The mantel function produces a one-tailed p-value
-                    # (H1: r>0). Here, compute a one-tailed p-value in the
-                    # direction of the sign.
-                    if orig_stat < 0:
-                        perm_sum = sum([1 for ps in perm_stats
-                                        if ps <= orig_stat]) + 1
-                        p_val = perm_sum / (num_perms + 1)
-                    results['mantel_p'].append(p_val)
-                else:
-                    results['mantel_r'].append(None)
-                    results['mantel_p'].append(None)
 
         # Correct p-values for multiple testing.
         results['mantel_p_corr'] = self._correct_p_values(results['mantel_p'])
@@ -1211,37 +1506,37 @@ class MantelCorrelogram(CorrelationStats):
         if self.VariableSizeDistanceClasses:
             class_size = int(ceil(len(dm_lower_flat) / num_classes))
             order = argsort(array(dm_lower_flat))
+            sorted_dists = dm_lower_flat[order]
 
             # Create the matrix of distance classes. Every element in the
             # matrix tells what distance class the original element belongs to.
-            # Each element in the original matrix is traversed in sorted
-            # (min -> max) order, and the current distance class is incremented
-            # once it is "filled" with class_size distances.
+            # Each element in the original matrix is taken in sorted
+            # (min -> max) order, and the distance class changes once the
+            # current one is "filled" with class_size distances (the final
+            # distance class may not completely fill up). The element at
+            # each index of the flattened matrix is found as by
+            # _find_row_col_indices.
+            rows, cols = tril_indices(size, -1)
+            sorted_classes = arange(len(order)) // class_size
             dist_class_matrix = empty([size, size], dtype=int)
-            class_indices = []
-            curr_class = 0
-            class_start = dm_lower_flat[order[0]]
-            for i, sorted_idx in enumerate(order):
-                row_idx, col_idx = self._find_row_col_indices(sorted_idx)
-                class_end = dm_lower_flat[sorted_idx]
-
-                # Matrix is symmetric.
-                dist_class_matrix[row_idx][col_idx] = curr_class
-                dist_class_matrix[col_idx][row_idx] = curr_class
-
-                # Check if we've filled up our current class or are at the last
-                # iteration (the final distance class may not completely fill
-                # up).
-                if (i + 1) % class_size == 0 or i == len(order) - 1:
-                    curr_class += 1
-                    class_indices.append(class_start +
-                                         (class_end - class_start) / 2)
-                    class_start = class_end
-
-            if curr_class < num_classes:
+            dist_class_matrix[rows[order], cols[order]] = sorted_classes
+            # Matrix is symmetric.
+            dist_class_matrix[cols[order], rows[order]] = sorted_classes
+
+            # Each class index is the midpoint between the last distance of
+            # the previous class (or the first distance, for the first class)
+            # and the last distance of the class.
+            class_ends = sorted_dists[
+                concatenate([arange(class_size, len(order), class_size),
+                             [len(order)]]) - 1]
+            class_starts = concatenate([sorted_dists[:1], class_ends[:-1]])
+            class_indices = list(class_starts +
+                                 (class_ends - class_starts) / 2)
+
+            if len(class_indices) < num_classes:
                 # Our last class was empty, so record the last distance seen
                 # (which will be the max) as the class index.
-                class_indices.append(class_end)
+                class_indices.append(sorted_dists[-1])
 
             # Fill diagonal with -1, as it does not belong to any distance
             # class.
@@ -1264,22 +1559,19 @@ class MantelCorrelogram(CorrelationStats):
                                      (0.5 * (next_bp - break_point)))
 
             # Create the matrix of distance classes. Every element in the
-            # matrix tells what distance class the original element belongs to.
-            dist_class_matrix = empty([size, size], dtype=int)
-            for i in range(size):
-                for j in range(size):
-                    if i != j:
-                        curr_ele = dm[i][j]
-                        bps = [(k - 1) for k, bp in enumerate(break_points)
-                               if bp >= curr_ele]
-                        min_bp = min(bps)
-
-                        # If we somehow got a negative breakpoint (possible
-                        # sometimes due to rounding error), put it in the first
-                        # distance class.
-                        dist_class_matrix[i][j] = min_bp if min_bp >= 0 else 0
-                    else:
-                        dist_class_matrix[i][j] = -1
+            # matrix tells what distance class the original element belongs
+            # to, which is the one ending at the first breakpoint that is at
+            # least the element.
+            dist_class_matrix = searchsorted(break_points, dm.data) - 1
+
+            # If we somehow got a negative breakpoint (possible sometimes
+            # due to rounding error), put it in the first distance class, and
+            # likewise put any distance past the last breakpoint in the last
+            # distance class.
+            dist_class_matrix[dist_class_matrix < 0] = 0
+            dist_class_matrix[dist_class_matrix >= num_classes] = \
+                num_classes - 1
+            fill_diagonal(dist_class_matrix, -1)
 
         return dist_class_matrix, class_indices
 
@@ -1439,7 +1731,7 @@ class Mantel(CorrelationStats):
                              "or 'less'.")
         self._tail_type = tail_type
 
-    def __call__(self, num_perms=999):
+    def __call__(self, num_perms=999, jobs_to_start=1):
         """Runs a Mantel test over the current distance matrices.
 
         Returns a dict containing the results. The following keys are set:
@@ -1456,6 +1748,8 @@ class Mantel(CorrelationStats):
         Arguments:
             num_perms - the number of times to permute the distance matrix
                 while calculating the p-value
+            jobs_to_start - the number of processes to compute the
+                permutations in
 
         Note: R's mantel function will always perform a one-sided test (type
         'greater'), so the p-values may differ from R unless you explicitly
@@ -1468,7 +1762,8 @@ class Mantel(CorrelationStats):
         # guaranteed to have DistanceMatrix instances (we don't need to check a
         # second time here).
         results = mantel_test(m1.data, m2.data, num_perms, alt=alt,
-                              suppress_symmetry_and_hollowness_check=True)
+                              suppress_symmetry_and_hollowness_check=True,
+                              jobs_to_start=jobs_to_start)
 
         resultsDict = super(Mantel, self).__call__(num_perms)
         resultsDict['method_name'] = "Mantel"
@@ -1503,7 +1798,7 @@ class PartialMantel(CorrelationStats):
         super(PartialMantel, self).__init__([dm1, dm2, cdm], num_dms=3,
                                             min_dm_size=3)
 
-    def __call__(self, num_perms=999):
+    def __call__(self, num_perms=999, jobs_to_start=1):
         """Runs a partial Mantel test on the current distance matrices.
 
         Returns a dict containing the results. The following keys are set:
@@ -1514,6 +1809,8 @@ class PartialMantel(CorrelationStats):
         Arguments:
             num_perms - the number of times to permute the distance matrix
                 while calculating the p-value
+            jobs_to_start - the number of processes to compute the
+                permutations in
 
         Credit: The code herein is based loosely on the implementation found in
         R's vegan package.
@@ -1529,34 +1826,22 @@ class PartialMantel(CorrelationStats):
         res['mantel_p'] = None
 
         dm1, dm2, cdm = self.DistanceMatrices
-        dm1_flat = dm1.condensed_form()
-        dm2_flat = dm2.condensed_form()
-        cdm_flat = cdm.condensed_form()
-
-        # Get the initial r-values before permuting.
-        rval1 = pearson(dm1_flat, dm2_flat)
-        rval2 = pearson(dm1_flat, cdm_flat)
-        rval3 = pearson(dm2_flat, cdm_flat)
-
-        # Calculate the original test statistic (r-value).
-        orig_stat = corr(rval1, rval2, rval3)
-
-        # Calculate permuted r-values and p-values, storing them for use in the
-        # calculation of the final statistic.
-        perm_stats = []
-        numerator = 0
-        for i in range(0, num_perms):
-            # Permute the first distance matrix and calculate new r and
-            # p-values.
-            p1 = permute_2d(dm1, permutation(dm1.shape[0]))
-            dm1_perm = DistanceMatrix(p1, dm1.ids)
-            dm1_perm_flat = dm1_perm.condensed_form()
-            rval1 = pearson(dm1_perm_flat, dm2_flat)
-            rval2 = pearson(dm1_perm_flat, cdm_flat)
-            perm_stats.append(corr(rval1, rval2, rval3))
-
-            if perm_stats[-1] >= orig_stat:
-                numerator += 1
+
+        # Get the r-values of the first distance matrix with the other two,
+        # before and after permuting it. The r-value of the second distance
+        # matrix with the control matrix doesn't change.
+        orig_rvals, perm_rvals = mantel_stats(dm1.data, [dm2.data, cdm.data],
+                                              num_perms,
+                                              jobs_to_start=jobs_to_start)
+        rval3 = pearson(dm2.condensed_form(), cdm.condensed_form())
+
+        # Calculate the original test statistic (r-value), and compare the
+        # statistics of the permutations to it (allowing for rounding error,
+        # see mantel_test).
+        orig_stat = corr(orig_rvals[0], orig_rvals[1], rval3)
+        perm_stats = corr(perm_rvals[:, 0], perm_rvals[:, 1], rval3)
+        numerator = (perm_stats >= orig_stat - sqrt(finfo(float).eps)).sum()
+
         # Load the final statistics into the result dictionary.
         res['mantel_r'] = orig_stat
         res['mantel_p'] = (numerator + 1) / (num_perms + 1)
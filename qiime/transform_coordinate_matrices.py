@@ -10,14 +10,21 @@ __version__ = "1.8.0-dev"
 __maintainer__ = "Greg Caporaso"
 __email__ = "gregcaporaso@gmail.com"
 
+from multiprocessing import Pool
 from random import shuffle
-from numpy import array, mean, append, zeros
-from cogent.cluster.procrustes import procrustes
+from numpy import array, mean, append, zeros, dot, empty, finfo, sqrt
+from numpy.linalg import svd
+from numpy.random import RandomState, randint
+from cogent.cluster.procrustes import procrustes, center, normalize
 
 from qiime.util import create_dir
 from qiime.parse import parse_coords
 from qiime.format import format_coords
 
+# number of Monte Carlo trials whose permutations are drawn from each
+# random number generator (see get_trial_permutations)
+_TRIAL_BLOCK_SIZE = 100
+
 
 def shuffle_full_matrix(m):
     """  """
@@ -126,11 +133,12 @@ def get_mean_eigenvalues(v1, v2):
     return [mean([p1, p2]) for p1, p2 in zip(v1, v2)]
 
 
-def get_procrustes_results(coords_f1, coords_f2, sample_id_map=None,
-                           randomize=None, max_dimensions=None,
-                           get_eigenvalues=get_mean_eigenvalues,
-                           get_percent_variation_explained=get_mean_percent_variation):
-    """ """
+def get_aligned_coords(coords_f1, coords_f2, sample_id_map=None):
+    """ Parse two coordinate files, keeping the samples they have in common
+
+        Returns the sample ids, and the (coords, eigvals, pct_var) of each
+        file, with the rows of both coords in the order of the sample ids.
+    """
     # Parse the PCoA files
     sample_ids1, coords1, eigvals1, pct_var1 = parse_coords(coords_f1)
     sample_ids2, coords2, eigvals2, pct_var2 = parse_coords(coords_f2)
@@ -144,18 +152,15 @@ def get_procrustes_results(coords_f1, coords_f2, sample_id_map=None,
     coords2 = reorder_coords(coords2, sample_ids2, order)
     if len(order) == 0:
         raise ValueError('No overlapping samples in the two files')
+    return order, (coords1, eigvals1, pct_var1), (coords2, eigvals2, pct_var2)
 
-    # If this is a random trial, apply the shuffling function passed as
-    # randomize()
-    if randomize:
-        coords2 = randomize(coords2)
-        randomized_coords2 = format_coords(coord_header=order,
-                                           coords=coords2,
-                                           eigvals=eigvals2,
-                                           pct_var=pct_var2)
-    else:
-        randomized_coords2 = None
 
+def match_dimensions(coords1, coords2, eigvals1, eigvals2, pct_var1, pct_var2,
+                     max_dimensions=None):
+    """ Pad (and optionally filter) the coords of two files to match
+
+        Returns coords1, coords2, eigvals1, eigvals2, pct_var1, pct_var2
+    """
     coords1, coords2 = pad_coords_matrices(coords1, coords2)
     if max_dimensions:
         coords1 = filter_coords_matrix(coords1, max_dimensions)
@@ -171,6 +176,31 @@ def get_procrustes_results(coords_f1, coords_f2, sample_id_map=None,
         elif len(pct_var1) < len(pct_var2):
             pct_var1 = append(pct_var1, zeros(len(pct_var2) - len(pct_var1)))
             eigvals1 = append(eigvals1, zeros(len(eigvals2) - len(eigvals1)))
+    return coords1, coords2, eigvals1, eigvals2, pct_var1, pct_var2
+
+
+def get_procrustes_results(coords_f1, coords_f2, sample_id_map=None,
+                           randomize=None, max_dimensions=None,
+                           get_eigenvalues=get_mean_eigenvalues,
+                           get_percent_variation_explained=get_mean_percent_variation):
+    """ """
+    order, (coords1, eigvals1, pct_var1), (coords2, eigvals2, pct_var2) =\
+        get_aligned_coords(coords_f1, coords_f2, sample_id_map)
+
+    # If this is a random trial, apply the shuffling function passed as
+    # randomize()
+    if randomize:
+        coords2 = randomize(coords2)
+        randomized_coords2 = format_coords(coord_header=order,
+                                           coords=coords2,
+                                           eigvals=eigvals2,
+                                           pct_var=pct_var2)
+    else:
+        randomized_coords2 = None
+
+    coords1, coords2, eigvals1, eigvals2, pct_var1, pct_var2 =\
+        match_dimensions(coords1, coords2, eigvals1, eigvals2,
+                         pct_var1, pct_var2, max_dimensions)
 
     # Run the Procrustes analysis
     transformed_coords_m1, transformed_coords_m2, m_squared =\
@@ -196,28 +226,104 @@ def get_procrustes_results(coords_f1, coords_f2, sample_id_map=None,
     )
 
 
+def standardize_coords(coords):
+    """ Center coords on the origin, and scale the sum of its squares to 1
+
+        This is how procrustes standardizes its input matrices.
+    """
+    return normalize(center(coords))
+
+
+def procrustes_m_squareds(mtx1, mtx2, perms):
+    """ Return the M^2 of mtx1 and each permutation of the rows of mtx2
+
+        mtx1, mtx2: coordinate matrices of the same shape, as returned by
+         standardize_coords
+        perms: 2D array with one permutation of the rows of mtx2 per row
+
+        For standardized matrices, the M^2 of procrustes is 1 - s^2, where
+         s is the sum of the singular values of dot(mtx1.T, mtx2). Permuting
+         the rows of mtx2 leaves it standardized, so each permutation only
+         needs the singular values of one small (dimensions x dimensions)
+         matrix. The products are computed for all of perms at once; the
+         singular values one matrix at a time, as numpy's svd only takes
+         stacks of matrices from numpy 1.8.
+    """
+    # (dimensions, permutations, dimensions)
+    products = dot(mtx1.T, mtx2[perms])
+    result = empty(len(perms))
+    for i in range(len(perms)):
+        result[i] = 1. - svd(products[:, i], compute_uv=False).sum() ** 2
+    return result
+
+
+def get_trial_permutations(seed, block_index, num_trials, num_samples):
+    """ Return the row permutations of one block of Monte Carlo trials
+
+        Each block of trials has its own random number generator, seeded
+        from seed and block_index, so the permutations of a block don't
+        depend on which process draws them (or on the other blocks).
+    """
+    prng = RandomState([seed, block_index])
+    result = empty((num_trials, num_samples), dtype=int)
+    for i in range(num_trials):
+        result[i] = prng.permutation(num_samples)
+    return result
+
+
+def _iter_trial_blocks(trials):
+    """ Yield the (block index, number of trials) of each block of trials """
+    for block_index, start in enumerate(range(0, trials, _TRIAL_BLOCK_SIZE)):
+        yield block_index, min(_TRIAL_BLOCK_SIZE, trials - start)
+
+
+def _set_worker_trial_data(data):
+    global _worker_trial_data
+    _worker_trial_data = data
+
+
+def _trial_block_worker(block):
+    mtx1, mtx2, seed = _worker_trial_data
+    block_index, num_trials = block
+    perms = get_trial_permutations(seed, block_index, num_trials, len(mtx2))
+    return procrustes_m_squareds(mtx1, mtx2, perms)
+
+
 def procrustes_monte_carlo(coords_f1,
                            coords_f2,
                            trials=1000,
                            max_dimensions=None,
                            shuffle_f=shuffle_row_order,
                            sample_id_map=None,
-                           trial_output_dir=None):  # rows are samples here
+                           trial_output_dir=None,
+                           seed=None,
+                           jobs_to_start=1):  # rows are samples here
     """ Run procrustes analysis with random trials
 
-        This analysis could be made more efficient, as the current version
-        just calls get_procrustes_results() random_trials times, which involves
-        re-parsing each time, etc. It is very fast though, so that's low
-        priority.
-
+        The coordinate files are parsed and aligned once. With the default
+        shuffle_f, the trials are run in blocks, each permuting the rows of
+        the standardized coords2 with its own random number generator
+        seeded from seed (drawn from numpy.random if None) and the index of
+        the block, so the results only depend on seed (and not on
+        jobs_to_start). Any other shuffle_f is applied to the aligned
+        coords2 one trial at a time, in this process.
+
+        Trial M^2s within floating point rounding of the actual M^2 count
+        as being as good as it. The transformed matrices of each trial are
+        only computed if trial_output_dir is provided.
     """
+    order, (coords1, eigvals1, pct_var1), (coords2, eigvals2, pct_var2) =\
+        get_aligned_coords(coords_f1, coords_f2, sample_id_map)
+    padded_coords1, padded_coords2, padded_eigvals1, padded_eigvals2, \
+        padded_pct_var1, padded_pct_var2 = match_dimensions(
+            coords1, coords2, eigvals1, eigvals2, pct_var1, pct_var2,
+            max_dimensions)
+    eigvals = get_mean_eigenvalues(padded_eigvals1, padded_eigvals2)
+    pct_var = get_mean_percent_variation(padded_pct_var1, padded_pct_var2)
+
     # Get the M^2 for the actual data
-    actual_m_squared = get_procrustes_results(
-        coords_f1,
-        coords_f2,
-        sample_id_map=sample_id_map,
-        randomize=None,
-        max_dimensions=max_dimensions)[2]
+    actual_m_squared = procrustes(padded_coords1, padded_coords2)[2]
+    tolerance = sqrt(finfo(float).eps)
 
     try:
         max_dimensions_str = 'maxdim_%d' % max_dimensions
@@ -233,49 +339,95 @@ def procrustes_monte_carlo(coords_f1,
         trial_summary_f = open(trail_summary_fp, 'w')
         trial_summary_f.write('trial id\ttrial M^2\n')
 
-    # Get the M^2 for the random trials, and count how many
-    # are lower than or equal to the actual M^2
-    trial_m_squareds = []
-    count_better = 0
-    for i in range(trials):
-        # perform the procrustes analysis
-        transformed_coords1, transformed_coords2, trial_m_squared, randomized_coords2 =\
-            get_procrustes_results(
-                coords_f1,
-                coords_f2,
-                sample_id_map=sample_id_map,
-                randomize=shuffle_f,
-                max_dimensions=max_dimensions)
-        trial_m_squareds.append(trial_m_squared)
-
-        if trial_m_squared <= actual_m_squared:
-            count_better += 1
-
-        # write the transformed coordinate matrices, if they're being
-        # stored
+    if shuffle_f is shuffle_row_order:
+        if seed is None:
+            seed = randint(0, 2 ** 31 - 1)
+        mtx1 = standardize_coords(padded_coords1)
+        mtx2 = standardize_coords(padded_coords2)
+        blocks = list(_iter_trial_blocks(trials))
+        if jobs_to_start > 1 and len(blocks) > 1:
+            pool = Pool(jobs_to_start, initializer=_set_worker_trial_data,
+                        initargs=((mtx1, mtx2, seed),))
+            block_m_squareds = pool.map(_trial_block_worker, blocks)
+            pool.close()
+            pool.join()
+        else:
+            block_m_squareds = [procrustes_m_squareds(
+                mtx1, mtx2, get_trial_permutations(seed, block_index,
+                                                   num_trials, len(order)))
+                for block_index, num_trials in blocks]
+
+        trial_m_squareds = []
+        for m_squareds in block_m_squareds:
+            trial_m_squareds.extend(m_squareds.tolist())
         if trial_output_dir:
-            trial_id = '%s_trial%d' % (max_dimensions_str, i)
-            output_matrix1_fp = '%s/pc1_transformed_%s.txt' \
-                % (trial_output_dir, trial_id)
-            output_matrix2_fp = '%s/pc2_transformed_%s.txt' \
-                % (trial_output_dir, trial_id)
-            output_matrix3_fp = '%s/pc2_randomized_trial%s.txt' \
-                % (trial_output_dir, i)
-            output_matrix1_f = open(output_matrix1_fp, 'w')
-            output_matrix1_f.write(transformed_coords1)
-            output_matrix1_f.close()
-            output_matrix2_f = open(output_matrix2_fp, 'w')
-            output_matrix2_f.write(transformed_coords2)
-            output_matrix2_f.close()
-            output_matrix3_f = open(output_matrix3_fp, 'w')
-            output_matrix3_f.write(randomized_coords2)
-            output_matrix3_f.close()
-            trial_summary_f.write('%s\t%2.2f\n' % (trial_id, trial_m_squared))
+            i = 0
+            for block_index, num_trials in blocks:
+                perms = get_trial_permutations(seed, block_index, num_trials,
+                                               len(order))
+                for perm in perms:
+                    _write_trial_details(
+                        trial_output_dir, max_dimensions_str, i, order,
+                        padded_coords1, padded_coords2[perm], eigvals,
+                        pct_var, coords2[perm], eigvals2, pct_var2,
+                        trial_m_squareds[i], trial_summary_f)
+                    i += 1
+    else:
+        trial_m_squareds = []
+        for i in range(trials):
+            randomized_coords2 = shuffle_f(coords2)
+            trial_coords1, trial_coords2 = match_dimensions(
+                coords1, randomized_coords2, eigvals1, eigvals2,
+                pct_var1, pct_var2, max_dimensions)[:2]
+            trial_m_squared = procrustes(trial_coords1, trial_coords2)[2]
+            trial_m_squareds.append(trial_m_squared)
+            if trial_output_dir:
+                _write_trial_details(
+                    trial_output_dir, max_dimensions_str, i, order,
+                    trial_coords1, trial_coords2, eigvals, pct_var,
+                    randomized_coords2, eigvals2, pct_var2, trial_m_squared,
+                    trial_summary_f)
 
     # Close the trial summary file, if one is being created
     if trial_output_dir:
         trial_summary_f.close()
 
+    # count how many of the random trials have an M^2 lower than or
+    # equal to the actual M^2
+    count_better = int((array(trial_m_squareds) <=
+                        actual_m_squared + tolerance).sum())
     return (
         actual_m_squared, trial_m_squareds, count_better, count_better / trials
     )
+
+
+def _write_trial_details(trial_output_dir, max_dimensions_str, i, order,
+                         coords1, coords2, eigvals, pct_var,
+                         randomized_coords2, eigvals2, pct_var2,
+                         trial_m_squared, trial_summary_f):
+    """ Write the transformed coordinate matrices of one random trial """
+    transformed_coords_m1, transformed_coords_m2 = \
+        procrustes(coords1, coords2)[:2]
+    trial_id = '%s_trial%d' % (max_dimensions_str, i)
+    output_matrix1_fp = '%s/pc1_transformed_%s.txt' \
+        % (trial_output_dir, trial_id)
+    output_matrix2_fp = '%s/pc2_transformed_%s.txt' \
+        % (trial_output_dir, trial_id)
+    output_matrix3_fp = '%s/pc2_randomized_trial%s.txt' \
+        % (trial_output_dir, i)
+    output_matrix1_f = open(output_matrix1_fp, 'w')
+    output_matrix1_f.write(format_coords(coord_header=order,
+                                         coords=transformed_coords_m1,
+                                         eigvals=eigvals, pct_var=pct_var))
+    output_matrix1_f.close()
+    output_matrix2_f = open(output_matrix2_fp, 'w')
+    output_matrix2_f.write(format_coords(coord_header=order,
+                                         coords=transformed_coords_m2,
+                                         eigvals=eigvals, pct_var=pct_var))
+    output_matrix2_f.close()
+    output_matrix3_f = open(output_matrix3_fp, 'w')
+    output_matrix3_f.write(format_coords(coord_header=order,
+                                         coords=randomized_coords2,
+                                         eigvals=eigvals2, pct_var=pct_var2))
+    output_matrix3_f.close()
+    trial_summary_f.write('%s\t%2.2f\n' % (trial_id, trial_m_squared))
@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+from __future__ import division
+
+__author__ = "Justin Kuczynski"
+__copyright__ = "Copyright 2011, The QIIME Project"
+__credits__ = ["Justin Kuczynski", "Rob Knight", "Greg Caporaso"]
+__license__ = "GPL"
+__version__ = "1.8.0-dev"
+__maintainer__ = "Justin Kuczynski"
+__email__ = "justinak@gmail.com"
+
+"""A phylogenetic tree indexed into arrays, for computing Faith's PD.
+
+cogent's PD_whole_tree copies, prunes and indexes the tree every time it is
+called. TreeIndex walks the tree once, recording each node's parent and
+branch length in postorder arrays, and computes PD from those arrays alone.
+
+A TreeIndex can be saved to (and loaded from) a numpy .npz file, which is
+much faster to load than the newick tree is to parse. from_newick_file keeps
+these in a cache directory, keyed by the md5 of the newick file, so each tree
+is only parsed once.
+"""
+
+from hashlib import md5
+from os import close, rename
+from os.path import exists, join
+from tempfile import mkstemp
+
+from numpy import (arange, argsort, array, asarray, bincount, concatenate,
+                   diff, int64, lexsort, load, repeat, savez, unique, zeros)
+from cogent.core.tree import PhyloNode
+from skbio.util.misc import create_dir
+
+from qiime.parse import parse_newick
+
+
+class TreeIndex(object):
+
+    """A tree indexed into postorder parent and branch length arrays
+
+    Parents: index of each node's parent (-1 for the root)
+    BranchLengths: length of the branch above each node (0 if it has none)
+    TipIndices: dict mapping each tip name to the index of its node
+    """
+
+    def __init__(self, parents, branch_lengths, tip_indices):
+        """Return a new TreeIndex
+
+        parents: index of each node's parent (-1 for the root), with the
+         nodes in postorder (so each node comes before its parent)
+        branch_lengths: length of the branch above each node
+        tip_indices: dict mapping each tip name to the index of its node
+        """
+        self.Parents = asarray(parents, dtype=int64)
+        self.BranchLengths = asarray(branch_lengths, dtype=float)
+        self.TipIndices = tip_indices
+        self._levels = None
+
+    @classmethod
+    def from_tree(cls, tree):
+        """Return a TreeIndex of tree, a cogent.core.tree.PhyloNode"""
+        nodes = list(tree.postorder())
+        node_indices = dict([(id(node), i) for i, node in enumerate(nodes)])
+        parents = [node_indices[id(node.Parent)]
+                   if node.Parent is not None else -1 for node in nodes]
+        branch_lengths = [node.Length or 0.0 for node in nodes]
+        tip_indices = dict([(node.Name, i) for i, node in enumerate(nodes)
+                            if not node.Children and node.Name is not None])
+        return cls(parents, branch_lengths, tip_indices)
+
+    @classmethod
+    def from_newick_file(cls, tree_fp, cache_dir=None):
+        """Return a TreeIndex of the newick tree at tree_fp
+
+        cache_dir: directory in which to keep the TreeIndex of each tree
+         file, keyed by the md5 of the file. If there is already one for
+         tree_fp it is loaded instead of parsing the tree; if not, it is
+         written there for next time.
+        """
+        if cache_dir is None:
+            return cls.from_tree(parse_newick(open(tree_fp, 'U'), PhyloNode))
+
+        cache_fp = join(cache_dir, 'tree_index_%s.npz' % _md5(tree_fp))
+        if exists(cache_fp):
+            return cls.load(cache_fp)
+        tree_index = cls.from_tree(parse_newick(open(tree_fp, 'U'),
+                                                PhyloNode))
+        create_dir(cache_dir)
+        # write to a temporary file first, so that other processes sharing
+        # the cache never load a partially written index
+        fd, tmp_fp = mkstemp(dir=cache_dir, prefix='tree_index_',
+                             suffix='.tmp')
+        close(fd)
+        tree_index.save(tmp_fp)
+        rename(tmp_fp, cache_fp)
+        return tree_index
+
+    @classmethod
+    def load(cls, fp):
+        """Return the TreeIndex saved to fp"""
+        data = load(fp)
+        tip_indices = dict(zip(data['tip_names'].tolist(),
+                               data['tip_nodes'].tolist()))
+        tree_index = cls(data['parents'], data['branch_lengths'], tip_indices)
+        tree_index._levels = data['levels']
+        return tree_index
+
+    def save(self, fp):
+        """Save the TreeIndex to fp, in numpy's .npz format"""
+        tip_names = self.TipIndices.keys()
+        f = open(fp, 'wb')
+        savez(f, parents=self.Parents, branch_lengths=self.BranchLengths,
+              levels=self._get_levels(),
+              tip_names=array(tip_names, dtype=str),
+              tip_nodes=array([self.TipIndices[name] for name in tip_names],
+                              dtype=int64))
+        f.close()
+
+    def get_tip_indices(self, names):
+        """Return the node index of each tip in names (-1 if not in the tree)
+        """
+        return array([self.TipIndices.get(name, -1) for name in names],
+                     dtype=int64)
+
+    def _get_levels(self):
+        """Return the height of each node above the furthest tip below it
+
+        Each node's level is greater than the levels of its children.
+        """
+        if self._levels is None:
+            levels = [0] * len(self.Parents)
+            # the nodes are in postorder, so each node's level is final by
+            # the time it's passed to its parent
+            for node, parent in enumerate(self.Parents.tolist()):
+                if parent >= 0 and levels[parent] <= levels[node]:
+                    levels[parent] = levels[node] + 1
+            self._levels = array(levels, dtype=int64)
+        return self._levels
+
+    def pd(self, sample_vectors, tip_indices):
+        """Return the PD of each sample of sample_vectors
+
+        sample_vectors: a qiime.sparse_beta_diversity.SampleVectors
+        tip_indices: the node index of each observation of sample_vectors,
+         or -1 for observations which aren't in the tree (see
+         get_tip_indices)
+
+        PD is the total length of the branches from the root to the
+         observed tips, including the branch above the root (as for cogent's
+         PD_whole_tree, which also truncates the counts to integers, so a
+         tip is observed if its count is at least 1). The observed tips of
+         all of the samples are propagated up the tree together, one level
+         at a time, as (sample, node) pairs. All of the children of a node
+         are on lower levels, so each pair is only passed up once, and PD is
+         the sum of the branch lengths of each sample's pairs.
+        """
+        num_samples = len(sample_vectors)
+        num_nodes = len(self.Parents)
+        levels = self._get_levels()
+        samples = repeat(arange(num_samples, dtype=int64),
+                         diff(sample_vectors.offsets))
+        nodes = asarray(tip_indices, dtype=int64)[sample_vectors.indices]
+        observed = (nodes >= 0) & (sample_vectors.values >= 1)
+        keys = samples[observed] * num_nodes + nodes[observed]
+
+        # keys waiting to be passed up the tree, by the level of their node
+        pending = {}
+        _add_by_level(pending, keys, levels[nodes[observed]])
+        all_keys = []
+        while pending:
+            keys = unique(concatenate(pending.pop(min(pending))))
+            all_keys.append(keys)
+            nodes = keys % num_nodes
+            parents = self.Parents[nodes]
+            has_parent = parents >= 0
+            keys = (keys - nodes + parents)[has_parent]
+            _add_by_level(pending, keys, levels[parents[has_parent]])
+        if not all_keys:
+            return zeros(num_samples)
+
+        keys = concatenate(all_keys)
+        result = zeros(num_samples)
+        lengths = bincount(keys // num_nodes,
+                           weights=self.BranchLengths[keys % num_nodes])
+        result[:len(lengths)] = lengths
+        return result
+
+    def nested_pd(self, tip_indices, first_depths, num_depths):
+        """Return the PD of a sample at each of num_depths nested depths
+
+        tip_indices: node indices of the tips observed in the sample
+        first_depths: for each tip, the index of the first depth at which it
+         is observed (it is observed at all the depths after that one)
+
+        PD is the total length of the branches from the root to the observed
+         tips, including the branch above the root (as for cogent's
+         PD_whole_tree). Each node counts from the first depth at which any
+         of the tips below it is observed, so the tree is only walked once
+         for all of the depths.
+        """
+        nodes = array(tip_indices, dtype=int64)
+        depths = array(first_depths, dtype=int64)
+        all_nodes = []
+        all_depths = []
+        while len(nodes):
+            # keep each node once, with the earliest depth it was reached at
+            order = lexsort((depths, nodes))
+            nodes = nodes[order]
+            depths = depths[order]
+            first = concatenate([[True], nodes[1:] != nodes[:-1]])
+            nodes = nodes[first]
+            depths = depths[first]
+            all_nodes.append(nodes)
+            all_depths.append(depths)
+            parents = self.Parents[nodes]
+            has_parent = parents >= 0
+            nodes = parents[has_parent]
+            depths = depths[has_parent]
+        if not all_nodes:
+            return zeros(num_depths)
+
+        # a node may be reached from tips at different heights, so keep
+        # only the earliest depth it was reached at
+        nodes = concatenate(all_nodes)
+        depths = concatenate(all_depths)
+        order = lexsort((depths, nodes))
+        nodes = nodes[order]
+        depths = depths[order]
+        first = concatenate([[True], nodes[1:] != nodes[:-1]])
+        lengths = bincount(depths[first],
+                           weights=self.BranchLengths[nodes[first]])
+        result = zeros(num_depths)
+        result[:len(lengths)] = lengths[:num_depths]
+        return result.cumsum()
+
+
+def _add_by_level(pending, keys, key_levels):
+    """Add keys to the lists in pending for the levels in key_levels"""
+    if not len(keys):
+        return
+    order = argsort(key_levels, kind='mergesort')
+    keys = keys[order]
+    key_levels = key_levels[order]
+    bounds = concatenate([[0], (diff(key_levels) != 0).nonzero()[0] + 1,
+                          [len(keys)]])
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        pending.setdefault(key_levels[start], []).append(keys[start:end])
+
+
+def _md5(fp):
+    """Return the hex md5 digest of the contents of the file at fp"""
+    digest = md5()
+    f = open(fp, 'rb')
+    for block in iter(lambda: f.read(2 ** 20), ''):
+        digest.update(block)
+    f.close()
+    return digest.hexdigest()
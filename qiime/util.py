@@ -661,6 +661,9 @@ def get_options_lookup():
     result['cluster_jobs_fp'] =\
         make_option('-U', '--cluster_jobs_fp',
                     help='path to cluster jobs script (defined in qiime_config) ' +
+                    '. Pass "local" to run the jobs in a pool of worker ' +
+                    'processes on this machine and merge the results as soon ' +
+                    'as they complete, without a poller' +
                     ' [default: %default]',
                     default=qiime_config['cluster_jobs_fp'] or
                     'start_parallel_jobs.py')
@@ -96,26 +96,37 @@ def run_beta_diversity_through_plots(otu_table_fp,
     except KeyError:
         beta_diversity_metrics = ['weighted_unifrac', 'unweighted_unifrac']
 
-    dm_fps = []
-    for beta_diversity_metric in beta_diversity_metrics:
+    # Prep the beta-diversity command
+    try:
+        bdiv_params_copy = params['beta_diversity'].copy()
+    except KeyError:
+        bdiv_params_copy = {}
+    try:
+        del bdiv_params_copy['metrics']
+    except KeyError:
+        pass
 
-        # Prep the beta-diversity command
-        try:
-            bdiv_params_copy = params['beta_diversity'].copy()
-        except KeyError:
-            bdiv_params_copy = {}
-        try:
-            del bdiv_params_copy['metrics']
-        except KeyError:
-            pass
+    bdiv_params_str = get_params_str(bdiv_params_copy)
 
-        params_str = get_params_str(bdiv_params_copy)
+    if tree_fp:
+        bdiv_params_str = '%s -t %s ' % (bdiv_params_str, tree_fp)
+
+    if not parallel:
+        # Build the beta-diversity command. All of the metrics are computed
+        # in a single run, so the OTU table and tree are only loaded once.
+        beta_div_cmd = 'beta_diversity.py -i %s -o %s --metrics %s %s' %\
+            (otu_table_fp, output_dir, ','.join(beta_diversity_metrics),
+             bdiv_params_str)
+        commands.append(
+            [('Beta Diversity (%s)' % ', '.join(beta_diversity_metrics),
+              beta_div_cmd)])
 
-        if tree_fp:
-            params_str = '%s -t %s ' % (params_str, tree_fp)
+    dm_fps = []
+    for beta_diversity_metric in beta_diversity_metrics:
 
-        # Build the beta-diversity command
+        # Build the parallel beta-diversity command
         if parallel:
+            params_str = bdiv_params_str
             # Grab the parallel-specific parameters
             try:
                 params_str += get_params_str(params['parallel'])
@@ -125,11 +136,6 @@ def run_beta_diversity_through_plots(otu_table_fp,
                 (otu_table_fp, output_dir, beta_diversity_metric, params_str)
             commands.append(
                 [('Beta Diversity (%s)' % beta_diversity_metric, beta_div_cmd)])
-        else:
-            beta_div_cmd = 'beta_diversity.py -i %s -o %s --metrics %s %s' %\
-                (otu_table_fp, output_dir, beta_diversity_metric, params_str)
-            commands.append(
-                [('Beta Diversity (%s)' % beta_diversity_metric, beta_div_cmd)])
 
         orig_beta_div_fp = '%s/%s_%s.txt' % \
             (output_dir, beta_diversity_metric, otu_table_basename)
@@ -197,7 +203,8 @@ def run_alpha_rarefaction(otu_table_fp,
                           suppress_md5=False,
                           status_update_callback=print_to_stdout,
                           plot_stderr_and_stddev=False,
-                          retain_intermediate_files=True):
+                          retain_intermediate_files=True,
+                          fused=False):
     """ Run the data preparation steps of Qiime
 
         The steps performed by this function are:
@@ -206,6 +213,9 @@ def run_alpha_rarefaction(otu_table_fp,
           3) Collate alpha diversity results;
           4) Generate alpha rarefaction plots.
 
+        If fused is True, steps 1-3 are performed by a single call to
+         rarefied_alpha_diversity.py, which doesn't write the rarefied OTU
+         tables or their alpha diversity.
     """
     # Prepare some variables for the later steps
     otu_table_dir, otu_table_filename = split(otu_table_fp)
@@ -231,68 +241,88 @@ def run_alpha_rarefaction(otu_table_fp,
     step = int((max_rare_depth - min_rare_depth) / num_steps) or 1
     max_rare_depth = int(max_rare_depth)
 
-    rarefaction_dir = '%s/rarefaction/' % output_dir
-    create_dir(rarefaction_dir)
-    try:
-        params_str = get_params_str(params['multiple_rarefactions'])
-    except KeyError:
-        params_str = ''
-    if parallel:
-        params_str += ' %s' % get_params_str(params['parallel'])
-        # Build the rarefaction command
-        rarefaction_cmd = \
-            'parallel_multiple_rarefactions.py -T -i %s -m %s -x %s -s %s -o %s %s' %\
+    alpha_collated_dir = '%s/alpha_div_collated/' % output_dir
+    if fused:
+        create_dir(alpha_collated_dir)
+        # rarefied_alpha_diversity.py takes the options of
+        # multiple_rarefactions.py and alpha_diversity.py, except for those
+        # which only apply to the rarefied OTU tables
+        fused_params = dict(params['multiple_rarefactions'])
+        fused_params.pop('lineages_included', None)
+        fused_params.pop('nested', None)
+        fused_params.update(params['alpha_diversity'])
+        params_str = get_params_str(fused_params)
+        if tree_fp:
+            params_str += ' -t %s' % tree_fp
+        if parallel and 'jobs_to_start' in params['parallel']:
+            params_str += ' -O %s' % params['parallel']['jobs_to_start']
+        fused_cmd = \
+            'rarefied_alpha_diversity.py -i %s --min %s -x %s -s %s -o %s %s' %\
             (otu_table_fp, min_rare_depth, max_rare_depth, step,
-             rarefaction_dir, params_str)
+             alpha_collated_dir, params_str)
+        commands.append([('Alpha rarefaction and diversity', fused_cmd)])
     else:
-        # Build the rarefaction command
-        rarefaction_cmd = \
-            'multiple_rarefactions.py -i %s -m %s -x %s -s %s -o %s %s' %\
-            (otu_table_fp, min_rare_depth, max_rare_depth, step,
-             rarefaction_dir, params_str)
-    commands.append([('Alpha rarefaction', rarefaction_cmd)])
-
-    # Prep the alpha diversity command
-    alpha_diversity_dir = '%s/alpha_div/' % output_dir
-    create_dir(alpha_diversity_dir)
-    try:
-        params_str = get_params_str(params['alpha_diversity'])
-    except KeyError:
-        params_str = ''
-    if tree_fp:
-        params_str += ' -t %s' % tree_fp
-    if parallel:
-        params_str += ' %s' % get_params_str(params['parallel'])
-        # Build the alpha diversity command
-        alpha_diversity_cmd = \
-            "parallel_alpha_diversity.py -T -i %s -o %s %s" %\
-            (rarefaction_dir, alpha_diversity_dir, params_str)
-    else:
-        # Build the alpha diversity command
-        alpha_diversity_cmd = \
-            "alpha_diversity.py -i %s -o %s %s" %\
-            (rarefaction_dir, alpha_diversity_dir, params_str)
+        rarefaction_dir = '%s/rarefaction/' % output_dir
+        create_dir(rarefaction_dir)
+        try:
+            params_str = get_params_str(params['multiple_rarefactions'])
+        except KeyError:
+            params_str = ''
+        if parallel:
+            params_str += ' %s' % get_params_str(params['parallel'])
+            # Build the rarefaction command
+            rarefaction_cmd = \
+                'parallel_multiple_rarefactions.py -T -i %s -m %s -x %s -s %s -o %s %s' %\
+                (otu_table_fp, min_rare_depth, max_rare_depth, step,
+                 rarefaction_dir, params_str)
+        else:
+            # Build the rarefaction command
+            rarefaction_cmd = \
+                'multiple_rarefactions.py -i %s -m %s -x %s -s %s -o %s %s' %\
+                (otu_table_fp, min_rare_depth, max_rare_depth, step,
+                 rarefaction_dir, params_str)
+        commands.append([('Alpha rarefaction', rarefaction_cmd)])
+
+        # Prep the alpha diversity command
+        alpha_diversity_dir = '%s/alpha_div/' % output_dir
+        create_dir(alpha_diversity_dir)
+        try:
+            params_str = get_params_str(params['alpha_diversity'])
+        except KeyError:
+            params_str = ''
+        if tree_fp:
+            params_str += ' -t %s' % tree_fp
+        if parallel:
+            params_str += ' %s' % get_params_str(params['parallel'])
+            # Build the alpha diversity command
+            alpha_diversity_cmd = \
+                "parallel_alpha_diversity.py -T -i %s -o %s %s" %\
+                (rarefaction_dir, alpha_diversity_dir, params_str)
+        else:
+            # Build the alpha diversity command
+            alpha_diversity_cmd = \
+                "alpha_diversity.py -i %s -o %s %s" %\
+                (rarefaction_dir, alpha_diversity_dir, params_str)
 
-    commands.append(
-        [('Alpha diversity on rarefied OTU tables', alpha_diversity_cmd)])
+        commands.append(
+            [('Alpha diversity on rarefied OTU tables', alpha_diversity_cmd)])
 
-    # Prep the alpha diversity collation command
-    alpha_collated_dir = '%s/alpha_div_collated/' % output_dir
-    create_dir(alpha_collated_dir)
-    try:
-        params_str = get_params_str(params['collate_alpha'])
-    except KeyError:
-        params_str = ''
-    # Build the alpha diversity collation command
-    alpha_collated_cmd = 'collate_alpha.py -i %s -o %s %s' %\
-        (alpha_diversity_dir, alpha_collated_dir, params_str)
-    commands.append([('Collate alpha', alpha_collated_cmd)])
-
-    if not retain_intermediate_files:
-        commands.append([('Removing intermediate files',
-                          'rm -r %s %s' % (rarefaction_dir, alpha_diversity_dir))])
-    else:
-        commands.append([('Skipping removal of intermediate files.', '')])
+        # Prep the alpha diversity collation command
+        create_dir(alpha_collated_dir)
+        try:
+            params_str = get_params_str(params['collate_alpha'])
+        except KeyError:
+            params_str = ''
+        # Build the alpha diversity collation command
+        alpha_collated_cmd = 'collate_alpha.py -i %s -o %s %s' %\
+            (alpha_diversity_dir, alpha_collated_dir, params_str)
+        commands.append([('Collate alpha', alpha_collated_cmd)])
+
+        if not retain_intermediate_files:
+            commands.append([('Removing intermediate files',
+                              'rm -r %s %s' % (rarefaction_dir, alpha_diversity_dir))])
+        else:
+            commands.append([('Skipping removal of intermediate files.', '')])
 
     # Prep the make rarefaction plot command(s)
     try:
@@ -420,6 +450,46 @@ def run_jackknifed_beta_diversity(otu_table_fp,
         (otu_table_fp, seqs_per_sample, rarefaction_dir, params_str)
     commands.append([('Rarefaction', rarefaction_cmd)])
 
+    # the metrics parameter is ignored for the rarefied OTU tables, as the
+    # metrics are listed explicitly
+    try:
+        d = params['beta_diversity'].copy()
+        del d['metrics']
+    except KeyError:
+        params_str = {}
+    if not parallel:
+        # Prep the serial beta diversity command (for rarefied OTU tables).
+        # All of the metrics are computed in a single run, so each rarefied
+        # OTU table (and the tree) is only loaded once, and the distance
+        # matrices are then moved from this scratch directory to the
+        # per-metric output directories.
+        all_rare_dm_dir = '%s/rare_dm_all_metrics_tmp/' % output_dir
+        create_dir(all_rare_dm_dir)
+        params_str = get_params_str(d) + ' -m %s ' % \
+            ','.join(beta_diversity_metrics)
+        if tree_fp:
+            params_str = '%s -t %s' % (params_str, tree_fp)
+        # Build the serial beta diversity command (for rarefied OTU tables)
+        beta_div_rarefied_cmd = \
+            'beta_diversity.py -i %s -o %s %s' %\
+            (rarefaction_dir, all_rare_dm_dir, params_str)
+        commands.append(
+            [('Beta diversity on rarefied OTU tables (%s)' %
+              ', '.join(beta_diversity_metrics), beta_div_rarefied_cmd)])
+        for beta_diversity_metric in beta_diversity_metrics:
+            # Move this metric's distance matrices (named
+            # <metric>_rarefaction_<depth>_<iteration>.txt) to its directory
+            dm_dir = '%s/%s/rare_dm/' % (output_dir, beta_diversity_metric)
+            create_dir(dm_dir)
+            commands.append(
+                [('Move rarefied distance matrices (%s)' % beta_diversity_metric,
+                  'mv %s/%s_rarefaction_* %s' %
+                  (all_rare_dm_dir, beta_diversity_metric, dm_dir))])
+        # the scratch directory should now be empty
+        commands.append(
+            [('Remove rarefied distance matrix scratch directory',
+              'rmdir %s' % all_rare_dm_dir)])
+
     # Begin iterating over beta diversity distance metrics, if more than one
     # was provided
     for beta_diversity_metric in beta_diversity_metrics:
@@ -444,32 +514,21 @@ def run_jackknifed_beta_diversity(otu_table_fp,
         # Prep the beta diversity command (for rarefied OTU tables)
         dm_dir = '%s/rare_dm/' % metric_output_dir
         create_dir(dm_dir)
-        # the metrics parameter needs to be ignored as we need to run
-        # beta_diversity one metric at a time to keep the per-metric
-        # output files in separate directories
-        try:
-            d = params['beta_diversity'].copy()
-            del d['metrics']
-        except KeyError:
-            params_str = {}
-        params_str = get_params_str(d) + ' -m %s ' % beta_diversity_metric
-        if tree_fp:
-            params_str = '%s -t %s' % (params_str, tree_fp)
         if parallel:
+            # parallel_beta_diversity is run one metric at a time to keep
+            # the per-metric output files in separate directories
+            params_str = get_params_str(d) + ' -m %s ' % beta_diversity_metric
+            if tree_fp:
+                params_str = '%s -t %s' % (params_str, tree_fp)
             params_str += ' %s' % get_params_str(params['parallel'])
             # Build the parallel beta diversity command (for rarefied OTU
             # tables)
             beta_div_rarefied_cmd = \
                 'parallel_beta_diversity.py -T -i %s -o %s %s' %\
                 (rarefaction_dir, dm_dir, params_str)
-        else:
-            # Build the serial beta diversity command (for rarefied OTU tables)
-            beta_div_rarefied_cmd = \
-                'beta_diversity.py -i %s -o %s %s' %\
-                (rarefaction_dir, dm_dir, params_str)
-        commands.append(
-            [('Beta diversity on rarefied OTU tables (%s)' % beta_diversity_metric,
-              beta_div_rarefied_cmd)])
+            commands.append(
+                [('Beta diversity on rarefied OTU tables (%s)' % beta_diversity_metric,
+                  beta_div_rarefied_cmd)])
 
         # Prep the hierarchical clustering command (for rarefied
         # distance matrices)
@@ -84,7 +84,12 @@ script_info['optional_options'] = [
     make_option('-t', '--tree_path', default=None,
                 help='Input newick tree filepath.' +
                 ' [default: %default; REQUIRED for phylogenetic metrics]',
-                type='existing_filepath')
+                type='existing_filepath'),
+    make_option('--tree_cache_dir', default=None, type='new_dirpath',
+                help='Directory in which to cache the indexed tree, keyed ' +
+                'by the md5 of the tree file. Later runs with the same ' +
+                'tree load the index from here instead of parsing the ' +
+                'tree. [default: %default]')
 ]
 
 script_info['version'] = __version__
@@ -105,7 +110,7 @@ def main():
 
     if os.path.isdir(opts.input_path):
         multiple_file_alpha(opts.input_path, opts.output_path, opts.metrics,
-                            opts.tree_path)
+                            opts.tree_path, opts.tree_cache_dir)
     elif os.path.isfile(opts.input_path):
         try:
             f = open(opts.output_path, 'w')
@@ -117,7 +122,8 @@ def main():
             else:
                 option_parser.error("ioerror, couldn't create output file")
         single_file_alpha(opts.input_path, opts.metrics,
-                          opts.output_path, opts.tree_path)
+                          opts.output_path, opts.tree_path,
+                          opts.tree_cache_dir)
 
 
 if __name__ == "__main__":
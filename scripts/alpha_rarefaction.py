@@ -82,6 +82,12 @@ script_info['optional_options'] = [
                 'intermediate files: rarefied OTU tables (rarefaction) and alpha diversity '
                 'results (alpha_div). By default these will be erased [default: %default]',
                 default=False),
+    make_option('--fused', action='store_true',
+                help='rarefy the OTU table and compute the collated alpha '
+                'diversity in a single process with '
+                'rarefied_alpha_diversity.py, without writing the rarefied '
+                'OTU tables or their alpha diversity [default: %default]',
+                default=False),
 ]
 script_info['version'] = __version__
 
@@ -155,7 +161,8 @@ def main():
                           min_rare_depth=min_rare_depth,
                           max_rare_depth=max_rare_depth,
                           status_update_callback=status_update_callback,
-                          retain_intermediate_files=retain_intermediate_files)
+                          retain_intermediate_files=retain_intermediate_files,
+                          fused=opts.fused)
 
 if __name__ == "__main__":
     main()
@@ -39,7 +39,13 @@ A number of metrics are currently supported, including unweighted and weighted\
  (e.g., at high temperatures), in part because abundance information can\
  obscure significant patterns of variation in which taxa are present (Lozupone\
  et al., 2007). Most qualitative measures are referred to here e.g.\
- "binary_jaccard". Typically both weighted and unweighted unifrac are used."""
+ "binary_jaccard". Typically both weighted and unweighted unifrac are used.
+
+Several metrics can be passed to -m as a comma-separated list. They are all\
+ computed in a single run, which loads each OTU table and the tree only once\
+ and shares work between related metrics (e.g., all UniFrac metrics are\
+ computed from the same tree index), so this is faster than running the script\
+ once per metric."""
 script_info['script_usage'] = []
 
 script_info['script_usage'].append(
@@ -55,6 +61,19 @@ script_info['script_usage'].append(
  command:""",
      """%prog -i otu_table.biom -m weighted_unifrac -o beta_div/ -t rep_set.tre"""))
 
+script_info['script_usage'].append(
+    ("""Single File Beta Diversity (multiple metrics):""",
+     """To compute several metrics in a single run (e.g. weighted and unweighted\
+ UniFrac and Bray-Curtis), pass them as a comma-separated list:""",
+     """%prog -i otu_table.biom -m weighted_unifrac,unweighted_unifrac,bray_curtis -o beta_div/ -t rep_set.tre"""))
+
+script_info['script_usage'].append(
+    ("""Single File Beta Diversity (binary output):""",
+     """For large numbers of samples, the distance matrices can be written in\
+ QIIME's binary format, which downstream scripts (e.g.,\
+ principal_coordinates.py) load without parsing text:""",
+     """%prog -i otu_table.biom -m weighted_unifrac -o beta_div/ -t rep_set.tre -b"""))
+
 script_info['script_usage'].append(
     ("""Multiple File (batch) Beta Diversity (phylogenetic):""",
      """To perform beta diversity on multiple OTU tables (e.g., resulting files from\
@@ -65,7 +84,7 @@ script_info['script_usage'].append(
 script_info['output_description'] = """Each file in the input directory should be\
  an otu table, and the output of beta_diversity.py is a folder containing text\
  files, each a distance matrix between samples corresponding to an input otu\
- table."""
+ table (or binary distance matrix files, if -b is passed)."""
 script_info['required_options'] = []
 script_info['optional_options'] = [
     make_option('-i', '--input_path',
@@ -99,6 +118,18 @@ script_info['optional_options'] = [
                 'Pass to skip this step if you\'re already passing a minimal tree.' +
                 ' Beware with "full_tree" metrics, as extra tips in the tree' +
                 ' change the result'),
+    make_option('-O', '--jobs_to_start', type='int', default=1,
+                help='Number of processes used to compute UniFrac metrics ' +
+                'and non-phylogenetic metrics which only depend on the pair ' +
+                'of samples being compared (e.g., bray_curtis, euclidean, ' +
+                'binary_jaccard). [default: %default]'),
+    make_option('-b', '--binary_output', action='store_true', default=False,
+                help='Write each distance matrix in QIIME\'s binary distance ' +
+                'matrix format (named <metric>_<input>.dm) rather than as ' +
+                'tab-delimited text. All QIIME scripts which read distance ' +
+                'matrices accept this format, and load it much faster than ' +
+                'text for large matrices. Not supported with --rows. ' +
+                '[default: %default]'),
 ]
 script_info['option_label'] = {'input_path': 'OTU table filepath',
                                'rows': 'List of samples for compute',
@@ -106,6 +137,8 @@ script_info['option_label'] = {'input_path': 'OTU table filepath',
                                'show_metrics': 'Show metrics',
                                'tree_path': 'Newick tree filepath',
                                'full_tree': 'Tree already trimmed',
+                               'jobs_to_start': 'Number of processes',
+                               'binary_output': 'Write binary distance matrices',
                                'output_dir': 'Output directory'}
 
 script_info['version'] = __version__
@@ -129,6 +162,12 @@ def main():
                      ' automatically.  And we refuse to make .txt directories\n')
         exit(1)
 
+    if opts.jobs_to_start < 1:
+        option_parser.error('--jobs_to_start must be at least 1.')
+
+    if opts.binary_output and opts.rows is not None:
+        option_parser.error('--binary_output can not be used with --rows.')
+
     if opts.tree_path == "None":
         opts.tree_path = None
 
@@ -139,10 +178,14 @@ def main():
 
     if os.path.isdir(opts.input_path):
         multiple_file_beta(opts.input_path, opts.output_dir, opts.metrics,
-                           opts.tree_path, opts.rows, full_tree=opts.full_tree)
+                           opts.tree_path, opts.rows, full_tree=opts.full_tree,
+                           jobs_to_start=opts.jobs_to_start,
+                           binary_output=opts.binary_output)
     elif os.path.isfile(opts.input_path):
         single_file_beta(opts.input_path, opts.metrics, opts.tree_path,
-                         opts.output_dir, opts.rows, full_tree=opts.full_tree)
+                         opts.output_dir, opts.rows, full_tree=opts.full_tree,
+                         jobs_to_start=opts.jobs_to_start,
+                         binary_output=opts.binary_output)
     else:
         stderr.write("io error, input path not valid.  Does it exist?")
         exit(1)
@@ -158,7 +158,17 @@ script_info['optional_options'] = [
                 'to use when calculating statistical significance. Only applies to '
                 'adonis, ANOSIM, MRPP, PERMANOVA, PERMDISP, and db-RDA. Must be '
                 'greater than or equal to zero [default: %default]', default=999,
-                type='int')
+                type='int'),
+    make_option('-O', '--jobs_to_start', type='int', default=1,
+                help='the number of processes to compute the ANOSIM or '
+                'PERMANOVA permutations, or the BEST combinations, in '
+                '[default: %default]'),
+    make_option('--best_stepwise', action='store_true', default=False,
+                help='add one category at a time to the best combination '
+                'found so far, rather than trying every combination of '
+                'categories. This is much faster for many categories, but '
+                'may miss the best combinations. Only applies to BEST '
+                '[default: %default]')
 ]
 script_info['version'] = __version__
 
@@ -169,6 +179,9 @@ def main():
     out_dir = opts.output_dir
     categories = opts.categories.split(',')
 
+    if opts.jobs_to_start < 1:
+        option_parser.error("jobs_to_start must be at least 1")
+
     # Create the output dir if it doesn't already exist.
     try:
         if not exists(out_dir):
@@ -178,7 +191,9 @@ def main():
                             "specified with the -o option." % out_dir)
 
     compare_categories(opts.input_dm, opts.mapping_file, opts.method,
-                       categories, opts.num_permutations, out_dir)
+                       categories, opts.num_permutations, out_dir,
+                       jobs_to_start=opts.jobs_to_start,
+                       best_stepwise=opts.best_stepwise)
 
 
 if __name__ == "__main__":
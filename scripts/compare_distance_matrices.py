@@ -109,6 +109,9 @@ script_info['optional_options'] = [
     make_option('-s', '--sample_id_map_fp', type='existing_filepath',
                 help='Map of original sample ids to new sample ids [default: '
                 '%default]', default=None),
+    make_option('-O', '--jobs_to_start', type='int', default=1,
+                help='the number of processes to compute the permutations in '
+                '[default: %default]'),
     # Standard Mantel specific, i.e., method == mantel
     make_option('-t', '--tail_type',
                 help='the type of tail test to perform when calculating the p-value. '
@@ -165,6 +168,9 @@ comment_corr = comment_mantel_pmantel[:-1] + \
 def main():
     option_parser, opts, args = parse_command_line_parameters(**script_info)
 
+    if opts.jobs_to_start < 1:
+        option_parser.error("jobs_to_start must be at least 1")
+
     # Create the output dir if it doesn't already exist.
     try:
         if not path.exists(opts.output_dir):
@@ -183,7 +189,8 @@ def main():
         output_f = open(path.join(opts.output_dir, 'mantel_results.txt'), 'w')
         output_f.write(run_mantel_test('mantel', input_dm_fps, distmats,
                        opts.num_permutations, opts.tail_type,
-                       comment_mantel_pmantel, sample_id_map=sample_id_map))
+                       comment_mantel_pmantel, sample_id_map=sample_id_map,
+                       jobs_to_start=opts.jobs_to_start))
     elif opts.method == 'partial_mantel':
         output_f = open(path.join(opts.output_dir,
                         'partial_mantel_results.txt'), 'w')
@@ -191,14 +198,16 @@ def main():
                        distmats, opts.num_permutations, opts.tail_type,
                        comment_mantel_pmantel, control_dm_fp=opts.control_dm,
                        control_dm=parse_distmat(open(opts.control_dm, 'U')),
-                       sample_id_map=sample_id_map))
+                       sample_id_map=sample_id_map,
+                       jobs_to_start=opts.jobs_to_start))
     elif opts.method == 'mantel_corr':
         output_f = open(path.join(opts.output_dir,
                         'mantel_correlogram_results.txt'), 'w')
         result_str, correlogram_fps, correlograms = run_mantel_correlogram(
             input_dm_fps, distmats, opts.num_permutations, comment_corr,
             opts.alpha, sample_id_map=sample_id_map,
-            variable_size_distance_classes=opts.variable_size_distance_classes)
+            variable_size_distance_classes=opts.variable_size_distance_classes,
+            jobs_to_start=opts.jobs_to_start)
 
         output_f.write(result_str)
         for corr_fp, corr in zip(correlogram_fps, correlograms):
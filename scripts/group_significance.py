@@ -18,9 +18,9 @@ from qiime.util import (parse_command_line_parameters, make_option,
 from qiime.pycogent_backports.test import (benjamini_hochberg_step_down,
                                            bonferroni_correction)
 from qiime.otu_significance import (get_sample_cats, get_sample_indices,
-                                    get_cat_sample_groups, group_significance_row_generator,
+                                    get_cat_sample_groups, group_significance_data,
                                     group_significance_output_formatter,
-                                    sort_by_pval, run_group_significance_test,
+                                    sort_by_pval, batch_group_significance_test,
                                     TWO_GROUP_TESTS, GROUP_TEST_CHOICES)
 from qiime.parse import parse_mapping_file_to_dict
 from biom.parse import parse_biom_table
@@ -266,13 +266,18 @@ script_info['optional_options'] = [
                 'Only their intersecting samples will be used for calculations.'),
     make_option('--print_non_overlap', action='store_true', default=False,
                 help='If this flag is passed the script will display the samples that' +
-                ' do not overlap between the mapping file and the biom file.')]
+                ' do not overlap between the mapping file and the biom file.'),
+    make_option('-O', '--jobs_to_start', type='int', default=1,
+                help='Number of processes to run the tests in ' +
+                '[default: %default]')]
 
 script_info['version'] = __version__
 
 
 def main():
     option_parser, opts, args = parse_command_line_parameters(**script_info)
+    if opts.jobs_to_start < 1:
+        option_parser.error("jobs_to_start must be at least 1")
     # sync the mapping file and the biom file
     tmp_bt = parse_biom_table(open(opts.otu_table_fp, 'U'))
     tmp_pmf, _ = parse_mapping_file_to_dict(opts.mapping_fp)
@@ -317,10 +322,10 @@ def main():
                              'documentation.')
 
     # run actual tests
-    data_feed = group_significance_row_generator(bt, cat_sam_indices)
-    test_stats, pvals, means = run_group_significance_test(
-        data_feed, opts.test,
-        GROUP_TEST_CHOICES, int(opts.permutations))
+    data, group_sizes = group_significance_data(bt, cat_sam_indices)
+    test_stats, pvals, means = batch_group_significance_test(
+        data, group_sizes, opts.test, int(opts.permutations),
+        jobs_to_start=opts.jobs_to_start)
 
     # calculate corrected pvals
     fdr_pvals = array(benjamini_hochberg_step_down(pvals))
@@ -22,6 +22,7 @@ from qiime.util import parse_command_line_parameters, get_options_lookup
 from qiime.util import make_option
 from qiime.parse import parse_taxonomy
 from qiime.make_otu_table import make_otu_table
+from qiime.compact_otu_map import is_compact_otu_map_file, load_otu_map
 
 options_lookup = get_options_lookup()
 
@@ -88,7 +89,11 @@ def main():
         else:
             ids_to_exclude = \
                 get_seq_ids_from_seq_id_file(open(exclude_otus_fp, 'U'))
-    biom_otu_table = make_otu_table(open(opts.otu_map_fp, 'U'),
+    if is_compact_otu_map_file(opts.otu_map_fp):
+        otu_map_f = load_otu_map(opts.otu_map_fp)
+    else:
+        otu_map_f = open(opts.otu_map_fp, 'U')
+    biom_otu_table = make_otu_table(otu_map_f,
                                     otu_to_taxonomy,
                                     ids_to_exclude)
     outfile.write(biom_otu_table)
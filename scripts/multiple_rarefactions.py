@@ -30,6 +30,10 @@ script_info['script_usage'].append(
     ("""Generate rarefied OTU tables:""",
      """Generate rarefied OTU tables beginning with 10 (-m) sequences/sample through 140 (-x) sequences per sample in steps of of 10 (-s), performing 2 iterations at each sampling depth (-n). All resulting OTU tables will be written to 'rarefied_otu_tables' (-o). Any sample containing fewer sequences in the input file than the requested number of sequences per sample is removed from the output rarefied otu table.""",
      """%prog -i otu_table.biom -m 10 -x 140 -s 10 -n 2 -o rarefied_otu_tables/"""))
+script_info['script_usage'].append(
+    ("""Generate nested rarefied OTU tables:""",
+     """As above, but draw all of the depths of each iteration from a single subsampling of each sample (--nested), using 4 processes (-O) and a fixed random seed (--seed) so the results can be reproduced.""",
+     """%prog -i otu_table.biom -m 10 -x 140 -s 10 -n 2 -o rarefied_otu_tables_nested/ --nested -O 4 --seed 42"""))
 
 script_info[
     'output_description'] = """The result of multiple_rarefactions.py consists of a number of biom files, which depend on the minimum/maximum number of sequences per samples, steps and iterations. The files have the same otu table format as the input otu_table.biom, and are named in the following way: rarefaction_100_0.biom, where "100" corresponds to the sequences per sample and "0" the iteration."""
@@ -65,7 +69,18 @@ script_info['optional_options'] = [
                 help='Retain OTUs of all zeros, which are usually omitted from' +
                 ' the output OTU tables. [default: %default]'),
     make_option('--subsample_multinomial', default=False, action='store_true',
-                help='subsample using subsampling with replacement [default: %default]')
+                help='subsample using subsampling with replacement [default: %default]'),
+    make_option('--nested', default=False, action='store_true',
+                help='Draw all of the depths of each iteration from a single ' +
+                'subsampling of each sample, so that each rarefied table ' +
+                'extends the table at the previous depth. This is much ' +
+                'faster when there are many depths. [default: %default]'),
+    make_option('--seed', type='int', default=None,
+                help='Seed for the random number generator used with ' +
+                '--nested, for reproducible results [default: random]'),
+    make_option('-O', '--jobs_to_start', type='int', default=1,
+                help='Number of processes used to subsample the samples ' +
+                'with --nested [default: %default]')
 ]
 
 script_info['option_label'] = {'input_path': 'OTU table filepath',
@@ -75,7 +90,10 @@ script_info['option_label'] = {'input_path': 'OTU table filepath',
                                'step': 'Step size',
                                'num-reps': '# of iterations',
                                'lineages_included': 'Include lineages',
-                               'keep_empty_otus': 'Retain empty OTUs'}
+                               'keep_empty_otus': 'Retain empty OTUs',
+                               'nested': 'Nested rarefaction',
+                               'seed': 'Random seed',
+                               'jobs_to_start': '# of jobs to start'}
 
 script_info['version'] = __version__
 
@@ -95,11 +113,21 @@ def main():
     else:
         subsample_f = subsample
 
-    maker.rarefy_to_files(opts.output_path,
-                          False,
-                          include_lineages=opts.lineages_included,
-                          empty_otus_removed=(not opts.keep_empty_otus),
-                          subsample_f=subsample_f)
+    if opts.nested:
+        maker.nested_rarefy_to_files(
+            opts.output_path,
+            False,
+            include_lineages=opts.lineages_included,
+            empty_otus_removed=(not opts.keep_empty_otus),
+            replace=opts.subsample_multinomial,
+            seed=opts.seed,
+            jobs_to_start=opts.jobs_to_start)
+    else:
+        maker.rarefy_to_files(opts.output_path,
+                              False,
+                              include_lineages=opts.lineages_included,
+                              empty_otus_removed=(not opts.keep_empty_otus),
+                              subsample_f=subsample_f)
 
 
 if __name__ == "__main__":
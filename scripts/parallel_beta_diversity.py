@@ -74,6 +74,11 @@ script_info['optional_options'] = [
                 help='By default, each job removes calls _fast_unifrac_setup to remove\
  unused parts of the tree. pass -f if you already have a minimal tree, and\
  this script will run faster'),
+    make_option('-b', '--binary_output', action='store_true', default=False,
+                help='Write each distance matrix in QIIME\'s binary distance ' +
+                'matrix format (named <metric>_<input>.dm) rather than as ' +
+                'tab-delimited text (see beta_diversity.py). ' +
+                '[default: %default]'),
 
 ]
 script_info['version'] = __version__
@@ -39,6 +39,8 @@ Currently, the following clustering methods have been implemented in QIIME:
 
 5. Trie [Qiime team, unpublished], which collapsing identical sequences and sequences which are subsequences of other sequences.
 
+   sorted_trie produces the same OTUs as trie, but finds them by sorting the sequences rather than building a trie, which is much faster on large inputs and can use several processes (see --jobs_to_start).
+
 6. uclust (Edgar, RC 2010), creates \"seeds\" of sequences which generate clusters based on percent identity.
 
 7. uclust_ref (Edgar, RC 2010), as uclust, but takes a reference database to use as seeds.  New clusters can be toggled on or off.
@@ -209,6 +211,10 @@ script_info['optional_options'] = [
                 help=(
                     'Max E-value when clustering with BLAST [default: %default]')),
 
+    make_option('--jobs_to_start', type='int', default=1,
+                help=('Number of processes to use with the sorted_trie OTU '
+                      'picker [default: %default]')),
+
     make_option('-q', '--trie_reverse_seqs', action='store_true',
                 default=False,
                 help=('Reverse seqs before picking OTUs with the Trie OTU picker for '
@@ -309,6 +315,12 @@ script_info['optional_options'] = [
                 default=False, action='store_true', help=("Don't collapse "
                                                           "exact matches before calling uclust [default: %default]")),
 
+    make_option('--prefilter_exact_match_on_disk',
+                default=False, action='store_true', help=("Collapse exact "
+                "matches before calling uclust using temporary files rather "
+                "than holding all sequences in memory. Recommended for very "
+                "large input files [default: %default]")),
+
     make_option('-d', '--save_uc_files', default=True, action='store_false',
                 help=("Enable preservation of intermediate uclust (.uc) files "
                       "that are used to generate clusters via uclust.  Also enables "
@@ -447,6 +459,7 @@ def main():
     save_uc_files = opts.save_uc_files
     prefilter_identical_sequences =\
         not opts.suppress_uclust_prefilter_exact_match
+    prefilter_identical_sequences_on_disk = opts.prefilter_exact_match_on_disk
     derep_fullseq = opts.derep_fullseq
     chimeras_retention = opts.non_chimeras_retention
     verbose = opts.verbose
@@ -525,6 +538,9 @@ def main():
     if abundance_skew <= 1:
         option_parser.error('abundance skew must be > 1')
 
+    if opts.jobs_to_start < 1:
+        option_parser.error('--jobs_to_start must be at least 1')
+
     # Check for logical inputs
     if otu_picking_method in ['usearch', 'usearch_ref'] and \
             reference_chimera_detection and not db_filepath:
@@ -655,7 +671,9 @@ def main():
                   'stable_sort': uclust_stable_sort,
                   'save_uc_files': save_uc_files,
                   'output_dir': output_dir,
-                  'prefilter_identical_sequences': prefilter_identical_sequences}
+                  'prefilter_identical_sequences': prefilter_identical_sequences,
+                  'prefilter_identical_sequences_on_disk':
+                  prefilter_identical_sequences_on_disk}
         otu_picker = otu_picker_constructor(params)
         otu_picker(input_seqs_filepath,
                    result_path=result_path, log_path=log_path, HALT_EXEC=False)
@@ -786,6 +804,8 @@ def main():
                   'output_dir': output_dir,
                   'prefilter_identical_sequences':
                   prefilter_identical_sequences,
+                  'prefilter_identical_sequences_on_disk':
+                  prefilter_identical_sequences_on_disk,
                   'chimeras_retention': chimeras_retention}
         otu_picker = otu_picker_constructor(params)
         otu_picker(input_seqs_filepath, refseqs_fp,
@@ -814,6 +834,14 @@ def main():
         otu_picker(input_seqs_filepath,
                    result_path=result_path, log_path=log_path)
 
+    # sorted trie
+    elif otu_picking_method == 'sorted_trie':
+        params = {'Reverse': trie_reverse_seqs,
+                  'jobs_to_start': opts.jobs_to_start}
+        otu_picker = otu_picker_constructor(params)
+        otu_picker(input_seqs_filepath,
+                   result_path=result_path, log_path=log_path)
+
     # blast
     elif otu_picking_method == 'blast':
         params = {'max_e_value': opts.max_e_value,
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+from __future__ import division
+
+__author__ = "Justin Kuczynski"
+__copyright__ = "Copyright 2011, The QIIME Project"
+__credits__ = ["Justin Kuczynski"]
+__license__ = "GPL"
+__version__ = "1.8.0-dev"
+__maintainer__ = "Justin Kuczynski"
+__email__ = "justinak@gmail.com"
+
+from biom.parse import parse_biom_table
+
+from qiime.util import make_option, parse_command_line_parameters
+from qiime.tree_index import TreeIndex
+from qiime.alpha_diversity import (collated_rarefaction_alpha,
+                                   write_collated_rarefaction_alpha,
+                                   list_known_metrics)
+
+script_info = {}
+script_info['brief_description'] = """Rarefy an OTU table and compute \
+collated alpha diversity in one step"""
+script_info['script_description'] = """This script does the work of \
+multiple_rarefactions.py, alpha_diversity.py and collate_alpha.py in a \
+single process, without writing the rarefied OTU tables or the alpha \
+diversity of each table. Each sample is rarefied to all of the depths of an \
+iteration at once (as with multiple_rarefactions.py --nested), and the \
+metrics are computed from the rarefied counts straight away, so the output \
+matches that of running the three scripts with the same seed.
+
+Phylogenetic diversity (PD_whole_tree) is computed on an index of the tree \
+which is built once (or loaded from --tree_cache_dir, as for \
+alpha_diversity.py), and matches alpha_diversity.py up to floating point \
+rounding."""
+script_info['script_usage'] = []
+script_info['script_usage'].append(
+    ("""Example:""",
+     """Rarefy otu_table.biom at 10, 20, ... 100 sequences per sample, 10 \
+times at each depth, and write the collated PD, chao1 and observed species \
+of the rarefied tables to collated_alpha/, using 4 processes:""",
+     """%prog -i otu_table.biom -t rep_set.tre -o collated_alpha/ \
+--min 10 -x 100 -s 10 -n 10 -O 4"""))
+script_info['output_description'] = """One file for each metric, as \
+written by collate_alpha.py."""
+script_info['required_options'] = [
+    make_option('-i', '--input_path',
+                help='Input OTU table filepath.',
+                type='existing_filepath'),
+    make_option('-o', '--output_path',
+                help="Output directory.",
+                type='new_dirpath'),
+    make_option('--min', type='int',
+                help='Minimum number of seqs/sample for rarefaction.'),
+    make_option('-x', '--max', type='int',
+                help='Maximum number of seqs/sample (inclusive) for ' +
+                'rarefaction. '),
+    make_option('-s', '--step', type='int',
+                help='Size of each steps between the min/max of' +
+                ' seqs/sample (e.g. min, min+step... for level <= max).')
+]
+script_info['optional_options'] = [
+    make_option('-m', '--metrics', type='multiple_choice',
+                mchoices=list_known_metrics(),
+                default='PD_whole_tree,chao1,observed_species',
+                help='Alpha-diversity metric(s) to use. A comma-separated ' +
+                'list should be provided when multiple metrics are ' +
+                'specified. [default: %default]'),
+    make_option('-t', '--tree_path', default=None,
+                help='Input newick tree filepath.' +
+                ' [default: %default; REQUIRED for phylogenetic metrics]',
+                type='existing_filepath'),
+    make_option('--tree_cache_dir', default=None, type='new_dirpath',
+                help='Directory in which to cache the indexed tree, keyed ' +
+                'by the md5 of the tree file. Later runs with the same ' +
+                'tree load the index from here instead of parsing the ' +
+                'tree. [default: %default]'),
+    make_option('-n', '--num-reps', dest='num_reps', default=10, type='int',
+                help='The number of iterations at each step. ' +
+                '[default: %default]'),
+    make_option('-k', '--keep_empty_otus', default=False,
+                action='store_true',
+                help='Compute the metrics with the OTUs of all zeros in ' +
+                'each rarefied table, which multiple_rarefactions.py ' +
+                'usually omits. [default: %default]'),
+    make_option('--subsample_multinomial', default=False,
+                action='store_true',
+                help='subsample using subsampling with replacement ' +
+                '[default: %default]'),
+    make_option('--seed', type='int', default=None,
+                help='Seed for the random number generator, for ' +
+                'reproducible results [default: random]'),
+    make_option('-O', '--jobs_to_start', type='int', default=1,
+                help='Number of processes to use [default: %default]')
+]
+script_info['version'] = __version__
+
+
+def main():
+    option_parser, opts, args =\
+        parse_command_line_parameters(**script_info)
+
+    if opts.step <= 0:
+        option_parser.error("nonpositive step not allowed (%s was supplied)"
+                            % opts.step)
+    if opts.jobs_to_start < 1:
+        option_parser.error("jobs_to_start must be at least 1")
+
+    otu_table = parse_biom_table(open(opts.input_path, 'U'))
+    if opts.tree_path:
+        tree = TreeIndex.from_newick_file(opts.tree_path,
+                                          opts.tree_cache_dir)
+    else:
+        tree = None
+
+    try:
+        result = collated_rarefaction_alpha(
+            otu_table, range(opts.min, opts.max + 1, opts.step),
+            opts.num_reps, opts.metrics, tree,
+            empty_otus_removed=not opts.keep_empty_otus,
+            replace=opts.subsample_multinomial, seed=opts.seed,
+            jobs_to_start=opts.jobs_to_start)
+    except ValueError as e:
+        option_parser.error(str(e))
+    write_collated_rarefaction_alpha(result, opts.output_path)
+
+
+if __name__ == "__main__":
+    main()
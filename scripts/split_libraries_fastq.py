@@ -137,7 +137,11 @@ script_info['optional_options'] = [
     make_option('--phred_offset', default=None, type="choice",
                 choices=phred_to_ascii_fs.keys(), help="the ascii offset to use when "
                 "decoding phred scores - warning: in most cases you don't need to "
-                "pass this value [default: determined automatically]")
+                "pass this value [default: determined automatically]"),
+    make_option('-O', '--jobs_to_start', type='int', default=1,
+                help='number of worker processes to use for demultiplexing '
+                'and quality filtering. Output is identical regardless of '
+                'the value passed here [default: %default]'),
     # NEED TO FIX THIS FUNCTIONALITY - CURRENTLY READING THE WRONG FIELD
     # make_option('--filter_bad_illumina_qual_digit',
     #    action='store_true',
@@ -174,6 +178,7 @@ def main():
     store_demultiplexed_fastq = opts.store_demultiplexed_fastq
     barcode_type = opts.barcode_type
     max_barcode_errors = opts.max_barcode_errors
+    jobs_to_start = opts.jobs_to_start
 
     # if this is not a demultiplexed run,
     if barcode_type == 'not-barcoded':
@@ -211,6 +216,10 @@ def main():
         option_parser.error('--last_bad_quality_char is no longer supported. '
                             'Use -q instead (see option help text by passing -h)')
 
+    if jobs_to_start < 1:
+        option_parser.error('--jobs_to_start must be at least 1. You passed '
+                            '%d' % jobs_to_start)
+
     if not (0 <= min_per_read_length_fraction <= 1):
         option_parser.error('--min_per_read_length_fraction must be between '
                             '0 and 1 (inclusive). You passed %1.5f' %
@@ -332,7 +341,8 @@ def main():
                 log_f=log_f, histogram_f=histogram_f,
                 barcode_correction_fn=barcode_correction_fn,
                 max_barcode_errors=max_barcode_errors,
-                phred_to_ascii_f=phred_to_ascii_f)
+                phred_to_ascii_f=phred_to_ascii_f,
+                jobs_to_start=jobs_to_start)
         else:
             seq_generator = process_fastq_single_end_read_file_no_barcode(
                 sequence_read_f, sample_ids[i],
@@ -344,7 +354,8 @@ def main():
                 start_seq_id=start_seq_id,
                 filter_bad_illumina_qual_digit=filter_bad_illumina_qual_digit,
                 log_f=log_f, histogram_f=histogram_f,
-                phred_to_ascii_f=phred_to_ascii_f)
+                phred_to_ascii_f=phred_to_ascii_f,
+                jobs_to_start=jobs_to_start)
 
         for fasta_header, sequence, quality, seq_id in seq_generator:
             output_f.write('>%s\n%s\n' % (fasta_header, sequence))
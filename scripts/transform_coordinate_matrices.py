@@ -72,6 +72,13 @@ script_info['optional_options'] = [
     make_option('--store_trial_details',
                 help='Store PC matrices for individual trials [default: %default]',
                 default=False, action='store_true'),
+    make_option('--seed', type='int', default=None,
+                help='Seed for the random number generator used in the ' +
+                'Monte Carlo analysis, for reproducible results ' +
+                '[default: random]'),
+    make_option('-O', '--jobs_to_start', type='int', default=1,
+                help='Number of processes to run the Monte Carlo trials ' +
+                'in [default: %default]'),
 ]
 
 script_info['version'] = __version__
@@ -90,6 +97,8 @@ def main():
     if random_trials is not None and random_trials < 10:
         option_parser.error(
             'Must perform >= 10 trails for Monte Carlo analysis.')
+    if opts.jobs_to_start < 1:
+        option_parser.error("jobs_to_start must be at least 1")
 
     if sample_id_map_fps and \
        (len(sample_id_map_fps) + 1) != len(opts.input_fps):
@@ -138,7 +147,8 @@ def main():
 
         if random_trials:
             if opts.store_trial_details:
-                trial_output_dir = join(output_dir, 'trial_details_%d' % i + 2)
+                trial_output_dir = join(output_dir,
+                                        'trial_details_%d' % (i + 2))
             else:
                 trial_output_dir = None
             coords_f1 = list(open(reference_input_fp, 'U'))
@@ -149,7 +159,9 @@ def main():
                                        trials=random_trials,
                                        max_dimensions=num_dimensions,
                                        sample_id_map=sample_id_map,
-                                       trial_output_dir=trial_output_dir)
+                                       trial_output_dir=trial_output_dir,
+                                       seed=opts.seed,
+                                       jobs_to_start=opts.jobs_to_start)
             # truncate the p-value to the correct number of significant
             # digits
             mc_p_value_str = format_p_value_for_num_iters(
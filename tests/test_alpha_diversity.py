@@ -13,9 +13,9 @@ __email__ = "justinak@gmail.com"
 from numpy import array
 import numpy
 from shutil import rmtree
-from os import makedirs, close
-from os.path import exists
-from tempfile import mkstemp
+from os import makedirs, close, listdir
+from os.path import exists, join
+from tempfile import mkstemp, mkdtemp
 from unittest import TestCase, main
 from numpy.testing import assert_almost_equal
 
@@ -25,9 +25,14 @@ from qiime.pycogent_backports.alpha_diversity import (observed_species, osd)
 from skbio.util.misc import remove_files
 from qiime.util import load_qiime_config
 from qiime.alpha_diversity import (AlphaDiversityCalc, AlphaDiversityCalcs,
-                                   single_file_cup)
+                                   single_file_cup, collated_rarefaction_alpha,
+                                   write_collated_rarefaction_alpha,
+                                   multiple_file_alpha)
 import qiime.alpha_diversity
-from qiime.parse import parse_newick
+from qiime.parse import parse_newick, parse_rarefaction, parse_matrix
+from qiime.tree_index import TreeIndex
+from qiime.rarefaction import iter_nested_rare_data
+from qiime.filter import filter_otus_from_otu_table
 from qiime.format import format_biom_table
 from biom.table import table_factory, DenseOTUTable
 
@@ -163,6 +168,20 @@ class AlphaDiversityCalcTests(AlphaDiversitySharedSetUpTests):
         assert_almost_equal(escaped_result, expected)
         assert_almost_equal(non_escaped_result, escaped_result)
 
+    def test_call_phylogenetic_tree_index(self):
+        """AlphaDiversityCalc __call__ should accept a TreeIndex for PD"""
+        c = AlphaDiversityCalc(metric=PD_whole_tree, is_phylogenetic=True)
+        # samples are returned in the order of sample_names
+        assert_almost_equal(c(data_path=self.otu_table1_fp,
+                              tree_path=TreeIndex.from_tree(self.tree1),
+                              taxon_names=self.otu_table1.ObservationIds,
+                              sample_names=['Z', 'X', 'Y']),
+                            [0, 13, 17])
+        # none of the OTUs are in the tree
+        self.assertRaises(ValueError, c, data_path=self.otu_table1_fp,
+                          tree_path=parse_newick('(q:1,r:2);'),
+                          sample_names=self.otu_table1.SampleIds)
+
 
 class AlphaDiversityCalcsTests(AlphaDiversitySharedSetUpTests):
 
@@ -185,6 +204,176 @@ class AlphaDiversityCalcsTests(AlphaDiversitySharedSetUpTests):
         self.assertEqual(len(results[2]), 5)
 
 
+class CollatedRarefactionAlphaTests(AlphaDiversitySharedSetUpTests):
+
+    """Tests of collated_rarefaction_alpha"""
+
+    def setUp(self):
+        super(CollatedRarefactionAlphaTests, self).setUp()
+        self.otu_table = table_factory(data=array([[5, 0, 3, 0, 9, 1],
+                                                   [0, 4, 2, 7, 1, 0],
+                                                   [8, 1, 0, 0, 2, 6],
+                                                   [1, 1, 1, 0, 0, 0]]).T,
+                                       sample_ids=['S1', 'S2', 'S3', 'S4'],
+                                       observation_ids=list('abcdef'),
+                                       constructor=DenseOTUTable)
+        # 'f' isn't in the tree
+        self.tree = parse_newick(
+            '(((a:1,b:2):0.5,c:3):1.5,(d:2.5,e:0.25):0.75);')
+        self.depths = [2, 5, 9, 14, 20]
+        self.metrics = ['PD_whole_tree', 'chao1', 'osd', 'singles',
+                        'shannon', 'gini_index']
+
+    def get_expected(self, empty_otus_removed):
+        """Rarefy to tables and compute the metrics as the scripts would"""
+        calcs = [AlphaDiversityCalc(PD_whole_tree, is_phylogenetic=True)]
+        calcs.extend([AlphaDiversityCalc(getattr(qiime.alpha_diversity.alph,
+                                                 metric))
+                      for metric in self.metrics[1:]])
+        result = {}
+        for depth, rep, table in iter_nested_rare_data(
+                self.otu_table, self.depths, 2, seed=42):
+            if empty_otus_removed:
+                table = filter_otus_from_otu_table(
+                    table, table.ObservationIds, 1, numpy.inf, 0, numpy.inf)
+            values = AlphaDiversityCalcs(calcs)(
+                data_path=table, tree_path=self.tree, result_path=None,
+                log_path=None)
+            result[(depth, rep)] = values
+        return result
+
+    def check_rows(self, obs, empty_otus_removed):
+        calc_names, all_samples, rows = obs
+        self.assertEqual(calc_names, ['PD_whole_tree', 'chao1', 'observed',
+                                      'singles', 'doubles', 'singles',
+                                      'shannon', 'gini_index'])
+        self.assertEqual(all_samples, ['S1', 'S2', 'S3', 'S4'])
+        self.assertEqual(sorted(rows), sorted(set(calc_names)))
+        exp = self.get_expected(empty_otus_removed)
+        for metric in rows:
+            # depth 20 is greater than every sample, so isn't included
+            self.assertEqual(len(rows[metric]), 8)
+            for row in rows[metric]:
+                fname, depth, rep = row[:3]
+                self.assertEqual(fname,
+                                 'alpha_rarefaction_%d_%d.txt' % (depth, rep))
+                exp_matrix, exp_samples, exp_metrics = exp[(depth, rep)]
+                col = exp_metrics.index(metric)
+                for sample, value in zip(all_samples, row[3:]):
+                    if sample not in exp_samples:
+                        self.assertEqual(value, 'n/a')
+                        continue
+                    exp_value = exp_matrix[exp_samples.index(sample), col]
+                    if metric == 'PD_whole_tree':
+                        assert_almost_equal(float(value), exp_value)
+                    else:
+                        self.assertEqual(value, str(exp_value))
+
+    def test_collated_rarefaction_alpha(self):
+        """collated_rarefaction_alpha matches rarefying to tables"""
+        obs = collated_rarefaction_alpha(self.otu_table, self.depths, 2,
+                                         ','.join(self.metrics), self.tree,
+                                         seed=42)
+        self.check_rows(obs, True)
+        obs = collated_rarefaction_alpha(self.otu_table, self.depths, 2,
+                                         self.metrics, self.tree,
+                                         empty_otus_removed=False, seed=42)
+        self.check_rows(obs, False)
+
+    def test_collated_rarefaction_alpha_jobs(self):
+        """collated_rarefaction_alpha gives the same result with workers"""
+        exp = collated_rarefaction_alpha(self.otu_table, self.depths, 2,
+                                         self.metrics, self.tree, seed=3)
+        obs = collated_rarefaction_alpha(self.otu_table, self.depths, 2,
+                                         self.metrics, self.tree, seed=3,
+                                         jobs_to_start=2)
+        self.assertEqual(obs, exp)
+
+    def test_collated_rarefaction_alpha_invalid(self):
+        """collated_rarefaction_alpha rejects unknown or unusable metrics"""
+        self.assertRaises(ValueError, collated_rarefaction_alpha,
+                          self.otu_table, self.depths, 2, 'chao1,fake_metric')
+        self.assertRaises(ValueError, collated_rarefaction_alpha,
+                          self.otu_table, self.depths, 2, 'PD_whole_tree')
+        # as AlphaDiversityCalc, when none of the OTUs are in the tree
+        tree = parse_newick('((x:1,y:2):0.5,z:3);')
+        self.assertRaises(ValueError, collated_rarefaction_alpha,
+                          self.otu_table, self.depths, 2, 'PD_whole_tree',
+                          tree)
+        self.assertRaises(ValueError, AlphaDiversityCalc(
+            PD_whole_tree, is_phylogenetic=True), data_path=self.otu_table,
+            taxon_names=self.otu_table.ObservationIds, tree_path=tree,
+            sample_names=self.otu_table.SampleIds)
+        # but the tree isn't needed for the other metrics
+        collated_rarefaction_alpha(self.otu_table, self.depths, 2, 'chao1',
+                                   tree)
+
+    def test_collated_rarefaction_alpha_tree_index(self):
+        """collated_rarefaction_alpha takes a TreeIndex of the tree"""
+        exp = collated_rarefaction_alpha(self.otu_table, self.depths, 2,
+                                         self.metrics, self.tree, seed=3)
+        obs = collated_rarefaction_alpha(self.otu_table, self.depths, 2,
+                                         self.metrics,
+                                         TreeIndex.from_tree(self.tree),
+                                         seed=3)
+        self.assertEqual(obs, exp)
+
+    def test_write_collated_rarefaction_alpha(self):
+        """write_collated_rarefaction_alpha writes one file per metric"""
+        output_dir = mkdtemp(dir=self.tmp_dir,
+                             prefix='alpha_diversity_tests')
+        self.dirs_to_remove.append(output_dir)
+        result = collated_rarefaction_alpha(self.otu_table, [2, 5], 3,
+                                            'observed_species,osd', seed=1)
+        write_collated_rarefaction_alpha(result, output_dir)
+        self.assertEqual(sorted(listdir(output_dir)),
+                         ['doubles.txt', 'observed.txt',
+                          'observed_species.txt', 'singles.txt'])
+        col_names, comments, row_names, data = parse_rarefaction(
+            open(join(output_dir, 'observed_species.txt'), 'U'))
+        self.assertEqual(col_names, ['', 'sequences per sample', 'iteration',
+                                     'S1', 'S2', 'S3', 'S4'])
+        self.assertEqual(row_names, ['alpha_rarefaction_2_0.txt',
+                                     'alpha_rarefaction_2_1.txt',
+                                     'alpha_rarefaction_2_2.txt',
+                                     'alpha_rarefaction_5_0.txt',
+                                     'alpha_rarefaction_5_1.txt',
+                                     'alpha_rarefaction_5_2.txt'])
+
+
+class MultipleFileAlphaTests(AlphaDiversitySharedSetUpTests):
+
+    """Tests of multiple_file_alpha"""
+
+    def test_multiple_file_alpha_tree_cache(self):
+        """multiple_file_alpha caches the index of the tree"""
+        input_dir = mkdtemp(dir=self.tmp_dir, prefix='alpha_diversity_tests')
+        output_dir = mkdtemp(dir=self.tmp_dir, prefix='alpha_diversity_tests')
+        cache_dir = mkdtemp(dir=self.tmp_dir, prefix='alpha_diversity_tests')
+        self.dirs_to_remove.extend([input_dir, output_dir, cache_dir])
+        open(join(input_dir, 'rare_1.biom'), 'w').write(
+            format_biom_table(self.otu_table1))
+        open(join(input_dir, 'rare_2.biom'), 'w').write(
+            format_biom_table(self.otu_table2))
+        tree_fp = join(input_dir, '.tree.tre')
+        open(tree_fp, 'w').write(self.tree1.getNewick(with_distances=True))
+
+        for i in range(2):
+            multiple_file_alpha(input_dir, output_dir,
+                                'PD_whole_tree,observed_species', tree_fp,
+                                tree_cache_dir=cache_dir)
+            self.assertEqual(len(listdir(cache_dir)), 1)
+            col_names, row_names, data = parse_matrix(
+                open(join(output_dir, 'alpha_rare_1.txt'), 'U'))
+            self.assertEqual(col_names, ['PD_whole_tree', 'observed_species'])
+            self.assertEqual(row_names, ['X', 'Y', 'Z'])
+            assert_almost_equal(data, [[13, 2], [17, 4], [0, 0]])
+            # d_ isn't in the tree
+            col_names, row_names, data = parse_matrix(
+                open(join(output_dir, 'alpha_rare_2.txt'), 'U'))
+            assert_almost_equal(data, [[4, 2], [15, 4], [0, 0]])
+
+
 class SingleFileCUPTests(TestCase):
     def setUp(self):
         self.files_to_remove = []
@@ -64,5 +64,47 @@ class BarcodeTests(TestCase):
         self.assertEqual(decoded, None)
         self.assertEqual(num_errors, 3)
 
+    def test_barcode_corrector(self):
+        """ BarcodeCorrector corrects each distinct barcode once
+        """
+        calls = []
+
+        def correction_fn(bc, possibilities):
+            calls.append(bc)
+            return barcode.correct_barcode(bc, possibilities)
+
+        possibilities = ['TGTATTCGTGTA', 'ATTTTTTTTTCG', 'TGTAGGCGTGTA']
+        corrector = barcode.BarcodeCorrector(
+            correction_fn, precomputed={'TGTATTCGTGTA': ('TGTATTCGTGTA', 0)})
+
+        # precomputed barcodes are never passed to correction_fn
+        self.assertEqual(corrector('TGTATTCGTGTA', possibilities),
+                         ('TGTATTCGTGTA', 0))
+        self.assertEqual(calls, [])
+
+        # other barcodes are corrected the first time they are seen only
+        self.assertEqual(corrector('ATTTTTTTTTTT', possibilities),
+                         ('ATTTTTTTTTCG', 2))
+        self.assertEqual(corrector('ATTTTTTTTTTT', possibilities),
+                         ('ATTTTTTTTTCG', 2))
+        self.assertEqual(calls, ['ATTTTTTTTTTT'])
+
+    def test_barcode_corrector_max_size(self):
+        """ BarcodeCorrector stops storing results when full
+        """
+        calls = []
+
+        def correction_fn(bc):
+            calls.append(bc)
+            return bc, 0
+
+        corrector = barcode.BarcodeCorrector(correction_fn, max_size=1)
+        corrector('AAAA')
+        corrector('CCCC')
+        corrector('AAAA')
+        corrector('CCCC')
+        self.assertEqual(calls, ['AAAA', 'CCCC', 'CCCC'])
+        self.assertEqual(corrector.lookup, {'AAAA': ('AAAA', 0)})
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+from __future__ import division
+
+__author__ = "Justin Kuczynski"
+__copyright__ = "Copyright 2011, The QIIME Project"
+__credits__ = ["Justin Kuczynski", "Rob Knight"]
+__license__ = "GPL"
+__version__ = "1.8.0-dev"
+__maintainer__ = "Justin Kuczynski"
+__email__ = "justinak@gmail.com"
+
+from unittest import TestCase, main
+import warnings
+
+from numpy import array
+from numpy.testing import assert_almost_equal
+from cogent.parse.tree import DndParser
+from cogent.maths.unifrac.fast_tree import (unifrac, unnormalized_unifrac,
+                                            G, unnormalized_G)
+from cogent.maths.unifrac.fast_unifrac import (fast_unifrac,
+                                               fast_unifrac_one_sample)
+from cogent.core.tree import PhyloNode
+
+from qiime.batch_unifrac import (UniFracIndex, unifrac_variants,
+                                 get_unifrac_variant)
+from qiime.beta_metrics import make_envs_dict
+
+
+class BatchUniFracTests(TestCase):
+
+    def setUp(self):
+        self.tree = DndParser(
+            "((a:0.1,b:0.2)c:0.3,((d:0.4,e:0.5)f:0.6,g:0.7)h:0.8,"
+            "(i:0.9,j:1.0)k:1.1)root;", PhyloNode)
+        # samples x taxa; 'x' isn't in the tree, and sample 'S5' only has
+        # counts for taxa which aren't in the tree
+        self.taxon_names = ['a', 'b', 'd', 'e', 'g', 'i', 'x']
+        self.sample_names = ['S1', 'S2', 'S3', 'S4', 'S5', 'S6']
+        self.data = array([[1, 0, 3, 0, 2, 0, 0],
+                           [0, 4, 0, 1, 0, 0, 5],
+                           [2, 2, 2, 2, 2, 2, 2],
+                           [0, 0, 0, 7, 1, 3, 0],
+                           [0, 0, 0, 0, 0, 0, 9],
+                           [1, 0, 3, 0, 2, 0, 1]])
+        self.present_names = ['S1', 'S2', 'S3', 'S4', 'S6']
+        self.present_data = self.data[[0, 1, 2, 3, 5]]
+
+    def test_get_unifrac_variant(self):
+        """get_unifrac_variant names fast_unifrac's arguments"""
+        self.assertEqual(get_unifrac_variant(False, unifrac),
+                         'unweighted_unifrac')
+        self.assertEqual(get_unifrac_variant(False, unnormalized_unifrac),
+                         'unweighted_unifrac_full_tree')
+        self.assertEqual(get_unifrac_variant(False, G), 'unifrac_g')
+        self.assertEqual(get_unifrac_variant(False, unnormalized_G),
+                         'unifrac_g_full_tree')
+        self.assertEqual(get_unifrac_variant(True, unifrac),
+                         'weighted_unifrac')
+        self.assertEqual(get_unifrac_variant('correct', None),
+                         'weighted_normalized_unifrac')
+        self.assertEqual(get_unifrac_variant(False, None), None)
+
+    def test_distance_matrices(self):
+        """distance_matrices matches fast_unifrac for all variants"""
+        envs = make_envs_dict(self.present_data, self.present_names,
+                              self.taxon_names)
+        for make_subtree in True, False:
+            index = UniFracIndex(self.present_data, self.taxon_names,
+                                 self.tree, self.present_names,
+                                 make_subtree=make_subtree)
+            for tile_size in None, 2:
+                obs = index.distance_matrices(unifrac_variants.keys(),
+                                              tile_size=tile_size)
+                for variant, (weighted, metric) in unifrac_variants.items():
+                    exp = fast_unifrac(self.tree, envs, weighted=weighted,
+                                       metric=metric,
+                                       make_subtree=make_subtree,
+                                       is_symmetric=(metric not in
+                                                     (G, unnormalized_G)),
+                                       modes=['distance_matrix'])
+                    exp_matrix, exp_names = exp['distance_matrix']
+                    self.assertEqual(exp_names, self.present_names)
+                    assert_almost_equal(obs[variant], exp_matrix)
+
+    def test_distance_matrices_jobs(self):
+        """distance_matrices gives the same result with a pool of workers"""
+        index = UniFracIndex(self.present_data, self.taxon_names, self.tree,
+                             self.present_names)
+        variants = ['unweighted_unifrac', 'weighted_normalized_unifrac']
+        exp = index.distance_matrices(variants, tile_size=2)
+        obs = index.distance_matrices(variants, tile_size=2, jobs_to_start=2)
+        for variant in variants:
+            assert_almost_equal(obs[variant], exp[variant])
+
+    def test_distance_matrices_missing_sample(self):
+        """samples without counts on the tree are 1 from all others"""
+        index = UniFracIndex(self.data, self.taxon_names, self.tree,
+                             self.sample_names)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            obs = index.distance_matrices(['unweighted_unifrac'])
+        self.assertEqual(len(w), 1)
+        obs = obs['unweighted_unifrac']
+        self.assertEqual(obs.shape, (6, 6))
+        for i in range(6):
+            self.assertEqual(obs[4, i], 0.0 if i == 4 else 1.0)
+            self.assertEqual(obs[i, 4], 0.0 if i == 4 else 1.0)
+        # S1 and S6 only differ by a taxon which isn't in the tree
+        self.assertEqual(obs[0, 5], 0.0)
+
+    def test_distance_rows(self):
+        """distance_rows matches fast_unifrac_one_sample and the matrix"""
+        envs = make_envs_dict(self.data, self.sample_names,
+                              self.taxon_names)
+        index = UniFracIndex(self.data, self.taxon_names, self.tree,
+                             self.sample_names, make_subtree=False)
+        variants = unifrac_variants.keys()
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            rows = index.distance_rows(variants, ['S2', 'S5', 'S6'],
+                                       tile_size=2)
+            matrices = index.distance_matrices(variants)
+        for variant, (weighted, metric) in unifrac_variants.items():
+            for i, name in enumerate(['S2', 'S6']):
+                exp_row, exp_names = fast_unifrac_one_sample(
+                    name, self.tree, envs, weighted=weighted, metric=metric)
+                obs_row = rows[variant][[0, 2][i]]
+                # fast_unifrac_one_sample leaves out samples without counts
+                self.assertEqual(exp_names, self.present_names)
+                assert_almost_equal(obs_row[[0, 1, 2, 3, 5]], exp_row)
+                self.assertEqual(obs_row[4], 1.0)
+                # rows are exactly the corresponding matrix rows
+                self.assertEqual(
+                    obs_row.tolist(),
+                    matrices[variant][self.sample_names.index(name)].tolist())
+            self.assertEqual(rows[variant][1].tolist(),
+                             [1.0, 1.0, 1.0, 1.0, 0.0, 1.0])
+
+    def test_invalid_input(self):
+        """UniFracIndex rejects inconsistent or uninformative input"""
+        self.assertRaises(ValueError, UniFracIndex, self.data,
+                          self.taxon_names[:-1], self.tree, self.sample_names)
+        self.assertRaises(ValueError, UniFracIndex, self.data[[4]],
+                          self.taxon_names, self.tree, ['S5'])
+        index = UniFracIndex(self.data, self.taxon_names, self.tree,
+                             self.sample_names)
+        self.assertRaises(ValueError, index.distance_matrices, ['bray_curtis'])
+
+
+if __name__ == '__main__':
+    main()
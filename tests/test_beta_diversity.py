@@ -25,7 +25,7 @@ from cogent.maths.distance_transform import dist_chisq
 from qiime.parse import parse_newick, parse_distmat, parse_matrix
 from qiime.beta_diversity import BetaDiversityCalc, single_file_beta,\
     list_known_nonphylogenetic_metrics, list_known_phylogenetic_metrics,\
-    single_object_beta
+    single_object_beta, iter_beta_dissims
 from qiime.beta_metrics import dist_unweighted_unifrac
 from qiime.format import format_biom_table
 from biom.table import DenseOTUTable
@@ -269,6 +269,89 @@ class BetaDiversityCalcTests(TestCase):
         self.single_file_beta(missing_otu_table, missing_tree,
                               missing_sams=['M'], use_metric_list=True)
 
+    def test_single_file_beta_multiple_metrics(self):
+        """ all metrics at once should give the same result as one at a time
+        """
+        fd, input_path = mkstemp(suffix='.txt')
+        close(fd)
+        in_fname = os.path.split(input_path)[1]
+        open(input_path, 'w').write(l19_otu_table)
+        fd, tree_path = mkstemp(suffix='.tre')
+        close(fd)
+        open(tree_path, 'w').write(l19_tree)
+        self.files_to_remove.extend([input_path, tree_path])
+        metrics = list_known_nonphylogenetic_metrics()
+        metrics.extend(list_known_phylogenetic_metrics())
+        warnings.filterwarnings('ignore', 'dissimilarity .* is not '
+                                'parallelized, calculating the whole matrix...')
+
+        for rowids in None, 'sam1,sam_middle,sam19':
+            all_dir = mkdtemp()
+            one_dir = mkdtemp()
+            self.folders_to_remove.extend([all_dir, one_dir])
+            single_file_beta(input_path, ','.join(metrics), tree_path,
+                             all_dir, rowids=rowids)
+            for metric in metrics:
+                single_file_beta(input_path, metric, tree_path, one_dir,
+                                 rowids=rowids)
+            for metric in metrics:
+                fname = metric + '_' + in_fname
+                self.assertEqual(open(os.path.join(all_dir, fname)).read(),
+                                 open(os.path.join(one_dir, fname)).read())
+
+    def test_iter_beta_dissims_no_samples_on_tree(self):
+        """ UniFrac distances are zero when no sample has counts on the tree
+        """
+        otu_table = DenseOTUTable(numpy.array([[0., 0.], [0., 0.]]),
+                                  ['S0', 'S1'], ['a', 'b'])
+        tree = parse_newick('(a:1,b:2);', PhyloNode)
+        metric_fs = [('unweighted_unifrac', dist_unweighted_unifrac, True)]
+        warnings.filterwarnings('ignore')
+        obs = list(iter_beta_dissims(otu_table, metric_fs, tree))
+        self.assertEqual(obs[0][0], 'unweighted_unifrac')
+        assert_almost_equal(obs[0][1], numpy.zeros((2, 2)))
+        obs = list(iter_beta_dissims(otu_table, metric_fs, tree,
+                                     rowids='S1'))
+        # as for the row metric
+        assert_almost_equal(obs[0][1], [[1., 0.]])
+        warnings.resetwarnings()
+
+    def test_single_file_beta_binary_output(self):
+        """ binary output should hold the same distances as text output
+        """
+        fd, input_path = mkstemp(suffix='.txt')
+        close(fd)
+        in_fname = os.path.split(input_path)[1]
+        open(input_path, 'w').write(l19_otu_table)
+        fd, tree_path = mkstemp(suffix='.tre')
+        close(fd)
+        open(tree_path, 'w').write(l19_tree)
+        self.files_to_remove.extend([input_path, tree_path])
+        metrics = ['bray_curtis', 'euclidean', 'unweighted_unifrac',
+                   'dist_chisq']
+        text_dir = mkdtemp()
+        binary_dir = mkdtemp()
+        self.folders_to_remove.extend([text_dir, binary_dir])
+
+        single_file_beta(input_path, ','.join(metrics), tree_path, text_dir)
+        single_file_beta(input_path, ','.join(metrics), tree_path,
+                         binary_dir, binary_output=True)
+        in_basename = os.path.splitext(in_fname)[0]
+        for metric in metrics:
+            text_fp = os.path.join(text_dir, metric + '_' + in_fname)
+            binary_fp = os.path.join(binary_dir,
+                                     metric + '_' + in_basename + '.dm')
+            self.assertFalse(os.path.exists(
+                os.path.join(binary_dir, metric + '_' + in_fname)))
+            exp_ids, exp_data = parse_distmat(open(text_fp, 'U'))
+            obs_ids, obs_data = parse_distmat(open(binary_fp, 'U'))
+            self.assertEqual(obs_ids, exp_ids)
+            assert_almost_equal(obs_data, exp_data)
+
+        self.assertRaises(ValueError, single_file_beta, input_path,
+                          'bray_curtis', tree_path, binary_dir,
+                          rowids='sam1', binary_output=True)
+
     def single_object_beta(self, otu_table, metric, tree_string,
                            missing_sams=None):
         """ running single_file_beta should give same result using --rows"""
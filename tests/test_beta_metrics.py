@@ -19,7 +19,10 @@ from qiime.parse import make_envs_dict
 from qiime.beta_metrics import (
     _reorder_unifrac_res,
     make_unifrac_metric,
-    make_unifrac_row_metric)
+    make_unifrac_row_metric,
+    dist_unweighted_unifrac,
+    dist_weighted_unifrac,
+    one_sample_unweighted_unifrac)
 from qiime.parse import parse_newick
 from cogent.core.tree import PhyloNode
 from cogent.maths.unifrac.fast_tree import (unifrac)
@@ -129,6 +132,23 @@ class FunctionTests(TestCase):
         self.assertEqual(res[0, 1], 1.0)
         warnings.resetwarnings()
 
+    def test_make_unifrac_metric_no_samples_on_tree(self):
+        """ all distances are zero when no sample has counts on the tree
+        """
+        tree = parse_newick('(a:1,b:2);', PhyloNode)
+        otu_data = numpy.array([[0., 0.], [0., 0.]])
+        warnings.filterwarnings('ignore')
+        for metric_f in dist_unweighted_unifrac, dist_weighted_unifrac:
+            for kwargs in {}, {'make_subtree': False}:
+                res = metric_f(otu_data, ['a', 'b'], tree, ['S0', 'S1'],
+                               **kwargs)
+                assert_almost_equal(res, numpy.zeros((2, 2)))
+        # the row metric has always treated the other samples as distant
+        res = one_sample_unweighted_unifrac(otu_data, ['a', 'b'], tree,
+                                            ['S0', 'S1'], 'S0')
+        assert_almost_equal(res, [0., 1.])
+        warnings.resetwarnings()
+
     def test_make_unifrac_metric3(self):
         treestr = '((((tax7:0.1):.98,tax8:.3, tax4:.3):.4, ' +\
             '((tax6:.09):0.43):0.5):.2,' +\
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+from __future__ import division
+
+__author__ = "Greg Caporaso"
+__copyright__ = "Copyright 2011, The QIIME Project"
+__credits__ = ["Greg Caporaso"]
+__license__ = "GPL"
+__version__ = "1.8.0-dev"
+__maintainer__ = "Greg Caporaso"
+__email__ = "gregcaporaso@gmail.com"
+
+from os import close
+from tempfile import mkstemp
+from unittest import TestCase, main
+
+from numpy.testing import assert_array_equal
+from skbio.util.misc import remove_files
+
+from qiime.parse import parse_otu_map
+from qiime.compact_otu_map import (CompactOtuMap, is_compact_otu_map_file,
+                                   load_otu_map)
+
+
+class CompactOtuMapTests(TestCase):
+
+    """Tests of the CompactOtuMap class"""
+
+    def setUp(self):
+        self.otu_map_lines = otu_map_lines.split('\n')
+        self.files_to_remove = []
+
+    def tearDown(self):
+        remove_files(self.files_to_remove)
+
+    def test_from_otu_map_lines(self):
+        """CompactOtuMap interns samples and stores integer read numbers"""
+        m = CompactOtuMap.from_otu_map_lines(self.otu_map_lines)
+        self.assertEqual(m.otu_ids, ['0', '1', 'x', 'y'])
+        self.assertEqual(m.sample_ids, ['S1', 'S2', 'S3', 'S.4_b', 'noread'])
+        assert_array_equal(m.offsets, [0, 3, 4, 8, 9])
+        assert_array_equal(m.sample_indices, [0, 1, 0, 0, 2, 3, 2, 1, 4])
+        assert_array_equal(m.read_numbers, [0, 1, 2, 3, 10, 5, -1, -1, -1])
+        self.assertEqual(m.irregular_ids,
+                         {6: 'S3_abc', 7: 'S2_007', 8: 'noread'})
+        self.assertEqual(len(m), 4)
+        self.assertEqual(list(m), ['0', '1', 'x', 'y'])
+
+    def test_iter_lines(self):
+        """CompactOtuMap.iter_lines round-trips the classic format"""
+        m = CompactOtuMap.from_otu_map_lines(self.otu_map_lines)
+        self.assertEqual(''.join(m.iter_lines()),
+                         '\n'.join(self.otu_map_lines) + '\n')
+        self.assertEqual(list(m.iteritems())[2],
+                         ('x', ['S3_10', 'S.4_b_5', 'S3_abc', 'S2_007']))
+
+    def test_from_items(self):
+        """CompactOtuMap.from_items accepts a non-default delimiter"""
+        m = CompactOtuMap.from_items([('a', ['S1.1', 'S_2.3']),
+                                      ('b', [])], delim='.')
+        self.assertEqual(m.sample_ids, ['S1', 'S_2'])
+        assert_array_equal(m.offsets, [0, 2, 2])
+        self.assertEqual(list(m.iteritems()),
+                         [('a', ['S1.1', 'S_2.3']), ('b', [])])
+
+    def test_init_invalid(self):
+        """CompactOtuMap.__init__ rejects inconsistent columns"""
+        self.assertRaises(ValueError, CompactOtuMap, ['a'], ['S1'],
+                          [0, 1, 2], [0], [1])
+        self.assertRaises(ValueError, CompactOtuMap, ['a'], ['S1'],
+                          [0, 2], [0], [1])
+
+    def test_save_load(self):
+        """CompactOtuMap round-trips through the binary sidecar format"""
+        m = CompactOtuMap.from_otu_map_lines(self.otu_map_lines)
+        fd, fp = mkstemp(prefix='CompactOtuMapTests_', suffix='.bin')
+        close(fd)
+        self.files_to_remove.append(fp)
+        f = open(fp, 'wb')
+        m.save(f)
+        f.close()
+
+        self.assertTrue(is_compact_otu_map_file(fp))
+        obs = load_otu_map(fp)
+        self.assertEqual(obs.otu_ids, m.otu_ids)
+        self.assertEqual(obs.sample_ids, m.sample_ids)
+        self.assertEqual(obs.irregular_ids, m.irregular_ids)
+        assert_array_equal(obs.offsets, m.offsets)
+        assert_array_equal(obs.sample_indices, m.sample_indices)
+        assert_array_equal(obs.read_numbers, m.read_numbers)
+        self.assertEqual(list(obs.iter_lines()), list(m.iter_lines()))
+
+        # truncated files are detected
+        f = open(fp, 'rb')
+        data = f.read()
+        f.close()
+        f = open(fp, 'wb')
+        f.write(data[:-4])
+        f.close()
+        self.assertRaises(ValueError, CompactOtuMap.load, open(fp, 'rb'))
+
+    def test_load_otu_map_text(self):
+        """load_otu_map reads classic OTU map files"""
+        fd, fp = mkstemp(prefix='CompactOtuMapTests_', suffix='.txt')
+        close(fd)
+        self.files_to_remove.append(fp)
+        f = open(fp, 'w')
+        f.write('\n'.join(self.otu_map_lines))
+        f.close()
+        self.assertFalse(is_compact_otu_map_file(fp))
+        self.assertEqual(''.join(load_otu_map(fp).iter_lines()),
+                         '\n'.join(self.otu_map_lines) + '\n')
+
+    def test_get_sample_otu_counts(self):
+        """get_sample_otu_counts matches parse_otu_map"""
+        m = CompactOtuMap.from_otu_map_lines(self.otu_map_lines)
+        for otu_ids_to_exclude in [None, ['0'], ['0', 'x', 'y']]:
+            for delim in ['_', '.']:
+                self.assertEqual(
+                    m.get_sample_otu_counts(otu_ids_to_exclude, delim),
+                    parse_otu_map(self.otu_map_lines, otu_ids_to_exclude,
+                                  delim))
+
+    def test_get_sample_otu_counts_empty(self):
+        """get_sample_otu_counts handles maps with no reads"""
+        m = CompactOtuMap.from_items([])
+        self.assertEqual(m.get_sample_otu_counts(), ({}, [], []))
+        m = CompactOtuMap.from_items([('a', [])])
+        self.assertEqual(m.get_sample_otu_counts(), ({}, [], ['a']))
+
+
+otu_map_lines = """0\tS1_0\tS2_1\tS1_2
+1\tS1_3
+x\tS3_10\tS.4_b_5\tS3_abc\tS2_007
+y\tnoread"""
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,8 @@ from unittest import TestCase, main
 from skbio.core.exception import DistanceMatrixError
 
 from qiime.compare_categories import compare_categories
+from qiime.format import write_binary_distance_matrix
+from qiime.parse import parse_distmat
 from qiime.util import get_qiime_temp_dir
 
 
@@ -116,6 +118,23 @@ class CompareCategoriesTests(TestCase):
             results_f.close()
             self.assertTrue(len(results) > 0)
 
+    def test_compare_categories_binary_distance_matrix(self):
+        """Test compare_categories() on a binary distance matrix."""
+        dm1_binary_fp = join(self.test_dir, 'dm1.dm')
+        write_binary_distance_matrix(*parse_distmat(open(self.dm1_fp, 'U')),
+                                     output_fp=dm1_binary_fp)
+        self.files_to_remove.append(dm1_binary_fp)
+        for method in 'anosim', 'best', 'permanova':
+            results_fp = join(self.test_dir, '%s_results.txt' % method)
+            self.files_to_remove.append(results_fp)
+            results = []
+            for dm_fp in self.dm1_fp, dm1_binary_fp:
+                compare_categories(dm_fp, self.map1_fp, method,
+                                   self.num_categories if method == 'best'
+                                   else self.cat_categories, 0, self.test_dir)
+                results.append(open(results_fp, 'U').read())
+            self.assertEqual(results[0], results[1])
+
     def test_compare_categories_morans_i_zeros(self):
         """Test Moran's I on distance matrix with non-diagonal zeros."""
         method = 'morans_i'
@@ -27,6 +27,7 @@ from qiime.demultiplex_fasta import (
     write_fasta_line, get_label_line, initialize_log_data,
     get_output_ids, assign_seqs, process_files_and_demultiplex_sequences
 )
+from qiime.barcode import BarcodeCorrector
 
 
 class FakeOutFile(object):
@@ -639,6 +640,32 @@ class TopLevelTests(TestCase):
         self.assertEqual(num_errors, expected_num_errors)
         self.assertEqual(added_field, expected_added_field)
 
+    def test_get_curr_bc_added_field_barcode_corrector(self):
+        """ Uses bc_correction_f, correcting each barcode once """
+
+        curr_bc = "GGCAGCACTTGT"
+        ids_bcs_added_field = {("AACTCGTCGATG", ""): "s1",
+                               ("AGCAGCACTTGT", ""): "s2", ("ACAGAGTCGGCT", ""): "s3"}
+        fasta_label = "123ABC region=1 length=255"
+        all_bcs = ["AACTCGTCGATG", "AGCAGCACTTGT", "ACAGAGTCGGCT"]
+        calls = []
+
+        def correction_f(curr_bc, all_bcs, barcode_type):
+            calls.append(curr_bc)
+            return attempt_bc_correction(curr_bc, all_bcs, barcode_type)
+        bc_correction_f = BarcodeCorrector(correction_f)
+
+        for i in range(3):
+            corrected_bc, num_errors, added_field =\
+                get_curr_bc_added_field(curr_bc, ids_bcs_added_field,
+                                        fasta_label, all_bcs, "golay_12", False, None,
+                                        bc_correction_f)
+            self.assertEqual(corrected_bc, "AGCAGCACTTGT")
+            self.assertEqual(num_errors, 1)
+            self.assertEqual(added_field, None)
+
+        self.assertEqual(calls, ["GGCAGCACTTGT"])
+
     def test_get_curr_bc_added_field_barcode_only_disabled_correction(self):
         """ Returns None when no exact match and correction disabled """
 
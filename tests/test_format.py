@@ -22,7 +22,8 @@ from cogent.util.misc import remove_files
 from unittest import TestCase, main
 from skbio.parse.sequences import parse_fasta
 from qiime.util import  get_qiime_library_version
-from qiime.parse import fields_to_dict, parse_mapping_file
+from qiime.parse import (fields_to_dict, parse_mapping_file, parse_distmat,
+                         parse_binary_distmat)
 from qiime.format import (format_distance_matrix, format_otu_table,
                           format_coords, build_prefs_string, format_matrix, format_map_file,
                           format_histograms, write_Fasta_from_name_seq_pairs,
@@ -35,7 +36,9 @@ from qiime.format import (format_distance_matrix, format_otu_table,
                           format_biom_table, format_mapping_html_data, format_te_prefs,
                           format_tep_file_lines, format_jnlp_file_lines, format_anosim_results,
                           format_best_results, format_permanova_results, format_fastq_record,
-                          format_histograms_two_bins)
+                          format_histograms_two_bins,
+                          write_binary_distance_matrix,
+                          create_binary_distance_matrix)
 from biom.parse import parse_biom_table, parse_classic_table_to_rich_table
 from biom.table import SparseTaxonTable
 from StringIO import StringIO
@@ -398,6 +401,38 @@ class TopLevelTests(TestCase):
                          '\t11\t22\t33\n11\t1\t2\t3\n22\t4\t5\t6\n33\t7\t8\t9')
         self.assertRaises(ValueError, format_distance_matrix, labels[:2], a)
 
+    def test_write_binary_distance_matrix(self):
+        """write_binary_distance_matrix should round-trip through parse"""
+        a = array([[0, 2.5, 3], [2.5, 0, 6], [3, 6, 0]])
+        labels = ['s1', 'sample.2', 3]
+        self.files_to_remove.append(self.tmp_fp1)
+        write_binary_distance_matrix(labels, a, self.tmp_fp1)
+        obs_labels, obs = parse_distmat(open(self.tmp_fp1, 'U'))
+        self.assertEqual(obs_labels, ['s1', 'sample.2', '3'])
+        self.assertEqual(obs.tolist(), a.tolist())
+        # the distances are 8-byte aligned
+        self.assertEqual(len(open(self.tmp_fp1, 'rb').read()) % 8, 0)
+        self.assertRaises(ValueError, write_binary_distance_matrix,
+                          labels[:2], a, self.tmp_fp1)
+
+        write_binary_distance_matrix([], array([]).reshape((0, 0)),
+                                     self.tmp_fp1)
+        obs_labels, obs = parse_binary_distmat(open(self.tmp_fp1, 'U'))
+        self.assertEqual(obs_labels, [])
+        self.assertEqual(obs.shape, (0, 0))
+
+    def test_create_binary_distance_matrix(self):
+        """create_binary_distance_matrix should map an empty matrix"""
+        self.files_to_remove.append(self.tmp_fp1)
+        dists = create_binary_distance_matrix(['a', 'b'], self.tmp_fp1)
+        self.assertEqual(dists.tolist(), [[0, 0], [0, 0]])
+        dists[1] = [4.2, 0]
+        dists[0] = [0, 4.2]
+        del dists
+        obs_labels, obs = parse_binary_distmat(open(self.tmp_fp1, 'U'))
+        self.assertEqual(obs_labels, ['a', 'b'])
+        self.assertEqual(obs.tolist(), [[0, 4.2], [4.2, 0]])
+
     def test_format_matrix(self):
         """format_matrix should return tab-delimited mat"""
         a = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
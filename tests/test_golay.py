@@ -193,6 +193,40 @@ class GolayTests(TestCase):
             self.assertEqual(corr, None)
             self.assertEqual(num_errs, 4)
 
+    def test_decode_many(self):
+        """ decode_many should match decode for valid, 2 and 4 bit errors"""
+        seqs = list(golay600)
+        seqs += [bc.replace('A', 'C', 1) for bc in golay600]
+        seqs += [bc.replace('A', 'C', 2) for bc in golay600]
+        seqs += ['C' + bc[1:] for bc in golay600]
+        corrected, num_errors = golay.decode_many(seqs)
+        self.assertEqual(len(corrected), len(seqs))
+        self.assertEqual(len(num_errors), len(seqs))
+        for seq, corr, num_errs in zip(seqs, corrected, num_errors):
+            self.assertEqual((corr, num_errs), golay.decode(seq))
+
+    def test_decode_many_nt_to_bits(self):
+        """ decode_many should handle alternative nt_to_bits """
+        NT_TO_BITS = {"A": "00", "C": "11", "T": "01", "G": "10"}
+        seqs = golay600[:50] + ['GCATCGTCCACA', 'AAAAAAAAAAAA']
+        corrected, num_errors = golay.decode_many(seqs, NT_TO_BITS)
+        for seq, corr, num_errs in zip(seqs, corrected, num_errors):
+            self.assertEqual((corr, num_errs), golay.decode(seq, NT_TO_BITS))
+
+    def test_decode_many_invalid(self):
+        """ decode_many should raise ValueError on bad length or bases """
+        self.assertEqual(golay.decode_many([])[0], [])
+        self.assertRaises(ValueError, golay.decode_many, ['AAAAAAAAAAA'])
+        self.assertRaises(ValueError, golay.decode_many,
+                          ['AAAAAAAAAAAA', 'AAAAAANAAAAA'])
+
+    def test_get_invalid_golay_barcodes(self):
+        """ get_invalid_golay_barcodes finds wrong length and non-codewords"""
+        seqs = ['AGCACGAGCCTA', 'CGCACGAGCCTA', 'AGCACGAGCC', 'AACTCGTCGATG']
+        self.assertEqual(golay.get_invalid_golay_barcodes(seqs),
+                         ['CGCACGAGCCTA', 'AGCACGAGCC'])
+        self.assertEqual(golay.get_invalid_golay_barcodes(golay600), [])
+
 # random 24 bit vectors
 ten_bitvecs = numpy.array([
     [0, 0, 0, 1, 0, 1, 1, 0, 1, 1, 1, 1, 0, 0, 0, 1, 0, 1, 1, 0, 0, 0,
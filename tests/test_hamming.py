@@ -15,7 +15,7 @@ __maintainer__ = "Justin Kuczynski"
 __email__ = "justinak@gmail.com"
 
 from unittest import TestCase, main
-from qiime.hamming import decode_barcode_8
+from qiime.hamming import decode_barcode_8, decode_many
 
 
 class GeneralSetUp(TestCase):
@@ -116,5 +116,23 @@ class StandaloneHammingTests(GeneralSetUp):
         self.assertEqual(decode_barcode_8(self.double_error_1), (None, 1))
         self.assertEqual(decode_barcode_8(self.double_error_1), (None, 1))
 
+    def test_decode_many(self):
+        """ decode_many should match decode_barcode_8 for every barcode """
+        barcodes = [self.valid_bc_1, self.valid_bc_2, self.valid_bc_3,
+                    self.valid_bc_4, self.valid_bc_5, self.single_error_1,
+                    self.single_error_2, self.single_error_3,
+                    self.single_error_4, self.single_error_5,
+                    self.single_error_6, self.single_error_7,
+                    self.single_error_8, self.double_error_1]
+        corrected, num_errors = decode_many(barcodes)
+        for bc, corr, num_errs in zip(barcodes, corrected, num_errors):
+            self.assertEqual((corr, num_errs), decode_barcode_8(bc))
+
+    def test_decode_many_invalid(self):
+        """ decode_many should raise ValueError on bad length or bases """
+        self.assertEqual(decode_many([])[0], [])
+        self.assertRaises(ValueError, decode_many, ['AACCATG'])
+        self.assertRaises(ValueError, decode_many, ['AACCATGC', 'AACCATGN'])
+
 if __name__ == '__main__':
     main()
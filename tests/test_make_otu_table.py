@@ -13,6 +13,7 @@ import json
 from unittest import TestCase, main
 from qiime.make_otu_table import (libs_from_seqids,
                                   seqids_from_otu_to_seqid, make_otu_table)
+from qiime.compact_otu_map import CompactOtuMap
 from biom.table import DenseOTUTable
 from biom.parse import parse_biom_table
 
@@ -54,6 +55,23 @@ z	DEF_3	XYZ_1""".split('\n')
             parse_biom_table(obs.split('\n')),
             parse_biom_table(exp.split('\n')))
 
+    def test_make_otu_table_compact_otu_map(self):
+        """make_otu_table should give the same table from a CompactOtuMap"""
+        otu_map_lines = """0	ABC_0	DEF_1
+1	ABC_1
+x	GHI_2	GHI_3	GHI_77
+y	ABC_X_7
+z	DEF_3	XYZ_1	XYZ""".split('\n')
+        otu_map = CompactOtuMap.from_otu_map_lines(otu_map_lines)
+        for ids_to_exclude in [None, ['1', 'x']]:
+            obs = make_otu_table(otu_map, None, ids_to_exclude,
+                                 constructor=DenseOTUTable)
+            exp = make_otu_table(otu_map_lines, None, ids_to_exclude,
+                                 constructor=DenseOTUTable)
+            self.assertEqual(
+                parse_biom_table(obs.split('\n')),
+                parse_biom_table(exp.split('\n')))
+
     def test_make_otu_table_taxonomy(self):
         """make_otu_table should work with taxonomy"""
         otu_map_lines = """0	ABC_0	DEF_1
@@ -11,17 +11,21 @@ __maintainer__ = "Luke Ursell"
 __email__ = "lkursell@gmail.com"
 
 from unittest import TestCase, main
+from itertools import izip
 from qiime.otu_significance import (get_sample_cats, get_cat_sample_groups,
                                     get_sample_indices, group_significance_row_generator, sort_by_pval,
                                     run_group_significance_test, group_significance_output_formatter,
                                     GROUP_TEST_CHOICES, grouped_correlation_row_generator,
                                     run_grouped_correlation, CORRELATION_TEST_CHOICES,
                                     grouped_correlation_formatter, correlation_row_generator,
-                                    run_correlation_test)
+                                    run_correlation_test, group_significance_data,
+                                    batch_group_significance_test, correlation_data,
+                                    batch_correlation_test, TWO_GROUP_TESTS)
 from qiime.pycogent_backports.test import (assign_correlation_pval, fisher,
-                                           fisher_population_correlation)
-from numpy import array, hstack, corrcoef
-from numpy.random import seed
+                                           fisher_population_correlation,
+                                           t_two_sample, mw_test)
+from numpy import array, hstack, vstack, corrcoef, isnan, cumsum, errstate
+from numpy.random import seed, permutation, randint
 from numpy.testing import assert_almost_equal
 from os import remove
 from qiime.parse import parse_mapping_file_to_dict, parse_otu_table
@@ -539,6 +543,92 @@ class GroupSignificanceFunctionsTests(TestCase):
         assert_almost_equal(exp_pvals, obs_pvals)
         assert_almost_equal(exp_means, obs_means)
 
+    def test_group_significance_data(self):
+        """group_significance_data puts the samples of each group together"""
+        sample_indices = {'cat1': [0, 1, 5], 'cat2': [4, 3, 2]}
+        bt = parse_biom_table(BT_IN_1)
+        data = array([bt.observationData(i) for i in bt.ObservationIds])
+        obs_data, obs_sizes = group_significance_data(bt, sample_indices)
+        exp_data = data.take(sample_indices['cat1'] + sample_indices['cat2'],
+                             1)
+        assert_almost_equal(obs_data, exp_data)
+        self.assertEqual(obs_sizes, [3, 3])
+
+    def test_batch_group_significance_test(self):
+        """batch_group_significance_test matches run_group_significance_test"""
+        bt = parse_biom_table(BT_4)
+        # add ties, an OTU which doesn't vary, and one which isn't observed
+        # in a group
+        data = array([bt.observationData(i) for i in bt.ObservationIds])
+        data = vstack([data, [5, 5, 5, 0, 0, 0, 5, 5],
+                       [3, 3, 3, 3, 3, 3, 3, 3]])
+        data[1, :3] = 14
+        for test in ['ANOVA', 'g_test', 'kruskal_wallis',
+                     'parametric_t_test', 'mann_whitney_u']:
+            if test in TWO_GROUP_TESTS:
+                group_sizes = [4, 4]
+            else:
+                group_sizes = [3, 3, 2]
+            bounds = [0] + list(cumsum(group_sizes))
+            row_gen = izip(*[data[:, start:stop]
+                             for start, stop in zip(bounds[:-1], bounds[1:])])
+            exp = run_group_significance_test(row_gen, test,
+                                              GROUP_TEST_CHOICES)
+            obs = batch_group_significance_test(data, group_sizes, test)
+            for o, e in zip(obs, exp):
+                assert_almost_equal(array(o, dtype=float),
+                                    array(e, dtype=float))
+
+    def test_batch_group_significance_test_permutations(self):
+        """batch_group_significance_test shares permutations between OTUs"""
+        bt = parse_biom_table(BT_4)
+        data = array([bt.observationData(i) for i in bt.ObservationIds])
+        # the permutations (or bootstrap samples) are drawn first
+        seed(0)
+        perms = [permutation(8) for i in range(100)]
+        seed(0)
+        obs = batch_group_significance_test(data, [4, 4],
+                                            'nonparametric_t_test', reps=100)
+        for row, obs_t, obs_p in zip(data, obs[0], obs[1]):
+            exp_t = t_two_sample(row[:4], row[4:])[0]
+            perm_ts = array([t_two_sample(row[p[:4]], row[p[4:]])[0]
+                             for p in perms])
+            self.assertAlmostEqual(obs_t, exp_t)
+            self.assertAlmostEqual(
+                obs_p, ((abs(perm_ts) >= abs(exp_t) - 1e-8).sum() + 1) / 101.)
+        # the results don't depend on the number of processes
+        seed(0)
+        obs_jobs = batch_group_significance_test(data, [4, 4],
+                                                 'nonparametric_t_test',
+                                                 reps=100, jobs_to_start=2)
+        for o, e in zip(obs_jobs, obs):
+            assert_almost_equal(o, e)
+
+        seed(0)
+        samples = [randint(0, 8, 8) for i in range(100)]
+        seed(0)
+        obs = batch_group_significance_test(data, [4, 4],
+                                            'bootstrap_mann_whitney_u',
+                                            reps=100)
+        for row, obs_u, obs_p in zip(data, obs[0], obs[1]):
+            exp_u = mw_test(row[:4], row[4:])[0]
+            boot_us = array([mw_test(row[b[:4]], row[b[4:]])[0]
+                             for b in samples])
+            self.assertAlmostEqual(obs_u, exp_u)
+            self.assertAlmostEqual(obs_p, (boot_us >= exp_u).sum() / 100.)
+
+    def test_batch_group_significance_test_single_sample(self):
+        """batch_group_significance_test handles groups of one sample"""
+        bt = parse_biom_table(BT_4)
+        data = array([bt.observationData(i) for i in bt.ObservationIds])
+        row_gen = izip(data[:, :1], data[:, 1:])
+        exp = run_group_significance_test(row_gen, 'parametric_t_test',
+                                          GROUP_TEST_CHOICES)
+        obs = batch_group_significance_test(data, [1, 7],
+                                            'parametric_t_test')
+        for o, e in zip(obs, exp):
+            assert_almost_equal(o, e)
+
     def test_group_significance_output_formatter(self):
         """output_formatter works"""
         # Using ANOVA test for example
@@ -937,6 +1027,58 @@ class GroupedCorrelationTests(TestCase):
                                                   permutations=1000)
         assert_almost_equal(exp_bootstrapped_pvals, obs_pvals)
 
+    def test_batch_correlation_test(self):
+        """batch_correlation_test matches run_correlation_test"""
+        bt = parse_biom_table(BT_4)
+        pmf = dict([('Sample%d' % i, {'test_corr': str(v)}) for i, v in
+                    zip(range(1, 9), [1, 2, 3, 3, 5, 0, 0, 8])])
+        data, md_vals = correlation_data(bt, pmf, 'test_corr')
+        assert_almost_equal(md_vals, [1, 2, 3, 3, 5, 0, 0, 8])
+        # add ties, an OTU which doesn't vary, and OTUs which are perfectly
+        # correlated with the metadata, whose parametric p values are nan
+        data[0, :4] = 0
+        data = vstack([data, [4, 4, 4, 4, 4, 4, 4, 4], 2 * md_vals + 1,
+                       -md_vals])
+        for test, methods in [
+                ('pearson', ['parametric_t_distribution', 'fisher_z_transform']),
+                ('spearman', ['parametric_t_distribution']),
+                ('kendall', ['kendall']),
+                ('cscore', ['parametric_t_distribution'])]:
+            for method in methods:
+                exp = run_correlation_test(((row, md_vals) for row in data),
+                                           test, CORRELATION_TEST_CHOICES,
+                                           method)
+                obs = batch_correlation_test(data, md_vals, test, method)
+                assert_almost_equal(obs, exp)
+                if test == 'pearson':
+                    # under cogent's default error handling
+                    with errstate(divide='raise'):
+                        obs = batch_correlation_test(data[-2:], md_vals, test,
+                                                     method)
+                    assert_almost_equal(obs[0], [1, -1])
+                    self.assertTrue(isnan(obs[1]).all())
+
+            # the permutations are drawn first, and shared by all OTUs
+            seed(0)
+            perms = [permutation(8) for i in range(100)]
+            seed(0)
+            obs = batch_correlation_test(data, md_vals, test, 'bootstrapped',
+                                         permutations=100)
+            test_fn = CORRELATION_TEST_CHOICES[test]
+            for row, obs_p in zip(data, obs[1]):
+                r = test_fn(row, md_vals)
+                perm_rs = array([test_fn(row, md_vals[p]) for p in perms])
+                if isnan(r):
+                    exp_p = 0.0
+                else:
+                    exp_p = (abs(perm_rs) >= abs(r) - 1e-8).sum() / 100.
+                self.assertAlmostEqual(obs_p, exp_p)
+            seed(0)
+            assert_almost_equal(
+                batch_correlation_test(data, md_vals, test, 'bootstrapped',
+                                       permutations=100, jobs_to_start=2),
+                obs)
+
 # globals used by certain tests.
 BT_IN_1 = '{"id": "None","format": "Biological Observation Matrix 1.0.0","format_url": "http://biom-format.org","type": "OTU table","generated_by": "testCode","date": "2013-08-20T15:48:21.166180","matrix_type": "sparse","matrix_element_type": "float","shape": [6, 6],"data": [[0,0,28.0],[0,1,52.0],[0,2,51.0],[0,3,78.0],[0,4,16.0],[0,5,77.0],[1,0,25.0],[1,1,14.0],[1,2,11.0],[1,3,32.0],[1,4,48.0],[1,5,63.0],[2,0,31.0],[2,1,2.0],[2,2,15.0],[2,3,69.0],[2,4,64.0],[2,5,27.0],[3,0,36.0],[3,1,68.0],[3,2,70.0],[3,3,65.0],[3,4,33.0],[3,5,62.0],[4,0,16.0],[4,1,41.0],[4,2,59.0],[4,3,40.0],[4,4,15.0],[4,5,3.0],[5,0,32.0],[5,1,8.0],[5,2,54.0],[5,3,98.0],[5,4,29.0],[5,5,50.0]],"rows": [{"id": "OTU1", "metadata": {"taxonomy": ["k__One"]}},{"id": "OTU2", "metadata": {"taxonomy": ["k__Two"]}},{"id": "OTU3", "metadata": {"taxonomy": ["k__Three"]}},{"id": "OTU4", "metadata": {"taxonomy": ["k__Four"]}},{"id": "OTU5", "metadata": {"taxonomy": ["k__Five"]}},{"id": "OTU6", "metadata": {"taxonomy": ["k__Six"]}}],"columns": [{"id": "Sample1", "metadata": null},{"id": "Sample2", "metadata": null},{"id": "Sample3", "metadata": null},{"id": "Sample4", "metadata": null},{"id": "Sample5", "metadata": null},{"id": "Sample6", "metadata": null}]}'
 MF_IN_1 = ['#SampleID\ttest_cat\ttest_corr',
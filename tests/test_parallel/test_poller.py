@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+from __future__ import division
+
+__author__ = "Greg Caporaso"
+__copyright__ = "Copyright 2011, The QIIME project"
+__credits__ = ["Greg Caporaso"]
+__license__ = "GPL"
+__version__ = "1.8.0-dev"
+__maintainer__ = "Greg Caporaso"
+__email__ = "gregcaporaso@gmail.com"
+
+from os.path import exists, join
+from shutil import rmtree
+from tempfile import mkdtemp
+from threading import Timer
+from unittest import TestCase, main
+
+from qiime.util import get_qiime_temp_dir
+from qiime.parallel.poller import (get_remaining_filepaths,
+                                   inotify_available,
+                                   wait_for_filepaths,
+                                   poller,
+                                   basic_check_run_complete_f,
+                                   basic_process_run_results_f,
+                                   basic_clean_up_f,
+                                   merge_files)
+
+
+class PollerTests(TestCase):
+
+    def setUp(self):
+        self.test_dir = mkdtemp(dir=get_qiime_temp_dir(),
+                                prefix='poller_tests_')
+        self.fp1 = join(self.test_dir, 'f1.txt')
+        self.fp2 = join(self.test_dir, 'f2.txt')
+        open(self.fp1, 'w').write('a\nb\n')
+
+    def tearDown(self):
+        rmtree(self.test_dir)
+
+    def _create_later(self, fp, seconds=0.2):
+        timer = Timer(seconds, lambda: open(fp, 'w').write('c\n'))
+        timer.start()
+        return timer
+
+    def test_get_remaining_filepaths(self):
+        """get_remaining_filepaths returns only missing filepaths"""
+        self.assertEqual(get_remaining_filepaths([self.fp1, self.fp2]),
+                         set([self.fp2]))
+        self.assertEqual(get_remaining_filepaths([self.fp1]), set())
+
+    def test_wait_for_filepaths_existing(self):
+        """wait_for_filepaths returns immediately when files exist"""
+        self.assertEqual(wait_for_filepaths(['%s\n' % self.fp1, '\n'], 60), 0)
+
+    def test_wait_for_filepaths_polling(self):
+        """wait_for_filepaths polls until missing files are created"""
+        timer = self._create_later(self.fp2)
+        loops = wait_for_filepaths([self.fp1, self.fp2], 0.05,
+                                   use_inotify=False)
+        timer.join()
+        self.assertTrue(loops > 0)
+        self.assertTrue(exists(self.fp2))
+
+    def test_wait_for_filepaths_inotify(self):
+        """wait_for_filepaths wakes up when missing files are created"""
+        if not inotify_available():
+            return
+        timer = self._create_later(self.fp2)
+        # the files are found via events long before the first check
+        loops = wait_for_filepaths([self.fp1, self.fp2], 60)
+        timer.join()
+        self.assertEqual(loops, 0)
+        self.assertTrue(exists(self.fp2))
+
+    def test_wait_for_filepaths_inotify_missing_dir(self):
+        """wait_for_filepaths checks files in unwatchable dirs"""
+        if not inotify_available():
+            return
+        fp = join(self.test_dir, 'not_yet', 'f3.txt')
+
+        def f():
+            from os import mkdir
+            mkdir(join(self.test_dir, 'not_yet'))
+            open(fp, 'w').close()
+        timer = Timer(0.1, f)
+        timer.start()
+        loops = wait_for_filepaths([fp], 0.2)
+        timer.join()
+        self.assertTrue(loops > 0)
+
+    def test_poller(self):
+        """poller waits for files, then merges and cleans up"""
+        out_fp = join(self.test_dir, 'out.txt')
+        timer = self._create_later(self.fp2)
+        poller(basic_check_run_complete_f,
+               basic_process_run_results_f,
+               basic_clean_up_f,
+               [self.fp1, self.fp2],
+               ['%s\t%s\t%s' % (self.fp1, self.fp2, out_fp)],
+               [self.fp1, self.fp2],
+               seconds_to_sleep=1)
+        timer.join()
+        self.assertEqual(open(out_fp).read(), 'a\nb\nc\n')
+        self.assertFalse(exists(self.fp1))
+        self.assertFalse(exists(self.fp2))
+
+    def test_merge_files(self):
+        """merge_files concatenates files, fixing up missing newlines"""
+        fps = []
+        for i, contents in enumerate(['a\nb', '', 'c\n\n', '\n', 'd']):
+            fp = join(self.test_dir, 'in%d.txt' % i)
+            open(fp, 'w').write(contents)
+            fps.append(fp)
+        out_fp = join(self.test_dir, 'out.txt')
+        merge_files(fps, out_fp, buffer_size=2)
+        self.assertEqual(open(out_fp).read(), 'a\nb\nc\n\n\nd\n')
+
+    def test_merge_files_bad_output(self):
+        """merge_files raises IOError if the output can't be written"""
+        self.assertRaises(IOError, merge_files, [self.fp1],
+                          join(self.test_dir, 'no', 'out.txt'))
+
+    def test_basic_process_run_results_f(self):
+        """basic_process_run_results_f merges several output groups"""
+        lines = []
+        expected = {}
+        for i in range(6):
+            in_fps = []
+            for j in range(3):
+                fp = join(self.test_dir, 'in%d_%d.txt' % (i, j))
+                open(fp, 'w').write('%d\t%d' % (i, j))
+                in_fps.append(fp)
+            out_fp = join(self.test_dir, 'out%d.txt' % i)
+            lines.append('\t'.join(in_fps + [out_fp]))
+            expected[out_fp] = ''.join(['%d\t%d\n' % (i, j)
+                                        for j in range(3)])
+        for max_concurrent_merges in [1, 4]:
+            self.assertTrue(basic_process_run_results_f(
+                lines, max_concurrent_merges=max_concurrent_merges))
+            for out_fp, contents in expected.items():
+                self.assertEqual(open(out_fp).read(), contents)
+
+
+if __name__ == "__main__":
+    main()
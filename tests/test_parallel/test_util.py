@@ -10,16 +10,19 @@ __version__ = "1.8.0-dev"
 __maintainer__ = "Greg Caporaso"
 __email__ = "gregcaporaso@gmail.com"
 
-from os import close
-from os.path import exists
-from tempfile import mkstemp
+from os import close, listdir
+from os.path import exists, join
+from shutil import rmtree
+from tempfile import mkstemp, mkdtemp
 from unittest import TestCase, main
 
 from skbio.util.misc import remove_files
 
 from qiime.util import get_qiime_temp_dir
 from qiime.parallel.util import (ParallelWrapper,
-                                 BufferedWriter)
+                                 BufferedWriter,
+                                 LOCAL_CLUSTER_JOBS_FP,
+                                 run_local_job)
 
 
 class ParallelWrapperTests(TestCase):
@@ -242,6 +245,95 @@ class ParallelWrapperTests(TestCase):
         self.assertEqual(actual_40, 1)
 
 
+class EchoParallelWrapper(ParallelWrapper):
+
+    """ Minimal wrapper whose jobs each write their input to a file """
+
+    _job_prefix = 'ECHO'
+    _input_splitter = ParallelWrapper._input_existing_filepaths
+
+    def _get_job_commands(self,
+                          input_fps,
+                          output_dir,
+                          params,
+                          job_prefix,
+                          working_dir,
+                          command_prefix='/bin/bash; ',
+                          command_suffix='; exit'):
+        commands = []
+        result_filepaths = []
+        for i, value in enumerate(input_fps):
+            output_fn = '%s%d.txt' % (job_prefix, i)
+            rename_command, current_result_filepaths =\
+                self._get_rename_command([output_fn], working_dir, output_dir)
+            result_filepaths += current_result_filepaths
+            commands.append('%s echo %s > %s/%s %s %s' %
+                            (command_prefix, value, working_dir, output_fn,
+                             rename_command, command_suffix))
+        return commands, result_filepaths
+
+    def _write_merge_map_file(self,
+                              input_file_basename,
+                              job_result_filepaths,
+                              params,
+                              output_dir,
+                              merge_map_filepath):
+        f = open(merge_map_filepath, 'w')
+        f.write('\t'.join(job_result_filepaths +
+                          [join(output_dir, 'merged.txt')]))
+        f.close()
+
+
+class LocalParallelWrapperTests(TestCase):
+
+    def setUp(self):
+        self.output_dir = mkdtemp(dir=get_qiime_temp_dir(),
+                                  prefix='LocalParallelWrapperTests_')
+
+    def tearDown(self):
+        rmtree(self.output_dir)
+
+    def test_call_local(self):
+        """ jobs run in local workers and results are merged on completion
+        """
+        for jobs_to_start in [1, 3]:
+            pw = EchoParallelWrapper(cluster_jobs_fp=LOCAL_CLUSTER_JOBS_FP,
+                                     jobs_to_start=jobs_to_start)
+            pw(['a', 'b', 'c', 'd'], self.output_dir, {}, job_prefix='ECHO')
+            merged_fp = join(self.output_dir, 'merged.txt')
+            self.assertEqual(open(merged_fp).read(), 'a\nb\nc\nd\n')
+            # the per-job output and the working directory are removed
+            self.assertEqual(listdir(self.output_dir), ['merged.txt'])
+            remove_files([merged_fp])
+
+    def test_call_local_suppress_polling(self):
+        """ job results are left unmerged when polling is suppressed
+        """
+        pw = EchoParallelWrapper(cluster_jobs_fp=LOCAL_CLUSTER_JOBS_FP,
+                                 jobs_to_start=2, suppress_polling=True)
+        pw(['a', 'b'], self.output_dir, {}, job_prefix='ECHO')
+        self.assertEqual(open(join(self.output_dir, 'ECHO1.txt')).read(),
+                         'b\n')
+        self.assertFalse(exists(join(self.output_dir, 'merged.txt')))
+
+    def test_call_local_failure(self):
+        """ failing jobs raise a RuntimeError
+        """
+        pw = EchoParallelWrapper(cluster_jobs_fp=LOCAL_CLUSTER_JOBS_FP,
+                                 jobs_to_start=2)
+        self.assertRaises(RuntimeError, pw, ['a', 'b; exit 3'],
+                          self.output_dir, {}, job_prefix='ECHO')
+
+    def test_run_local_job(self):
+        """ run_local_job strips the cluster job wrapping and runs command
+        """
+        command, stdout, stderr, return_value = \
+            run_local_job('/bin/bash; echo hello ; exit')
+        self.assertEqual(command, 'echo hello')
+        self.assertEqual(stdout, 'hello\n')
+        self.assertEqual(return_value, 0)
+
+
 class BufferedWriterTests(TestCase):
 
     def setUp(self):
@@ -31,7 +31,8 @@ from qiime.parse import (group_by_field, group_by_fields,
                          parse_taxa_summary_table, parse_prefs_file, parse_mapping_file_to_dict,
                          mapping_file_to_dict, MinimalQualParser, parse_denoiser_mapping,
                          parse_otu_map, parse_sample_id_map, parse_taxonomy_to_otu_metadata,
-                         is_casava_v180_or_later, MinimalSamParser)
+                         is_casava_v180_or_later, MinimalSamParser,
+                         parse_binary_distmat, is_binary_distmat)
 
 
 class TopLevelTests(TestCase):
@@ -315,6 +316,52 @@ c\t1\t3.5\t0
         self.assertEqual(obs[0], exp[0])
         assert_almost_equal(obs[1], exp[1])
 
+    def test_parse_binary_distmat(self):
+        """parse_binary_distmat should read binary distmat correctly"""
+        data = array([[0, 1, 2], [1, 0, 3.5], [2, 3.5, 0]])
+        # header is padded so that the distances are 8-byte aligned
+        binary = '\x93QIIME_DM\na\tb\tc \n' + data.astype('<f8').tostring()
+        fd, fp = mkstemp(prefix='test_parse_binary_distmat', suffix='.dm')
+        close(fd)
+        self.files_to_remove.append(fp)
+        open(fp, 'wb').write(binary)
+
+        # from a file on disk, opened as text or binary
+        for mode in 'U', 'rb':
+            dm_f = open(fp, mode)
+            self.assertTrue(is_binary_distmat(dm_f))
+            obs = parse_binary_distmat(dm_f)
+            self.assertEqual(obs[0], ['a', 'b', 'c'])
+            assert_almost_equal(obs[1], data)
+            # parse_distmat recognizes the format
+            dm_f.seek(0)
+            obs = parse_distmat(dm_f)
+            self.assertEqual(obs[0], ['a', 'b', 'c'])
+            assert_almost_equal(obs[1], data)
+            dm_f.close()
+
+        # from a file-like object
+        obs = parse_distmat(StringIO(binary))
+        self.assertEqual(obs[0], ['a', 'b', 'c'])
+        assert_almost_equal(obs[1], data)
+        self.assertEqual(parse_distmat_to_dict(StringIO(binary))['c']['b'],
+                         3.5)
+
+        # an empty matrix
+        obs = parse_binary_distmat(StringIO('\x93QIIME_DM\n      \n'))
+        self.assertEqual(obs[0], [])
+        self.assertEqual(obs[1].shape, (0, 0))
+
+        # text files and lines aren't binary distance matrices
+        self.assertFalse(is_binary_distmat(StringIO('\ta\tb\na\t0\t1\n')))
+        self.assertFalse(is_binary_distmat(['\ta\tb', 'a\t0\t1']))
+
+        # truncated files are rejected
+        open(fp, 'wb').write(binary[:-8])
+        self.assertRaises(ValueError, parse_binary_distmat, open(fp, 'U'))
+        self.assertRaises(ValueError, parse_binary_distmat,
+                          StringIO(binary[:-8]))
+
     def test_parse_distmat_to_dict(self):
         """parse_distmat should return dict of distmat"""
         lines = """\ta\tb\tc
@@ -29,12 +29,14 @@ from skbio.util.misc import create_dir, remove_files
 from brokit.formatdb import build_blast_db_from_fasta_path
 
 from qiime.util import load_qiime_config
+import qiime.pick_otus
 from qiime.pick_otus import (CdHitOtuPicker, OtuPicker,
                              MothurOtuPicker, PrefixSuffixOtuPicker, TrieOtuPicker, BlastOtuPicker,
                              expand_otu_map_seq_ids, map_otu_map_files, UclustOtuPicker,
                              UclustReferenceOtuPicker, expand_failures, UsearchOtuPicker,
                              UsearchReferenceOtuPicker, get_blast_hits, BlastxOtuPicker,
-                             Usearch610DeNovoOtuPicker, Usearch61ReferenceOtuPicker)
+                             Usearch610DeNovoOtuPicker, Usearch61ReferenceOtuPicker,
+                             SortedPrefixOtuPicker)
 
 
 class OtuPickerTests(TestCase):
@@ -72,6 +74,106 @@ class OtuPickerTests(TestCase):
         actual = p._prefilter_exact_matches(seqs)
         self.assertEqual(actual, expected)
 
+    def test_prefilter_with_trie(self):
+        """OtuPicker._prefilter_with_trie collapses prefixes onto longer seqs
+        """
+        fd, seqs_fp = mkstemp(prefix='OtuPickerTests', suffix='.fasta')
+        close(fd)
+        f = open(seqs_fp, 'w')
+        f.write('>s1 comment\nACGTAATGGT\n>s2\nACGTATTTTAATTTGGCATGGT\n'
+                '>s3\nACGTAAT\n>s4\nACGTA\n>s5\nATTTAATGGT\n'
+                '>s6\nATTTAAT\n>s7\nAAATAAAAA\n')
+        f.close()
+        p = OtuPicker({})
+        try:
+            filtered_seqs, mapping = p._prefilter_with_trie(seqs_fp)
+        finally:
+            remove_files([seqs_fp])
+        self.assertEqual(filtered_seqs, [('s1', 'ACGTAATGGT'),
+                                         ('s2', 'ACGTATTTTAATTTGGCATGGT'),
+                                         ('s5', 'ATTTAATGGT'),
+                                         ('s7', 'AAATAAAAA')])
+        self.assertEqual(mapping, {'s1': ['s3', 's4', 's1'],
+                                   's2': ['s2'],
+                                   's5': ['s6', 's5'],
+                                   's7': ['s7']})
+
+    def test_prefilter_exact_matches_on_disk(self):
+        """_prefilter_exact_matches_on_disk matches in-memory prefilter
+        """
+        seqs = [('s1 comment1', 'ACCTTGTTACTTT'),  # three copies
+                ('s2 comment2', 'ACCTTGTTACTTTC'),  # one copy
+                ('s3 comment3', 'ACCTTGTTACTTTCC'),  # two copies
+                ('s4 comment4', 'ACCTTGTTACTTT'),
+                ('s5 comment5', 'ACCTTGTTACTTTCC'),
+                ('s6 comment6', 'ACCTTGTTACTTT'),
+                ('s7', 'GGTTACA'),
+                ('s8', 'AAAAAAA'),
+                ('s9', 'GGTTACA')]
+        fd, seqs_fp = mkstemp(prefix='OtuPickerTests', suffix='.fasta')
+        close(fd)
+        fd, unique_seqs_fp = mkstemp(prefix='OtuPickerTests', suffix='.fasta')
+        close(fd)
+        f = open(seqs_fp, 'w')
+        f.write(''.join('>%s\n%s\n' % s for s in seqs))
+        f.close()
+
+        p = OtuPicker({})
+        expected_seqs, expected_map = p._prefilter_exact_matches(seqs)
+        expected_fasta = ''.join('>%s\n%s\n' % s for s in expected_seqs)
+        seq_id_map_key = qiime.pick_otus._seq_id_map_key
+        try:
+            # a tiny bucket size forces the sequences across several buckets,
+            # which are merged in several passes if few files may be open
+            for bucket_size, max_open_files, key_f in [
+                    (1, 256, seq_id_map_key),
+                    (1, 3, seq_id_map_key),
+                    (10, 3, seq_id_map_key),
+                    (1000000, 256, seq_id_map_key),
+                    # ids which share index keys
+                    (1, 256, lambda temp_seq_id: len(temp_seq_id) % 2)]:
+                qiime.pick_otus._seq_id_map_key = key_f
+                p.files_to_remove = []
+                actual_map = p._prefilter_exact_matches_on_disk(
+                    seqs_fp, unique_seqs_fp, bucket_size=bucket_size,
+                    max_open_files=max_open_files)
+                self.assertEqual(open(unique_seqs_fp).read(), expected_fasta)
+                self.assertEqual(len(actual_map), len(expected_map))
+                self.assertEqual(dict(actual_map.items()), expected_map)
+                self.assertEqual(actual_map.keys(),
+                                 [s[0] for s in expected_seqs])
+                for temp_seq_id, seq_ids in expected_map.items():
+                    self.assertEqual(actual_map[temp_seq_id], seq_ids)
+                self.assertTrue('QiimeExactMatch.s7' in actual_map)
+                self.assertFalse('QiimeExactMatch.s9' in actual_map)
+                self.assertRaises(KeyError, actual_map.__getitem__,
+                                  'QiimeExactMatch.s9')
+                # the map remains usable once its file has been removed
+                remove_files(p.files_to_remove)
+                self.assertEqual(
+                    p._map_filtered_clusters_to_full_clusters(
+                        [['QiimeExactMatch.s1', 'QiimeExactMatch.s8'],
+                         ['QiimeExactMatch.s3']], actual_map),
+                    [['s1', 's4', 's6', 's8'], ['s3', 's5']])
+                actual_map.close()
+                self.assertRaises(ValueError, actual_map.__getitem__,
+                                  'QiimeExactMatch.s1')
+
+            # an empty input
+            open(seqs_fp, 'w').close()
+            p.files_to_remove = []
+            actual_map = p._prefilter_exact_matches_on_disk(seqs_fp,
+                                                            unique_seqs_fp)
+            self.assertEqual(open(unique_seqs_fp).read(), '')
+            self.assertEqual(len(actual_map), 0)
+            self.assertEqual(actual_map.items(), [])
+            self.assertFalse('QiimeExactMatch.s1' in actual_map)
+            actual_map.close()
+            remove_files(p.files_to_remove)
+        finally:
+            qiime.pick_otus._seq_id_map_key = seq_id_map_key
+            remove_files([seqs_fp, unique_seqs_fp])
+
 
 class MothurOtuPickerTests(TestCase):
 
@@ -721,6 +823,50 @@ class TrieOtuPickerTests(TestCase):
         self.assertEqual(actual, expected)
 
 
+class SortedPrefixOtuPickerTests(TrieOtuPickerTests):
+
+    """ Tests of the sorted prefix OTU picker
+
+    Runs the TrieOtuPicker tests against SortedPrefixOtuPicker, and checks
+    that the two pickers agree, including on how ties are broken.
+    """
+
+    def setUp(self):
+        """
+        """
+        TrieOtuPickerTests.setUp(self)
+        self.otu_picker = SortedPrefixOtuPicker({})
+        self.otu_picker_rev = SortedPrefixOtuPicker({'Reverse': True})
+
+    def test_call_matches_trie(self):
+        """SortedPrefixOtuPicker output is identical to TrieOtuPicker
+        """
+        seqs = [('s1', 'AC'), ('s2', 'ACGT'), ('s3', 'ACTA'),
+                ('s4', 'ACG'), ('s5', 'C'), ('s6', 'GA'), ('s7', 'AC'),
+                ('s8', 'ACTAG'), ('s9', 'TT'), ('s10', 'G'), ('s11', 'GA'),
+                ('s12', 'ACTAC'), ('s13', 'ACTAC'), ('s14', 'T')]
+        seq_path = self.small_seq_path
+        f = open(seq_path, 'w')
+        f.write('\n'.join(['>%s\n%s' % s for s in seqs]))
+        f.close()
+        fd, exp_path = mkstemp(prefix='SortedPrefixOtuPickerTest_',
+                               suffix='.txt')
+        close(fd)
+        fd, obs_path = mkstemp(prefix='SortedPrefixOtuPickerTest_',
+                               suffix='.txt')
+        close(fd)
+        self._files_to_remove.extend([exp_path, obs_path])
+
+        TrieOtuPicker({})(seq_path, result_path=exp_path)
+        for jobs_to_start in [1, 2]:
+            otu_picker = SortedPrefixOtuPicker(
+                {'jobs_to_start': jobs_to_start})
+            self.assertEqual(otu_picker(seq_path),
+                             TrieOtuPicker({})(seq_path))
+            otu_picker(seq_path, result_path=obs_path)
+            self.assertEqual(open(obs_path).read(), open(exp_path).read())
+
+
 class Usearch610DeNovoOtuPickerTests(TestCase):
 
     """ Tests for usearch 6.1 de novo functionality """
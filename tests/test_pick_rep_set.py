@@ -20,6 +20,7 @@ from skbio.parse.sequences import parse_fasta
 from skbio.core.alignment import SequenceCollection
 from skbio.core.sequence import DNA
 
+from qiime.compact_otu_map import load_otu_map
 from qiime.pick_rep_set import (RepSetPicker, GenericRepSetPicker, first_id,
                                 first, random_id, longest_id, unique_id_map, label_to_name,
                                 make_most_abundant, parse_fasta, ReferenceRepSetPicker)
@@ -89,6 +90,28 @@ class GenericRepSetPickerTests(SharedSetupTestCase):
         obs = app(self.tmp_seq_filepath, self.tmp_otu_filepath)
         self.assertEqual(obs, exp)
 
+    def test_call_compact_otu_map(self):
+        """GenericRepSetPicker.__call__ accepts a compact OTU map"""
+        exp = {'0': 'R27DLI_4812',
+               '1': 'U1PLI_7889',
+               '2': 'W3Cecum_4858',
+               '3': 'R27DLI_3243',
+               }
+        app = GenericRepSetPicker(params={'Algorithm': 'first',
+                                          'ChoiceF': first_id})
+        otu_map = load_otu_map(self.tmp_otu_filepath)
+        self.assertEqual(app(self.tmp_seq_filepath, otu_map), exp)
+
+        # and the binary compact OTU map file
+        fd, compact_otu_fp = mkstemp(prefix='GenericRepSetPickerTest_',
+                                     suffix='.otu.bin')
+        close(fd)
+        self.files_to_remove.append(compact_otu_fp)
+        compact_otu_f = open(compact_otu_fp, 'wb')
+        otu_map.save(compact_otu_f)
+        compact_otu_f.close()
+        self.assertEqual(app(self.tmp_seq_filepath, compact_otu_fp), exp)
+
     def test_call_wrapped_function(self):
         """GenericRepSetPicker.__call__ returns expected clusters default params"""
 
@@ -10,14 +10,16 @@ from qiime.pycogent_backports.test import (tail, likelihoods,
                                            multiple_comparisons, multiple_inverse, multiple_n, fisher, regress,
                                            regress_major, f_value, f_two_sample, MonteCarloP,
                                            regress_residuals, safe_sum_p_log_p, regress_origin, stdev_from_mean,
-                                           regress_R2, permute_2d, mantel, mantel_test, _flatten_lower_triangle,
+                                           regress_R2, permute_2d, mantel, mantel_test, mantel_stats, mantel_class_stats, _flatten_lower_triangle,
                                            pearson, spearman, std, median,
                                            get_values_from_matrix, get_ltm_cells, distance_matrix_permutation_test,
                                            ANOVA_one_way, mw_test, mw_boot, is_symmetric_and_hollow)
 from numpy import (array, concatenate, fill_diagonal, reshape, arange, matrix,
-                   ones, testing, tril, cov, sqrt, nan, corrcoef, e, log)
-from numpy.random import seed
+                   ones, testing, tril, cov, sqrt, nan, corrcoef, e, log,
+                   isnan, zeros)
+from numpy.random import permutation, rand, seed
 import math
+import qiime.pycogent_backports.test as stats_test
 # G Test related imports
 from qiime.pycogent_backports.test import (williams_correction, G_stat, G_fit)
 from qiime.pycogent_backports.test import (G_2_by_2, safe_sum_p_log_p, G_ind)
@@ -1054,6 +1056,68 @@ class CorrelationTests(TestsHelper):
         self.assertRaises(ValueError, mantel_test, array([[1]]),
                           array([[1]]), -1)
 
+    def test_mantel_stats(self):
+        """mantel_stats should correlate the permutations of m1 and others"""
+        ms = []
+        for i in range(3):
+            m = rand(20, 20)
+            m = m + m.T
+            fill_diagonal(m, 0)
+            ms.append(m)
+        others_flat = [_flatten_lower_triangle(m) for m in ms[1:]]
+
+        # Gather the permuted matrices a few rows at a time.
+        row_block_entries = stats_test._MANTEL_ROW_BLOCK_ENTRIES
+        stats_test._MANTEL_ROW_BLOCK_ENTRIES = 50
+        try:
+            seed(0)
+            orig_stats, perm_stats = mantel_stats(ms[0], ms[1:], 10)
+            seed(0)
+            jobs_orig_stats, jobs_perm_stats = mantel_stats(
+                ms[0], ms[1:], 10, jobs_to_start=2)
+        finally:
+            stats_test._MANTEL_ROW_BLOCK_ENTRIES = row_block_entries
+
+        m1_flat = _flatten_lower_triangle(ms[0])
+        self.assertFloatEqual(orig_stats, [pearson(m1_flat, m_flat)
+                                           for m_flat in others_flat])
+        self.assertEqual(perm_stats.shape, (10, 2))
+        seed(0)
+        for stats in perm_stats:
+            perm_flat = _flatten_lower_triangle(permute_2d(ms[0],
+                                                           permutation(20)))
+            self.assertFloatEqual(stats, [pearson(perm_flat, m_flat)
+                                          for m_flat in others_flat])
+        # The permutations don't depend on the number of processes.
+        testing.assert_array_equal(jobs_orig_stats, orig_stats)
+        testing.assert_array_equal(jobs_perm_stats, perm_stats)
+
+        self.assertRaises(ValueError, mantel_stats, array([[0, 1], [1, 0]]),
+                          [array([[0, 2], [2, 0]])], 10)
+
+    def test_mantel_class_stats(self):
+        """mantel_class_stats should correlate m1 with each class's model"""
+        m1 = rand(8, 8)
+        m1 = m1 + m1.T
+        fill_diagonal(m1, 0)
+        classes = (m1 * 3).astype(int)
+        fill_diagonal(classes, -1)
+        # the pairs in classes above 2 are in none of the three classes
+        models = [(classes == i).astype(float) for i in range(3)]
+
+        seed(0)
+        obs_orig, obs_perms = mantel_class_stats(m1, classes, 3, 5)
+        seed(0)
+        exp_orig, exp_perms = mantel_stats(m1, models, 5)
+        self.assertFloatEqual(obs_orig, exp_orig)
+        self.assertFloatEqual(obs_perms, exp_perms)
+
+        # a class which holds none or all of the pairs has no correlation
+        obs_orig, obs_perms = mantel_class_stats(m1, zeros((8, 8)), 2, 3)
+        self.assertTrue(isnan(obs_orig).all())
+        self.assertEqual(obs_perms.shape, (3, 2))
+        self.assertTrue(isnan(obs_perms).all())
+
     def test_is_symmetric_and_hollow(self):
         """Should correctly test for symmetry and hollowness of dist mats."""
         self.assertTrue(is_symmetric_and_hollow(array([[0, 1], [1, 0]])))
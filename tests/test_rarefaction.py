@@ -19,10 +19,12 @@ from unittest import TestCase, main
 
 from numpy.testing import assert_almost_equal
 import numpy
+from numpy.random import RandomState
 from biom.table import table_factory, TableException
 from biom.parse import parse_biom_table
 
-from qiime.rarefaction import RarefactionMaker, get_rare_data
+from qiime.rarefaction import (RarefactionMaker, get_rare_data,
+                               nested_subsample, iter_nested_rare_data)
 from qiime.util import load_qiime_config
 from qiime.format import format_biom_table
 
@@ -170,5 +172,115 @@ class FunctionTests(TestCase):
                        for (val, otu_id, meta) in rare_otu_table.iterObservations()]
         self.assertEqual(rare_values, [1.0, 5.0, 3.0, 2.0])
 
+    def test_nested_subsample(self):
+        """nested_subsample should give nested rarefactions to each depth"""
+        counts = numpy.array([5, 0, 3, 2, 10])
+        depths = [0, 1, 5, 5, 12, 20]
+        for replace in False, True:
+            obs = nested_subsample(counts, depths, 4, RandomState(0),
+                                   replace=replace)
+            self.assertEqual(obs.shape, (4, 6, 5))
+            self.assertEqual(obs.sum(2).tolist(), [depths] * 4)
+            # each depth extends the previous one
+            self.assertTrue((obs[:, 1:] >= obs[:, :-1]).all())
+            # OTUs which aren't in the sample are never drawn
+            self.assertEqual(obs[:, :, 1].tolist(), [[0] * 6] * 4)
+            if not replace:
+                self.assertTrue((obs <= counts).all())
+                # all of the sequences were drawn at the deepest depth
+                self.assertEqual(obs[:, -1].tolist(), [counts.tolist()] * 4)
+
+        # the draws only depend on the random number generator
+        self.assertEqual(
+            nested_subsample(counts, depths, 2, RandomState(1)).tolist(),
+            nested_subsample(counts, depths, 2, RandomState(1)).tolist())
+
+    def test_nested_subsample_distribution(self):
+        """nested_subsample should draw each depth uniformly"""
+        counts = numpy.array([5, 0, 3, 2, 10])
+        for replace in False, True:
+            obs = nested_subsample(counts, [4, 7], 10000, RandomState(2),
+                                   replace=replace)
+            assert_almost_equal(obs.mean(0) / 10,
+                                [counts * 0.4 / 20, counts * 0.7 / 20],
+                                decimal=2)
+
+    def test_nested_subsample_invalid(self):
+        """nested_subsample should reject invalid depths"""
+        counts = numpy.array([5, 0, 3, 2, 10])
+        self.assertRaises(ValueError, nested_subsample, counts, [21])
+        self.assertRaises(ValueError, nested_subsample, counts, [5, 2])
+        self.assertRaises(ValueError, nested_subsample, counts, [-1, 2])
+        self.assertRaises(ValueError, nested_subsample, [[1, 2]], [1])
+
+    def test_iter_nested_rare_data(self):
+        """iter_nested_rare_data should rarefy each rep and depth"""
+        obs = list(iter_nested_rare_data(self.otu_table, [3, 1, 11, 50], 2,
+                                         seed=0))
+        # depths greater than every sample are skipped
+        self.assertEqual([(depth, rep) for depth, rep, table in obs],
+                         [(1, 0), (3, 0), (11, 0), (1, 1), (3, 1), (11, 1)])
+        for depth, rep, table in obs:
+            # as for get_rare_data, small samples are removed
+            exp_samples = ('X',) if depth == 11 else ('Y', 'X')
+            self.assertEqual(table.SampleIds, exp_samples)
+            self.assertEqual(table.ObservationIds,
+                             self.otu_table.ObservationIds)
+            for sample_v in table.iterSampleData():
+                self.assertEqual(sample_v.sum(), depth)
+        # the rarefied tables of a rep are nested
+        for i in range(2):
+            small, large = obs[i][2], obs[i + 1][2]
+            for sample_id in large.SampleIds:
+                self.assertTrue((small.sampleData(sample_id) <=
+                                 large.sampleData(sample_id)).all())
+
+        # small samples are kept unchanged if requested
+        obs = list(iter_nested_rare_data(self.otu_table, [3, 50], 1,
+                                         include_small_samples=True, seed=0))
+        self.assertEqual([table.SampleIds for depth, rep, table in obs],
+                         [('Y', 'X', 'Z')] * 2)
+        self.assertEqual(obs[1][2], self.otu_table)
+
+    def test_iter_nested_rare_data_seed(self):
+        """iter_nested_rare_data should be reproducible from a seed"""
+        exp = list(iter_nested_rare_data(self.otu_table, [1, 2, 3], 3,
+                                         replace=True, seed=42))
+        obs = list(iter_nested_rare_data(self.otu_table, [1, 2, 3], 3,
+                                         replace=True, seed=42,
+                                         jobs_to_start=2))
+        self.assertEqual(obs, exp)
+        numpy.random.seed(0)
+        exp = list(iter_nested_rare_data(self.otu_table, [1, 2, 3], 3))
+        numpy.random.seed(0)
+        obs = list(iter_nested_rare_data(self.otu_table, [1, 2, 3], 3))
+        self.assertEqual(obs, exp)
+
+    def test_nested_rarefy_to_files(self):
+        """nested_rarefy_to_files should write the same files as
+        rarefy_to_files
+
+        """
+        maker = RarefactionMaker(self.otu_table_meta_fp, 0, 11, 1, 2)
+        maker.nested_rarefy_to_files(
+            self.rare_dir,
+            include_full=True,
+            include_lineages=False,
+            seed=0)
+
+        exp_fnames = ["rarefaction_%d_%d.biom" % (depth, rep)
+                      for depth in range(12) for rep in range(2)]
+        exp_fnames.append("rarefaction_full_0.biom")
+        self.assertItemsEqual(os.listdir(self.rare_dir), exp_fnames)
+        otu_table = parse_biom_table(
+            open(os.path.join(self.rare_dir, "rarefaction_1_0.biom"), 'U'))
+        # third sample had 0 seqs, so it's gone
+        self.assertItemsEqual(
+            otu_table.SampleIds,
+            self.otu_table.SampleIds[:2])
+        self.assertItemsEqual(
+            otu_table.ObservationIds,
+            self.otu_table.ObservationIds)
+
 if __name__ == '__main__':
     main()
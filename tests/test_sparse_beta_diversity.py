@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+from __future__ import division
+
+__author__ = "Justin Kuczynski"
+__copyright__ = "Copyright 2011, The QIIME Project"
+__credits__ = ["Justin Kuczynski", "Greg Caporaso"]
+__license__ = "GPL"
+__version__ = "1.8.0-dev"
+__maintainer__ = "Justin Kuczynski"
+__email__ = "justinak@gmail.com"
+
+from unittest import TestCase, main
+
+from numpy import array
+from numpy.testing import assert_almost_equal
+import cogent.maths.distance_transform as distance_transform
+from biom.table import table_factory, SparseOTUTable, DenseOTUTable
+
+from qiime.sparse_beta_diversity import (SampleVectors, sparse_beta,
+                                         multiple_sparse_beta,
+                                         iter_sparse_beta_rows,
+                                         is_sparse_beta_metric,
+                                         sparse_beta_metrics,
+                                         get_tile_size)
+
+
+class SparseBetaDiversityTests(TestCase):
+
+    def setUp(self):
+        # samples x observations, including an empty sample and a sample
+        # with non-integer values
+        self.data = array([[0, 1, 0, 0, 5, 0],
+                           [2, 0, 0, 0, 3, 0],
+                           [0, 0, 0, 0, 0, 0],
+                           [0, 0, 7, 1, 0, 0],
+                           [1, 1, 1, 1, 1, 0],
+                           [0.5, 0, 0, 2.5, 0, 0],
+                           [2, 0, 0, 0, 3, 0]])
+        self.sample_ids = ['s%d' % i for i in range(len(self.data))]
+        self.observation_ids = ['o%d' % i for i in range(self.data.shape[1])]
+
+    def _get_table(self, constructor=SparseOTUTable):
+        return table_factory(self.data.T, self.sample_ids,
+                             self.observation_ids, constructor=constructor)
+
+    def test_sample_vectors_from_table(self):
+        """SampleVectors holds the nonzero values of each sample"""
+        for constructor in [SparseOTUTable, DenseOTUTable]:
+            sv = SampleVectors.from_table(self._get_table(constructor))
+            self.assertEqual(len(sv), 7)
+            self.assertEqual(sv.num_observations, 6)
+            self.assertEqual(list(sv.offsets), [0, 2, 4, 4, 6, 11, 13, 15])
+            self.assertEqual(list(sv.indices[:4]), [1, 4, 0, 4])
+            self.assertEqual(list(sv.values[:4]), [1, 5, 2, 3])
+            assert_almost_equal(sv.get_dense_tile([3, 0]),
+                                array([[0, 7, 1, 0], [1, 0, 0, 5]]))
+
+    def test_sparse_beta(self):
+        """sparse_beta matches the dense cogent metrics"""
+        sv = SampleVectors.from_table(self._get_table())
+        for metric_f in sparse_beta_metrics:
+            expected = metric_f(self.data)
+            for tile_size in [1, 3, 7, 100]:
+                assert_almost_equal(sparse_beta(sv, metric_f, tile_size),
+                                    expected)
+        # several processes give the same result
+        assert_almost_equal(
+            sparse_beta(sv, distance_transform.dist_bray_curtis, 2, 3),
+            distance_transform.dist_bray_curtis(self.data))
+
+    def test_multiple_sparse_beta(self):
+        """multiple_sparse_beta computes all metrics in one pass"""
+        sv = SampleVectors.from_table(self._get_table())
+        metric_fs = sparse_beta_metrics.keys()
+        for tile_size, jobs_to_start in [(1, 1), (3, 1), (100, 1), (2, 3)]:
+            obs = multiple_sparse_beta(sv, metric_fs, tile_size,
+                                       jobs_to_start)
+            self.assertEqual(len(obs), len(metric_fs))
+            for metric_f, dists in zip(metric_fs, obs):
+                assert_almost_equal(dists, metric_f(self.data))
+        # the values are checked for each metric
+        negative = SampleVectors([0, 1], [0], [-1.0], 1)
+        self.assertRaises(ValueError, multiple_sparse_beta, negative,
+                          [distance_transform.dist_euclidean,
+                           distance_transform.dist_bray_curtis])
+
+    def test_iter_sparse_beta_rows(self):
+        """iter_sparse_beta_rows generates each row in order"""
+        sv = SampleVectors.from_table(self._get_table())
+        expected = distance_transform.dist_canberra(self.data)
+        rows = list(iter_sparse_beta_rows(
+            sv, distance_transform.dist_canberra, tile_size=3))
+        self.assertEqual([i for i, row in rows], range(7))
+        for i, row in rows:
+            assert_almost_equal(row, expected[i])
+
+    def test_iter_sparse_beta_rows_invalid(self):
+        """iter_sparse_beta_rows raises ValueError on invalid input"""
+        sv = SampleVectors.from_table(self._get_table())
+        self.assertRaises(ValueError, iter_sparse_beta_rows, sv,
+                          distance_transform.dist_chisq)
+        self.data[1, 1] = -1
+        sv = SampleVectors.from_table(self._get_table())
+        self.assertRaises(ValueError, iter_sparse_beta_rows, sv,
+                          distance_transform.dist_bray_curtis)
+        # euclidean allows negative values
+        assert_almost_equal(
+            sparse_beta(sv, distance_transform.dist_euclidean),
+            distance_transform.dist_euclidean(self.data))
+
+    def test_get_tile_size(self):
+        """get_tile_size bounds the number of values in each tile"""
+        sv = SampleVectors.from_table(self._get_table())
+        # few observations, so tiles can have many samples
+        self.assertEqual(get_tile_size(sv), 1024)
+        self.assertEqual(get_tile_size(sv, max_tile_elements=96), 16)
+        self.assertEqual(get_tile_size(sv, max_tile_elements=1), 8)
+
+    def test_is_sparse_beta_metric(self):
+        """is_sparse_beta_metric excludes metrics using other samples"""
+        self.assertTrue(
+            is_sparse_beta_metric(distance_transform.dist_bray_curtis))
+        self.assertTrue(
+            is_sparse_beta_metric(distance_transform.binary_dist_jaccard))
+        self.assertFalse(is_sparse_beta_metric(distance_transform.dist_chisq))
+        self.assertFalse(is_sparse_beta_metric(distance_transform.dist_gower))
+        self.assertFalse(
+            is_sparse_beta_metric(distance_transform.dist_pearson))
+
+
+if __name__ == "__main__":
+    main()
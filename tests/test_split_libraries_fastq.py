@@ -16,6 +16,7 @@ from unittest import TestCase, main
 from qiime.split_libraries_fastq import (
     process_fastq_single_end_read_file,
     quality_filter_sequence,
+    quality_filter_sequences,
     bad_chars_from_threshold,
     get_illumina_qual_chars,
     quality_filter_sequence,
@@ -204,6 +205,56 @@ class SplitLibrariesFastqTests(TestCase):
                                                 histogram_f=histogram))
         self.assertTrue(histogram.s.startswith("Length"))
 
+    def test_process_fastq_single_end_read_file_jobs_to_start(self):
+        """process_fastq_single_end_read_file w multiple jobs matches serial run
+        """
+        serial_log = FakeFile()
+        serial_histogram = FakeFile()
+        expected = list(process_fastq_single_end_read_file(
+            self.fastq1,
+            self.barcode_fastq1,
+            self.barcode_map1,
+            min_per_read_length_fraction=0.45,
+            start_seq_id=42,
+            log_f=serial_log,
+            histogram_f=serial_histogram))
+
+        # small chunks so records are spread across several workers
+        parallel_log = FakeFile()
+        parallel_histogram = FakeFile()
+        actual = list(process_fastq_single_end_read_file(
+            self.fastq1,
+            self.barcode_fastq1,
+            self.barcode_map1,
+            min_per_read_length_fraction=0.45,
+            start_seq_id=42,
+            log_f=parallel_log,
+            histogram_f=parallel_histogram,
+            jobs_to_start=2,
+            chunk_size=3))
+
+        self.assertEqual(len(actual), len(expected))
+        for i in range(len(expected)):
+            np.testing.assert_equal(actual[i], expected[i])
+        self.assertEqual(actual[0][3], 42)
+        self.assertEqual(parallel_log.s, serial_log.s)
+        self.assertEqual(parallel_histogram.s, serial_histogram.s)
+
+    def test_process_fastq_single_end_read_file_chunk_size(self):
+        """process_fastq_single_end_read_file result is independent of chunk_size
+        """
+        for chunk_size in (1, 4, 1000):
+            actual = list(process_fastq_single_end_read_file(
+                self.fastq1,
+                self.barcode_fastq1,
+                self.barcode_map1,
+                min_per_read_length_fraction=0.45,
+                chunk_size=chunk_size))
+            expected = self.fastq1_expected_default
+            self.assertEqual(len(actual), len(expected))
+            for i in range(len(expected)):
+                np.testing.assert_equal(actual[i], expected[i])
+
     def test_check_header_match_pre180(self):
         """check_header_match_pre180 functions as expected with varied input """
 
@@ -1015,6 +1066,54 @@ class SplitLibrariesFastqTests(TestCase):
                     _ascii_to_phred64("bbbbbbbbbbbbbbbbbbbbbbbbbY``\`bbbbbbbbbbbbb`bbbbab`a`_[ba_aa]b^_bIWTTQ^YR^"))
         np.testing.assert_equal(actual, expected)
 
+    def test_quality_filter_sequences(self):
+        """quality_filter_sequences matches quality_filter_sequence per read
+        """
+        headers = ["990:2:4:11271:5323#1/1",
+                   "990:2:4:11271:5324#0/1",
+                   "990:2:4:11271:5325#1/1",
+                   "990:2:4:11271:5326#1/1",
+                   "990:2:4:11271:5327#1/1"]
+        sequences = [
+            "GCACTCACCGCCCGTCACACCACGAAAGTTGGTAACACCCGAAGCCGGTGAGATAACCTTTTAGGAGTCAGCTGTN",
+            "GCACTCACCGCCCGTCACACCACGAAAGTNGGTAACACCCGAAGCCGGTGAGATAACCTTTTAGGAGTCAGCTGTC",
+            "GCACTCACCGCCCGTCACACCACGAAAGTNGGTAACACCCGAAGCCGGTGAGATAACCTTTTAGGAGTCAGCTGTC",
+            "GCACTCACCGCCCGTCAC",
+            ""]
+        qualities = [
+            _ascii_to_phred64("bbbbbbbbbbbbbbbbbbbbbbbbbY``\`bbbbbbbbbbbbb`bbbbab`a`_[ba_aa]b^_bIWTTQ^YR^B`"),
+            _ascii_to_phred64("bbbbbbbbbbbbbbbbbbbbbbbbbY``\`bbbbbbbbbbbbb`bbbbab`a`_[ba_aa]b^_bIWTTQ^YR^U`"),
+            _ascii_to_phred64("bbbbbbbbbbbbbbbbbbBBbbbbbY``\`bbbbbbbbbbbbb`bbbbab`a`_[ba_aa]b^_bIWTTQ^YR^U`"),
+            _ascii_to_phred64("bbbbbbbbbbbbbbbbBB"),
+            _ascii_to_phred64("")]
+
+        # the whole batch, and batches in which every read is empty
+        batches = [(headers, sequences, qualities),
+                   (headers[-1:], sequences[-1:], qualities[-1:]),
+                   (headers[:2], sequences[-1:] * 2, qualities[-1:] * 2)]
+        params_choices = [(max_bad_run_length, phred_quality_threshold,
+                           min_per_read_length, seq_max_N,
+                           filter_bad_illumina_qual_digit)
+                          for max_bad_run_length in (0, 1, 2)
+                          for phred_quality_threshold in (None, 2, 30)
+                          for min_per_read_length in (0, 10)
+                          for seq_max_N in (0, 1)
+                          for filter_bad_illumina_qual_digit in (True, False)]
+        for batch_headers, batch_sequences, batch_qualities in batches:
+            for params in params_choices:
+                actual = quality_filter_sequences(
+                    batch_headers, batch_sequences, batch_qualities, *params)
+                expected = [quality_filter_sequence(h, s, q, *params)
+                            for h, s, q in zip(batch_headers, batch_sequences,
+                                               batch_qualities)]
+                self.assertEqual(len(actual), len(expected))
+                for a, e in zip(actual, expected):
+                    np.testing.assert_equal(a, e)
+
+        # empty input
+        self.assertEqual(quality_filter_sequences(
+            [], [], [], 0, 2, 10, 0, False), [])
+
 barcode_map1 = {'AAAAAAAAAAAA': 's1',
                 'AAAAAAAAAAAC': 's2',
                 'AAAAAAAAAAAG': 's3',
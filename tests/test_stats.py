@@ -31,8 +31,9 @@ from qiime.stats import (all_pairs_t_test, _perform_pairwise_tests,
                          Anosim, Best, CategoryStats, CorrelationStats,
                          DistanceMatrixStats, MantelCorrelogram, Mantel,
                          PartialMantel, Permanova, quantile, _quantile,
-                         paired_difference_analyses)
+                         paired_difference_analyses, _within_group_sums)
 from qiime.util import MetadataMap, get_qiime_temp_dir
+from qiime.pycogent_backports.test import pearson, permute_2d
 
 class TestHelper(TestCase):
     """Helper class that instantiates some commonly-used objects.
@@ -790,6 +791,33 @@ class AnosimTests(TestHelper):
         assert_almost_equal(obs['r_value'], exp['r_value'])
         assert_almost_equal(obs['p_value'], exp['p_value'])
 
+    def test_call_matches_anosim(self):
+        """__call__() should compare to the R values of the permutations."""
+        nrs = NonRandomShuffler()
+        self.anosim_overview.RandomFunction = nrs.permutation
+        obs = self.anosim_overview(5)
+
+        # Roll the grouping as the shuffler does, computing R each time.
+        samples = self.overview_dm.ids
+        groups = [self.overview_map.getCategoryValue(samp_id, 'Treatment')
+                  for samp_id in samples]
+        r_stat = self.anosim_overview._anosim(dict(zip(samples, groups)))
+        assert_almost_equal(obs['r_value'], r_stat)
+        num_at_least = 0
+        for i in range(5):
+            groups = roll(groups, i)
+            num_at_least += self.anosim_overview._anosim(
+                dict(zip(samples, groups))) >= r_stat
+        assert_almost_equal(obs['p_value'], (num_at_least + 1) / 6)
+
+    def test_call_jobs(self):
+        """__call__() should give the same result in multiple processes."""
+        np.random.seed(0)
+        exp = self.anosim_overview(99)
+        np.random.seed(0)
+        obs = self.anosim_overview(99, jobs_to_start=2)
+        self.assertEqual(obs, exp)
+
 
 class PermanovaTests(TestHelper):
 
@@ -942,6 +970,45 @@ class PermanovaTests(TestHelper):
         assert_almost_equal(obs['f_value'], exp['f_value'])
         self.assertCorrectPValue(0.005, 0.07, self.permanova_overview, 50)
 
+    def test_call_matches_permanova(self):
+        """__call__() should compare to the F values of the permutations."""
+        nrs = NonRandomShuffler()
+        self.permanova_uneven.RandomFunction = nrs.permutation
+        obs = self.permanova_uneven(4)
+
+        samples = self.distmtx_uneven.ids
+        groups = [self.map_uneven[samp_id] for samp_id in samples]
+        f_stat = self.permanova_uneven._permanova(self.map_uneven)
+        assert_almost_equal(obs['f_value'], f_stat)
+        perm_stats = []
+        for i in range(4):
+            groups = roll(groups, i)
+            perm_stats.append(self.permanova_uneven._permanova(
+                dict(zip(samples, groups))))
+        # The first roll is by 0, which gives the original grouping.
+        assert_almost_equal(perm_stats[0], f_stat)
+        num_at_least = sum([perm_stat >= f_stat - 1e-8
+                            for perm_stat in perm_stats])
+        assert_almost_equal(obs['p_value'], (num_at_least + 1) / 5)
+
+    def test_call_jobs(self):
+        """__call__() should give the same result in multiple processes."""
+        np.random.seed(0)
+        exp = self.permanova_overview(99)
+        np.random.seed(0)
+        obs = self.permanova_overview(99, jobs_to_start=2)
+        self.assertEqual(obs, exp)
+
+    def test_within_group_sums(self):
+        """Should sum over the pairs of samples in each group."""
+        matrix = self.distmtx_uneven.data
+        groupings = array([[0, 0, 1, 2, 2],
+                           [1, 0, 1, 0, 0]])
+        obs = _within_group_sums(matrix, groupings, 3)
+        # 0: sam1-sam2, 1: none, 2: sam4-sam5
+        # 0: sam2-sam4, sam2-sam5, sam4-sam5, 1: sam1-sam3, 2: none
+        assert_almost_equal(obs, [[3, 0, 2], [7, 7, 0]])
+
     def test_call_incompatible_data(self):
         """Should fail on incompatible mdmap/dm combo and bad perms."""
         self.assertRaises(ValueError, self.permanova_plain, -1)
@@ -1098,6 +1165,27 @@ class BestTests(TestHelper):
         # we expect to be there are the same
         self.assertTrue(set(exp.keys()) == set(obs.keys()))
 
+    def test_call_jobs(self):
+        """Test that Best gives the same result in multiple processes."""
+        self.assertEqual(self.best(jobs_to_start=2), self.best())
+
+    def test_call_stepwise(self):
+        """Test that the stepwise search adds one category at a time."""
+        obs = self.best(stepwise=True)
+        exp = [(0.75, '8'), (0.4357142857142857, '1,8'),
+               (0.5107142857142857, '1,8,11'),
+               (0.47857142857142854, '1,6,8,11')]
+        for i, j in zip(exp, obs['rho_vals']):
+            assert_almost_equal(i[0], j[0])
+            self.assertEqual(i[1], j[1])
+        self.assertEqual(len(obs['rho_vals']), 11)
+        combos = [set(combo.split(',')) for r, combo in obs['rho_vals']]
+        for combo, next_combo in zip(combos, combos[1:]):
+            self.assertEqual(len(next_combo - combo), 1)
+            self.assertTrue(combo < next_combo)
+        self.assertEqual(obs['rho_vals'][-1], self.best()['rho_vals'][-1])
+        self.assertEqual(self.best(jobs_to_start=2, stepwise=True), obs)
+
 
 class MantelCorrelogramTests(TestHelper):
     """Tests for the MantelCorrelogram class."""
@@ -1253,6 +1341,39 @@ class MantelCorrelogramTests(TestHelper):
                 break
         self.assertTrue(found_match)
 
+    def test_call_shared_permutations(self):
+        """Test that each distance class is tested on the same permutations."""
+        np.random.seed(0)
+        obs = self.mc(20)
+
+        eco_dm, geo_dm = self.mc.DistanceMatrices
+        dist_class_matrix = self.mc._find_distance_classes(geo_dm, 7)[0]
+        eco_flat = eco_dm.condensed_form()
+        np.random.seed(0)
+        perm_flats = [DistanceMatrix(permute_2d(eco_dm.data, permutation(9)),
+                                     eco_dm.ids).condensed_form()
+                      for i in range(20)]
+        for class_num in range(3):
+            model_flat = DistanceMatrix(
+                (dist_class_matrix == class_num).astype(int),
+                geo_dm.ids).condensed_form()
+            r = pearson(model_flat, eco_flat)
+            assert_almost_equal(obs['mantel_r'][class_num], -r)
+            perm_rs = array([pearson(model_flat, perm_flat)
+                             for perm_flat in perm_flats])
+            if r < 0:
+                num_at_least = (perm_rs <= r + 1e-8).sum()
+            else:
+                num_at_least = (perm_rs >= r - 1e-8).sum()
+            assert_almost_equal(obs['mantel_p'][class_num],
+                                (num_at_least + 1) / 21)
+
+        # The permutations don't depend on the number of processes.
+        np.random.seed(0)
+        jobs_obs = self.mc(20, jobs_to_start=2)
+        self.assertEqual(jobs_obs['mantel_r'], obs['mantel_r'])
+        self.assertEqual(jobs_obs['mantel_p'], obs['mantel_p'])
+
     def test_find_distance_classes(self):
         """Test finding the distance classes a matrix's elements are in."""
         exp = (array([[-1, 0, 1], [0, -1, 2], [1, 2, -1]]),
@@ -1276,6 +1397,23 @@ class MantelCorrelogramTests(TestHelper):
             self.mc.DistanceMatrices[1], 8)
         self.compare_multiple_level_array(obs, exp)
 
+    def test_find_distance_classes_past_last_break_point(self):
+        """Test that distances past the last breakpoint are in the last class.
+        """
+        find_break_points = self.small_mc._find_break_points
+
+        def find_short_break_points(start, end, num_classes):
+            # as if the last breakpoint were rounded down
+            break_points = find_break_points(start, end, num_classes)
+            break_points[-1] -= 1e-10
+            return break_points
+        self.small_mc._find_break_points = find_short_break_points
+        exp = (array([[-1, 0, 1], [0, -1, 2], [1, 2, -1]]),
+               [3.0, 5.0, 7.0])
+        obs = self.small_mc._find_distance_classes(
+            self.small_mc.DistanceMatrices[1], 3)
+        self.compare_multiple_level_array(obs, exp)
+
     def test_find_distance_classes_variable_size_bins(self):
         """Test finding distance classes with variable-size bins."""
         # Single distance class.
@@ -1588,7 +1726,10 @@ class PartialMantelTests(TestHelper):
 
         exp_mantel_r = 0.99999999999999734
         assert_almost_equal(obs['mantel_r'], exp_mantel_r)
-        self.assertCorrectPValue(0.25, 0.4, self.small_pm_diff,
+        # The statistic of three samples is always 1 or -1, and it is 1 for
+        # three of the six permutations (up to rounding error, which is
+        # allowed for), so the p-value should be close to 0.5.
+        self.assertCorrectPValue(0.4, 0.6, self.small_pm_diff,
                                  p_val_key='mantel_p')
 
         obs = self.small_pm_diff2()
@@ -1600,6 +1741,29 @@ class PartialMantelTests(TestHelper):
         self.assertCorrectPValue(0.8, 1.0, self.small_pm_diff2,
                                  p_val_key='mantel_p')
 
+    def test_call_matches_permutations(self):
+        """Test that the p-value counts the permutations of the first dm."""
+        np.random.seed(0)
+        obs = self.small_pm_diff2(20)
+
+        dm1, dm2, cdm = self.small_pm_diff2.DistanceMatrices
+        corr = lambda rxy, rxz, ryz: ((rxy - rxz * ryz) /
+                                      np.sqrt((1 - rxz ** 2) * (1 - ryz ** 2)))
+        rval3 = pearson(dm2.condensed_form(), cdm.condensed_form())
+        np.random.seed(0)
+        num_at_least = 0
+        for i in range(20):
+            perm_flat = DistanceMatrix(
+                permute_2d(dm1.data, permutation(5)), dm1.ids).condensed_form()
+            perm_stat = corr(pearson(perm_flat, dm2.condensed_form()),
+                             pearson(perm_flat, cdm.condensed_form()), rval3)
+            num_at_least += perm_stat >= obs['mantel_r']
+        assert_almost_equal(obs['mantel_p'], (num_at_least + 1) / 21)
+
+        # The permutations don't depend on the number of processes.
+        np.random.seed(0)
+        self.assertEqual(self.small_pm_diff2(20, jobs_to_start=2), obs)
+
 
 class TopLevelTests(TestHelper):
 
@@ -10,13 +10,18 @@ __version__ = "1.8.0-dev"
 __maintainer__ = "Greg Caporaso"
 __email__ = "gregcaporaso@gmail.com"
 
+from os import listdir
+from shutil import rmtree
+from tempfile import mkdtemp
 from numpy import array
 from unittest import TestCase, main
 from numpy.testing import assert_almost_equal
+from cogent.cluster.procrustes import procrustes
 from qiime.parse import parse_coords
 from qiime.transform_coordinate_matrices import map_sample_ids, reorder_coords,\
     filter_coords_matrix, pad_coords_matrix, pad_coords_matrices,\
-    get_procrustes_results, procrustes_monte_carlo
+    get_procrustes_results, procrustes_monte_carlo, standardize_coords,\
+    procrustes_m_squareds, get_trial_permutations
 
 
 class ProcrustesTests(TestCase):
@@ -229,6 +234,78 @@ class ProcrustesTests(TestCase):
         self.assertEqual(actual[2], expected_count_better)
         self.assertEqual(actual[3], expected_p_value)
 
+    def test_procrustes_m_squareds(self):
+        """ procrustes_m_squareds matches procrustes for each permutation
+        """
+        coords1 = self.coords1
+        coords2 = self.coords2[:, :5]
+        coords1, coords2 = pad_coords_matrices(coords1, coords2)
+        perms = array([[0, 1, 2, 3], [3, 2, 1, 0], [1, 3, 0, 2]])
+        actual = procrustes_m_squareds(standardize_coords(coords1),
+                                       standardize_coords(coords2), perms)
+        expected = [procrustes(coords1, coords2[perm])[2] for perm in perms]
+        assert_almost_equal(actual, expected)
+
+        # each block of permutations depends only on the seed and the block
+        perms = get_trial_permutations(42, 3, 5, 4)
+        self.assertEqual(perms.shape, (5, 4))
+        self.assertEqual(sorted(perms[0]), [0, 1, 2, 3])
+        assert_almost_equal(get_trial_permutations(42, 3, 5, 4), perms)
+
+    def test_procrustes_monte_carlo_seed(self):
+        """ procrustes_monte_carlo results depend only on the seed
+        """
+        actual = procrustes_monte_carlo(self.pcoa1_f, self.pcoa2_f,
+                                        trials=250, seed=7)
+        self.assertAlmostEqual(actual[0], 0.0211, 3)
+        self.assertEqual(len(actual[1]), 250)
+        # with 4 samples there are only 24 permutations, so the actual
+        # ordering of the samples comes up in some of the trials
+        self.assertTrue(min(actual[1]) <= actual[0])
+        self.assertEqual(actual[2],
+                         len([m2 for m2 in actual[1] if m2 <= actual[0] + 1e-8]))
+        self.assertEqual(actual[3], actual[2] / 250)
+
+        parallel = procrustes_monte_carlo(self.pcoa1_f, self.pcoa2_f,
+                                          trials=250, seed=7,
+                                          jobs_to_start=2)
+        assert_almost_equal(parallel[1], actual[1])
+        self.assertEqual(parallel[2], actual[2])
+
+    def test_procrustes_monte_carlo_trial_output(self):
+        """ procrustes_monte_carlo writes each trial if requested
+        """
+        trial_output_dir = mkdtemp(prefix='ProcrustesTests_')
+        try:
+            actual = procrustes_monte_carlo(self.pcoa1_f, self.pcoa2_f,
+                                            trials=3, max_dimensions=3,
+                                            seed=7,
+                                            trial_output_dir=trial_output_dir)
+            self.assertEqual(
+                sorted(listdir(trial_output_dir)),
+                ['pc1_transformed_maxdim_3_trial0.txt',
+                 'pc1_transformed_maxdim_3_trial1.txt',
+                 'pc1_transformed_maxdim_3_trial2.txt',
+                 'pc2_randomized_trial0.txt',
+                 'pc2_randomized_trial1.txt',
+                 'pc2_randomized_trial2.txt',
+                 'pc2_transformed_maxdim_3_trial0.txt',
+                 'pc2_transformed_maxdim_3_trial1.txt',
+                 'pc2_transformed_maxdim_3_trial2.txt',
+                 'trial_summary_maxdim_3.txt'])
+            # each trial's randomized coords give the trial's M^2
+            for i in range(3):
+                randomized_f = open('%s/pc2_randomized_trial%d.txt' %
+                                    (trial_output_dir, i), 'U')
+                trial = get_procrustes_results(self.pcoa1_f, randomized_f,
+                                               max_dimensions=3)
+                self.assertAlmostEqual(trial[2], actual[1][i])
+            summary = list(open('%s/trial_summary_maxdim_3.txt' %
+                                trial_output_dir, 'U'))
+            self.assertEqual(len(summary), 4)
+        finally:
+            rmtree(trial_output_dir)
+
 
 pcoa1_f = """pc vector number	1	2	3	4	5	6
 CP3A1	-322.585729836	938.204618621	-28.2137779927	490.569459399	-1046.48732174	-234.500487421
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+from __future__ import division
+
+__author__ = "Justin Kuczynski"
+__copyright__ = "Copyright 2011, The QIIME Project"
+__credits__ = ["Justin Kuczynski", "Rob Knight", "Greg Caporaso"]
+__license__ = "GPL"
+__version__ = "1.8.0-dev"
+__maintainer__ = "Justin Kuczynski"
+__email__ = "justinak@gmail.com"
+
+from os import close, listdir
+from shutil import rmtree
+from tempfile import mkdtemp, mkstemp
+from unittest import TestCase, main
+
+from numpy import array
+from numpy.testing import assert_almost_equal
+from cogent.maths.unifrac.fast_unifrac import PD_whole_tree
+from skbio.util.misc import remove_files
+
+from qiime.parse import parse_newick
+from qiime.sparse_beta_diversity import SampleVectors
+from qiime.tree_index import TreeIndex
+
+
+class TreeIndexTests(TestCase):
+
+    def setUp(self):
+        self.newick = '(((a:1,b:2)x:0.5,c:3)y:1.5,(d:2.5,e)z:0.75)root;'
+        self.tree = parse_newick(self.newick)
+        self.index = TreeIndex.from_tree(self.tree)
+        self.files_to_remove = []
+        self.dirs_to_remove = []
+
+    def tearDown(self):
+        remove_files(self.files_to_remove)
+        for d in self.dirs_to_remove:
+            rmtree(d)
+
+    def _write_tree(self):
+        fd, tree_fp = mkstemp(prefix='TreeIndexTests_', suffix='.tre')
+        close(fd)
+        self.files_to_remove.append(tree_fp)
+        f = open(tree_fp, 'w')
+        f.write(self.newick)
+        f.close()
+        return tree_fp
+
+    def _assert_same_index(self, obs, exp):
+        self.assertEqual(obs.Parents.tolist(), exp.Parents.tolist())
+        assert_almost_equal(obs.BranchLengths, exp.BranchLengths)
+        self.assertEqual(obs.TipIndices, exp.TipIndices)
+
+    def test_from_tree(self):
+        """TreeIndex indexes the tree in postorder"""
+        # postorder: a b x c y d e z root
+        self.assertEqual(self.index.Parents.tolist(),
+                         [2, 2, 4, 4, 8, 7, 7, 8, -1])
+        # e and the root have no branch length
+        assert_almost_equal(self.index.BranchLengths,
+                            [1, 2, 0.5, 3, 1.5, 2.5, 0, 0.75, 0])
+        self.assertEqual(self.index.TipIndices,
+                         {'a': 0, 'b': 1, 'c': 3, 'd': 5, 'e': 6})
+
+    def test_save_load(self):
+        """TreeIndex can be saved and loaded"""
+        fd, fp = mkstemp(prefix='TreeIndexTests_', suffix='.npz')
+        close(fd)
+        self.files_to_remove.append(fp)
+        self.index.save(fp)
+        self._assert_same_index(TreeIndex.load(fp), self.index)
+
+    def test_from_newick_file(self):
+        """from_newick_file caches the index of each tree file"""
+        tree_fp = self._write_tree()
+        self._assert_same_index(TreeIndex.from_newick_file(tree_fp),
+                                self.index)
+
+        cache_dir = mkdtemp(prefix='TreeIndexTests_')
+        self.dirs_to_remove.append(cache_dir)
+        self._assert_same_index(
+            TreeIndex.from_newick_file(tree_fp, cache_dir), self.index)
+        cache_fps = listdir(cache_dir)
+        self.assertEqual(len(cache_fps), 1)
+        self.assertTrue(cache_fps[0].startswith('tree_index_'))
+        # the cached index is used the next time
+        self._assert_same_index(
+            TreeIndex.from_newick_file(tree_fp, cache_dir), self.index)
+        self.assertEqual(listdir(cache_dir), cache_fps)
+
+        # a different tree gets its own index
+        self.newick = '(a:1,b:2)root;'
+        other_fp = self._write_tree()
+        obs = TreeIndex.from_newick_file(other_fp, cache_dir)
+        self.assertEqual(obs.TipIndices, {'a': 0, 'b': 1})
+        self.assertEqual(len(listdir(cache_dir)), 2)
+
+    def test_get_tip_indices(self):
+        """get_tip_indices gives -1 for names which aren't in the tree"""
+        self.assertEqual(
+            self.index.get_tip_indices(['d', 'a', 'q', 'x']).tolist(),
+            [5, 0, -1, -1])
+
+    def test_pd(self):
+        """pd matches PD_whole_tree for each sample"""
+        # samples x observations, where 'f' isn't in the tree
+        data = array([[1, 0, 4, 0, 0, 2],
+                      [0, 0, 0, 0, 0, 0],
+                      [0, 0, 0, 0, 0, 5],
+                      [1, 1, 1, 1, 1, 1],
+                      [0, 0, 0, 2, 3, 0],
+                      [0, 0.5, 0, 1.5, 0, 0]])
+        names = ['a', 'b', 'c', 'd', 'e', 'f']
+        sample_vectors = SampleVectors(
+            array([0, 3, 3, 4, 10, 12, 14]),
+            array([0, 2, 5, 5, 0, 1, 2, 3, 4, 5, 3, 4, 1, 3]),
+            data[data > 0], 6)
+        obs = self.index.pd(sample_vectors,
+                            self.index.get_tip_indices(names))
+        for i, counts in enumerate(data):
+            envs = dict([(name, {'s': count})
+                         for name, count in zip(names, counts) if count])
+            if set(envs) - set(['f']):
+                exp = PD_whole_tree(self.tree, envs)[1][0]
+            else:
+                exp = 0
+            assert_almost_equal(obs[i], exp)
+        # a count below 1 doesn't count
+        assert_almost_equal(obs, [6, 0, 0, 11.25, 3.25, 3.25])
+
+    def test_pd_empty(self):
+        """pd of samples without any tips is 0"""
+        sample_vectors = SampleVectors(array([0, 0, 0]),
+                                       array([], dtype=int), array([]), 2)
+        assert_almost_equal(self.index.pd(sample_vectors, [0, 1]), [0, 0])
+
+    def test_nested_pd(self):
+        """nested_pd matches PD_whole_tree at each depth"""
+        tips = ['a', 'b', 'c', 'd', 'e']
+        # the first of three depths at which each tip is observed (3 means
+        # it isn't observed at all)
+        first_depths = [2, 0, 3, 1, 0]
+        tip_indices = [self.index.TipIndices[tip] for tip in tips]
+        obs = self.index.nested_pd(tip_indices, first_depths, 3)
+        for depth in range(3):
+            envs = dict([(tip, {'s': int(first_depth <= depth)})
+                         for tip, first_depth in zip(tips, first_depths)])
+            exp = PD_whole_tree(self.tree, envs)[1][0]
+            assert_almost_equal(obs[depth], exp)
+        assert_almost_equal(obs, [4.75, 7.25, 8.25])
+
+    def test_nested_pd_empty(self):
+        """nested_pd of a sample without any tips is 0"""
+        assert_almost_equal(self.index.nested_pd([], [], 2), [0, 0])
+        assert_almost_equal(self.index.nested_pd(array([0]), array([2]), 2),
+                            [0, 0])
+
+
+if __name__ == '__main__':
+    main()
@@ -14,7 +14,7 @@ import sys
 from StringIO import StringIO
 from shutil import rmtree
 from glob import glob
-from os.path import join, exists, getsize, split, splitext
+from os.path import join, exists, getsize, split, splitext, normpath
 from tempfile import mkdtemp
 
 from unittest import TestCase, main
@@ -325,6 +325,52 @@ class DownstreamWorkflowTests(TestCase):
         log_fp = glob(join(self.test_out, 'log*.txt'))[0]
         self.assertTrue(getsize(log_fp) > 0)
 
+    def test_run_alpha_rarefaction_fused(self):
+        """ run_alpha_rarefaction generates expected results when fused
+        """
+        # the options of alpha_diversity.py are passed to the fused script
+        tree_cache_dir = join(self.test_out, 'tree_cache')
+        self.params['alpha_diversity']['tree_cache_dir'] = tree_cache_dir
+
+        run_alpha_rarefaction(
+            self.test_data['biom'][0],
+            self.test_data['map'][0],
+            self.test_out,
+            call_commands_serially,
+            self.params,
+            self.qiime_config,
+            tree_fp=self.test_data['tree'][0],
+            num_steps=5,
+            parallel=False,
+            min_rare_depth=3,
+            max_rare_depth=18,
+            status_update_callback=no_status_updates,
+            fused=True)
+
+        html_fp = join(self.test_out, 'alpha_rarefaction_plots',
+                       'rarefaction_plots.html')
+        pd_collated_fp = join(self.test_out, 'alpha_div_collated',
+                              'PD_whole_tree.txt')
+
+        # Confirm that palm and gut alpha diversities are different,
+        # and suggestive of statistical significance (we only have a
+        # few sequences, so we don't get significant results)
+        ttest_res, alpha_avg = compare_alpha_diversities(
+            open(pd_collated_fp), open(self.test_data['map'][0]),
+            'SampleType', 18, test_type='parametric')
+        feces_palm_t = ttest_res[('feces', 'L_palm')][0]
+        self.assertTrue(feces_palm_t < 0,
+                        "t-statistic too high: %1.3f, but should be less than 0"
+                        % feces_palm_t)
+
+        # check that final output files have non-zero size
+        self.assertTrue(getsize(html_fp) > 0)
+        # and that the rarefied OTU tables weren't written
+        self.assertFalse(exists(join(self.test_out, 'rarefaction')))
+        self.assertFalse(exists(join(self.test_out, 'alpha_div')))
+        self.assertEqual(len(glob(join(tree_cache_dir, 'tree_index_*.npz'))),
+                         1)
+
     def test_run_alpha_rarefaction_parallel(self):
         """ run_alpha_rarefaction generates expected results when run in parallel
         """
@@ -431,6 +477,62 @@ class DownstreamWorkflowTests(TestCase):
         log_fp = glob(join(self.test_out, 'log*.txt'))[0]
         self.assertTrue(getsize(log_fp) > 0)
 
+    def test_run_jackknifed_beta_diversity_serial_commands(self):
+        """ run_jackknifed_beta_diversity computes all rarefied metrics at once
+        """
+        commands = []
+
+        def record_commands(cmds, status_update_callback, logger,
+                            close_logger_on_success):
+            commands.extend([cmd for cmd_group in cmds for cmd in cmd_group])
+            logger.close()
+
+        self.params['beta_diversity']['metrics'] = \
+            'weighted_unifrac,unweighted_unifrac'
+        run_jackknifed_beta_diversity(
+            self.test_data['biom'][0],
+            self.test_data['tree'][0],
+            20,
+            self.test_out,
+            record_commands,
+            self.params,
+            self.qiime_config,
+            self.test_data['map'][0],
+            parallel=False,
+            status_update_callback=no_status_updates)
+
+        scratch_dir = '%s/rare_dm_all_metrics_tmp/' % self.test_out
+        rarefaction_dir = '%s/rarefaction/' % self.test_out
+        # a single beta_diversity.py run for the rarefied OTU tables, whose
+        # distance matrices are moved to each metric's directory before the
+        # scratch directory is removed
+        rarefied_cmds = [cmd for name, cmd in commands
+                         if cmd.startswith('beta_diversity.py -i %s ' %
+                                           rarefaction_dir)]
+        self.assertEqual(len(rarefied_cmds), 1)
+        self.assertTrue(' -o %s ' % scratch_dir in rarefied_cmds[0])
+        self.assertTrue(' -m weighted_unifrac,unweighted_unifrac '
+                        in rarefied_cmds[0])
+        self.assertTrue(' -t %s' % self.test_data['tree'][0]
+                        in rarefied_cmds[0])
+        cmds = [cmd for name, cmd in commands]
+        i = cmds.index(rarefied_cmds[0])
+        self.assertEqual(cmds[i + 1:i + 4], [
+            'mv %s/weighted_unifrac_rarefaction_* %s/weighted_unifrac/rare_dm/'
+            % (scratch_dir, self.test_out),
+            'mv %s/unweighted_unifrac_rarefaction_* '
+            '%s/unweighted_unifrac/rare_dm/' % (scratch_dir, self.test_out),
+            'rmdir %s' % scratch_dir])
+        self.assertFalse([cmd for cmd in cmds
+                          if cmd.startswith('parallel_beta_diversity.py')])
+        # the later steps read each metric's distance matrices
+        upgma_inputs = [normpath(cmd.split()[2]) for cmd in cmds
+                        if cmd.startswith('upgma_cluster.py')]
+        for metric in ['weighted_unifrac', 'unweighted_unifrac']:
+            dm_dir = join(self.test_out, metric, 'rare_dm')
+            self.assertTrue(dm_dir in upgma_inputs)
+            self.assertTrue(exists(dm_dir))
+
     def test_run_jackknifed_beta_diversity_parallel(self):
         """ run_jackknifed_beta_diversity generates expected results """
 